@@ -1,16 +1,40 @@
 """
 VK-Agent FastAPI Server
 HTTP API for controlling the voice agent bridge
+
+Endpoints:
+    GET    /health            - Health check
+    GET    /status            - Default room bridge status
+    GET    /stats             - Default room statistics
+    POST   /text              - Send text to Gemini (default room)
+    POST   /screen            - Send screen capture to Gemini (default room)
+    GET    /rooms             - List rooms hosted by this process
+    POST   /rooms             - Create a bridge for a room
+    GET    /rooms/{room_id}   - Room bridge status
+    DELETE /rooms/{room_id}   - Stop a room bridge and release its ports
+
+Supervisor mode (VK_AGENT_WORKERS > 1) serves the same endpoints from
+create_supervisor_app(), forwarding each to the worker owning the room,
+plus:
+    GET    /workers           - Worker processes, their rooms and load
 """
 
 import base64
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional
 import structlog
 
 from .bridge import AgentBridge
+from .session_manager import (
+    SessionManager,
+    RoomExistsError,
+    RoomNotFoundError,
+    PortPoolExhaustedError,
+)
+from .supervisor import Supervisor, WorkerHandle
 
 logger = structlog.get_logger()
 
@@ -25,11 +49,16 @@ class ScreenRequest(BaseModel):
     prompt: Optional[str] = "What do you see on this screen?"
 
 
-def create_app(bridge: AgentBridge) -> FastAPI:
+class RoomRequest(BaseModel):
+    room_id: int
+    display_name: Optional[str] = None
+
+
+def create_app(manager: SessionManager) -> FastAPI:
     """Create the FastAPI application with routes.
 
     Args:
-        bridge: The AgentBridge instance for voice AI operations
+        manager: The SessionManager hosting per-room AgentBridge instances
     """
     app = FastAPI(
         title="VK-Agent",
@@ -51,14 +80,22 @@ def create_app(bridge: AgentBridge) -> FastAPI:
         """Health check endpoint."""
         return {"status": "healthy", "version": "1.0.0"}
 
+    def default_bridge() -> AgentBridge:
+        """Get the default room bridge (legacy single-room endpoints)."""
+        bridge = manager.default_bridge
+        if bridge is None:
+            raise HTTPException(status_code=503, detail="No room bridge running")
+        return bridge
+
     @app.get("/status")
     async def status():
         """Get comprehensive bridge status."""
-        return bridge.get_status()
+        return default_bridge().get_status()
 
     @app.post("/text")
     async def send_text(request: TextRequest):
         """Send text to Gemini for voice response."""
+        bridge = default_bridge()
         if not bridge.gemini_client or not bridge.gemini_client.is_ready:
             return {"success": False, "error": "Gemini not ready"}
 
@@ -74,6 +111,7 @@ def create_app(bridge: AgentBridge) -> FastAPI:
     @app.post("/screen")
     async def send_screen(request: ScreenRequest):
         """Send screen capture to Gemini for visual analysis."""
+        bridge = default_bridge()
         if not bridge.gemini_client or not bridge.gemini_client.is_ready:
             return {"success": False, "error": "Gemini not ready"}
 
@@ -101,10 +139,164 @@ def create_app(bridge: AgentBridge) -> FastAPI:
     @app.get("/stats")
     async def stats():
         """Get bridge statistics."""
+        bridge = default_bridge()
         return {
             "stats": bridge.stats.to_dict() if bridge.stats else {},
             "audio": bridge.audio_processor.get_stats() if bridge.audio_processor else {},
             "gemini": bridge.gemini_client.get_stats() if bridge.gemini_client else {},
+            "manager": manager.get_stats(),
         }
 
+    # ============== Room Lifecycle ==============
+
+    @app.get("/rooms")
+    async def list_rooms():
+        """List rooms hosted by this process."""
+        return {**manager.get_stats(), "rooms": manager.list_rooms()}
+
+    @app.post("/rooms", status_code=201)
+    async def create_room(request: RoomRequest):
+        """Create and start a bridge for a room."""
+        try:
+            await manager.create_room(request.room_id, display_name=request.display_name)
+        except RoomExistsError as e:
+            raise HTTPException(status_code=409, detail=str(e)) from e
+        except PortPoolExhaustedError as e:
+            raise HTTPException(status_code=503, detail=str(e)) from e
+        except Exception as e:
+            logger.error("Failed to create room", room_id=request.room_id, error=str(e))
+            raise HTTPException(status_code=500, detail=str(e)) from e
+        return {"success": True, "room_id": request.room_id}
+
+    @app.get("/rooms/{room_id}")
+    async def room_status(room_id: int):
+        """Get a room bridge's status."""
+        bridge = manager.get_bridge(room_id)
+        if bridge is None:
+            raise HTTPException(status_code=404, detail=f"Room {room_id} not found")
+        return bridge.get_status()
+
+    @app.delete("/rooms/{room_id}")
+    async def delete_room(room_id: int):
+        """Stop a room bridge and release its ports."""
+        try:
+            await manager.delete_room(room_id)
+        except RoomNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+        return {"success": True, "room_id": room_id}
+
+    return app
+
+
+def create_supervisor_app(supervisor: Supervisor) -> FastAPI:
+    """Create the front-controller FastAPI application.
+
+    Args:
+        supervisor: The Supervisor sharding rooms across worker processes
+    """
+    app = FastAPI(
+        title="VK-Agent",
+        description="Voice AI Bridge: Janus AudioBridge <-> Gemini Live API",
+        version="1.0.0",
+    )
+
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    def relay(status: int, body) -> JSONResponse:
+        """Return a worker's response unchanged."""
+        return JSONResponse(status_code=status, content=body)
+
+    def default_worker() -> WorkerHandle:
+        """Get the worker hosting the default room (legacy endpoints)."""
+        worker = supervisor.default_owner
+        if worker is None:
+            raise HTTPException(status_code=503, detail="No room bridge running")
+        return worker
+
+    @app.get("/health")
+    async def health():
+        """Health check endpoint."""
+        stats = supervisor.get_stats()
+        return {
+            "status": "healthy" if stats["workers_alive"] else "unhealthy",
+            "version": "1.0.0",
+            "workers_alive": stats["workers_alive"],
+            "workers": len(supervisor.workers),
+        }
+
+    @app.get("/workers")
+    async def workers():
+        """Get worker processes, their rooms and load."""
+        return supervisor.get_stats()
+
+    @app.get("/status")
+    async def status():
+        """Get the default room bridge status."""
+        return relay(*await supervisor.forward(default_worker(), "GET", "/status"))
+
+    @app.post("/text")
+    async def send_text(request: TextRequest):
+        """Send text to Gemini for voice response (default room)."""
+        return relay(*await supervisor.forward(
+            default_worker(), "POST", "/text", request.model_dump()
+        ))
+
+    @app.post("/screen")
+    async def send_screen(request: ScreenRequest):
+        """Send screen capture to Gemini (default room)."""
+        return relay(*await supervisor.forward(
+            default_worker(), "POST", "/screen", request.model_dump()
+        ))
+
+    @app.get("/stats")
+    async def stats():
+        """Get default room statistics plus supervisor statistics."""
+        status, body = await supervisor.forward(default_worker(), "GET", "/stats")
+        if status != 200:
+            return relay(status, body)
+        return {**body, "supervisor": supervisor.get_stats()}
+
+    # ============== Room Lifecycle ==============
+
+    @app.get("/rooms")
+    async def list_rooms():
+        """List rooms across all workers."""
+        return {**supervisor.get_stats(), "rooms": await supervisor.list_rooms()}
+
+    @app.post("/rooms", status_code=201)
+    async def create_room(request: RoomRequest):
+        """Create a bridge for a room on the least-loaded worker."""
+        try:
+            status, body = await supervisor.create_room(
+                request.room_id, display_name=request.display_name
+            )
+        except RoomExistsError as e:
+            raise HTTPException(status_code=409, detail=str(e)) from e
+        except PortPoolExhaustedError as e:
+            raise HTTPException(status_code=503, detail=str(e)) from e
+        return relay(status, body)
+
+    @app.get("/rooms/{room_id}")
+    async def room_status(room_id: int):
+        """Get a room bridge's status from its worker."""
+        worker = supervisor.owner(room_id)
+        if worker is None:
+            raise HTTPException(status_code=404, detail=f"Room {room_id} not found")
+        return relay(*await supervisor.forward(worker, "GET", f"/rooms/{room_id}"))
+
+    @app.delete("/rooms/{room_id}")
+    async def delete_room(room_id: int):
+        """Stop a room bridge on its worker."""
+        try:
+            return relay(*await supervisor.delete_room(room_id))
+        except RoomNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+
     return app
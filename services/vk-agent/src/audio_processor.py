@@ -7,6 +7,11 @@ Pipeline:
     Janus → Agent (RTP Opus 48kHz → Decode → Resample → PCM16 16kHz) → Gemini
     Gemini → Agent (PCM16 24kHz → Resample → Encode → RTP Opus 48kHz) → Janus
 
+Native-rate mode (AudioConfig.opus_native_rate, default):
+    Opus decodes straight to 16kHz and encodes straight from 24kHz, so both
+    resample passes disappear from the hot path. The RTP clock stays 48kHz
+    (RFC 7587) - see RTPSender. The soxr streams remain as the fallback.
+
 Features:
     - Opus encoding/decoding using opuslib
     - High-quality streaming resampling using python-soxr (40-80ms faster than scipy)
@@ -21,10 +26,34 @@ Audio Formats:
 Performance (Phase 1 Optimization):
     - soxr provides ~40-80ms latency savings over scipy.signal.resample
     - Streaming resampler maintains state for gapless audio
+
+Streaming Resamplers:
+    Each direction owns a persistent StreamingResampler (48k→16k inbound,
+    24k→48k outbound) that runs natively on int16, so filter state carries
+    across 20ms packets instead of resetting (and clicking) at every boundary.
+    Call reset_inbound()/reset_outbound() on interruption or stream restart.
+    Benchmark: python -m tests.benchmarks.bench_resampler
+
+Loss Recovery:
+    janus_to_gemini(opus, lost=n) rebuilds the n frames missing before a
+    packet: the last one from the packet's in-band FEC (LBRR) data, the
+    rest with decoder PLC. Gaps longer than max_conceal_frames are left
+    silent rather than synthesized.
+
+Per-Source Decoding:
+    Each inbound RTP source (SSRC) gets its own Opus decoder and inbound
+    resampler, created on first use via janus_to_gemini(..., ssrc=...).
+    Interleaving two speakers through one decoder corrupts its state.
+    remove_inbound(ssrc) frees an idle source. SSRC 0 is the default stream.
+
+Outbound Framing:
+    Gemini chunk sizes are not multiples of 20ms. A PCMFramer carries the
+    partial-frame remainder over to the next chunk, so only full frames are
+    encoded; flush_outbound() pads and emits the tail once per turn.
 """
 
 import logging
-from typing import Optional, List
+from typing import Dict, Optional, List
 import numpy as np
 
 from .config import AudioConfig
@@ -52,6 +81,40 @@ except ImportError:
     logger.warning("soxr not available - trying scipy fallback")
 
 
+# Sample rates libopus can decode to / encode from
+OPUS_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+def opus_packet_has_fec(packet: bytes) -> bool:
+    """Check whether a single-frame mono Opus packet carries in-band FEC.
+
+    Reads the SILK LBRR flag that follows the per-frame VAD flags at the
+    start of the SILK payload (same check as WebRTC's PacketHasFec).
+    CELT-only and multi-frame (code 1-3) packets report False.
+
+    Args:
+        packet: Opus packet (RTP payload)
+
+    Returns:
+        True if the packet's LBRR (FEC) flag is set
+    """
+    if len(packet) < 2:
+        return False
+
+    toc = packet[0]
+    config = toc >> 3
+    if config >= 16 or toc & 0x3:
+        return False  # CELT-only (no SILK layer) or multiple frames
+
+    if config < 12:
+        duration_ms = (10, 20, 40, 60)[config % 4]  # SILK-only
+    else:
+        duration_ms = (10, 20)[config % 2]           # Hybrid
+    silk_frames = max(1, duration_ms // 20)
+
+    return bool(packet[1] & (0x80 >> silk_frames))
+
+
 # Fallback to scipy if soxr not available
 HAS_SCIPY = False
 if not HAS_SOXR:
@@ -63,6 +126,252 @@ if not HAS_SOXR:
         logger.warning("Neither soxr nor scipy available - using linear interpolation")
 
 
+def resample_oneshot(
+    samples: np.ndarray,
+    from_rate: int,
+    to_rate: int,
+) -> np.ndarray:
+    """Resample a self-contained block of audio (no state carried over).
+
+    Args:
+        samples: Input samples as numpy array
+        from_rate: Original sample rate
+        to_rate: Target sample rate
+
+    Returns:
+        Resampled numpy array with the input dtype
+    """
+    if from_rate == to_rate:
+        return samples
+
+    # Calculate new length
+    duration = len(samples) / from_rate
+    new_length = int(duration * to_rate)
+
+    if new_length == 0:
+        return np.array([], dtype=samples.dtype)
+
+    if HAS_SOXR:
+        # High-performance soxr resampling (Phase 1 optimization)
+        # soxr.resample is ~20-40x faster than scipy.signal.resample
+        resampled = soxr.resample(
+            samples.astype(np.float64),
+            from_rate,
+            to_rate,
+            quality='HQ'  # High quality, still very fast
+        )
+    elif HAS_SCIPY:
+        # Fallback: scipy polyphase resampling (slower)
+        resampled = signal.resample(samples.astype(np.float64), new_length)
+    else:
+        # Last resort: linear interpolation
+        x_old = np.linspace(0, 1, len(samples))
+        x_new = np.linspace(0, 1, new_length)
+        resampled = np.interp(x_new, x_old, samples.astype(np.float64))
+
+    # Clip and convert back to original dtype
+    if samples.dtype == np.int16:
+        resampled = np.clip(resampled, -32768, 32767)
+        return resampled.astype(np.int16)
+
+    return resampled.astype(samples.dtype)
+
+
+class StreamingResampler:
+    """Stateful resampler for one direction of a continuous audio stream.
+
+    Wraps soxr.ResampleStream so the anti-aliasing filter state survives
+    between packets: no edge artifacts at 20ms boundaries and no per-call
+    setup. Runs natively on int16 (or float32) without float64 round trips.
+
+    Output size per call is not constant (soxr processes in blocks and has
+    a small fixed delay); callers must accumulate rather than assume
+    len(out) == len(in) * ratio.
+
+    Falls back to resample_oneshot() per chunk when soxr is unavailable.
+
+    Example:
+        >>> inbound = StreamingResampler(48000, 16000)
+        >>> pcm_16k = inbound.process(pcm_48k_frame)
+        >>> inbound.reset()  # On interruption / stream restart
+    """
+
+    def __init__(
+        self,
+        from_rate: int,
+        to_rate: int,
+        dtype: type = np.int16,
+        quality: str = "HQ",
+    ):
+        """Initialize streaming resampler.
+
+        Args:
+            from_rate: Input sample rate
+            to_rate: Output sample rate
+            dtype: Sample dtype (np.int16 or np.float32)
+            quality: soxr quality preset
+        """
+        self.from_rate = from_rate
+        self.to_rate = to_rate
+        self.dtype = np.dtype(dtype)
+        self.quality = quality
+
+        self._stream = None
+        if HAS_SOXR and from_rate != to_rate:
+            self._stream = soxr.ResampleStream(
+                from_rate,
+                to_rate,
+                1,
+                dtype=self.dtype.name,
+                quality=quality,
+            )
+
+        self.resets = 0
+
+    @property
+    def is_streaming(self) -> bool:
+        """Whether filter state is carried across calls (soxr available)."""
+        return self._stream is not None
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample the next chunk of the stream.
+
+        Args:
+            samples: Mono samples at from_rate
+
+        Returns:
+            Samples at to_rate (may be empty while the filter fills)
+        """
+        if samples.dtype != self.dtype:
+            samples = samples.astype(self.dtype)
+
+        if self.from_rate == self.to_rate:
+            return samples
+
+        if self._stream is None:
+            return resample_oneshot(samples, self.from_rate, self.to_rate)
+
+        return self._stream.resample_chunk(samples)
+
+    def flush(self) -> np.ndarray:
+        """Drain samples still held in the filter and reset the stream.
+
+        Returns:
+            Remaining output samples (end of stream)
+        """
+        if self._stream is None:
+            return np.array([], dtype=self.dtype)
+
+        tail = self._stream.resample_chunk(np.array([], dtype=self.dtype), last=True)
+        self.reset()
+        return tail
+
+    def reset(self) -> None:
+        """Discard filter state (start of a new, unrelated stream)."""
+        if self._stream is not None:
+            self._stream.clear()
+        self.resets += 1
+
+
+class PCMFramer:
+    """Accumulates PCM across chunks and emits fixed-size frames.
+
+    Backed by a preallocated int16 buffer: samples are appended at the
+    tail, full frames are sliced from the head, and the (< 1 frame)
+    remainder is moved to the front before the next append.
+
+    Example:
+        >>> framer = PCMFramer(frame_size=480)
+        >>> frames = framer.push(pcm_24k_chunk)  # Full frames only
+        >>> last = framer.flush()                # Zero-padded tail (turn end)
+    """
+
+    def __init__(self, frame_size: int, capacity_frames: int = 64):
+        """Initialize framer.
+
+        Args:
+            frame_size: Samples per emitted frame
+            capacity_frames: Initial buffer size in frames (grows if exceeded)
+        """
+        self.frame_size = frame_size
+        self._buffer = np.zeros(frame_size * capacity_frames, dtype=np.int16)
+        self._length = 0
+
+        self.frames_emitted = 0
+        self.frames_padded = 0
+
+    @property
+    def pending(self) -> int:
+        """Samples held back waiting for a full frame."""
+        return self._length
+
+    def push(self, samples: np.ndarray) -> List[np.ndarray]:
+        """Append samples and return every complete frame.
+
+        Args:
+            samples: Mono int16 samples
+
+        Returns:
+            Complete frames (copies, safe to keep), possibly empty
+        """
+        n = len(samples)
+        if n:
+            needed = self._length + n
+            if needed > len(self._buffer):
+                grown = np.zeros(max(needed, 2 * len(self._buffer)), dtype=np.int16)
+                grown[:self._length] = self._buffer[:self._length]
+                self._buffer = grown
+            self._buffer[self._length:needed] = samples
+            self._length = needed
+
+        count = self._length // self.frame_size
+        if count == 0:
+            return []
+
+        used = count * self.frame_size
+        frames = list(self._buffer[:used].copy().reshape(count, self.frame_size))
+
+        # Keep the partial remainder for the next chunk
+        remainder = self._length - used
+        if remainder:
+            self._buffer[:remainder] = self._buffer[used:self._length]
+        self._length = remainder
+
+        self.frames_emitted += count
+        return frames
+
+    def flush(self) -> Optional[np.ndarray]:
+        """Emit the remainder as a zero-padded frame.
+
+        Returns:
+            Final frame, or None if nothing is pending
+        """
+        if self._length == 0:
+            return None
+
+        frame = np.zeros(self.frame_size, dtype=np.int16)
+        frame[:self._length] = self._buffer[:self._length]
+        self._length = 0
+
+        self.frames_emitted += 1
+        self.frames_padded += 1
+        return frame
+
+    def clear(self) -> None:
+        """Discard pending samples."""
+        self._length = 0
+
+
+class _InboundStream:
+    """Decoder and resampler state for one inbound RTP source (SSRC)."""
+
+    __slots__ = ("decoder", "resampler")
+
+    def __init__(self, decoder: Optional["opuslib.Decoder"], resampler: StreamingResampler):
+        self.decoder = decoder
+        self.resampler = resampler
+
+
 class AudioProcessor:
     """Audio processor for Janus-Gemini format conversion.
 
@@ -97,23 +406,63 @@ class AudioProcessor:
         # Frame size for 20ms at 48kHz (standard Opus frame)
         self.opus_frame_size = self.config.janus_frame_samples
 
+        # Codec rates: native mode runs the codecs at the Gemini rates
+        self.native_rate = (
+            self.config.opus_native_rate
+            and self.gemini_input_rate in OPUS_RATES
+            and self.gemini_output_rate in OPUS_RATES
+        )
+        if self.native_rate:
+            self.decoder_rate = self.gemini_input_rate
+            self.encoder_rate = self.gemini_output_rate
+        else:
+            self.decoder_rate = self.janus_sample_rate
+            self.encoder_rate = self.janus_sample_rate
+        frame_ms = self.config.frame_duration_ms
+        self.decode_frame_size = self.decoder_rate * frame_ms // 1000
+        self.encode_frame_size = self.encoder_rate * frame_ms // 1000
+
         # Initialize codecs
         self._opus_decoder: Optional[opuslib.Decoder] = None
         self._opus_encoder: Optional[opuslib.Encoder] = None
         self._init_opus_codecs()
 
+        # Persistent per-direction resamplers (state carries across packets)
+        # Pass-through (no soxr stream) when the codecs run at native rate
+        self._inbound_resampler = StreamingResampler(
+            self.decoder_rate, self.gemini_input_rate
+        )
+        self._outbound_resampler = StreamingResampler(
+            self.gemini_output_rate, self.encoder_rate
+        )
+
+        # Outbound remainder carry-over (only full frames are encoded)
+        self._outbound_framer = PCMFramer(self.encode_frame_size)
+
+        # Per-SSRC inbound state; SSRC 0 is the default stream
+        self._inbound_streams: Dict[int, _InboundStream] = {
+            0: _InboundStream(self._opus_decoder, self._inbound_resampler)
+        }
+
         # Statistics
         self._decode_count = 0
         self._encode_count = 0
         self._decode_errors = 0
         self._encode_errors = 0
 
+        # Loss recovery (Opus in-band FEC, then decoder PLC)
+        self.max_conceal_frames = 5  # 100ms; longer gaps are not synthesized
+        self._fec_recovered = 0
+        self._plc_concealed = 0
+        self._loss_unrecovered = 0
+
         logger.info(
             f"AudioProcessor initialized: "
             f"Janus={self.janus_sample_rate}Hz, "
             f"Gemini In={self.gemini_input_rate}Hz, "
             f"Gemini Out={self.gemini_output_rate}Hz, "
-            f"Opus={'enabled' if self._opus_decoder else 'disabled'}"
+            f"Opus={'enabled' if self._opus_decoder else 'disabled'}, "
+            f"native_rate={self.native_rate}"
         )
 
     def _init_opus_codecs(self) -> None:
@@ -123,15 +472,12 @@ class AudioProcessor:
             return
 
         try:
-            # Decoder for incoming Janus audio
-            self._opus_decoder = opuslib.Decoder(
-                fs=self.janus_sample_rate,
-                channels=1
-            )
+            # Decoder for incoming Janus audio (48kHz stream decoded at decoder_rate)
+            self._opus_decoder = self._new_decoder()
 
-            # Encoder for outgoing audio to Janus
+            # Encoder for outgoing audio to Janus (RTP clock stays 48kHz)
             self._opus_encoder = opuslib.Encoder(
-                fs=self.janus_sample_rate,
+                fs=self.encoder_rate,
                 channels=1,
                 application=opuslib.APPLICATION_VOIP
             )
@@ -140,8 +486,9 @@ class AudioProcessor:
             self._opus_encoder.complexity = 5  # Balance quality/CPU
 
             logger.info(
-                f"Opus codecs initialized: {self.janus_sample_rate}Hz mono, "
-                f"frame_size={self.opus_frame_size}"
+                f"Opus codecs initialized: decode {self.decoder_rate}Hz "
+                f"(frame_size={self.decode_frame_size}), "
+                f"encode {self.encoder_rate}Hz (frame_size={self.encode_frame_size})"
             )
 
         except Exception as e:
@@ -149,21 +496,52 @@ class AudioProcessor:
             self._opus_decoder = None
             self._opus_encoder = None
 
+    def _new_decoder(self) -> "opuslib.Decoder":
+        """Create an Opus decoder at decoder_rate."""
+        return opuslib.Decoder(fs=self.decoder_rate, channels=1)
+
+    def _inbound(self, ssrc: int) -> _InboundStream:
+        """Get (or create) the inbound state for an RTP source."""
+        stream = self._inbound_streams.get(ssrc)
+        if stream is None:
+            decoder = self._new_decoder() if self._opus_decoder else None
+            stream = _InboundStream(
+                decoder,
+                StreamingResampler(self.decoder_rate, self.gemini_input_rate),
+            )
+            self._inbound_streams[ssrc] = stream
+            logger.info(
+                f"Inbound stream added: ssrc={ssrc} "
+                f"({len(self._inbound_streams) - 1} sources)"
+            )
+        return stream
+
+    def remove_inbound(self, ssrc: int) -> None:
+        """Free the decoder state of an inbound source (no-op for SSRC 0).
+
+        Args:
+            ssrc: RTP source to drop
+        """
+        if ssrc != 0 and self._inbound_streams.pop(ssrc, None) is not None:
+            logger.info(f"Inbound stream removed: ssrc={ssrc}")
+
     @property
     def is_ready(self) -> bool:
         """Check if processor is ready for audio conversion."""
         return HAS_OPUS and self._opus_decoder is not None
 
-    def decode_opus(self, opus_data: bytes) -> Optional[np.ndarray]:
+    def decode_opus(self, opus_data: bytes, ssrc: int = 0) -> Optional[np.ndarray]:
         """Decode Opus audio to PCM samples.
 
         Args:
             opus_data: Opus encoded audio bytes
+            ssrc: RTP source whose decoder state to use
 
         Returns:
-            numpy array of int16 PCM samples at 48kHz, or None on error
+            numpy array of int16 PCM samples at decoder_rate, or None on error
         """
-        if not self._opus_decoder:
+        decoder = self._inbound(ssrc).decoder
+        if not decoder:
             logger.warning("[AUDIO-DEBUG] Opus decoder not available!")
             return None
 
@@ -173,14 +551,14 @@ class AudioProcessor:
                 logger.info(
                     f"[AUDIO-DEBUG] Decoding Opus: "
                     f"size={len(opus_data)}, "
-                    f"frame_size={self.opus_frame_size}, "
+                    f"frame_size={self.decode_frame_size}, "
                     f"total_decoded={self._decode_count}"
                 )
 
             # Decode Opus packet
-            pcm_data = self._opus_decoder.decode(
+            pcm_data = decoder.decode(
                 opus_data,
-                frame_size=self.opus_frame_size
+                frame_size=self.decode_frame_size
             )
 
             # Convert bytes to numpy array
@@ -198,12 +576,74 @@ class AudioProcessor:
             logger.error(f"Unexpected decode error: {e}")
             return None
 
+    def recover_lost(
+        self,
+        lost: int,
+        next_opus: Optional[bytes] = None,
+        ssrc: int = 0,
+    ) -> Optional[np.ndarray]:
+        """Reconstruct frames lost before the next received packet.
+
+        The frame immediately preceding next_opus is rebuilt from its
+        in-band FEC data when present; earlier frames (or all of them if
+        FEC decode fails) use decoder packet-loss concealment.
+
+        Args:
+            lost: Number of consecutive 20ms frames missing
+            next_opus: The packet received after the gap (carries FEC)
+            ssrc: RTP source whose decoder state to use
+
+        Returns:
+            int16 PCM at decoder_rate covering the gap, or None if nothing
+            was recovered (decoder unavailable or gap too long)
+        """
+        decoder = self._inbound(ssrc).decoder
+        if not decoder or lost <= 0:
+            return None
+        if lost > self.max_conceal_frames:
+            self._loss_unrecovered += lost
+            return None
+
+        frame_size = self.decode_frame_size
+        chunks: List[bytes] = []
+
+        try:
+            # PLC for all but the last missing frame
+            for _ in range(lost - 1):
+                chunks.append(decoder.decode(b"", frame_size=frame_size))
+                self._plc_concealed += 1
+
+            # Last missing frame: FEC from the following packet, else PLC
+            fec_pcm = None
+            if next_opus and opus_packet_has_fec(next_opus):
+                try:
+                    fec_pcm = decoder.decode(
+                        next_opus, frame_size=frame_size, decode_fec=True
+                    )
+                except opuslib.OpusError:
+                    fec_pcm = None
+            if fec_pcm:
+                chunks.append(fec_pcm)
+                self._fec_recovered += 1
+            else:
+                chunks.append(decoder.decode(b"", frame_size=frame_size))
+                self._plc_concealed += 1
+
+        except Exception as e:
+            logger.warning(f"Opus loss recovery error: {e}")
+            self._loss_unrecovered += lost - len(chunks)
+
+        if not chunks:
+            return None
+        return np.frombuffer(b"".join(chunks), dtype=np.int16)
+
     def encode_opus(self, pcm_samples: np.ndarray) -> Optional[bytes]:
         """Encode PCM samples to Opus.
 
         Args:
-            pcm_samples: numpy array of int16 PCM samples at 48kHz
-                        Must be exactly opus_frame_size samples (960 for 20ms)
+            pcm_samples: numpy array of int16 PCM samples at encoder_rate
+                        Must be exactly encode_frame_size samples
+                        (480 for 20ms at 24kHz native, 960 at 48kHz)
 
         Returns:
             Opus encoded bytes, or None on error
@@ -259,79 +699,91 @@ class AudioProcessor:
             - Uses soxr for high-performance resampling (~1-2ms vs 20-40ms with scipy)
             - Falls back to scipy.signal.resample if soxr not available
             - Linear interpolation as last resort
-        """
-        if from_rate == to_rate:
-            return samples
-
-        # Calculate new length
-        duration = len(samples) / from_rate
-        new_length = int(duration * to_rate)
 
-        if new_length == 0:
-            return np.array([], dtype=samples.dtype)
-
-        if HAS_SOXR:
-            # High-performance soxr resampling (Phase 1 optimization)
-            # soxr.resample is ~20-40x faster than scipy.signal.resample
-            resampled = soxr.resample(
-                samples.astype(np.float64),
-                from_rate,
-                to_rate,
-                quality='HQ'  # High quality, still very fast
-            )
-        elif HAS_SCIPY:
-            # Fallback: scipy polyphase resampling (slower)
-            resampled = signal.resample(samples.astype(np.float64), new_length)
-        else:
-            # Last resort: linear interpolation
-            x_old = np.linspace(0, 1, len(samples))
-            x_new = np.linspace(0, 1, new_length)
-            resampled = np.interp(x_new, x_old, samples.astype(np.float64))
+        Note:
+            Stateless - use the streaming janus_to_gemini()/gemini_to_janus()
+            paths for continuous audio.
+        """
+        return resample_oneshot(samples, from_rate, to_rate)
 
-        # Clip and convert back to original dtype
-        if samples.dtype == np.int16:
-            resampled = np.clip(resampled, -32768, 32767)
-            return resampled.astype(np.int16)
+    def reset_inbound(self) -> None:
+        """Reset the inbound (Janus → Gemini) resampler state of every source."""
+        for stream in self._inbound_streams.values():
+            stream.resampler.reset()
 
-        return resampled.astype(samples.dtype)
+    def reset_outbound(self) -> None:
+        """Reset the outbound (Gemini → Janus) resampler, framer and encoder.
 
-    def janus_to_gemini(self, opus_data: bytes) -> Optional[bytes]:
+        Call on interruption so stale filter history, the pending partial
+        frame and the encoder's prediction state are not played out.
+        """
+        self._outbound_resampler.reset()
+        self._outbound_framer.clear()
+        if self._opus_encoder:
+            try:
+                self._opus_encoder.reset_state()
+            except Exception as e:
+                logger.warning(f"Opus encoder reset failed: {e}")
+
+    def reset_streams(self) -> None:
+        """Reset both resampler streams (e.g., Gemini session restart)."""
+        self.reset_inbound()
+        self.reset_outbound()
+
+    def janus_to_gemini(
+        self,
+        opus_data: bytes,
+        lost: int = 0,
+        ssrc: int = 0,
+    ) -> Optional[bytes]:
         """Convert Janus audio to Gemini input format.
 
         Complete pipeline: Opus 48kHz → PCM16 16kHz
+        (native-rate mode decodes directly at 16kHz, no resampling)
 
         Args:
             opus_data: Opus encoded audio from Janus RTP
+            lost: Frames missing immediately before this packet; recovered
+                  via FEC/PLC and prepended to the output
+            ssrc: RTP source (each gets its own decoder and resampler)
 
         Returns:
             PCM16 bytes at 16kHz suitable for Gemini, or None on error
         """
-        # Step 1: Decode Opus to PCM at 48kHz
-        pcm_samples = self.decode_opus(opus_data)
+        # Step 0: Rebuild lost frames first (decoder state must see them in order)
+        recovered = self.recover_lost(lost, opus_data, ssrc) if lost > 0 else None
+
+        # Step 1: Decode Opus to PCM at decoder_rate
+        pcm_samples = self.decode_opus(opus_data, ssrc)
         if pcm_samples is None or len(pcm_samples) == 0:
-            return None
+            if recovered is None:
+                return None
+            pcm_samples = recovered
+        elif recovered is not None:
+            pcm_samples = np.concatenate((recovered, pcm_samples))
 
-        # Step 2: Resample from 48kHz to 16kHz
-        resampled = self.resample(
-            pcm_samples,
-            self.janus_sample_rate,
-            self.gemini_input_rate,
-        )
+        # Step 2: Resample to 16kHz (stateful stream; pass-through if native)
+        resampled = self._inbound(ssrc).resampler.process(pcm_samples)
 
         # Step 3: Convert to bytes (PCM16, little-endian)
-        return resampled.astype(np.int16).tobytes()
+        # May be empty while the resampler filter fills - not an error
+        return resampled.astype(np.int16, copy=False).tobytes()
 
     def gemini_to_janus(self, pcm_data: bytes) -> List[bytes]:
         """Convert Gemini output to Janus audio format.
 
         Complete pipeline: PCM16 24kHz → Opus 48kHz
+        (native-rate mode encodes the 24kHz PCM directly, no resampling)
+
+        Only complete 20ms frames are encoded; the partial remainder is
+        carried into the next chunk. Call flush_outbound() at turn end.
 
         Args:
             pcm_data: PCM16 bytes from Gemini at 24kHz
 
         Returns:
             List of Opus encoded frames (20ms each) for Janus RTP,
-            or empty list on error
+            or empty list on error / while less than a frame is buffered
         """
         if not pcm_data:
             return []
@@ -342,38 +794,45 @@ class AudioProcessor:
             if len(pcm_samples) == 0:
                 return []
 
-            # Step 2: Resample from 24kHz to 48kHz
-            resampled = self.resample(
-                pcm_samples,
-                self.gemini_output_rate,
-                self.janus_sample_rate,
-            )
-
-            # Step 3: Split into 20ms frames (960 samples at 48kHz)
-            frames: List[bytes] = []
+            # Step 2: Resample to encoder_rate (stateful stream; pass-through if native)
+            resampled = self._outbound_resampler.process(pcm_samples)
 
-            for i in range(0, len(resampled), self.opus_frame_size):
-                frame_samples = resampled[i : i + self.opus_frame_size]
+            # Step 3: Frame across chunk boundaries and encode full frames
+            return self._encode_frames(self._outbound_framer.push(resampled))
 
-                # Pad last frame if needed
-                if len(frame_samples) < self.opus_frame_size:
-                    frame_samples = np.pad(
-                        frame_samples,
-                        (0, self.opus_frame_size - len(frame_samples)),
-                        mode='constant'
-                    )
+        except Exception as e:
+            logger.error(f"gemini_to_janus conversion error: {e}")
+            return []
 
-                # Encode to Opus
-                opus_frame = self.encode_opus(frame_samples.astype(np.int16))
-                if opus_frame:
-                    frames.append(opus_frame)
+    def flush_outbound(self) -> List[bytes]:
+        """Encode everything still buffered at the end of a turn.
 
-            return frames
+        Drains the resampler tail and emits the last partial frame
+        zero-padded. Leaves the outbound stream ready for the next turn.
 
+        Returns:
+            Final Opus frames (usually zero or one)
+        """
+        try:
+            frames = self._outbound_framer.push(self._outbound_resampler.flush())
+            last = self._outbound_framer.flush()
+            if last is not None:
+                frames.append(last)
+            return self._encode_frames(frames)
         except Exception as e:
-            logger.error(f"gemini_to_janus conversion error: {e}")
+            logger.error(f"flush_outbound error: {e}")
+            self._outbound_framer.clear()
             return []
 
+    def _encode_frames(self, frames: List[np.ndarray]) -> List[bytes]:
+        """Encode PCM frames to Opus, skipping failed encodes."""
+        encoded: List[bytes] = []
+        for frame_samples in frames:
+            opus_frame = self.encode_opus(frame_samples)
+            if opus_frame:
+                encoded.append(opus_frame)
+        return encoded
+
     def pcm16_to_float32(self, pcm_data: bytes) -> np.ndarray:
         """Convert PCM16 bytes to float32 array (-1.0 to 1.0).
 
@@ -411,10 +870,24 @@ class AudioProcessor:
             "encode_count": self._encode_count,
             "decode_errors": self._decode_errors,
             "encode_errors": self._encode_errors,
+            "fec_recovered_frames": self._fec_recovered,
+            "plc_concealed_frames": self._plc_concealed,
+            "unrecovered_lost_frames": self._loss_unrecovered,
+            "inbound_sources": len(self._inbound_streams) - 1,
             "opus_available": HAS_OPUS,
             "soxr_available": HAS_SOXR,
             "scipy_available": HAS_SCIPY,
             "resampler": "soxr" if HAS_SOXR else ("scipy" if HAS_SCIPY else "linear"),
+            "native_rate": self.native_rate,
+            "decoder_rate": self.decoder_rate,
+            "encoder_rate": self.encoder_rate,
+            "streaming_resampler": self._inbound_resampler.is_streaming,
+            "resampler_resets": {
+                "inbound": self._inbound_resampler.resets,
+                "outbound": self._outbound_resampler.resets,
+            },
+            "outbound_frames_padded": self._outbound_framer.frames_padded,
+            "outbound_pending_samples": self._outbound_framer.pending,
             "is_ready": self.is_ready,
         }
 
@@ -440,6 +913,7 @@ class SimpleAudioProcessor:
         self.gemini_input_rate = self.config.gemini_input_rate
         self.gemini_output_rate = self.config.gemini_output_rate
         self.opus_frame_size = self.config.janus_frame_samples
+        self._outbound_framer = PCMFramer(self.opus_frame_size)
 
         logger.warning(
             "SimpleAudioProcessor initialized - "
@@ -458,39 +932,32 @@ class SimpleAudioProcessor:
         to_rate: int,
     ) -> np.ndarray:
         """Resample audio using best available method."""
-        if from_rate == to_rate:
-            return samples
+        return resample_oneshot(samples, from_rate, to_rate)
 
-        duration = len(samples) / from_rate
-        new_length = int(duration * to_rate)
+    def reset_inbound(self) -> None:
+        """No streaming state to reset."""
 
-        if new_length == 0:
-            return np.array([], dtype=samples.dtype)
+    def remove_inbound(self, ssrc: int) -> None:
+        """No per-source state to free."""
 
-        if HAS_SOXR:
-            resampled = soxr.resample(
-                samples.astype(np.float64),
-                from_rate,
-                to_rate,
-                quality='HQ'
-            )
-        elif HAS_SCIPY:
-            resampled = signal.resample(samples.astype(np.float64), new_length)
-        else:
-            x_old = np.linspace(0, 1, len(samples))
-            x_new = np.linspace(0, 1, new_length)
-            resampled = np.interp(x_new, x_old, samples.astype(np.float64))
+    def reset_outbound(self) -> None:
+        """Discard the pending partial frame."""
+        self._outbound_framer.clear()
 
-        if samples.dtype == np.int16:
-            resampled = np.clip(resampled, -32768, 32767)
-            return resampled.astype(np.int16)
+    def reset_streams(self) -> None:
+        """Discard the pending partial frame."""
+        self.reset_outbound()
 
-        return resampled.astype(samples.dtype)
-
-    def janus_to_gemini(self, audio_data: bytes) -> Optional[bytes]:
+    def janus_to_gemini(
+        self,
+        audio_data: bytes,
+        lost: int = 0,
+        ssrc: int = 0,
+    ) -> Optional[bytes]:
         """Convert audio treating input as raw PCM (not Opus).
 
         WARNING: This won't work with real Janus traffic (which is Opus).
+        Lost frames are not concealed (no decoder).
         """
         try:
             samples = np.frombuffer(audio_data, dtype=np.int16)
@@ -523,23 +990,18 @@ class SimpleAudioProcessor:
                 self.janus_sample_rate,
             )
 
-            # Split into 20ms chunks
-            frames = []
-            for i in range(0, len(resampled), self.opus_frame_size):
-                frame = resampled[i : i + self.opus_frame_size]
-                if len(frame) < self.opus_frame_size:
-                    frame = np.pad(
-                        frame,
-                        (0, self.opus_frame_size - len(frame)),
-                        mode='constant'
-                    )
-                frames.append(frame.astype(np.int16).tobytes())
-
-            return frames
+            # Split into 20ms chunks (remainder carried to the next call)
+            frames = self._outbound_framer.push(resampled.astype(np.int16))
+            return [frame.tobytes() for frame in frames]
         except Exception as e:
             logger.error(f"SimpleAudioProcessor error: {e}")
             return []
 
+    def flush_outbound(self) -> List[bytes]:
+        """Emit the pending partial frame zero-padded."""
+        last = self._outbound_framer.flush()
+        return [last.tobytes()] if last is not None else []
+
     def get_stats(self) -> dict:
         """Get processor statistics."""
         return {
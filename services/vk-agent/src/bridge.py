@@ -19,7 +19,7 @@ Architecture:
     │           ▼                                                      ▼          │
     │  ┌─────────────────┐                                    ┌───────────────┐  │
     │  │  RTPReceiver    │                                    │ Audio Output  │  │
-    │  │  (UDP In)       │────► Jitter Buffer ────►           │ (24kHz PCM)   │  │
+    │  │  (UDP In)       │────► Jitter Buffer (timed) ──►     │ (24kHz PCM)   │  │
     │  └─────────────────┘      Decode Opus                   └───────────────┘  │
     │           │               Resample 48k→16k                      │          │
     │           │                    │                                │          │
@@ -31,14 +31,30 @@ Architecture:
     │           │                                                     │          │
     │           ▼                                               Resample 24k→48k │
     │  ┌─────────────────┐                                    Encode Opus        │
-    │  │  RTPSender      │◄──── 20ms Opus frames ◄────────────────────┘          │
+    │  │  RTPSender      │◄── PlayoutScheduler (t0 + n*20ms) ◄────────┘          │
     │  │  (UDP Out)      │                                                       │
     │  └─────────────────┘                                                       │
     │                                                                             │
     │  Feedback Prevention:                                                       │
-    │    - While Gemini is speaking, discard incoming audio                       │
+    │    - While Gemini is speaking, discard incoming audio (or, with             │
+    │      VK_AGENT_BARGE_IN, hold it and cut playout on sustained speech)        │
     │    - On interruption, clear outgoing buffer                                 │
     │                                                                             │
+    │  Turn Detection (VK_AGENT_TURN_DETECTION):                                  │
+    │    - server: Gemini endpointing on the VAD-filtered stream                  │
+    │    - client: local VAD segments send activityStart / activityEnd            │
+    │                                                                             │
+    │  Gemini Recovery:                                                           │
+    │    - Dropped socket / goAway: reconnect at once with the resumption handle  │
+    │      (backoff only on repeated failure), conversation context kept          │
+    │    - User audio during the gap is buffered (bounded) and replayed           │
+    │                                                                             │
+    │  Call Start:                                                                │
+    │    - Gemini session taken warm from GeminiSessionPool when one is shared    │
+    │    - Cached greeting Opus frames played straight to playout on join; the    │
+    │      name follow-up goes to Gemini once it is ready (miss: the live         │
+    │      greeting turn is captured into the GreetingCache)                      │
+    │                                                                             │
     └────────────────────────────────────────────────────────────────────────────┘
 
 Usage:
@@ -56,23 +72,50 @@ Usage:
 import asyncio
 import logging
 import os
+import time
 import wave
-from collections import deque
 from datetime import datetime, timezone
-from typing import Optional, Deque
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Set, Tuple
 
 from .config import Settings, get_settings
-from .models import AgentState, BridgeStats, RTPPacket, Participant
+from .models import AgentState, BridgeStats, RTPPacketView, Participant
 from .audio_processor import get_audio_processor, AudioProcessor
-from .rtp_handler import RTPReceiver, RTPSender, RTPJitterBuffer
+from .rtp_handler import RTPReceiver, RTPSender, RTPJitterBuffer, RTPStreamDemuxer
+from .mixer import AudioMixer
+from .playout import PlayoutScheduler
+from .queues import BoundedQueue, QueuePolicy
+from .rtcp import RTCPSession
+from .dsp_executor import DSPExecutor
 from .janus_client import JanusClient
 from .gemini_client import GeminiLiveClient
+from .gemini_pool import GeminiSessionPool
+from .greeting_cache import GreetingCache, GreetingCapture
 from .videoroom_client import VideoRoomClient, VideoRoomConfig, Publisher
 from .video_processor import VideoProcessor, VideoRTPReceiver
 from .vad import VoiceActivityDetector  # Phase 1: Silero VAD
+from .speech_gate import BargeInDetector, SpeechGate, SpeechSegmenter
 
 logger = logging.getLogger(__name__)
 
+# Base for per-publisher forward SSRCs ("VK" in the top 16 bits)
+FORWARD_SSRC_BASE = 0x564B0000
+
+# Greeting: how long to wait for a warming Gemini session / the greeting turn
+GREETING_READY_TIMEOUT = 10.0
+GREETING_CAPTURE_TIMEOUT = 15.0
+
+# Personalization after the cached (name-free) greeting
+GREETING_FOLLOW_UP = (
+    "The user who just joined is named {name}. They have already heard your "
+    "greeting; welcome them by name in one short sentence without "
+    "introducing yourself again."
+)
+
+# Gemini reconnect backoff after the first (immediate) attempt fails
+GEMINI_RECONNECT_BASE_DELAY = 0.5
+GEMINI_RECONNECT_MAX_DELAY = 10.0
+
 
 class AgentBridge:
     """Main bridge orchestrator for Janus-Gemini voice AI.
@@ -82,7 +125,8 @@ class AgentBridge:
     - GeminiClient: WebSocket connection to Gemini Live API
     - AudioProcessor: Opus codec and sample rate conversion
     - RTPReceiver/Sender: UDP audio transport
-    - JitterBuffer: Packet reordering
+    - RTPStreamDemuxer: Per-SSRC jitter buffers (one per forwarded publisher)
+    - AudioMixer: Sums decoded publishers into one Gemini stream
 
     Features:
     - Sub-500ms latency (Gemini Live API)
@@ -97,13 +141,36 @@ class AgentBridge:
         ...     await bridge.run_until_stopped()
     """
 
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        dsp: Optional[DSPExecutor] = None,
+        gemini_pool: Optional[GeminiSessionPool] = None,
+        greeting_cache: Optional[GreetingCache] = None,
+    ):
         """Initialize the bridge.
 
         Args:
             settings: Configuration settings (uses defaults if not provided)
+            dsp: Shared DSP executor (default: inline on the event loop)
+            gemini_pool: Shared warm session pool (default: connect on start)
+            greeting_cache: Shared greeting cache (default: own one if enabled)
         """
         self.settings = settings or get_settings()
+        # Opus/resample/VAD jobs (thread pool shared across rooms, or inline)
+        self._dsp = dsp or DSPExecutor(workers=0)
+        self._gemini_pool = gemini_pool
+        if greeting_cache is None and self.settings.gemini.greeting_cache:
+            greeting_cache = GreetingCache(
+                self.settings.gemini.greeting_cache_dir,
+                max_entries=self.settings.gemini.greeting_cache_size,
+                frame_duration_ms=self.settings.audio.frame_duration_ms,
+            )
+        self._greeting_cache = greeting_cache
+        # Gemini greeting turn being recorded into the cache (cache miss)
+        self._greeting_capture: Optional[GreetingCapture] = None
+        # Janus participant IDs already greeted (greet each join once)
+        self._greeted: Set[int] = set()
 
         # Components
         self.janus_client: Optional[JanusClient] = None
@@ -111,7 +178,24 @@ class AgentBridge:
         self.audio_processor: Optional[AudioProcessor] = None
         self.rtp_receiver: Optional[RTPReceiver] = None
         self.rtp_sender: Optional[RTPSender] = None
-        self._jitter_buffer = RTPJitterBuffer()
+        # One adaptive jitter buffer per inbound SSRC (publisher forward)
+        self._rtp_streams = RTPStreamDemuxer(self._new_jitter_buffer)
+        self._mixer = AudioMixer(
+            sample_rate=self.settings.audio.gemini_input_rate,
+            frame_duration_ms=self.settings.audio.frame_duration_ms,
+        )
+        # Idle SSRCs whose decoder/mixer state the next decode job frees
+        self._reaped_ssrcs: List[int] = []
+        # Codec state resets requested by the loop (e.g. Gemini reconnect),
+        # applied by the loop that owns the state, never concurrently
+        self._inbound_reset_pending = False
+        self._outbound_reset_pending = False
+        self._jitter_timer: Optional[asyncio.TimerHandle] = None
+        self._jitter_timer_at = 0.0
+        # RTCP on the audio/video RTP sockets (RTT, jitter, loss; NACK/PLI)
+        self.audio_rtcp: Optional[RTCPSession] = None
+        self.video_rtcp: Optional[RTCPSession] = None
+        self._rtcp_tasks: list = []
 
         # Video components
         self.videoroom_client: Optional[VideoRoomClient] = None
@@ -125,12 +209,63 @@ class AgentBridge:
             threshold=0.5,           # Standard threshold (normalized audio works now)
             sample_rate=16000,       # Gemini input rate
             min_speech_duration_ms=100,  # Reasonable response time
-            min_silence_duration_ms=200,
+            # Hysteresis silence = hangover kept open after speech ends
+            min_silence_duration_ms=self.settings.audio.vad_hangover_ms,
+            backend=self.settings.audio.vad_backend,  # ONNX (no torch) when available
+        )
+        # Janus talking events + energy floor decide before Silero runs
+        self._speech_gate = SpeechGate(
+            self._vad,
+            talking=self._janus_talking,
+            use_janus=self.settings.audio.vad_gate_janus,
+            min_rms=self.settings.audio.vad_min_rms,
+        )
+        # Pre-roll + hangover so gating does not clip onsets and endings
+        self._segmenter = SpeechSegmenter(
+            self._speech_gate,
+            preroll_ms=self.settings.audio.vad_preroll_ms,
+        )
+        # Full-duplex: keep listening while the agent speaks
+        self._barge_in: Optional[BargeInDetector] = (
+            BargeInDetector(self.settings.audio.barge_in_min_speech_ms)
+            if self.settings.audio.barge_in else None
+        )
+        # Set on barge-in: drop the rest of the interrupted Gemini turn
+        self._suppress_gemini_audio = False
+
+        # Stage queues (bounded, with overflow policy + stats; see queues.py)
+        # Inbound entries are (ssrc, opus_payload, frames_lost_before_it);
+        # produced by the jitter timer, so they must never block
+        self._incoming_audio: BoundedQueue[Tuple[int, bytes, int]] = BoundedQueue(
+            "audio_in", maxsize=100, policy=QueuePolicy.DROP_OLDEST
         )
+        # Outbound entries are (playout generation, pcm); pcm None marks end
+        # of turn (flush the framer). Produced by the Gemini receive loop,
+        # which must never block (interrupted/goAway arrive behind the
+        # audio); the playback loop moves chunks on to the playout buffer
+        # (bounded by playout_buffer_ms) as fast as it encodes them. Sized
+        # to hold that buffer's worth of chunks as short as one frame.
+        self._outgoing_audio: BoundedQueue[Tuple[int, Optional[bytes]]] = BoundedQueue(
+            "audio_out",
+            maxsize=max(100, self.settings.audio.playout_buffer_ms
+                        // self.settings.audio.frame_duration_ms),
+            policy=QueuePolicy.DROP_OLDEST,
+        )
+        # Screen-share frames for Gemini: only the newest one matters
+        self._video_frames: BoundedQueue[bytes] = BoundedQueue(
+            "video_out", policy=QueuePolicy.LATEST
+        )
+        self._video_task: Optional[asyncio.Task] = None
 
-        # Audio buffers
-        self._incoming_audio: Deque[bytes] = deque(maxlen=100)
-        self._outgoing_audio: Deque[bytes] = deque(maxlen=100)
+        # Isochronous outbound pacing (monotonic deadlines, bounded buffer)
+        self._playout = PlayoutScheduler(
+            send=self._send_rtp_frame,
+            frame_duration_ms=self.settings.audio.frame_duration_ms,
+            max_buffer_ms=self.settings.audio.playout_buffer_ms,
+        )
+
+        # Janus participant ID -> SSRC of its RTP forward
+        self._forwarded_participants: Dict[int, int] = {}
 
         # State
         self.stats = BridgeStats()
@@ -138,9 +273,24 @@ class AgentBridge:
         self._gemini_speaking = False
         self._stop_event = asyncio.Event()
 
+        # Turn detection: local VAD segments -> activityStart/End (client mode)
+        self._client_turns = self.settings.gemini.client_turn_detection
+        self._activity_open = False
+        # Monotonic time of the last chunk the VAD judged speech (TTFA start)
+        self._last_user_speech_at: Optional[float] = None
+        # Participant join awaiting its greeting's first audio (monotonic)
+        self._joined_at: Optional[float] = None
+
+        # Gemini reconnection: user audio (None = activityEnd) held for replay
+        self._gemini_recovering = False
+        self._gemini_recovery_task: Optional[asyncio.Task] = None
+        self._resume_buffer: Deque[Optional[bytes]] = deque()
+        self._resume_buffer_ms = 0.0
+
         # Background tasks
         self._forward_task: Optional[asyncio.Task] = None
         self._playback_task: Optional[asyncio.Task] = None
+        self._playout_task: Optional[asyncio.Task] = None
 
         # Debug audio files
         self._debug_wav_in: Optional[wave.Wave_write] = None
@@ -148,6 +298,17 @@ class AgentBridge:
 
         logger.info("AgentBridge initialized")
 
+    def _new_jitter_buffer(self) -> RTPJitterBuffer:
+        """Create a jitter buffer for a new inbound SSRC.
+
+        Adaptive delay between one frame and jitter_buffer_ms (RFC 3550 jitter).
+        """
+        return RTPJitterBuffer(
+            min_delay_ms=self.settings.audio.jitter_min_delay_ms,
+            max_delay_ms=self.settings.audio.jitter_buffer_ms,
+            clock_rate=self.settings.audio.janus_sample_rate,
+        )
+
     @property
     def state(self) -> AgentState:
         """Get current agent state."""
@@ -244,6 +405,9 @@ class AgentBridge:
             port=rtp_target[1],
             ssrc=ssrc,
             payload_type=111,  # Opus
+            # RTP clock stays 48kHz even when the encoder runs at 24kHz native rate
+            sample_rate=self.settings.audio.janus_sample_rate,
+            frame_duration_ms=self.settings.audio.frame_duration_ms,
         )
         # IMPORTANT: Share the receiver's transport so we send FROM port 5004
         # Janus plain RTP requires packets to come FROM the registered address
@@ -260,18 +424,36 @@ class AgentBridge:
                 self.stats.state = AgentState.ERROR
                 return False
 
-        # Initialize Gemini client
-        self.gemini_client = GeminiLiveClient(self.settings.gemini)
-        self.gemini_client.on_audio = self._on_gemini_audio
-        self.gemini_client.on_text = self._on_gemini_text
-        self.gemini_client.on_setup_complete = self._on_gemini_ready
-        self.gemini_client.on_turn_complete = self._on_gemini_turn_complete
-        self.gemini_client.on_interrupted = self._on_gemini_interrupted
-        self.gemini_client.on_error = self._on_gemini_error
+        if self.settings.janus.rtcp:
+            # Reports on the forwarded streams + SR for ours, muxed on the RTP
+            # port. No NACK: Janus RTP forwarders never retransmit, and the
+            # jitter buffer releases long before a resend could arrive (Opus
+            # FEC/PLC covers loss). NACKs Janus sends us are only counted, as
+            # the sender keeps no retransmit history.
+            self.audio_rtcp = RTCPSession(
+                ssrc=ssrc,
+                clock_rate=self.settings.audio.janus_sample_rate,
+                send=self.rtp_receiver.send_to,
+                cname=f"vk-agent-{self.settings.janus.room_id}",
+                nack=False,
+            )
+            self.audio_rtcp.peer = rtp_target
+            self.rtp_receiver.rtcp = self.audio_rtcp
+            self.rtp_sender.rtcp = self.audio_rtcp
 
-        # Connect to Gemini
+        # Gemini session: a warm one from the shared pool, or connect now
         logger.info("Connecting to Gemini Live API...")
-        if not await self.gemini_client.connect():
+        if self._gemini_pool:
+            self.gemini_client = await self._gemini_pool.acquire(self.settings.gemini)
+            connected = self.gemini_client is not None
+            if connected:
+                self._wire_gemini(self.gemini_client)
+        else:
+            self.gemini_client = GeminiLiveClient(self.settings.gemini)
+            self._wire_gemini(self.gemini_client)
+            connected = await self.gemini_client.connect()
+
+        if not connected:
             logger.error("Failed to connect to Gemini")
             await self.rtp_sender.stop()
             await self.rtp_receiver.stop()
@@ -294,6 +476,12 @@ class AgentBridge:
         self._stop_event.clear()
         self._forward_task = asyncio.create_task(self._audio_forward_loop())
         self._playback_task = asyncio.create_task(self._audio_playback_loop())
+        self._playout_task = asyncio.create_task(self._playout.run())
+        self._video_task = asyncio.create_task(self._video_forward_loop())
+        self._rtcp_tasks = [
+            asyncio.create_task(rtcp.run())
+            for rtcp in (self.audio_rtcp, self.video_rtcp) if rtcp
+        ]
 
         self.stats.state = AgentState.READY
         logger.info("AgentBridge started successfully!")
@@ -327,6 +515,16 @@ class AgentBridge:
         await self.video_rtp_receiver.start()
         logger.info(f"Video RTP receiver started on port {video_port}")
 
+        if self.settings.janus.rtcp:
+            # Receive-only leg: our SSRC only appears in RR/NACK/PLI
+            self.video_rtcp = RTCPSession(
+                ssrc=(self.rtp_sender.ssrc + 1) & 0xFFFFFFFF if self.rtp_sender else 1,
+                clock_rate=90000,
+                send=self.video_rtp_receiver.send_to,
+                cname=f"vk-agent-{self.settings.janus.room_id}",
+            )
+            self.video_rtp_receiver.rtcp = self.video_rtcp
+
         # Initialize VideoRoom client
         videoroom_config = VideoRoomConfig(
             ws_url=self.settings.janus.websocket_url,
@@ -334,6 +532,7 @@ class AgentBridge:
             display_name=f"{self.settings.janus.display_name}-video",
             rtp_video_port=video_port,
             rtp_video_host=self.settings.janus.rtp_host,
+            rtcp=self.settings.janus.rtcp,
         )
 
         self.videoroom_client = VideoRoomClient(videoroom_config)
@@ -356,9 +555,18 @@ class AgentBridge:
         """
         logger.debug(f"Video frame received: {len(jpeg_bytes)} bytes")
 
-        # Send to Gemini as image input
+        # Send to Gemini as image input; a frame not yet sent is replaced
         if self.gemini_client and self.gemini_client.is_ready:
-            asyncio.create_task(self._send_video_to_gemini(jpeg_bytes))
+            self._video_frames.put_nowait(jpeg_bytes)
+
+    async def _video_forward_loop(self) -> None:
+        """Send the newest queued video frame to Gemini, one at a time."""
+        while self._running:
+            try:
+                jpeg_bytes = await self._video_frames.get()
+                await self._send_video_to_gemini(jpeg_bytes)
+            except asyncio.CancelledError:
+                break
 
     async def _send_video_to_gemini(self, jpeg_bytes: bytes) -> None:
         """Send video frame to Gemini."""
@@ -398,8 +606,12 @@ class AgentBridge:
         """Request a keyframe from the video publisher.
 
         Called by video processor when it needs a fresh keyframe
-        (e.g., after starting or after decode errors).
+        (e.g., after starting or after decode errors). Sends an RTCP PLI
+        when the forwarder's RTCP address is known; otherwise falls back to
+        restarting the forward over the Janus WebSocket.
         """
+        if self.video_rtcp and self.video_rtcp.request_keyframe():
+            return
         if self.videoroom_client and self.videoroom_client.subscribed_feed:
             # Run async request in background
             asyncio.create_task(self._request_keyframe_async())
@@ -454,6 +666,10 @@ class AgentBridge:
         self._running = False
         self._stop_event.set()
 
+        if self._jitter_timer is not None:
+            self._jitter_timer.cancel()
+            self._jitter_timer = None
+
         # Cancel background tasks
         if self._forward_task:
             self._forward_task.cancel()
@@ -469,6 +685,21 @@ class AgentBridge:
             except asyncio.CancelledError:
                 pass
 
+        self._playout.stop()
+        if self._playout_task:
+            self._playout_task.cancel()
+            try:
+                await self._playout_task
+            except asyncio.CancelledError:
+                pass
+
+        if self._video_task:
+            self._video_task.cancel()
+            try:
+                await self._video_task
+            except asyncio.CancelledError:
+                pass
+
         if self._keyframe_task:
             self._keyframe_task.cancel()
             try:
@@ -476,6 +707,21 @@ class AgentBridge:
             except asyncio.CancelledError:
                 pass
 
+        # BYE on both RTP legs while the sockets are still open
+        for task in self._rtcp_tasks:
+            task.cancel()
+        for rtcp in (self.audio_rtcp, self.video_rtcp):
+            if rtcp:
+                rtcp.stop()
+        self._rtcp_tasks = []
+
+        if self._gemini_recovery_task:
+            self._gemini_recovery_task.cancel()
+            try:
+                await self._gemini_recovery_task
+            except asyncio.CancelledError:
+                pass
+
         # Stop components in reverse order
         if self.gemini_client:
             await self.gemini_client.disconnect()
@@ -556,6 +802,10 @@ class AgentBridge:
         logger.info(f"Joined Janus room: participant_id={data.get('participant_id')}")
         self.stats.participants_seen = len(data.get("participants", []))
 
+    def _janus_talking(self) -> Optional[bool]:
+        """AudioBridge talking state for the speech gate (None if unknown)."""
+        return self.janus_client.any_talking if self.janus_client else None
+
     def _on_participants_changed(self, participants: list[Participant]) -> None:
         """Called when participants join/leave."""
         self.stats.participants_seen = len(participants)
@@ -563,43 +813,185 @@ class AgentBridge:
         logger.info(f"Participants: {names}")
 
         # Set up RTP forwarding for new participants (to receive their audio)
+        forwarding = None
         if participants and self.janus_client:
-            asyncio.create_task(self._setup_rtp_forwarding(participants))
-
-        # Send greeting for new participants
-        if participants and self.gemini_client and self.gemini_client.is_ready:
-            asyncio.create_task(self._send_greeting(participants[-1].display))
+            forwarding = asyncio.create_task(self._setup_rtp_forwarding(participants))
+
+        # Greet newly joined participants (a cached greeting needs no Gemini
+        # yet); updates and leaves re-send the list and must not re-greet
+        self._greeted &= {p.id for p in participants}
+        joined = [p for p in participants if p.id not in self._greeted]
+        gemini_ready = self.gemini_client is not None and self.gemini_client.is_ready
+        if joined and (gemini_ready or self._greeting_cache):
+            self._greeted.update(p.id for p in joined)
+            self._joined_at = time.monotonic()
+            asyncio.create_task(self._send_greeting(joined[-1].display, forwarding))
 
     async def _setup_rtp_forwarding(self, participants: list[Participant]) -> None:
         """Set up RTP forwarding for WebRTC participants to receive their audio."""
         for p in participants:
             # Skip if we already set up forwarding for this participant
-            if hasattr(self, '_forwarded_participants') and p.id in self._forwarded_participants:
+            if p.id in self._forwarded_participants:
                 continue
 
-            if not hasattr(self, '_forwarded_participants'):
-                self._forwarded_participants = set()
-
-            logger.info(f"Setting up RTP forwarding for participant {p.id} ({p.display})")
+            # Distinct SSRC per forward so the receiver can demux publishers
+            ssrc = self._forward_ssrc()
+            logger.info(
+                f"Setting up RTP forwarding for participant {p.id} ({p.display}), ssrc={ssrc}"
+            )
             try:
                 await self.janus_client.configure_rtp_forwarding(
                     forward_host=self.settings.janus.rtp_host,
                     forward_port=self.settings.janus.rtp_port,
-                    publisher_id=p.id
+                    publisher_id=p.id,
+                    ssrc=ssrc,
                 )
-                self._forwarded_participants.add(p.id)
+                self._forwarded_participants[p.id] = ssrc
                 logger.info(f"RTP forwarding set up for {p.display}")
             except Exception as e:
                 logger.error(f"Failed to set up RTP forwarding for {p.display}: {e}")
 
-    async def _send_greeting(self, participant_name: str) -> None:
-        """Send a greeting when new participant joins."""
-        await asyncio.sleep(1.5)  # Brief delay for RTP setup
-        if self.gemini_client and self.gemini_client.is_ready:
-            logger.info(f"Sending greeting for: {participant_name}")
-            await self.gemini_client.send_text(
-                f"A user named {participant_name} just joined the call. Greet them warmly and briefly introduce yourself as Jimmy."
-            )
+    def _forward_ssrc(self) -> int:
+        """Pick an SSRC for a new forward (unique on this room's port, != our sender's)."""
+        used = set(self._forwarded_participants.values())
+        if self.rtp_sender:
+            used.add(self.rtp_sender.ssrc)
+        ssrc = FORWARD_SSRC_BASE
+        while ssrc in used:
+            ssrc += 1
+        return ssrc
+
+    async def _send_greeting(
+        self,
+        participant_name: str,
+        forwarding: Optional[asyncio.Task] = None,
+    ) -> None:
+        """Send a greeting when new participant joins.
+
+        With the greeting cache, the name-free greeting is played from
+        cached Opus frames at once (or generated and captured on a miss),
+        and the name is a short Gemini follow-up.
+
+        Args:
+            participant_name: Display name to greet
+            forwarding: RTP forward setup to finish first (replaces a fixed delay)
+        """
+        if not self._greeting_cache:
+            if forwarding:
+                await asyncio.wait([forwarding])
+            if self.gemini_client and self.gemini_client.is_ready:
+                logger.info(f"Sending greeting for: {participant_name}")
+                await self.gemini_client.send_text(
+                    f"A user named {participant_name} just joined the call. Greet them warmly and briefly introduce yourself as Jimmy."
+                )
+            return
+
+        key = self._greeting_key()
+        generation = self._playout.generation
+        frames = None
+        if self._gemini_speaking or self._playout.buffered_frames or self._playout.is_playing:
+            # Don't talk over the current answer: Gemini fits the greeting
+            # in as its next turn instead
+            logger.info("Agent is speaking; greeting through Gemini, not the cache")
+        else:
+            frames = await self._dsp.run(self._greeting_cache.get, key)
+        if frames:
+            if not self._play_cached_greeting(frames, generation):
+                return
+        elif not await self._generate_greeting(key, forwarding):
+            return
+
+        if await self._wait_gemini_ready(GREETING_READY_TIMEOUT):
+            logger.info(f"Sending greeting follow-up for: {participant_name}")
+            await self.gemini_client.send_text(GREETING_FOLLOW_UP.format(name=participant_name))
+
+    def _greeting_key(self) -> str:
+        """Greeting cache key for this bridge's voice, persona and template."""
+        gemini = self.settings.gemini
+        return GreetingCache.key(
+            gemini.voice,
+            gemini.system_instruction or "",
+            gemini.greeting_template,
+            self.settings.audio.frame_duration_ms,
+            self.settings.audio.opus_bitrate,
+        )
+
+    def _play_cached_greeting(self, frames: list, generation: int) -> bool:
+        """Queue cached greeting frames straight to playout.
+
+        The greeting counts as agent speech (echo handling, barge-in) until
+        it has played out, so the user can cut it like a Gemini turn.
+
+        Args:
+            frames: Cached Opus frames
+            generation: Playout generation before the cache read
+
+        Returns:
+            False if playout was cut meanwhile (nothing queued)
+        """
+        if not self._playout.enqueue(frames, generation):
+            return False
+        logger.info(f"Playing cached greeting ({len(frames)} frames)")
+        self._playout.end_of_turn()
+        self._gemini_speaking = True
+        asyncio.get_running_loop().call_later(
+            len(frames) * self._playout.frame_duration, self._end_cached_greeting, generation
+        )
+        self.stats.greetings_cached += 1
+        if self._joined_at is not None:
+            self.stats.join_to_audio.add((time.monotonic() - self._joined_at) * 1000)
+            self._joined_at = None
+        return True
+
+    def _end_cached_greeting(self, generation: int) -> None:
+        """Cached greeting played out: stop treating it as agent speech."""
+        gemini_turn = self.gemini_client is not None and self.gemini_client.session.is_speaking
+        if generation == self._playout.generation and not gemini_turn:
+            self._gemini_speaking = False
+
+    async def _generate_greeting(self, key: str, forwarding: Optional[asyncio.Task]) -> bool:
+        """Ask Gemini for the name-free greeting and capture it into the cache.
+
+        Returns:
+            True if the greeting turn played to completion
+        """
+        if forwarding:
+            await asyncio.wait([forwarding])
+        if not await self._wait_gemini_ready(GREETING_READY_TIMEOUT):
+            return False
+
+        capture = GreetingCapture(key=key, generation=self._playout.generation)
+        # Only record a clean turn (nothing else playing in this generation)
+        if not self._gemini_speaking:
+            self._greeting_capture = capture
+        logger.info("Generating greeting (not cached yet)")
+        await self.gemini_client.send_text(self.settings.gemini.greeting_template)
+        self.stats.greetings_generated += 1
+        if self._greeting_capture is not capture:
+            return True
+
+        try:
+            await asyncio.wait_for(capture.done.wait(), GREETING_CAPTURE_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Greeting turn did not complete; not cached")
+        finally:
+            if self._greeting_capture is capture:
+                self._greeting_capture = None
+
+        if capture.complete:
+            await self._dsp.run(self._greeting_cache.put, key, capture.frames)
+        return capture.complete
+
+    async def _wait_gemini_ready(self, timeout: float) -> bool:
+        """Wait for a Gemini session that is still connecting (start/pool/reconnect)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if self.gemini_client:
+                return await self.gemini_client.wait_ready(max(0.0, remaining))
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(0.05)
 
     def _on_janus_error(self, error: str) -> None:
         """Called on Janus error."""
@@ -608,10 +1000,10 @@ class AgentBridge:
 
     # ============== RTP Callbacks ==============
 
-    def _on_rtp_packet(self, packet: RTPPacket) -> None:
+    def _on_rtp_packet(self, packet: RTPPacketView) -> None:
         """Called when RTP packet received from Janus."""
         self.stats.rtp_packets_received += 1
-        self.stats.rtp_bytes_received += len(packet.payload) + 12
+        self.stats.rtp_bytes_received += len(packet.data)
 
         # DEBUG: Log every 50th packet
         if self.stats.rtp_packets_received % 50 == 1:
@@ -619,26 +1011,80 @@ class AgentBridge:
                 f"[BRIDGE-DEBUG] RTP packet #{self.stats.rtp_packets_received}: "
                 f"seq={packet.sequence_number}, "
                 f"ts={packet.timestamp}, "
-                f"payload={len(packet.payload)}B, "
+                f"payload={packet.payload_size}B, "
                 f"pt={packet.payload_type}"
             )
 
-        # Add to jitter buffer
-        self._jitter_buffer.put(packet)
+        # Add to the SSRC's jitter buffer (arrival = socket receive time);
+        # release happens on the playout timer
+        self._rtp_streams.put(packet, packet.received_at)
+        self._schedule_jitter_release()
 
-        # Get ordered packet
-        ordered = self._jitter_buffer.get()
-        if ordered:
-            self._incoming_audio.append(ordered.payload)
+    def _schedule_jitter_release(self) -> None:
+        """Arm a loop timer for the earliest jitter buffer playout deadline."""
+        deadline = self._rtp_streams.next_deadline()
+        if deadline is None:
+            return
+        if self._jitter_timer is not None:
+            if self._jitter_timer_at <= deadline:
+                return  # Earlier timer already pending
+            self._jitter_timer.cancel()
+
+        loop = asyncio.get_running_loop()
+        self._jitter_timer_at = deadline
+        self._jitter_timer = loop.call_at(deadline, self._release_jitter)
+
+    def _release_jitter(self) -> None:
+        """Move every due packet from the jitter buffers to the forward loop."""
+        self._jitter_timer = None
+        now = max(asyncio.get_running_loop().time(), self._jitter_timer_at)
+
+        # lost = sequence gap skipped by the buffer (recovered via FEC/PLC)
+        released = self._rtp_streams.pop_ready(now)
+        for ssrc, ordered, lost in released:
+            # Materialize the payload only for packets actually played out
+            # (opuslib's ctypes binding needs bytes, not a memoryview)
+            self._incoming_audio.put_nowait((ssrc, bytes(ordered.payload), lost))
+
+        # Free decoders of publishers that stopped sending. The decoder and
+        # mixer state belong to the decode job (possibly on a DSP thread),
+        # so the job frees them, never the loop
+        self._reaped_ssrcs.extend(self._rtp_streams.reap_idle(now))
+
+        if self._running:
+            self._schedule_jitter_release()
 
     # ============== Gemini Callbacks ==============
 
+    def _wire_gemini(self, client: GeminiLiveClient) -> None:
+        """Route a Gemini client's events to this bridge."""
+        client.on_audio = self._on_gemini_audio
+        client.on_text = self._on_gemini_text
+        client.on_setup_complete = self._on_gemini_ready
+        client.on_turn_complete = self._on_gemini_turn_complete
+        client.on_interrupted = self._on_gemini_interrupted
+        client.on_error = self._on_gemini_error
+        client.on_go_away = self._on_gemini_go_away
+
     def _on_gemini_ready(self) -> None:
         """Called when Gemini is ready."""
         logger.info("Gemini is ready for audio")
 
     def _on_gemini_audio(self, audio_data: bytes) -> None:
-        """Called when audio received from Gemini."""
+        """Called when audio received from Gemini (queues it for playback, never waits)."""
+        if self._suppress_gemini_audio:
+            return  # Rest of a turn the user barged in on
+
+        # Time to first audio byte: user end-of-speech -> first response chunk
+        if not self._gemini_speaking and self._last_user_speech_at is not None:
+            self.stats.ttfa.add((time.monotonic() - self._last_user_speech_at) * 1000)
+            self._last_user_speech_at = None
+
+        # Participant join to first agent audio (the greeting)
+        if self._joined_at is not None:
+            self.stats.join_to_audio.add((time.monotonic() - self._joined_at) * 1000)
+            self._joined_at = None
+
         self._gemini_speaking = True
         self.stats.audio_chunks_from_gemini += 1
         self.stats.audio_bytes_from_gemini += len(audio_data)
@@ -647,7 +1093,7 @@ class AgentBridge:
         if self._debug_wav_out:
             self._debug_wav_out.writeframes(audio_data)
 
-        self._outgoing_audio.append(audio_data)
+        self._outgoing_audio.put_nowait((self._playout.generation, audio_data))
 
     def _on_gemini_text(self, text: str) -> None:
         """Called when text received from Gemini."""
@@ -657,13 +1103,19 @@ class AgentBridge:
         """Called when Gemini finishes speaking."""
         self._gemini_speaking = False
         self.stats.gemini_turn_completions += 1
+        if self._suppress_gemini_audio:
+            self._suppress_gemini_audio = False
+            return  # Playout was already cut by barge-in
+        # Flush the last partial frame after the turn's queued chunks
+        self._outgoing_audio.put_nowait((self._playout.generation, None))
         logger.debug("Gemini turn complete")
 
     def _on_gemini_interrupted(self) -> None:
         """Called when Gemini is interrupted by user."""
         self._gemini_speaking = False
+        self._suppress_gemini_audio = False
         self.stats.gemini_interruptions += 1
-        self._outgoing_audio.clear()  # Clear pending audio
+        self._cut_playout()
         logger.debug("Gemini interrupted")
 
     def _on_gemini_error(self, error: str) -> None:
@@ -673,32 +1125,146 @@ class AgentBridge:
 
         # If connection closed, attempt reconnection
         if "Connection closed" in error:
-            asyncio.create_task(self._reconnect_gemini())
+            self._start_gemini_recovery()
 
-    async def _reconnect_gemini(self) -> None:
-        """Attempt to reconnect to Gemini after connection loss."""
-        if not self._running:
+    def _on_gemini_go_away(self, time_left: str) -> None:
+        """Called when Gemini announces it will close: move over now."""
+        self._start_gemini_recovery()
+
+    def _start_gemini_recovery(self) -> None:
+        """Begin buffering user audio and reconnect in the background."""
+        if not self._running or self._gemini_recovering or not self.gemini_client:
             return
+        self._gemini_recovering = True
+        self._gemini_speaking = False  # Don't discard user audio as echo
+        self._gemini_recovery_task = asyncio.create_task(self._reconnect_gemini())
+
+    async def _reconnect_gemini(self) -> None:
+        """Reconnect to Gemini, resuming the session, then replay buffered audio.
 
-        logger.info("Attempting Gemini reconnection...")
-        await asyncio.sleep(2)  # Brief delay before reconnect
+        The first attempt is immediate; later ones back off exponentially.
+        A rejected resumption handle is dropped so the next attempt starts
+        a fresh session.
+        """
+        client = self.gemini_client
+        started_at = time.monotonic()
+        attempt = 0
+        try:
+            if client.is_connected:
+                await client.disconnect()  # goAway: leave before the server closes
+
+            logger.info("Attempting Gemini reconnection...")
+            while self._running:
+                if attempt:
+                    await asyncio.sleep(min(
+                        GEMINI_RECONNECT_BASE_DELAY * 2 ** (attempt - 1),
+                        GEMINI_RECONNECT_MAX_DELAY,
+                    ))
+                attempt += 1
+                resuming = client.resumption_handle is not None
+                if await client.connect():
+                    break
+                logger.warning(f"Gemini reconnection attempt {attempt} failed")
+                if resuming:
+                    client.resumption_handle = None  # Expired or rejected
+            else:
+                return
+
+            self.stats.gemini_reconnects += 1
+            if client.resumed:
+                self.stats.gemini_resumptions += 1
+            # New connection, new streams (reset by the decode/encode loops)
+            self._inbound_reset_pending = True
+            self._outbound_reset_pending = True
+
+            await self._replay_resume_buffer()
+            self.stats.gemini_recovery.add((time.monotonic() - started_at) * 1000)
+            logger.info(
+                f"Gemini reconnected after {attempt} attempt(s) "
+                f"(resumed={client.resumed})"
+            )
+        except Exception as e:
+            logger.error(f"Gemini reconnection error: {e}")
+        finally:
+            # No await between the replay draining the buffer and this
+            self._gemini_recovering = False
+            self.stats.gemini_lost_audio_ms += self._resume_buffer_ms  # Never replayed
+            self._resume_buffer.clear()
+            self._resume_buffer_ms = 0.0
+
+    def _audio_ms(self, audio_bytes: bytes) -> float:
+        """Duration of 16kHz PCM16 audio in milliseconds."""
+        return len(audio_bytes) / 2 / self.settings.gemini.input_sample_rate * 1000
+
+    def _buffer_for_resume(self, audio_bytes: Optional[bytes]) -> None:
+        """Hold user audio (or an activityEnd marker) until Gemini is back.
+
+        Bounded to resume_buffer_ms; the oldest audio is dropped first.
+        """
+        self._resume_buffer.append(audio_bytes)
+        if audio_bytes is None:
+            return
+        self._resume_buffer_ms += self._audio_ms(audio_bytes)
+        limit = self.settings.gemini.resume_buffer_ms
+        while self._resume_buffer_ms > limit and self._resume_buffer:
+            dropped = self._resume_buffer.popleft()
+            if dropped is not None:
+                dropped_ms = self._audio_ms(dropped)
+                self._resume_buffer_ms -= dropped_ms
+                self.stats.gemini_lost_audio_ms += dropped_ms
+
+    async def _replay_resume_buffer(self) -> None:
+        """Send audio buffered during the gap, re-opening client-side turns."""
+        activity = False
+        while self._resume_buffer:
+            audio_bytes = self._resume_buffer.popleft()
+            if audio_bytes is None:
+                if activity:
+                    activity = False
+                    await self.gemini_client.send_activity_end()
+                continue
+            if self._client_turns and not activity:
+                activity = True
+                await self.gemini_client.send_activity_start()
+            audio_ms = self._audio_ms(audio_bytes)
+            self._resume_buffer_ms -= audio_ms
+            if await self.gemini_client.send_audio(audio_bytes):
+                self.stats.gemini_replayed_audio_ms += audio_ms
+                self.stats.audio_chunks_to_gemini += 1
+                self.stats.audio_bytes_to_gemini += len(audio_bytes)
+            else:
+                self.stats.gemini_lost_audio_ms += audio_ms
+        self._activity_open = activity
+
+    async def _send_user_audio(self, audio_bytes: bytes) -> None:
+        """Send gated user audio to Gemini (buffered while reconnecting)."""
+        if self._client_turns and not self._activity_open:
+            self._activity_open = True
+            if not self._gemini_recovering:
+                await self.gemini_client.send_activity_start()
+
+        if self._gemini_recovering:
+            self._buffer_for_resume(audio_bytes)
+            return
 
-        if self.gemini_client:
-            # Try to reconnect
-            try:
-                if await self.gemini_client.connect():
-                    logger.info("Gemini reconnected successfully!")
-                else:
-                    logger.error("Gemini reconnection failed")
-            except Exception as e:
-                logger.error(f"Gemini reconnection error: {e}")
+        if await self.gemini_client.send_audio(audio_bytes):
+            self.stats.audio_chunks_to_gemini += 1
+            self.stats.audio_bytes_to_gemini += len(audio_bytes)
+        else:
+            self.stats.gemini_lost_audio_ms += self._audio_ms(audio_bytes)
 
     # ============== Audio Processing Loops ==============
 
     async def _audio_forward_loop(self) -> None:
         """Forward audio from Janus (RTP) to Gemini (WebSocket).
 
-        Pipeline: RTP Opus 48kHz → Decode → Resample 48k→16k → VAD Filter → PCM16 → Gemini
+        Pipeline: RTP Opus 48kHz → FEC/PLC + Decode (per SSRC) → Resample 48k→16k
+                  → Mix publishers → Speech gate (Janus → energy → VAD) → PCM16 → Gemini
+
+        Event-driven: sleeps on the audio_in queue until the jitter timer
+        releases packets, then drains them in one batch (no idle polling).
+        Decode + mix of the batch and the VAD gating each run as one DSP
+        executor job, so the event loop only does I/O.
 
         Phase 1 Optimization:
             Silero VAD filters silence before sending to Gemini,
@@ -712,46 +1278,57 @@ class AgentBridge:
 
         while self._running:
             try:
-                if self._incoming_audio:
-                    opus_data = self._incoming_audio.popleft()
-
-                    # Convert Opus to Gemini format
-                    pcm_data = self.audio_processor.janus_to_gemini(opus_data)
-
-                    if pcm_data:
-                        audio_buffer.extend(pcm_data)
-
-                        # Debug: save audio
-                        if self._debug_wav_in:
-                            self._debug_wav_in.writeframes(pcm_data)
-
-                        # Send when buffer is full (unless Gemini is speaking)
-                        if len(audio_buffer) >= send_threshold:
-                            if self._gemini_speaking:
-                                # Discard to prevent feedback
-                                audio_buffer.clear()
-                            elif self.gemini_client and self.gemini_client.is_ready:
-                                # Phase 1: VAD filter - only send if speech detected
-                                audio_bytes = bytes(audio_buffer)
-
-                                # Get speech probability (audio is normalized in VAD)
-                                speech_prob = self._vad.get_speech_probability(audio_bytes)
-                                self._vad._total_frames += 1
-
-                                if speech_prob > self._vad.threshold:
-                                    self._vad._speech_frames_total += 1
-                                    await self.gemini_client.send_audio(audio_bytes)
-                                    self.stats.audio_chunks_to_gemini += 1
-                                    self.stats.audio_bytes_to_gemini += len(audio_buffer)
-                                else:
-                                    self._vad._silence_frames_total += 1
-                                    silence_filtered += 1
-
-                                audio_buffer.clear()
+                await self._incoming_audio.wait()
+
+                # Drain every pending packet and decode them as one DSP job
+                batch = [self._incoming_audio.popleft() for _ in range(len(self._incoming_audio))]
+                reaped, self._reaped_ssrcs = self._reaped_ssrcs, []
+                reset, self._inbound_reset_pending = self._inbound_reset_pending, False
+                pcm_data = await self._dsp.run(self._decode_batch, batch, reaped, reset)
+                if not pcm_data:
+                    continue
+
+                audio_buffer.extend(pcm_data)
+
+                # Debug: save audio
+                if self._debug_wav_in:
+                    self._debug_wav_in.writeframes(pcm_data)
+
+                # Send when buffer is full (unless Gemini is speaking)
+                if len(audio_buffer) < send_threshold:
+                    continue
+
+                if self._gemini_speaking and not self._barge_in:
+                    # Discard to prevent feedback (and stale pre-roll)
+                    audio_buffer.clear()
+                    self._segmenter.clear()
+                    if self._activity_open:
+                        await self._end_user_activity()
+                elif self.gemini_client and (
+                    self.gemini_client.is_ready or self._gemini_recovering
+                ):
+                    # Phase 1: VAD filter with pre-roll + hangover. Cheap gates
+                    # first; Silero only runs on ambiguous audio
+                    chunk_ms = len(audio_buffer) / 2 / self._vad.sample_rate * 1000
+                    audio_bytes = await self._dsp.run(
+                        self._segmenter.process, bytes(audio_buffer)
+                    )
+                    is_speech = self._segmenter.last_probability > self._vad.threshold
+                    if is_speech:
+                        self._last_user_speech_at = time.monotonic()
+
+                    if self._barge_in:
+                        audio_bytes = self._apply_barge_in(audio_bytes, is_speech, chunk_ms)
+
+                    if audio_bytes:
+                        await self._send_user_audio(audio_bytes)
                     else:
-                        self.stats.decode_errors += 1
-                else:
-                    await asyncio.sleep(0.01)
+                        silence_filtered += 1
+                        if self._activity_open:
+                            # Segment closed (hangover elapsed): end the turn
+                            await self._end_user_activity()
+
+                    audio_buffer.clear()
 
             except asyncio.CancelledError:
                 break
@@ -761,44 +1338,150 @@ class AgentBridge:
 
         logger.info(f"Audio forward loop stopped (VAD filtered {silence_filtered} chunks)")
 
+    def _decode_batch(self, batch: list, reaped: Sequence[int] = (), reset: bool = False) -> bytes:
+        """Decode a batch of (ssrc, opus, lost) and mix publishers (DSP job).
+
+        Args:
+            batch: Released packets in playout order
+            reaped: Idle SSRCs whose decoder and mixer state to free first
+            reset: Reset every inbound resampler first (new Gemini stream)
+
+        Returns:
+            Mixed 16kHz PCM16 (empty while resamplers fill)
+        """
+        for ssrc in reaped:
+            self._mixer.remove(ssrc)
+            self.audio_processor.remove_inbound(ssrc)
+        if reset:
+            self.audio_processor.reset_inbound()
+
+        for ssrc, opus_data, lost in batch:
+            # Convert Opus to Gemini format (conceals lost frames first)
+            pcm_data = self.audio_processor.janus_to_gemini(
+                opus_data, lost=lost, ssrc=ssrc
+            )
+
+            if pcm_data is None:
+                self.stats.decode_errors += 1
+                continue
+
+            # Empty while the resampler fills - mixer ignores it
+            self._mixer.push(ssrc, pcm_data)
+
+        # Sum active publishers into the single 16kHz stream
+        return self._mixer.mix()
+
+    def _apply_barge_in(self, audio_bytes: bytes, is_speech: bool, chunk_ms: float) -> bytes:
+        """Hold user audio during agent speech; interrupt on sustained speech.
+
+        Returns:
+            Audio to forward now (held audio once barge-in triggers)
+        """
+        if not self._gemini_speaking:
+            # Agent finished while the user was mid-segment: keep their audio
+            if self._barge_in.pending:
+                return self._barge_in.release() + audio_bytes
+            return audio_bytes
+
+        if not self._barge_in.hold(audio_bytes, is_speech, chunk_ms):
+            return b""
+
+        onset_at = self._barge_in.onset_at
+        self._cut_playout()
+        self._gemini_speaking = False
+        # Drop the rest of the Gemini turn until it ends (a cached greeting
+        # has no Gemini turn behind it)
+        self._suppress_gemini_audio = (
+            self.gemini_client is not None and self.gemini_client.session.is_speaking
+        )
+        self.stats.barge_ins += 1
+        if onset_at is not None:
+            self.stats.interrupt_to_silence.add((time.monotonic() - onset_at) * 1000)
+        logger.info("Barge-in: user interrupted agent playback")
+        return self._barge_in.release()
+
+    def _cut_playout(self) -> None:
+        """Stop agent audio now: drop queued chunks and frames.
+
+        Bumping the playout generation also invalidates the chunk the
+        playback loop may be encoding right now. The playback loop resets
+        the outbound resampler/encoder/framer before the first chunk of the
+        new generation (it may be mid-encode in a DSP thread right now).
+        """
+        self._outgoing_audio.clear()  # Clear pending audio
+        self._playout.clear()  # Drop queued frames, start a new generation
+        if self._greeting_capture:
+            self._greeting_capture.done.set()  # A cut greeting is not cached
+
+    async def _end_user_activity(self) -> None:
+        """Close the open client-side turn (Gemini responds after this)."""
+        self._activity_open = False
+        if self._gemini_recovering:
+            self._buffer_for_resume(None)
+        elif self.gemini_client:
+            await self.gemini_client.send_activity_end()
+
     async def _audio_playback_loop(self) -> None:
         """Forward audio from Gemini (WebSocket) to Janus (RTP).
 
-        Pipeline: Gemini PCM16 24kHz → Resample 24k→48k → Encode Opus → RTP
+        Pipeline: Gemini PCM16 24kHz → Resample 24k→48k → Encode Opus → PlayoutScheduler → RTP
+
+        Event-driven: sleeps on the audio_out queue until _on_gemini_audio
+        signals, then drains every pending chunk in one batch. Pacing is
+        done by the PlayoutScheduler, so encoding never blocks on timing.
+        Partial frames carry over between chunks; the end-of-turn marker
+        (None) flushes the padded remainder.
+
+        Each chunk carries the playout generation it arrived in. The loop
+        yields between chunks so an interruption can land mid-batch; chunks
+        (and frames encoded from them) of an older generation are dropped.
+
+        Never waits on playout: a whole answer is buffered (bounded by
+        playout_buffer_ms) so the Gemini receive loop keeps reading control
+        messages behind the audio.
         """
         logger.info("Audio playback loop started")
+        encoded_generation = self._playout.generation
 
         while self._running:
             try:
-                if self._outgoing_audio:
-                    pcm_data = self._outgoing_audio.popleft()
-
-                    # Convert Gemini format to Opus frames
-                    opus_frames = self.audio_processor.gemini_to_janus(pcm_data)
-
-                    if opus_frames and self.rtp_sender:
-                        # Send each 20ms frame with timing
-                        for i, opus_frame in enumerate(opus_frames):
-                            marker = (i == 0)  # First frame after gap
-                            sent = self.rtp_sender.send(opus_frame, marker=marker)
-                            if sent:
-                                self.stats.rtp_packets_sent += 1
-                                self.stats.rtp_bytes_sent += len(opus_frame) + 12
-                                # Log every 50th packet
-                                if self.stats.rtp_packets_sent % 50 == 1:
-                                    logger.info(
-                                        f"[PLAYBACK-DEBUG] Sent RTP #{self.stats.rtp_packets_sent}: "
-                                        f"{len(opus_frame)}B to Janus"
-                                    )
-                            else:
-                                logger.warning("[PLAYBACK-DEBUG] RTP send failed!")
-
-                            # Pace at 20ms intervals
-                            await asyncio.sleep(0.018)
-                    else:
+                await self._outgoing_audio.wait()
+
+                # Drain every pending chunk in one batch
+                while self._outgoing_audio:
+                    generation, pcm_data = self._outgoing_audio.popleft()
+                    if generation != self._playout.generation:
+                        continue  # Interrupted after this chunk arrived
+
+                    if generation != encoded_generation or self._outbound_reset_pending:
+                        # First chunk after an interruption: drop stale
+                        # resampler/encoder history and the partial frame
+                        self.audio_processor.reset_outbound()
+                        encoded_generation = generation
+                        self._outbound_reset_pending = False
+
+                    if pcm_data is None:
+                        # Turn complete: emit the remainder, let playout drain
+                        frames = await self._dsp.run(self.audio_processor.flush_outbound)
+                        self._playout.enqueue(frames, generation)
+                        self._playout.end_of_turn()
+                        self._capture_greeting(generation, frames, end_of_turn=True)
+                        continue
+
+                    # Convert Gemini format to Opus frames (full frames only)
+                    opus_frames = await self._dsp.run(
+                        self.audio_processor.gemini_to_janus, pcm_data
+                    )
+
+                    if not self.rtp_sender:
                         self.stats.encode_errors += 1
-                else:
-                    await asyncio.sleep(0.01)
+                        continue
+                    if opus_frames:
+                        self._playout.enqueue(opus_frames, generation)
+                        self._capture_greeting(generation, opus_frames)
+
+                    # Let an interruption in before the next chunk (inline DSP)
+                    await asyncio.sleep(0)
 
             except asyncio.CancelledError:
                 break
@@ -808,6 +1491,46 @@ class AgentBridge:
 
         logger.info("Audio playback loop stopped")
 
+    def _capture_greeting(self, generation: int, frames: list, end_of_turn: bool = False) -> None:
+        """Record encoded frames of the greeting turn for the cache."""
+        capture = self._greeting_capture
+        if capture is None or capture.done.is_set():
+            return
+        if generation != capture.generation:
+            capture.done.set()  # Interrupted: not cached
+            return
+        capture.frames.extend(frames)
+        if end_of_turn:
+            capture.complete = True
+            capture.done.set()
+
+    def _send_rtp_frame(self, opus_frame: bytes, marker: bool) -> bool:
+        """Send one Opus frame to Janus (called by the PlayoutScheduler).
+
+        Args:
+            opus_frame: Encoded 20ms Opus frame
+            marker: RTP marker bit (first frame of a talkspurt)
+
+        Returns:
+            True if sent successfully
+        """
+        if not self.rtp_sender:
+            return False
+
+        sent = self.rtp_sender.send(opus_frame, marker=marker)
+        if sent:
+            self.stats.rtp_packets_sent += 1
+            self.stats.rtp_bytes_sent += len(opus_frame) + 12
+            # Log every 50th packet
+            if self.stats.rtp_packets_sent % 50 == 1:
+                logger.info(
+                    f"[PLAYBACK-DEBUG] Sent RTP #{self.stats.rtp_packets_sent}: "
+                    f"{len(opus_frame)}B to Janus"
+                )
+        else:
+            logger.warning("[PLAYBACK-DEBUG] RTP send failed!")
+        return sent
+
     async def send_text(self, text: str) -> bool:
         """Send text message to Gemini (for commands or testing).
 
@@ -840,6 +1563,7 @@ class AgentBridge:
                 "connected": self.gemini_client.is_connected if self.gemini_client else False,
                 "ready": self.gemini_client.is_ready if self.gemini_client else False,
                 "session": self.gemini_client.session.to_dict() if self.gemini_client else None,
+                "tokens": self.gemini_client.usage.to_dict() if self.gemini_client else None,
             },
             "audio": {
                 "processor_ready": self.audio_processor.is_ready if self.audio_processor else False,
@@ -848,10 +1572,25 @@ class AgentBridge:
             "rtp": {
                 "receiver_running": self.rtp_receiver.is_running if self.rtp_receiver else False,
                 "sender_running": self.rtp_sender.is_running if self.rtp_sender else False,
-                "jitter_buffer": self._jitter_buffer.get_stats(),
+                "jitter_buffer": self._rtp_streams.get_stats(),
+                "mixer": self._mixer.get_stats(),
+                "playout": self._playout.get_stats(),
+            },
+            "rtcp": {
+                "audio": self.audio_rtcp.get_stats() if self.audio_rtcp else None,
+                "video": self.video_rtcp.get_stats() if self.video_rtcp else None,
+            },
+            "queues": {
+                q.name: q.get_stats()
+                for q in (self._incoming_audio, self._outgoing_audio, self._video_frames)
             },
             # Phase 1: VAD stats
             "vad": self._vad.get_stats(),
+            "speech_gate": self._speech_gate.get_stats(),
+            "segmenter": self._segmenter.get_stats(),
+            "barge_in": self._barge_in.get_stats() if self._barge_in else None,
+            "dsp": self._dsp.get_stats(),
+            "greeting_cache": self._greeting_cache.get_stats() if self._greeting_cache else None,
             "stats": self.stats.to_dict(),
         }
 
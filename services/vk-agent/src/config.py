@@ -7,6 +7,18 @@ with sensible defaults. Follows the same patterns as vk-ice.
 Environment Variables:
     VK_AGENT_LOG_LEVEL      - Logging level (default: INFO)
     VK_AGENT_DEBUG_AUDIO    - Save audio to files for debugging (default: false)
+    VK_AGENT_OPUS_NATIVE_RATE - Opus decode at 16kHz / encode from 24kHz,
+                              skipping resampling (default: true)
+    VK_AGENT_VAD_BACKEND    - Silero VAD backend: auto, onnx or torch (default: auto)
+    VK_AGENT_VAD_MODEL      - Silero ONNX model path (default: src/assets/silero_vad.onnx)
+    VK_AGENT_VAD_GATE_JANUS - Skip VAD while Janus reports nobody talking (default: true)
+    VK_AGENT_VAD_MIN_RMS    - Energy floor below which VAD is skipped (default: 40)
+    VK_AGENT_VAD_PREROLL_MS - Audio sent from before speech onset (default: 300)
+    VK_AGENT_VAD_HANGOVER_MS - Audio sent after speech ends (default: 300)
+    VK_AGENT_BARGE_IN       - Let users interrupt the agent mid-speech (default: false)
+    VK_AGENT_BARGE_IN_MS    - Sustained speech needed to interrupt (default: 300)
+    VK_AGENT_DSP_WORKERS    - Threads for Opus/resample/VAD work; 0 runs it on the
+                              event loop (default: 0)
 
     # Janus Configuration
     VK_AGENT_JANUS_WS_URL   - Janus WebSocket URL (default: ws://localhost:8188)
@@ -14,11 +26,42 @@ Environment Variables:
     VK_AGENT_JANUS_DISPLAY  - Display name in room (default: VKAgent)
     VK_AGENT_RTP_HOST       - RTP listening host (default: 172.19.0.1)
     VK_AGENT_RTP_PORT       - RTP listening port (default: 5004)
+    VK_AGENT_RTCP           - RTCP reports, NACK and PLI on the RTP sockets (default: true)
+    VK_AGENT_MAX_ROOMS      - Max concurrent rooms per process; each room takes
+                              a block of 4 ports from VK_AGENT_RTP_PORT (default: 32)
+    VK_AGENT_WORKERS        - Bridge worker processes; above 1 a supervisor shards
+                              rooms across them, each with its own port range
+                              (default: 1)
 
     # Gemini Configuration
     GEMINI_API_KEY          - Google AI API key (required)
     VK_AGENT_GEMINI_MODEL   - Gemini model ID (default: models/gemini-2.0-flash-exp)
     VK_AGENT_GEMINI_VOICE   - Voice preset (default: Puck)
+    VK_AGENT_TURN_DETECTION - server (Gemini endpointing) or client (local VAD
+                              sends activityStart/activityEnd) (default: server)
+    VK_AGENT_GEMINI_RESUME  - Resume the Gemini session (context kept) after a
+                              dropped connection (default: true)
+    VK_AGENT_GEMINI_RESUME_BUFFER_MS - User audio buffered while reconnecting and
+                              replayed on resume (default: 5000)
+    VK_AGENT_GEMINI_CONTEXT_COMPRESSION - Server-side sliding-window context
+                              compression for long calls (default: true)
+    VK_AGENT_GEMINI_CONTEXT_TRIGGER_TOKENS - Context size that triggers
+                              compression; keep below the model's window
+                              (default: 32000, the 2.0 Live window)
+    VK_AGENT_GEMINI_CONTEXT_TARGET_TOKENS - Context kept after compression; at
+                              1 fps screen share 16000 is about a minute
+                              (default: 16000)
+    VK_AGENT_GREETING_CACHE - Play a pre-rendered greeting on join, then greet by
+                              name as a short follow-up (default: true)
+    VK_AGENT_GREETING_CACHE_DIR - Greeting Opus frames on disk
+                              (default: /tmp/vk-agent-greetings)
+    VK_AGENT_GREETING_CACHE_SIZE - Greetings kept before LRU eviction (default: 16)
+    VK_AGENT_GREETING_TEMPLATE - Name-free greeting prompt that gets cached
+    VK_AGENT_GEMINI_WS_URL  - Override the Live API WebSocket endpoint (default: Google)
+    VK_AGENT_GEMINI_POOL_SIZE - Pre-connected, set-up Gemini sessions kept warm per
+                              profile; 0 connects on demand (default: 0)
+    VK_AGENT_GEMINI_POOL_MAX_IDLE - Seconds a warm session may idle before it is
+                              replaced (default: 300)
 
     # API Server (optional)
     VK_AGENT_API_HOST       - API server host (default: 0.0.0.0)
@@ -75,6 +118,10 @@ class JanusConfig:
     video_rtp_port: int = field(
         default_factory=lambda: int(os.getenv("VK_AGENT_VIDEO_RTP_PORT", "5006"))
     )
+    # RTCP (RR/SR, NACK, PLI) multiplexed on the RTP sockets (see rtcp.py)
+    rtcp: bool = field(
+        default_factory=lambda: _get_bool("VK_AGENT_RTCP", True)
+    )
 
     # Connection settings
     keepalive_interval: int = 30
@@ -90,6 +137,7 @@ class JanusConfig:
             "rtp_host": self.rtp_host,
             "rtp_port": self.rtp_port,
             "video_rtp_port": self.video_rtp_port,
+            "rtcp": self.rtcp,
         }
 
 
@@ -112,6 +160,12 @@ class GeminiConfig:
         default_factory=lambda: os.getenv("VK_AGENT_GEMINI_VOICE", "Puck")
     )
 
+    # Turn detection: "server" (Gemini automatic activity detection) or
+    # "client" (local VAD segments drive activityStart/activityEnd)
+    turn_detection: str = field(
+        default_factory=lambda: os.getenv("VK_AGENT_TURN_DETECTION", "server")
+    )
+
     # Audio settings (fixed by Gemini API)
     input_sample_rate: int = 16000   # Audio sent TO Gemini
     output_sample_rate: int = 24000  # Audio received FROM Gemini
@@ -186,7 +240,66 @@ You help users create wills, powers of attorney, and comprehensive estate planni
         )
     )
 
+    # Session resumption: reconnect with the server's handle (context kept)
+    # and replay up to resume_buffer_ms of user audio sent during the gap
+    session_resumption: bool = field(
+        default_factory=lambda: _get_bool("VK_AGENT_GEMINI_RESUME", True)
+    )
+    resume_buffer_ms: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_GEMINI_RESUME_BUFFER_MS", "5000"))
+    )
+
+    # Sliding-window context compression: once the session context passes
+    # trigger tokens the server drops the oldest turns down to target tokens
+    # (long calls with 1 fps screenshots otherwise grow without bound).
+    # Trade-off: audio costs 32 tokens/s and a screenshot 258, so a 1 fps
+    # screen share adds ~300 tokens/s and 32000/16000 (sized for the default
+    # model's 32k window) keeps only about the last minute of such a call;
+    # voice alone keeps several minutes. Models with a 128k window (native
+    # audio) can raise both, e.g. 100000/50000, to remember more.
+    context_compression: bool = field(
+        default_factory=lambda: _get_bool("VK_AGENT_GEMINI_CONTEXT_COMPRESSION", True)
+    )
+    context_trigger_tokens: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_GEMINI_CONTEXT_TRIGGER_TOKENS", "32000"))
+    )
+    context_target_tokens: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_GEMINI_CONTEXT_TARGET_TOKENS", "16000"))
+    )
+
+    # Greeting cache (see greeting_cache.py): the name-free greeting is
+    # rendered once per voice/persona/template and replayed on join
+    greeting_cache: bool = field(
+        default_factory=lambda: _get_bool("VK_AGENT_GREETING_CACHE", True)
+    )
+    greeting_cache_dir: str = field(
+        default_factory=lambda: os.getenv("VK_AGENT_GREETING_CACHE_DIR", "/tmp/vk-agent-greetings")
+    )
+    greeting_cache_size: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_GREETING_CACHE_SIZE", "16"))
+    )
+    greeting_template: str = field(
+        default_factory=lambda: os.getenv(
+            "VK_AGENT_GREETING_TEMPLATE",
+            "A user just joined the call. Greet them warmly and briefly introduce yourself as Jimmy.",
+        )
+    )
+
+    # Live API endpoint override (empty = Google's BidiGenerateContent URL)
+    ws_url: str = field(
+        default_factory=lambda: os.getenv("VK_AGENT_GEMINI_WS_URL", "")
+    )
+
+    # Warm session pool (see gemini_pool.py): sessions per profile, max idle age
+    pool_size: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_GEMINI_POOL_SIZE", "0"))
+    )
+    pool_max_idle: float = field(
+        default_factory=lambda: float(os.getenv("VK_AGENT_GEMINI_POOL_MAX_IDLE", "300"))
+    )
+
     # WebSocket settings
+    setup_timeout: float = 5.0  # Wait for setupComplete
     ping_interval: int = 30
     ping_timeout: int = 10
     max_message_size: int = 10 * 1024 * 1024  # 10MB
@@ -196,13 +309,25 @@ You help users create wills, powers of attorney, and comprehensive estate planni
         """Check if API key is configured."""
         return bool(self.api_key)
 
+    @property
+    def client_turn_detection(self) -> bool:
+        """Whether the local VAD (not Gemini) decides turn boundaries."""
+        return self.turn_detection == "client"
+
     def to_dict(self) -> dict:
         """Convert to dictionary (excludes API key)."""
         return {
             "model": self.model,
             "voice": self.voice,
+            "turn_detection": self.turn_detection,
             "input_sample_rate": self.input_sample_rate,
             "output_sample_rate": self.output_sample_rate,
+            "session_resumption": self.session_resumption,
+            "context_compression": self.context_compression,
+            "context_trigger_tokens": self.context_trigger_tokens,
+            "context_target_tokens": self.context_target_tokens,
+            "pool_size": self.pool_size,
+            "greeting_cache": self.greeting_cache,
             "is_configured": self.is_configured,
         }
 
@@ -223,9 +348,51 @@ class AudioConfig:
     frame_duration_ms: int = 20  # Standard 20ms Opus frames
     opus_bitrate: int = 24000    # Opus encoding bitrate
 
+    # Native-rate Opus: decode straight to gemini_input_rate and encode
+    # straight from gemini_output_rate (no resampling). The RTP clock stays
+    # at janus_sample_rate (48kHz, RFC 7587). soxr is only the fallback.
+    opus_native_rate: bool = field(
+        default_factory=lambda: _get_bool("VK_AGENT_OPUS_NATIVE_RATE", True)
+    )
+
+    # Silero VAD backend: auto | onnx | torch (see vad.py)
+    vad_backend: str = field(
+        default_factory=lambda: os.getenv("VK_AGENT_VAD_BACKEND", "auto")
+    )
+
+    # Speech gate in front of the VAD (see speech_gate.py)
+    vad_gate_janus: bool = field(
+        default_factory=lambda: _get_bool("VK_AGENT_VAD_GATE_JANUS", True)
+    )
+    vad_min_rms: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_VAD_MIN_RMS", "40"))
+    )
+    # Pre-roll before speech onset / hangover after it ends (SpeechSegmenter)
+    vad_preroll_ms: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_VAD_PREROLL_MS", "300"))
+    )
+    vad_hangover_ms: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_VAD_HANGOVER_MS", "300"))
+    )
+
+    # Full-duplex barge-in: keep the VAD running while the agent speaks
+    barge_in: bool = field(
+        default_factory=lambda: _get_bool("VK_AGENT_BARGE_IN", False)
+    )
+    barge_in_min_speech_ms: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_BARGE_IN_MS", "300"))
+    )
+
+    # DSP worker threads shared by all rooms (0 = inline on the event loop)
+    dsp_workers: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_DSP_WORKERS", "0"))
+    )
+
     # Buffer settings
-    jitter_buffer_ms: int = 100  # Jitter buffer depth
+    jitter_buffer_ms: int = 100  # Max adaptive jitter buffer delay
+    jitter_min_delay_ms: int = 20  # Jitter buffer delay floor (one frame)
     send_buffer_ms: int = 100    # Audio accumulation before sending
+    playout_buffer_ms: int = 30000  # Outbound playout buffer (holds a whole Gemini answer; drop-oldest)
 
     @property
     def janus_frame_samples(self) -> int:
@@ -246,6 +413,16 @@ class AudioConfig:
             "gemini_output_rate": self.gemini_output_rate,
             "frame_duration_ms": self.frame_duration_ms,
             "jitter_buffer_ms": self.jitter_buffer_ms,
+            "playout_buffer_ms": self.playout_buffer_ms,
+            "opus_native_rate": self.opus_native_rate,
+            "vad_backend": self.vad_backend,
+            "vad_gate_janus": self.vad_gate_janus,
+            "vad_min_rms": self.vad_min_rms,
+            "vad_preroll_ms": self.vad_preroll_ms,
+            "vad_hangover_ms": self.vad_hangover_ms,
+            "barge_in": self.barge_in,
+            "barge_in_min_speech_ms": self.barge_in_min_speech_ms,
+            "dsp_workers": self.dsp_workers,
         }
 
 
@@ -282,6 +459,16 @@ class Settings:
         default_factory=lambda: int(os.getenv("VK_AGENT_API_PORT", "3004"))
     )
 
+    # Multi-room hosting (see session_manager.py)
+    max_rooms: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_MAX_ROOMS", "32"))
+    )
+
+    # Multi-process sharding (see supervisor.py); max_rooms is per worker
+    workers: int = field(
+        default_factory=lambda: int(os.getenv("VK_AGENT_WORKERS", "1"))
+    )
+
     # Component configs
     janus: JanusConfig = field(default_factory=JanusConfig)
     gemini: GeminiConfig = field(default_factory=GeminiConfig)
@@ -317,6 +504,32 @@ class Settings:
         if self.janus.rtp_port < 1024 or self.janus.rtp_port > 65535:
             errors.append(f"Invalid RTP port: {self.janus.rtp_port}")
 
+        if self.workers < 1:
+            errors.append(f"Invalid worker count: {self.workers}")
+        elif self.api_port + self.workers > 65535:
+            errors.append(
+                f"Worker API ports exceed 65535: {self.api_port} + {self.workers}"
+            )
+
+        if self.gemini.context_compression and not (
+            0 < self.gemini.context_target_tokens < self.gemini.context_trigger_tokens
+        ):
+            errors.append(
+                f"Gemini context target tokens ({self.gemini.context_target_tokens}) must be "
+                f"positive and below the trigger ({self.gemini.context_trigger_tokens})"
+            )
+
+        if self.gemini.pool_size < 0:
+            errors.append(f"Invalid Gemini pool size: {self.gemini.pool_size}")
+
+        if self.max_rooms < 1:
+            errors.append(f"Invalid max rooms: {self.max_rooms}")
+        elif self.janus.rtp_port + max(1, self.workers) * self.max_rooms * 4 - 1 > 65535:
+            errors.append(
+                f"RTP port range exceeds 65535: {self.janus.rtp_port} + "
+                f"{max(1, self.workers)} workers x {self.max_rooms} rooms x 4 ports"
+            )
+
         return errors
 
     def to_dict(self) -> dict:
@@ -326,6 +539,8 @@ class Settings:
             "debug_audio": self.debug_audio,
             "api_host": self.api_host,
             "api_port": self.api_port,
+            "max_rooms": self.max_rooms,
+            "workers": self.workers,
             "janus": self.janus.to_dict(),
             "gemini": self.gemini.to_dict(),
             "audio": self.audio.to_dict(),
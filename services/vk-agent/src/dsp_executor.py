@@ -0,0 +1,197 @@
+"""
+VK-Agent DSP Executor + Event-Loop Lag Monitor
+
+Moves CPU-bound audio work (Opus decode/encode, resampling, Silero VAD)
+off the asyncio event loop, which then only does I/O: RTP sockets, the
+Janus/Gemini WebSockets and the API server. With several rooms on one
+loop, a slow VAD call in one room would otherwise delay every packet of
+every other room.
+
+Architecture:
+    event loop (I/O)                           DSP threads (VK_AGENT_DSP_WORKERS)
+    ────────────────                           ─────────────────────────────────
+    forward loop ── run(decode_batch, pkts) ─► decode + resample + mix ─┐
+              ◄──────────────── pcm ────────────────────────────────────┘
+    forward loop ── run(segmenter.process) ──► gate + Silero ───────────┐
+              ◄──────────────── audio ──────────────────────────────────┘
+    playback loop ─ run(gemini_to_janus) ────► resample + Opus encode ──┐
+              ◄──────────────── frames ─────────────────────────────────┘
+
+    Threads, not processes: opuslib (ctypes), soxr, onnxruntime and large
+    numpy operations release the GIL, and the per-stream codec/VAD state
+    stays in-process with no serialization. Each bridge loop awaits its
+    job before submitting the next, and only that loop changes the state
+    its jobs use: other code (SSRC reaping, a Gemini reconnect) leaves a
+    request that the next job applies. So one stream's state is never
+    touched by two threads at once. Multi-core scale-out across rooms is
+    the job of worker processes, not of this pool.
+
+    workers=0 runs jobs inline on the loop (the previous behavior), so
+    loop lag can be compared with and without the pool.
+
+Loop lag:
+    LoopLagMonitor sleeps for a fixed interval and records how late it
+    wakes up. The lateness is how long the loop was blocked by callbacks
+    and synchronous work - the delay every RTP packet and WebSocket
+    message saw at that moment.
+
+Usage:
+    >>> dsp = DSPExecutor(workers=4)
+    >>> pcm = await dsp.run(decode_batch, packets)
+    >>> monitor = LoopLagMonitor()
+    >>> asyncio.create_task(monitor.run())
+    >>> monitor.get_stats()["lag"]["p95_ms"]
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from .models import LatencyStats
+
+logger = logging.getLogger(__name__)
+
+
+class DSPExecutor:
+    """Optional thread pool for audio DSP jobs.
+
+    Example:
+        >>> dsp = DSPExecutor(workers=2)
+        >>> frames = await dsp.run(processor.gemini_to_janus, pcm)
+        >>> dsp.shutdown()
+    """
+
+    def __init__(self, workers: int = 0):
+        """Initialize executor.
+
+        Args:
+            workers: Thread count (0 = run jobs inline on the event loop)
+        """
+        self.workers = max(0, workers)
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # Statistics
+        self._jobs = 0
+        self._errors = 0
+        self.queue_wait = LatencyStats()
+        self.run_time = LatencyStats()
+
+    @property
+    def inline(self) -> bool:
+        """Whether jobs run on the event loop."""
+        return self.workers == 0
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="vk-dsp"
+            )
+            logger.info(f"DSP executor started ({self.workers} threads)")
+        return self._pool
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run one DSP job and return its result.
+
+        Args:
+            fn: Synchronous function to run
+            *args: Arguments for fn
+
+        Returns:
+            fn(*args); exceptions propagate to the caller
+        """
+        self._jobs += 1
+        if self.inline:
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            except Exception:
+                self._errors += 1
+                raise
+            finally:
+                self.run_time.add((time.perf_counter() - start) * 1000)
+
+        submitted = time.perf_counter()
+
+        def job() -> Any:
+            start = time.perf_counter()
+            self.queue_wait.add((start - submitted) * 1000)
+            try:
+                return fn(*args)
+            finally:
+                self.run_time.add((time.perf_counter() - start) * 1000)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_pool(), job)
+        except Exception:
+            self._errors += 1
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (a later run() starts a new pool)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def get_stats(self) -> dict:
+        """Get executor statistics."""
+        return {
+            "workers": self.workers,
+            "inline": self.inline,
+            "jobs": self._jobs,
+            "errors": self._errors,
+            "queue_wait": self.queue_wait.to_dict(),
+            "run_time": self.run_time.to_dict(),
+        }
+
+
+class LoopLagMonitor:
+    """Measures event-loop scheduling lag.
+
+    Example:
+        >>> monitor = LoopLagMonitor(interval=0.1)
+        >>> task = asyncio.create_task(monitor.run())
+        >>> monitor.stop()
+    """
+
+    def __init__(self, interval: float = 0.1, warn_ms: float = 100.0):
+        """Initialize monitor.
+
+        Args:
+            interval: Seconds between probes
+            warn_ms: Lag above which a warning is logged
+        """
+        self.interval = interval
+        self.warn_ms = warn_ms
+        self.lag = LatencyStats(window=600)  # Last minute at 100ms probes
+        self.max_lag_ms = 0.0
+        self._running = False
+
+    async def run(self) -> None:
+        """Probe until stopped or cancelled."""
+        self._running = True
+        while self._running:
+            try:
+                start = time.monotonic()
+                await asyncio.sleep(self.interval)
+                lag_ms = max(0.0, (time.monotonic() - start - self.interval) * 1000)
+                self.lag.add(lag_ms)
+                if lag_ms > self.max_lag_ms:
+                    self.max_lag_ms = lag_ms
+                if lag_ms > self.warn_ms:
+                    logger.warning(f"Event loop blocked for {lag_ms:.0f}ms")
+            except asyncio.CancelledError:
+                break
+
+    def stop(self) -> None:
+        """Stop probing after the current interval."""
+        self._running = False
+
+    def get_stats(self) -> dict:
+        """Get lag statistics."""
+        return {
+            "interval_ms": round(self.interval * 1000),
+            "lag": self.lag.to_dict(),
+            "max_lag_ms": round(self.max_lag_ms, 1),
+        }
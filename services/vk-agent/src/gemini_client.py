@@ -22,6 +22,25 @@ Architecture:
     │  Audio Flow:                                                     │
     │    Input: PCM16 @ 16kHz -> base64 -> realtimeInput              │
     │    Output: serverContent.modelTurn.inlineData -> base64 -> PCM  │
+    │    Hot messages go through gemini_codec (template encode,       │
+    │    splice-and-decode of inlineData without a full parse tree)   │
+    │                                                                  │
+    │  Turn Detection:                                                 │
+    │    - server: Gemini automatic activity detection (default)      │
+    │    - client: local VAD sends realtimeInput.activityStart /      │
+    │      activityEnd; automatic detection disabled in setup         │
+    │                                                                  │
+    │  Session Resumption:                                             │
+    │    - sessionResumptionUpdate.newHandle kept while resumable      │
+    │    - connect() sends it in setup.session_resumption.handle so a  │
+    │      reconnect continues the same conversation                  │
+    │    - goAway: server will close soon (on_go_away)                 │
+    │                                                                  │
+    │  Long Calls:                                                     │
+    │    - context_window_compression: sliding window from trigger to  │
+    │      target tokens, so latency stays flat for 30-60 min calls   │
+    │    - TokenUsage: approximate tokens per audio second / image /   │
+    │      text, plus usageMetadata from the server (get_stats)       │
     │                                                                  │
     │  Events:                                                         │
     │    - setupComplete: Session ready                                │
@@ -41,7 +60,7 @@ Audio Format:
 """
 
 import asyncio
-import base64
+import inspect
 import json
 import logging
 from datetime import datetime, timezone
@@ -51,7 +70,14 @@ import websockets
 from websockets.client import WebSocketClientProtocol
 
 from .config import GeminiConfig
-from .models import GeminiSession
+from .gemini_codec import (
+    ACTIVITY_END,
+    ACTIVITY_START,
+    MediaChunkEncoder,
+    decode_server_message,
+    encode_media_chunk,
+)
+from .models import CHARS_PER_TOKEN, GeminiSession, TokenUsage
 
 
 # Phase 1 Optimization: Circuit breaker for Gemini API resilience
@@ -76,11 +102,72 @@ GEMINI_LIVE_WS_URL = (
 )
 
 
+# Prebuilt realtimeInput activity signals
+_ACTIVITY_MESSAGES = {"activityStart": ACTIVITY_START, "activityEnd": ACTIVITY_END}
+
+
 # Phase 1 Optimization: Circuit breaker for Gemini API
 # Note: pybreaker works as a decorator - we'll use it for connect_with_retry
 gemini_circuit_breaker = None  # Reserved for future decorator usage
 
 
+def build_setup(config: GeminiConfig, resumption_handle: Optional[str] = None) -> dict:
+    """Build the BidiGenerateContent setup for a configuration.
+
+    Everything a session is fixed to at setup time comes from here, so the
+    session pool keys warm sessions on this dict as well.
+
+    Args:
+        config: Gemini configuration
+        resumption_handle: Handle of the session to continue, if any
+
+    Returns:
+        Value of the "setup" message field
+    """
+    setup_config = {
+        "model": config.model,
+        "generation_config": {
+            "response_modalities": ["AUDIO"],
+            # Enable video/image input with medium resolution
+            "media_resolution": "MEDIA_RESOLUTION_MEDIUM",
+            "speech_config": {
+                "voice_config": {
+                    "prebuilt_voice_config": {
+                        "voice_name": config.voice,
+                    }
+                }
+            },
+        },
+        "tools": [],
+    }
+
+    # Client-side turn detection: we send activityStart/activityEnd
+    if config.client_turn_detection:
+        setup_config["realtime_input_config"] = {
+            "automatic_activity_detection": {"disabled": True},
+        }
+
+    # Ask for resumption handles; pass the last one to continue a session
+    if config.session_resumption:
+        setup_config["session_resumption"] = (
+            {"handle": resumption_handle} if resumption_handle else {}
+        )
+
+    # Long calls: server drops the oldest turns past the trigger
+    if config.context_compression:
+        setup_config["context_window_compression"] = {
+            "trigger_tokens": config.context_trigger_tokens,
+            "sliding_window": {"target_tokens": config.context_target_tokens},
+        }
+
+    if config.system_instruction:
+        setup_config["system_instruction"] = {
+            "parts": [{"text": config.system_instruction}]
+        }
+
+    return setup_config
+
+
 class GeminiLiveClient:
     """Gemini Live API client for real-time audio conversation.
 
@@ -113,6 +200,8 @@ class GeminiLiveClient:
         # WebSocket connection
         self._ws: Optional[WebSocketClientProtocol] = None
         self._receive_task: Optional[asyncio.Task] = None
+        self._setup_done = asyncio.Event()
+        self._audio_encoder = MediaChunkEncoder("audio/pcm;rate=16000")
 
         # Session state
         self.session = GeminiSession(
@@ -128,12 +217,25 @@ class GeminiLiveClient:
         self.on_interrupted: Optional[Callable[[], None]] = None
         self.on_setup_complete: Optional[Callable[[], None]] = None
         self.on_error: Optional[Callable[[str], None]] = None
+        self.on_go_away: Optional[Callable[[str], None]] = None
+
+        # Latest resumable session handle (sent in the next setup)
+        self.resumption_handle: Optional[str] = None
+        # Whether the current session continued a previous one
+        self.resumed = False
+        self._resumptions = 0
 
         # Statistics
         self._audio_chunks_sent = 0
         self._audio_chunks_received = 0
         self._bytes_sent = 0
         self._bytes_received = 0
+        self._activity_starts = 0
+        self._activity_ends = 0
+        self.usage = TokenUsage(
+            trigger_tokens=config.context_trigger_tokens if config.context_compression else 0,
+            target_tokens=config.context_target_tokens if config.context_compression else 0,
+        )
 
     @property
     def is_connected(self) -> bool:
@@ -145,9 +247,25 @@ class GeminiLiveClient:
         """Check if client is ready to send/receive audio."""
         return self.session.is_ready
 
+    async def wait_ready(self, timeout: float) -> bool:
+        """Wait for setupComplete (e.g. while a connect or reconnect runs).
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if the session is ready
+        """
+        if not self.is_ready:
+            try:
+                await asyncio.wait_for(self._setup_done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.is_ready
+
     def _get_websocket_url(self) -> str:
         """Get WebSocket URL with API key."""
-        return f"{GEMINI_LIVE_WS_URL}?key={self.config.api_key}"
+        return f"{self.config.ws_url or GEMINI_LIVE_WS_URL}?key={self.config.api_key}"
 
     async def connect(self) -> bool:
         """Connect to Gemini Live API.
@@ -162,6 +280,7 @@ class GeminiLiveClient:
             logger.error("GEMINI_API_KEY not configured")
             return False
 
+        self._setup_done.clear()
         try:
             url = self._get_websocket_url()
             # Use additional_headers for websockets >=11.0
@@ -185,16 +304,29 @@ class GeminiLiveClient:
             # Start receive loop
             self._receive_task = asyncio.create_task(self._receive_loop())
 
-            # Wait for setup complete
-            for _ in range(50):  # 5 second timeout
-                if self.session.setup_complete:
-                    logger.info("Gemini session ready")
-                    return True
-                await asyncio.sleep(0.1)
-
-            logger.error("Timeout waiting for Gemini setup")
-            await self.disconnect()
-            return False
+            # Wait for setupComplete (set by the receive loop, no polling);
+            # a close during setup (e.g. expired handle) fails fast
+            setup = asyncio.ensure_future(self._setup_done.wait())
+            done, _ = await asyncio.wait(
+                {setup, self._receive_task},
+                timeout=self.config.setup_timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if setup not in done:
+                setup.cancel()
+                logger.error("Gemini closed or timed out before setup complete")
+                await self.disconnect()
+                return False
+
+            if self.resumed:
+                self._resumptions += 1
+            else:
+                # Fresh context: only the system instruction
+                self.usage.reset_context(
+                    len(self.config.system_instruction or "") // CHARS_PER_TOKEN
+                )
+            logger.info(f"Gemini session ready (resumed={self.resumed})")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to connect to Gemini: {e}")
@@ -236,38 +368,22 @@ class GeminiLiveClient:
 
     async def _send_setup(self) -> None:
         """Send initial setup message to configure the session."""
-        setup_config = {
-            "model": self.config.model,
-            "generation_config": {
-                "response_modalities": ["AUDIO"],
-                # Enable video/image input with medium resolution
-                "media_resolution": "MEDIA_RESOLUTION_MEDIUM",
-                "speech_config": {
-                    "voice_config": {
-                        "prebuilt_voice_config": {
-                            "voice_name": self.config.voice,
-                        }
-                    }
-                },
-            },
-            "tools": [],
-        }
-
-        if self.config.system_instruction:
-            setup_config["system_instruction"] = {
-                "parts": [{"text": self.config.system_instruction}]
-            }
+        setup_config = build_setup(self.config, self.resumption_handle)
+        self.resumed = bool(self.config.session_resumption and self.resumption_handle)
 
         msg = {"setup": setup_config}
         await self._ws.send(json.dumps(msg))
-        logger.info(f"Sent setup: model={self.config.model}, voice={self.config.voice}")
+        logger.info(
+            f"Sent setup: model={self.config.model}, voice={self.config.voice}, "
+            f"turn_detection={self.config.turn_detection}"
+        )
 
     async def _receive_loop(self) -> None:
         """Process incoming messages from Gemini."""
         while self._ws and self.session.connected:
             try:
                 message = await self._ws.recv()
-                data = json.loads(message)
+                data = decode_server_message(message)
                 await self._handle_message(data)
             except websockets.exceptions.ConnectionClosed as e:
                 logger.warning(f"Gemini connection closed: code={e.code}, reason={e.reason}")
@@ -290,15 +406,39 @@ class GeminiLiveClient:
         - serverContent: Audio/text response from model
         - toolCall: Function calling request
         - toolCallCancellation: Function call cancelled
+        - sessionResumptionUpdate: New handle for resuming the session
+        - goAway: Server will close the connection soon
         """
         # Setup complete
         if "setupComplete" in data:
             self.session.setup_complete = True
+            self._setup_done.set()
             logger.info("Gemini setup complete")
             if self.on_setup_complete:
                 self.on_setup_complete()
             return
 
+        # New resumption handle (only usable while the server says resumable)
+        if "sessionResumptionUpdate" in data:
+            update = data["sessionResumptionUpdate"]
+            if update.get("resumable") and update.get("newHandle"):
+                self.resumption_handle = update["newHandle"]
+            return
+
+        # Server is about to close the connection
+        if "goAway" in data:
+            time_left = data["goAway"].get("timeLeft", "")
+            logger.warning(f"Gemini goAway (time left: {time_left or 'unknown'})")
+            if self.on_go_away:
+                self.on_go_away(time_left)
+            return
+
+        # Authoritative token counts (may accompany serverContent)
+        if "usageMetadata" in data:
+            metadata = data["usageMetadata"]
+            self.usage.server_prompt_tokens = metadata.get("promptTokenCount", 0)
+            self.usage.server_total_tokens = metadata.get("totalTokenCount", 0)
+
         # Server content (responses)
         if "serverContent" in data:
             content = data["serverContent"]
@@ -315,8 +455,7 @@ class GeminiLiveClient:
             if content.get("turnComplete"):
                 self.session.is_speaking = False
                 logger.debug("Gemini turn complete")
-                if self.on_turn_complete:
-                    self.on_turn_complete()
+                await self._emit(self.on_turn_complete)
 
             # Process model output
             model_turn = content.get("modelTurn", {})
@@ -330,19 +469,22 @@ class GeminiLiveClient:
 
                     if mime_type.startswith("audio/pcm"):
                         self.session.is_speaking = True
-                        audio_b64 = inline_data.get("data", "")
-                        audio_bytes = base64.b64decode(audio_b64)
+                        # Already base64-decoded by decode_server_message
+                        audio_bytes = inline_data.get("data", b"")
 
                         self._audio_chunks_received += 1
                         self._bytes_received += len(audio_bytes)
+                        self.usage.add_audio_out(
+                            len(audio_bytes) / 2 / self.config.output_sample_rate
+                        )
                         self.session.last_audio_received = datetime.now(timezone.utc)
 
-                        if self.on_audio:
-                            self.on_audio(audio_bytes)
+                        await self._emit(self.on_audio, audio_bytes)
 
                 # Text response
                 if "text" in part:
                     text = part["text"]
+                    self.usage.add_text_out(text)
                     logger.debug(f"Gemini text: {text}")
                     if self.on_text:
                         self.on_text(text)
@@ -365,6 +507,17 @@ class GeminiLiveClient:
             if self.on_error:
                 self.on_error(f"API error: {error_msg}")
 
+    async def _emit(self, callback: Optional[Callable[..., Any]], *args: Any) -> None:
+        """Invoke a callback, awaiting it if it is async.
+
+        The receive loop waits for async callbacks, so they must return
+        promptly: control messages (interrupted, goAway) queue behind them.
+        """
+        if callback:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+
     async def send_audio(self, audio_data: bytes) -> bool:
         """Send audio data to Gemini.
 
@@ -383,24 +536,12 @@ class GeminiLiveClient:
             return False
 
         try:
-            # Encode audio as base64
-            audio_b64 = base64.b64encode(audio_data).decode("utf-8")
-
-            msg = {
-                "realtimeInput": {
-                    "mediaChunks": [
-                        {
-                            "mimeType": "audio/pcm;rate=16000",
-                            "data": audio_b64,
-                        }
-                    ]
-                }
-            }
-
-            await self._ws.send(json.dumps(msg))
+            # realtimeInput.mediaChunks with the base64 spliced into a template
+            await self._ws.send(self._audio_encoder.encode(audio_data))
 
             self._audio_chunks_sent += 1
             self._bytes_sent += len(audio_data)
+            self.usage.add_audio_in(len(audio_data) / 2 / self.config.input_sample_rate)
             self.session.last_audio_sent = datetime.now(timezone.utc)
 
             return True
@@ -409,6 +550,51 @@ class GeminiLiveClient:
             logger.error(f"Error sending audio to Gemini: {e}")
             return False
 
+    async def send_activity_start(self) -> bool:
+        """Mark the start of user speech (client-side turn detection).
+
+        Only meaningful when automatic activity detection is disabled
+        (turn_detection="client"); audio sent until send_activity_end()
+        forms one user turn.
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        if await self._send_activity("activityStart"):
+            self._activity_starts += 1
+            return True
+        return False
+
+    async def send_activity_end(self) -> bool:
+        """Mark the end of user speech; Gemini starts responding on receipt.
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        if await self._send_activity("activityEnd"):
+            self._activity_ends += 1
+            return True
+        return False
+
+    async def _send_activity(self, signal: str) -> bool:
+        """Send a realtimeInput activity signal."""
+        if not self._ws or not self.session.connected:
+            logger.debug(f"Cannot send {signal}: not connected")
+            return False
+
+        if not self.session.setup_complete:
+            logger.debug(f"Cannot send {signal}: setup not complete")
+            return False
+
+        try:
+            await self._ws.send(_ACTIVITY_MESSAGES[signal])
+            logger.debug(f"Sent {signal} to Gemini")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error sending {signal} to Gemini: {e}")
+            return False
+
     async def send_text(self, text: str, end_of_turn: bool = True) -> bool:
         """Send text message to Gemini.
 
@@ -436,6 +622,7 @@ class GeminiLiveClient:
             }
 
             await self._ws.send(json.dumps(msg))
+            self.usage.add_text_in(text)
             logger.debug(f"Sent text to Gemini: {text[:100]}...")
             return True
 
@@ -465,23 +652,10 @@ class GeminiLiveClient:
             return False
 
         try:
-            # Encode image as base64
-            image_b64 = base64.b64encode(image_data).decode("utf-8")
-
             # Use same camelCase format as audio - realtimeInput with mediaChunks
             # This is the format that works for audio streaming
-            msg = {
-                "realtimeInput": {
-                    "mediaChunks": [
-                        {
-                            "mimeType": mime_type,
-                            "data": image_b64,
-                        }
-                    ]
-                }
-            }
-
-            await self._ws.send(json.dumps(msg))
+            await self._ws.send(encode_media_chunk(image_data, mime_type))
+            self.usage.add_image()
             logger.info(f"Sent image to Gemini: {len(image_data)} bytes")
             return True
 
@@ -558,6 +732,12 @@ class GeminiLiveClient:
             "audio_chunks_received": self._audio_chunks_received,
             "bytes_sent": self._bytes_sent,
             "bytes_received": self._bytes_received,
+            "turn_detection": self.config.turn_detection,
+            "activity_starts": self._activity_starts,
+            "activity_ends": self._activity_ends,
+            "resumable": self.resumption_handle is not None,
+            "resumptions": self._resumptions,
+            "tokens": self.usage.to_dict(),
             "connected_at": (
                 self.session.connected_at.isoformat()
                 if self.session.connected_at else None
@@ -0,0 +1,230 @@
+"""
+VK-Agent Gemini Wire Codec
+
+Encoding and decoding for the Gemini Live messages on the audio hot path.
+
+Architecture:
+    ┌─────────────────────────────────────────────────────────────────┐
+    │                        Gemini Codec                              │
+    ├─────────────────────────────────────────────────────────────────┤
+    │                                                                  │
+    │  Outbound (every 100ms chunk):                                   │
+    │    PCM -> b2a_base64 -> spliced between a prebuilt               │
+    │    '{"realtimeInput":{"mediaChunks":[{..."data":"' prefix and    │
+    │    '"}]}}' suffix in a reused buffer -> one str                  │
+    │    (no dict, no json.dumps scan of the base64 text)              │
+    │                                                                  │
+    │  Inbound (multi-KB serverContent):                               │
+    │    raw frame -> large "data" strings cut out by offset and       │
+    │    base64-decoded straight from the frame -> small skeleton      │
+    │    parsed with orjson (json fallback) -> decoded bytes put back  │
+    │    at parts[i].inlineData.data                                   │
+    │                                                                  │
+    │  Anything unexpected (escapes, unknown "data" keys) falls back   │
+    │  to a full parse, so the result is always the same dict shape.   │
+    │                                                                  │
+    └─────────────────────────────────────────────────────────────────┘
+
+Usage:
+    encoder = MediaChunkEncoder("audio/pcm;rate=16000")
+    await ws.send(encoder.encode(pcm))
+
+    data = decode_server_message(await ws.recv())
+    for part in data["serverContent"]["modelTurn"]["parts"]:
+        pcm = part["inlineData"]["data"]  # bytes
+"""
+
+import base64
+import binascii
+import json
+from typing import List, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# JSON parser for skeletons and fallbacks
+_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Base64 strings shorter than this are left for the JSON parser
+MIN_SPLICE_CHARS = 256
+
+# Prebuilt messages with no payload
+ACTIVITY_START = '{"realtimeInput":{"activityStart":{}}}'
+ACTIVITY_END = '{"realtimeInput":{"activityEnd":{}}}'
+
+_DATA_KEY = '"data"'
+_DATA_KEY_BYTES = b'"data"'
+
+Message = Union[str, bytes, bytearray]
+
+
+class MediaChunkEncoder:
+    """Encodes realtimeInput.mediaChunks messages for one MIME type.
+
+    The JSON around the base64 payload never changes, so it is built once
+    and the encoded chunk is spliced into a reused bytearray.
+
+    Example:
+        >>> encoder = MediaChunkEncoder("audio/pcm;rate=16000")
+        >>> encoder.encode(b"\\x00\\x00")
+        '{"realtimeInput":{"mediaChunks":[{"mimeType":"audio/pcm;rate=16000","data":"AAA="}]}}'
+    """
+
+    def __init__(self, mime_type: str):
+        """Initialize encoder.
+
+        Args:
+            mime_type: MIME type of every chunk (e.g. audio/pcm;rate=16000)
+        """
+        self.mime_type = mime_type
+        self._prefix = (
+            '{"realtimeInput":{"mediaChunks":[{"mimeType":'
+            + json.dumps(mime_type)
+            + ',"data":"'
+        ).encode("ascii")
+        self._suffix = b'"}]}}'
+        self._buffer = bytearray(self._prefix)
+
+    def encode(self, data: bytes) -> str:
+        """Encode one chunk as a text frame.
+
+        Args:
+            data: Raw media bytes
+
+        Returns:
+            JSON message string
+        """
+        buffer = self._buffer
+        del buffer[len(self._prefix):]  # Keeps the allocation
+        buffer += binascii.b2a_base64(data, newline=False)
+        buffer += self._suffix
+        return buffer.decode("ascii")
+
+
+def encode_media_chunk(data: bytes, mime_type: str) -> str:
+    """Encode a one-off realtimeInput.mediaChunks message (e.g. an image).
+
+    Args:
+        data: Raw media bytes
+        mime_type: MIME type of the chunk
+
+    Returns:
+        JSON message string
+    """
+    return MediaChunkEncoder(mime_type).encode(data)
+
+
+def _splice(message: Message, key) -> tuple:
+    """Cut large "data" string values out of a raw message.
+
+    Returns:
+        (skeleton, chunks): the message with each large value replaced by
+        a placeholder ("#0", "#1", ...; '#' is not base64), and the
+        decoded bytes in order. None skeleton if the frame needs a full
+        parse.
+    """
+    pieces = []
+    chunks: List[bytes] = []
+    is_text = isinstance(message, str)
+    view = message if is_text else memoryview(message)
+    quote, colon, backslash = ('"', ":", "\\") if is_text else (b'"', b":", b"\\")
+    pos = 0
+    search = 0
+
+    while True:
+        start = message.find(key, search)
+        if start < 0:
+            break
+        # Only a key is followed by ':' (a "data" string value is not)
+        open_quote = message.find(quote, start + len(key))
+        if open_quote < 0:
+            break
+        between = message[start + len(key):open_quote]
+        if between.strip() != colon:
+            search = start + len(key)
+            continue
+        close_quote = message.find(quote, open_quote + 1)
+        if close_quote < 0:
+            return None, chunks
+        search = close_quote + 1
+        if close_quote - open_quote - 1 < MIN_SPLICE_CHARS:
+            continue
+        if message.find(backslash, open_quote, close_quote) >= 0:
+            return None, chunks  # Escaped JSON string; let the parser handle it
+
+        pieces.append(message[pos:open_quote + 1])
+        index = f"#{len(chunks)}"
+        pieces.append(index if is_text else index.encode("ascii"))
+        chunks.append(binascii.a2b_base64(view[open_quote + 1:close_quote]))
+        pos = close_quote
+
+    if not chunks:
+        return message, chunks
+    pieces.append(message[pos:])
+    return ("" if is_text else b"").join(pieces), chunks
+
+
+def _inline_parts(data: dict) -> list:
+    """Return the inlineData dicts of serverContent.modelTurn.parts."""
+    content = data.get("serverContent")
+    if not isinstance(content, dict):
+        return []
+    parts = (content.get("modelTurn") or {}).get("parts") or []
+    return [
+        part["inlineData"] for part in parts
+        if isinstance(part, dict) and isinstance(part.get("inlineData"), dict)
+    ]
+
+
+def _decode_full(message: Message) -> dict:
+    """Parse a whole message and base64-decode every inlineData payload."""
+    data = _loads(message)
+    for inline in _inline_parts(data):
+        if isinstance(inline.get("data"), str):
+            inline["data"] = base64.b64decode(inline["data"])
+    return data
+
+
+def decode_server_message(message: Message) -> dict:
+    """Decode a Gemini Live server message.
+
+    Equivalent to json.loads() followed by base64-decoding every
+    serverContent.modelTurn.parts[*].inlineData.data into bytes, but the
+    base64 text is decoded directly from the frame instead of becoming a
+    Python str inside a parsed tree first.
+
+    Args:
+        message: Raw text or binary WebSocket frame
+
+    Returns:
+        Parsed message with inlineData.data as bytes
+    """
+    key = _DATA_KEY if isinstance(message, str) else _DATA_KEY_BYTES
+    skeleton, chunks = _splice(message, key)
+    if skeleton is None or not chunks:
+        return _decode_full(message)
+
+    data = _loads(skeleton)
+    restored = 0
+    for inline in _inline_parts(data):
+        value = inline.get("data")
+        if not isinstance(value, str):
+            continue
+        if value == f"#{restored}":
+            inline["data"] = chunks[restored]
+            restored += 1
+        elif value.startswith("#"):
+            # Placeholder out of order: an earlier large "data" value
+            # (e.g. toolCall args) took a chunk ('#' is not base64)
+            return _decode_full(message)
+        else:
+            inline["data"] = base64.b64decode(value)  # Short enough to skip splicing
+
+    if restored != len(chunks):
+        # A large "data" value somewhere other than modelTurn audio
+        return _decode_full(message)
+    return data
@@ -0,0 +1,274 @@
+"""
+VK-Agent Gemini Session Pool
+
+Keeps pre-connected, set-up Gemini Live sessions ready so a new bridge
+can start talking without paying TLS + WebSocket + setup on the call path.
+
+Architecture:
+    ┌─────────────────────────────────────────────────────────────────┐
+    │                      GeminiSessionPool                           │
+    ├─────────────────────────────────────────────────────────────────┤
+    │                                                                  │
+    │  Profile = (endpoint, API key, full setup message): every       │
+    │  setting the session is fixed to (voice, persona, turn          │
+    │  detection, resumption, context compression, ...)               │
+    │                                                                  │
+    │   warm(config) ──► profile registered ──► run() keeps `size`    │
+    │                     idle sessions connected + setupComplete      │
+    │                                                                  │
+    │   acquire(config):                                               │
+    │     idle session ready?  ── yes ──► hand over (hit)              │
+    │                          ── no  ──► connect now (miss)           │
+    │     then wake run() to replenish in the background               │
+    │                                                                  │
+    │   run(): evicts closed or idle > max_idle sessions, refills      │
+    │   each profile; failed connects back off (1s, 2s ... 30s)        │
+    │                                                                  │
+    └─────────────────────────────────────────────────────────────────┘
+
+A handed-over session belongs to the caller (the bridge disconnects it on
+stop); the pool never reuses a session that has carried a call.
+
+Usage:
+    pool = GeminiSessionPool(size=2)
+    pool.warm(settings.gemini)
+    task = asyncio.create_task(pool.run())
+
+    client = await pool.acquire(settings.gemini)
+    client.on_audio = handle_audio
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Set, Tuple
+
+from .config import GeminiConfig
+from .gemini_client import GeminiLiveClient, build_setup
+from .models import LatencyStats
+
+logger = logging.getLogger(__name__)
+
+# Longest wait between connect attempts for a failing profile
+MAX_RETRY_DELAY = 30.0
+
+Profile = Tuple[str, str, str]
+
+
+def profile_key(config: GeminiConfig) -> Profile:
+    """Settings fixed at setup time; sessions are only shared within one.
+
+    Built from the setup message itself, so a setting added to the setup
+    can never be missed here.
+    """
+    setup = json.dumps(build_setup(config), sort_keys=True)
+    return (config.ws_url, config.api_key, setup)
+
+
+class GeminiSessionPool:
+    """Pool of warm Gemini Live sessions per profile.
+
+    Example:
+        >>> pool = GeminiSessionPool(size=1)
+        >>> pool.warm(config)
+        >>> asyncio.create_task(pool.run())
+        >>> client = await pool.acquire(config)  # Already setupComplete
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_idle: float = 300.0,
+        refill_interval: float = 1.0,
+        factory: Callable[[GeminiConfig], GeminiLiveClient] = GeminiLiveClient,
+    ):
+        """Initialize pool.
+
+        Args:
+            size: Idle sessions to keep per profile
+            max_idle: Seconds before an idle session is replaced
+            refill_interval: Maintenance period when nothing wakes the pool
+            factory: Creates an unconnected client for a config
+        """
+        self.size = size
+        self.max_idle = max_idle
+        self.refill_interval = refill_interval
+        self._factory = factory
+
+        self._configs: Dict[Profile, GeminiConfig] = {}
+        # Idle sessions per profile: (parked at monotonic, client)
+        self._idle: Dict[Profile, Deque[Tuple[float, GeminiLiveClient]]] = {}
+        self._filling: Dict[Profile, int] = {}
+        self._failures: Dict[Profile, int] = {}
+        self._retry_at: Dict[Profile, float] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.connect_failures = 0
+        self.evicted = 0
+        self.acquire_time = LatencyStats()
+        self.connect_time = LatencyStats()
+
+    def warm(self, config: GeminiConfig) -> None:
+        """Keep sessions ready for a profile.
+
+        Args:
+            config: Gemini configuration of future bridges
+        """
+        key = profile_key(config)
+        if key not in self._configs:
+            self._configs[key] = config
+            self._idle[key] = deque()
+            self._filling[key] = 0
+        self._wakeup.set()
+
+    def idle_count(self, config: GeminiConfig) -> int:
+        """Number of idle sessions for a profile."""
+        return len(self._idle.get(profile_key(config), ()))
+
+    async def acquire(self, config: GeminiConfig) -> Optional[GeminiLiveClient]:
+        """Take a ready session, connecting one now if none is warm.
+
+        Also registers the profile, so the next call for it is warm.
+
+        Args:
+            config: Gemini configuration for the bridge
+
+        Returns:
+            Connected, set-up client, or None if connecting failed
+        """
+        start = time.monotonic()
+        key = profile_key(config)
+        self.warm(config)
+
+        client = None
+        idle = self._idle[key]
+        while idle:
+            parked_at, candidate = idle.popleft()
+            if self._usable(candidate, parked_at, start):
+                client = candidate
+                break
+            self._discard(candidate)
+
+        if client is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            logger.info("No warm Gemini session, connecting on demand")
+            client = await self._connect(key)
+
+        self._wakeup.set()  # Replenish
+        self.acquire_time.add((time.monotonic() - start) * 1000)
+        return client
+
+    def _usable(self, client: GeminiLiveClient, parked_at: float, now: float) -> bool:
+        """Whether an idle session can still take a call."""
+        return client.is_ready and now - parked_at < self.max_idle
+
+    def _discard(self, client: GeminiLiveClient) -> None:
+        """Close a session the pool no longer wants."""
+        self.evicted += 1
+        self._spawn(client.disconnect())
+
+    def _spawn(self, coro) -> None:
+        """Run a background task tracked for stop()."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _connect(self, key: Profile) -> Optional[GeminiLiveClient]:
+        """Connect and set up one session for a profile."""
+        client = self._factory(self._configs[key])
+        start = time.monotonic()
+        try:
+            connected = await client.connect()
+        except Exception as e:
+            logger.error(f"Gemini pool connect error: {e}")
+            connected = False
+
+        if not connected:
+            self.connect_failures += 1
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            self._retry_at[key] = time.monotonic() + min(2 ** (failures - 1), MAX_RETRY_DELAY)
+            return None
+
+        self._failures[key] = 0
+        self.connect_time.add((time.monotonic() - start) * 1000)
+        return client
+
+    async def _fill(self, key: Profile) -> None:
+        """Add one warm session to a profile."""
+        try:
+            client = await self._connect(key)
+            if client is None:
+                return
+            if not self._running:
+                await client.disconnect()
+                return
+            self._idle[key].append((time.monotonic(), client))
+            logger.debug(f"Warm Gemini session ready ({len(self._idle[key])}/{self.size})")
+        finally:
+            self._filling[key] -= 1
+
+    def _maintain(self) -> None:
+        """Evict unusable idle sessions and start refills."""
+        now = time.monotonic()
+        for key, idle in self._idle.items():
+            for entry in [e for e in idle if not self._usable(e[1], e[0], now)]:
+                idle.remove(entry)
+                self._discard(entry[1])
+
+            if now < self._retry_at.get(key, 0.0):
+                continue  # Backing off after failures
+            for _ in range(self.size - len(idle) - self._filling[key]):
+                self._filling[key] += 1
+                self._spawn(self._fill(key))
+
+    async def run(self) -> None:
+        """Maintain the pool until stop() is called."""
+        self._running = True
+        while self._running:
+            self._wakeup.clear()
+            self._maintain()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.refill_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stop(self) -> None:
+        """Stop replenishing and close every idle session."""
+        self._running = False
+        self._wakeup.set()
+
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        for idle in self._idle.values():
+            while idle:
+                _, client = idle.popleft()
+                await client.disconnect()
+
+    def get_stats(self) -> dict:
+        """Get pool statistics."""
+        return {
+            "size": self.size,
+            "max_idle_s": self.max_idle,
+            "profiles": len(self._configs),
+            "idle": sum(len(idle) for idle in self._idle.values()),
+            "connecting": sum(self._filling.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "connect_failures": self.connect_failures,
+            "evicted": self.evicted,
+            "acquire": self.acquire_time.to_dict(),
+            "connect": self.connect_time.to_dict(),
+        }
@@ -0,0 +1,258 @@
+"""
+VK-Agent Greeting Cache
+
+Pre-rendered greeting audio, stored as ready-to-send Opus frames so a
+joining participant hears the agent immediately instead of waiting for
+Gemini to generate and synthesize the same introduction every call.
+
+Architecture:
+    ┌─────────────────────────────────────────────────────────────────┐
+    │                        GreetingCache                             │
+    ├─────────────────────────────────────────────────────────────────┤
+    │                                                                  │
+    │  Key = sha256(voice, persona, template, frame ms, bitrate)      │
+    │                                                                  │
+    │  Join, cache hit:                                                │
+    │    frames ──► PlayoutScheduler ──► RTP (no Gemini round trip)   │
+    │    then a short name follow-up once the session is ready        │
+    │                                                                  │
+    │  Join, cache miss:                                               │
+    │    template prompt ──► Gemini ──► Opus frames (playback loop)   │
+    │    captured for that turn ──► put() ──► <dir>/<key>.greeting    │
+    │                                                                  │
+    │  LRU on disk: hits touch the file's mtime; beyond max_entries   │
+    │  the least recently used files are deleted.                      │
+    │                                                                  │
+    └─────────────────────────────────────────────────────────────────┘
+
+File format:
+    b"VKG1", frame duration ms (u16), frame count (u32), then each frame
+    as a u16 length + Opus packet (all big-endian).
+
+Usage:
+    cache = GreetingCache("/tmp/vk-agent-greetings", max_entries=16)
+    key = cache.key(voice, system_instruction, template, 20, 24000)
+    frames = cache.get(key)
+    if frames is None:
+        cache.put(key, captured_frames)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"VKG1"
+_HEADER = struct.Struct("!4sHI")
+_LENGTH = struct.Struct("!H")
+SUFFIX = ".greeting"
+
+# Shorter captures are treated as failed (e.g. an interrupted turn)
+MIN_FRAMES = 10
+
+
+def _mtime(path: str) -> int:
+    """Last-use time of a greeting file (0 if it just vanished)."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@dataclass
+class GreetingCapture:
+    """Opus frames of one Gemini greeting turn being recorded for the cache.
+
+    Attributes:
+        key: Cache key the frames will be stored under
+        generation: Playout generation of the greeting turn
+        frames: Encoded frames captured so far
+        complete: Turn finished without interruption
+        done: Set when the turn completes or is interrupted
+    """
+    key: str
+    generation: int
+    frames: List[bytes] = field(default_factory=list)
+    complete: bool = False
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class GreetingCache:
+    """Disk cache of greeting Opus frames with LRU eviction.
+
+    Example:
+        >>> cache = GreetingCache("/tmp/greetings", max_entries=4)
+        >>> key = cache.key("Puck", persona, template, 20, 24000)
+        >>> cache.put(key, frames)
+        >>> cache.get(key) == frames
+        True
+    """
+
+    def __init__(self, directory: str, max_entries: int = 16, frame_duration_ms: int = 20):
+        """Initialize cache.
+
+        Args:
+            directory: Where greeting files are kept (created on demand)
+            max_entries: Greetings kept before LRU eviction
+            frame_duration_ms: Duration of each stored Opus frame
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.frame_duration_ms = frame_duration_ms
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(voice: str, persona: str, template: str, frame_duration_ms: int, bitrate: int) -> str:
+        """Cache key for everything that changes the rendered audio.
+
+        Args:
+            voice: Gemini voice preset
+            persona: System instruction the greeting was generated under
+            template: Greeting prompt
+            frame_duration_ms: Opus frame duration
+            bitrate: Opus bitrate
+
+        Returns:
+            Hex digest used as the file name
+        """
+        material = "\0".join((voice, persona, template, str(frame_duration_ms), str(bitrate)))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key: str) -> Optional[List[bytes]]:
+        """Load a greeting and mark it recently used.
+
+        Args:
+            key: Key from key()
+
+        Returns:
+            Opus frames in playout order, or None if not cached
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            frames = self._decode(data)
+        except FileNotFoundError:
+            frames = None
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Discarding unreadable greeting {path}: {e}")
+            self._remove(path)
+            frames = None
+
+        if frames is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        try:
+            os.utime(path)  # LRU: most recently used
+        except OSError:
+            pass
+        return frames
+
+    def put(self, key: str, frames: List[bytes]) -> bool:
+        """Store a captured greeting.
+
+        Args:
+            key: Key from key()
+            frames: Opus frames of one complete greeting turn
+
+        Returns:
+            True if stored
+        """
+        if len(frames) < MIN_FRAMES:
+            return False
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(self._encode(frames))
+            os.replace(tmp_path, path)  # Readers never see a partial file
+        except OSError as e:
+            logger.warning(f"Could not store greeting: {e}")
+            self._remove(tmp_path)
+            return False
+
+        self.stores += 1
+        logger.info(
+            f"Cached greeting {key} ({len(frames)} frames, "
+            f"{len(frames) * self.frame_duration_ms / 1000:.1f}s)"
+        )
+        self._evict()
+        return True
+
+    def _encode(self, frames: List[bytes]) -> bytes:
+        parts = [_HEADER.pack(MAGIC, self.frame_duration_ms, len(frames))]
+        for frame in frames:
+            parts.append(_LENGTH.pack(len(frame)))
+            parts.append(frame)
+        return b"".join(parts)
+
+    def _decode(self, data: bytes) -> List[bytes]:
+        magic, frame_ms, count = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("bad magic")
+        if frame_ms != self.frame_duration_ms:
+            raise ValueError(f"frame duration {frame_ms}ms != {self.frame_duration_ms}ms")
+
+        frames = []
+        offset = _HEADER.size
+        for _ in range(count):
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            frame = data[offset:offset + length]
+            if len(frame) != length:
+                raise ValueError("truncated frame")
+            frames.append(frame)
+            offset += length
+        return frames
+
+    def _entries(self) -> List[str]:
+        """Greeting files, least recently used first."""
+        try:
+            names = [n for n in os.listdir(self.directory) if n.endswith(SUFFIX)]
+        except OSError:
+            return []
+        paths = [os.path.join(self.directory, n) for n in names]
+        return sorted(paths, key=_mtime)
+
+    def _evict(self) -> None:
+        """Delete least recently used greetings beyond max_entries."""
+        entries = self._entries()
+        for path in entries[:max(0, len(entries) - self.max_entries)]:
+            self._remove(path)
+            self.evictions += 1
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "directory": self.directory,
+            "entries": len(self._entries()),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
@@ -89,6 +89,8 @@ class JanusClient:
 
         # Participants in room
         self._participants: Dict[int, Participant] = {}
+        # Set once a talking/stopped-talking event has been received
+        self._talking_events_seen = False
 
         # Background tasks
         self._keepalive_task: Optional[asyncio.Task] = None
@@ -122,6 +124,18 @@ class JanusClient:
         """Get list of participants in room."""
         return list(self._participants.values())
 
+    @property
+    def any_talking(self) -> Optional[bool]:
+        """Whether any remote participant is talking, per AudioBridge events.
+
+        None until the first talking event arrives (audio level events may be
+        disabled, or nobody has spoken yet), so callers can tell "unknown"
+        from "silent".
+        """
+        if not self._talking_events_seen:
+            return None
+        return any(p.talking for p in self._participants.values())
+
     def _transaction_id(self) -> str:
         """Generate unique transaction ID for request tracking."""
         return secrets.token_hex(6)
@@ -328,8 +342,12 @@ class JanusClient:
                 "is_private": False,
                 "sampling_rate": 48000,
                 "audiolevel_event": True,
-                "audio_active_packets": 50,
+                # Talking events after 10 packets (200ms) instead of 1s, so the
+                # speech gate can trust them without clipping utterance onsets
+                "audio_active_packets": 10,
                 "audio_level_average": 25,
+                # Enables Opus in-band FEC in Janus' encoders (incl. forwarders)
+                "default_expectedloss": 10,
                 "record": False,
                 "allow_rtp_participants": True,  # Critical for plain RTP
                 "admin_key": "platform_audiobridge_admin_2024",
@@ -514,20 +532,26 @@ class JanusClient:
         forward_host: str,
         forward_port: int,
         publisher_id: Optional[int] = None,
+        ssrc: Optional[int] = None,
     ) -> bool:
         """Configure RTP forwarding for a participant.
 
         This enables receiving a specific participant's audio via RTP.
+        Each forward needs its own SSRC so the receiver can demultiplex
+        publishers sharing one port.
 
         Args:
             forward_host: IP to forward audio to
             forward_port: Port to forward audio to
             publisher_id: Participant ID to forward (None = self)
+            ssrc: SSRC for the forwarded stream (default: derived from the ID)
 
         Returns:
             True if forwarding configured, False otherwise
         """
         target_id = publisher_id or self.session.participant_id
+        if ssrc is None:
+            ssrc = (target_id or 0) & 0xFFFFFFFF
 
         msg = {
             "janus": "message",
@@ -542,7 +566,7 @@ class JanusClient:
                 "port": forward_port,
                 "codec": "opus",
                 "ptype": 111,
-                "ssrc": 12345678,
+                "ssrc": ssrc,
                 "admin_key": "platform_audiobridge_admin_2024",
             },
         }
@@ -550,7 +574,7 @@ class JanusClient:
 
         logger.info(
             f"Configured RTP forward: participant {target_id} -> "
-            f"{forward_host}:{forward_port}"
+            f"{forward_host}:{forward_port} (ssrc={ssrc})"
         )
 
         # Wait for response
@@ -596,10 +620,12 @@ class JanusClient:
         """Add or update participant from Janus data."""
         pid = data.get("id")
         if pid:
+            previous = self._participants.get(pid)
             self._participants[pid] = Participant(
                 id=pid,
                 display=data.get("display", "Unknown"),
                 muted=data.get("muted", False),
+                talking=data.get("talking", previous.talking if previous else False),
             )
 
     def _remove_participant(self, pid: int) -> None:
@@ -671,11 +697,13 @@ class JanusClient:
                 pid = plugindata.get("id")
                 if pid in self._participants:
                     self._participants[pid].talking = True
+                    self._talking_events_seen = True
 
             elif event_type == "stopped-talking":
                 pid = plugindata.get("id")
                 if pid in self._participants:
                     self._participants[pid].talking = False
+                    self._talking_events_seen = True
 
             elif event_type == "rtp_forward":
                 logger.debug(f"RTP forward response: {plugindata}")
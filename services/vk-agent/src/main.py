@@ -6,6 +6,12 @@ Uses the AgentBridge for proper bidirectional audio streaming:
 - Janus AudioBridge via WebSocket + RTP
 - Gemini Live API via WebSocket
 - Opus codec and sample rate conversion
+
+One process hosts many rooms through the SessionManager. The configured
+VK_AGENT_JANUS_ROOM_ID is started at boot; further rooms are created and
+deleted on demand through the /rooms API. With VK_AGENT_WORKERS > 1 this
+process becomes a Supervisor that shards rooms across worker processes
+(see supervisor.py), each running run_rooms() on its own ports.
 """
 
 import asyncio
@@ -16,9 +22,10 @@ import structlog
 import uvicorn
 from dotenv import load_dotenv
 
-from .api import create_app
-from .bridge import AgentBridge
-from .config import get_settings, configure_logging
+from .api import create_app, create_supervisor_app
+from .session_manager import SessionManager
+from .supervisor import Supervisor
+from .config import Settings, get_settings, configure_logging
 
 # Load environment variables
 load_dotenv()
@@ -39,43 +46,22 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
-async def main():
-    """Start the VK-Agent service."""
-    logger.info("Starting VK-Agent")
-
-    # Load configuration
-    settings = get_settings()
-    configure_logging(settings.log_level)
-
-    # Validate configuration
-    errors = settings.validate()
-    if errors:
-        for error in errors:
-            logger.error(f"Configuration error: {error}")
-        sys.exit(1)
-
-    logger.info(
-        "Configuration loaded",
-        janus_url=settings.janus.websocket_url,
-        room_id=settings.janus.room_id,
-        display_name=settings.janus.display_name,
-        gemini_model=settings.gemini.model,
-        gemini_voice=settings.gemini.voice,
-    )
-
-    # Create the bridge (main agent orchestrator)
-    bridge = AgentBridge(settings)
-
-    # Create API server with bridge
-    app = create_app(bridge)
+async def serve(app, host: str, port: int, on_start, on_stop) -> None:
+    """Run the API server until SIGINT/SIGTERM.
 
+    Args:
+        app: FastAPI application
+        host: API listen host
+        port: API listen port
+        on_start: Coroutine function run once the API is up
+        on_stop: Coroutine function run before the API shuts down
+    """
     # Setup signal handlers
     shutdown_event = asyncio.Event()
 
     def signal_handler(sig, frame):
         logger.info(f"Received signal {sig}, shutting down...")
         shutdown_event.set()
-        bridge._stop_event.set()
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -83,30 +69,26 @@ async def main():
     # Start API server first (for health checks)
     config = uvicorn.Config(
         app,
-        host=settings.api_host,
-        port=settings.api_port,
+        host=host,
+        port=port,
         log_level="warning",  # Reduce uvicorn noise
     )
     server = uvicorn.Server(config)
     server_task = asyncio.create_task(server.serve())
 
-    logger.info(f"API server running on http://{settings.api_host}:{settings.api_port}")
+    logger.info(f"API server running on http://{host}:{port}")
 
-    # Start the bridge (connects to Janus and Gemini)
-    if await bridge.start():
-        logger.info("Bridge started successfully - ready for voice AI!")
+    await on_start()
 
-        # Run until shutdown
-        try:
-            await bridge.run_until_stopped()
-        except asyncio.CancelledError:
-            pass
-    else:
-        logger.error("Failed to start bridge")
+    # Run until shutdown (rooms may be added/removed via the API meanwhile)
+    try:
+        await shutdown_event.wait()
+    except asyncio.CancelledError:
+        pass
 
     # Cleanup
     logger.info("Shutting down VK-Agent...")
-    await bridge.stop()
+    await on_stop()
     server.should_exit = True
 
     try:
@@ -114,6 +96,69 @@ async def main():
     except asyncio.TimeoutError:
         logger.warning("Server shutdown timed out")
 
+
+async def run_rooms(settings: Settings, create_default: bool = True) -> None:
+    """Host rooms in this process (single-process mode, or one worker).
+
+    Args:
+        settings: Process settings (API port, RTP port range)
+        create_default: Start the configured default room at boot
+    """
+    # Create the session manager (hosts one AgentBridge per room)
+    manager = SessionManager(settings)
+
+    # Create API server with session manager
+    app = create_app(manager)
+
+    async def on_start():
+        manager.start()  # Warm Gemini sessions before the first room asks
+        if not create_default:
+            return
+        # Start the default room bridge (connects to Janus and Gemini)
+        try:
+            await manager.create_room(settings.janus.room_id)
+            logger.info("Bridge started successfully - ready for voice AI!")
+        except Exception as e:
+            logger.error(f"Failed to start bridge for default room: {e}")
+
+    await serve(app, settings.api_host, settings.api_port, on_start, manager.stop_all)
+
+
+async def main():
+    """Start the VK-Agent service."""
+    logger.info("Starting VK-Agent")
+
+    # Load configuration
+    settings = get_settings()
+    configure_logging(settings.log_level)
+
+    # Validate configuration
+    errors = settings.validate()
+    if errors:
+        for error in errors:
+            logger.error(f"Configuration error: {error}")
+        sys.exit(1)
+
+    logger.info(
+        "Configuration loaded",
+        janus_url=settings.janus.websocket_url,
+        room_id=settings.janus.room_id,
+        display_name=settings.janus.display_name,
+        gemini_model=settings.gemini.model,
+        gemini_voice=settings.gemini.voice,
+        workers=settings.workers,
+    )
+
+    if settings.workers > 1:
+        # Front controller: rooms are sharded across worker processes
+        supervisor = Supervisor(settings)
+        app = create_supervisor_app(supervisor)
+        await serve(
+            app, settings.api_host, settings.api_port, supervisor.start, supervisor.stop
+        )
+    else:
+        await run_rooms(settings)
+
     logger.info("VK-Agent stopped")
 
 
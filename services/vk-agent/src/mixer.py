@@ -0,0 +1,193 @@
+"""
+VK-Agent Inbound Audio Mixer
+
+Sums the decoded 16kHz PCM of every active publisher into the single
+stream sent to Gemini. Each publisher arrives as its own RTP forward
+(distinct SSRC) with its own jitter buffer and Opus decoder; the mixer
+only ever sees already-decoded int16 PCM.
+
+Architecture:
+    SSRC A ──► jitter buffer ──► decoder A ──► push(A, pcm) ──► FIFO A ─┐
+    SSRC B ──► jitter buffer ──► decoder B ──► push(B, pcm) ──► FIFO B ─┼─► mix() ──► Gemini
+    SSRC C ──► (idle, reaped) ──────────────────────────────────────────┘
+
+Frame clock:
+    Every publisher's jitter buffer releases on its own deadline, so two
+    speakers almost never arrive in the same batch. mix() therefore runs
+    on a fixed frame clock (20ms by default): each tick that is due pulls
+    one frame from every source FIFO, and a source with no full frame yet
+    contributes silence for that tick. Output advances at one stream's
+    rate however the sources interleave. The clock stops when no source
+    has a frame and re-anchors on the next one, so idle time never turns
+    into silence.
+
+Mixing:
+    A tick's frames are stacked into one int32 matrix and summed with a
+    single vectorized np.sum, then clipped back to int16. A single
+    source is passed through without copying, so cost grows with the
+    number of publishers currently speaking, not with room size.
+
+Usage:
+    >>> mixer = AudioMixer(sample_rate=16000, frame_duration_ms=20)
+    >>> mixer.push(ssrc_a, pcm_a)
+    >>> mixer.push(ssrc_b, pcm_b)
+    >>> mixed = mixer.mix()  # Frames whose tick is due
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class AudioMixer:
+    """Frame-clocked, vectorized int16 mixer for per-publisher PCM streams.
+
+    Example:
+        >>> mixer = AudioMixer()
+        >>> mixer.push(1, pcm_bytes_1)
+        >>> mixer.push(2, pcm_bytes_2)
+        >>> pcm = mixer.mix()  # bytes, clipped sum of both
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_duration_ms: int = 20,
+        max_backlog_ms: int = 100,
+    ):
+        """Initialize mixer.
+
+        Args:
+            sample_rate: Rate of the pushed PCM
+            frame_duration_ms: Mixing clock period
+            max_backlog_ms: Audio a source may queue ahead of the clock
+                (oldest dropped beyond)
+        """
+        self.frame_samples = sample_rate * frame_duration_ms // 1000
+        self.frame_duration = frame_duration_ms / 1000.0
+        self.max_backlog = max(1, max_backlog_ms // frame_duration_ms) * self.frame_samples
+
+        self._fifos: Dict[int, np.ndarray] = {}
+        # Time of the next due tick (None = clock stopped, nothing to mix)
+        self._next_tick: Optional[float] = None
+
+        # Statistics
+        self._mix_calls = 0
+        self._frames_mixed = 0
+        self._multi_source_mixes = 0
+        self._silence_fills = 0
+        self._dropped_samples = 0
+        self._clipped_samples = 0
+        self._max_sources = 0
+
+    @property
+    def active_sources(self) -> int:
+        """Sources with audio waiting to be mixed."""
+        # list() snapshot: get_stats runs on the loop while a DSP thread mixes
+        return sum(1 for fifo in list(self._fifos.values()) if len(fifo))
+
+    def push(self, source_id: int, pcm_data: bytes) -> None:
+        """Queue decoded PCM for a source.
+
+        Args:
+            source_id: Publisher / SSRC identifier
+            pcm_data: PCM16 bytes at the mixer's sample rate
+        """
+        if not pcm_data:
+            return
+        samples = np.frombuffer(pcm_data, dtype=np.int16)
+        fifo = self._fifos.get(source_id)
+        if fifo is not None and len(fifo):
+            samples = np.concatenate((fifo, samples))
+
+        excess = len(samples) - self.max_backlog
+        if excess > 0:
+            # Source ran ahead of the clock: keep the newest audio
+            self._dropped_samples += excess
+            samples = samples[excess:]
+        self._fifos[source_id] = samples
+
+    def mix(self, now: Optional[float] = None) -> bytes:
+        """Mix every frame whose clock tick is due.
+
+        Args:
+            now: Monotonic time (default: time.monotonic())
+
+        Returns:
+            Mixed PCM16 bytes, whole frames only (empty if none is due)
+        """
+        self._mix_calls += 1
+        if now is None:
+            now = time.monotonic()
+        if self._next_tick is None:
+            self._next_tick = now  # Re-anchor on the first frame after idle
+
+        # Half a frame of slack absorbs release timer granularity
+        horizon = now + self.frame_duration / 2
+        out: List[np.ndarray] = []
+        while self._next_tick <= horizon:
+            frame = self._mix_frame()
+            if frame is None:
+                self._next_tick = None  # Idle: stop the clock
+                break
+            out.append(frame)
+            self._next_tick += self.frame_duration
+
+        if not out:
+            return b""
+        return out[0].tobytes() if len(out) == 1 else np.concatenate(out).tobytes()
+
+    def _mix_frame(self) -> Optional[np.ndarray]:
+        """Pull one frame per source and sum them (None if no source has one)."""
+        n = self.frame_samples
+        frames = []
+        for source_id, fifo in self._fifos.items():
+            if len(fifo) >= n:
+                frames.append(fifo[:n])
+                self._fifos[source_id] = fifo[n:]
+        if not frames:
+            return None
+
+        self._frames_mixed += 1
+        # Sources without a full frame yet contribute silence this tick
+        self._silence_fills += len(self._fifos) - len(frames)
+        if len(frames) > self._max_sources:
+            self._max_sources = len(frames)
+
+        # Fast path: one speaker, nothing to sum
+        if len(frames) == 1:
+            return frames[0]
+
+        self._multi_source_mixes += 1
+        mixed = np.sum(np.stack(frames).astype(np.int32), axis=0)
+        clipped = np.count_nonzero((mixed > 32767) | (mixed < -32768))
+        if clipped:
+            self._clipped_samples += int(clipped)
+            np.clip(mixed, -32768, 32767, out=mixed)
+
+        return mixed.astype(np.int16)
+
+    def remove(self, source_id: int) -> None:
+        """Drop a source and any audio queued for it (e.g., reaped stream)."""
+        self._fifos.pop(source_id, None)
+
+    def clear(self) -> None:
+        """Drop all queued audio and stop the clock."""
+        self._fifos.clear()
+        self._next_tick = None
+
+    def get_stats(self) -> dict:
+        """Get mixer statistics."""
+        return {
+            "active_sources": self.active_sources,
+            "mix_calls": self._mix_calls,
+            "frames_mixed": self._frames_mixed,
+            "multi_source_mixes": self._multi_source_mixes,
+            "max_sources": self._max_sources,
+            "silence_fills": self._silence_fills,
+            "dropped_samples": self._dropped_samples,
+            "clipped_samples": self._clipped_samples,
+        }
@@ -9,17 +9,31 @@ Models are designed for:
 
 Architecture:
     RTPPacket → Individual RTP packet (RFC 3550)
+    RTPPacketView → Zero-copy view of a received RTP datagram (hot path)
+    RTPPacketWriter → Preallocated outbound RTP packet buffer (hot path)
     AudioFormat → Audio stream configuration
     JanusSession → Janus connection state
     GeminiSession → Gemini Live API state
+    TokenUsage → Approximate Gemini context tokens (audio seconds, images, text)
     BridgeStats → Aggregate metrics
+    LatencyStats → Rolling latency samples (count/last/avg/p50/p95)
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Deque, Optional, Dict, Any, Tuple
 import struct
+import time
+
+
+# Fixed 12-byte RTP header: V/P/X/CC, M/PT, sequence, timestamp, SSRC
+RTP_HEADER = struct.Struct("!BBHII")
+RTP_HEADER_SIZE = RTP_HEADER.size
+
+# Largest payload that fits one UDP datagram on a 1500-byte MTU
+RTP_MAX_PAYLOAD = 1500 - 20 - 8 - RTP_HEADER_SIZE
 
 
 class AgentState(Enum):
@@ -291,6 +305,212 @@ class RTPPacket:
         }
 
 
+class RTPPacketView:
+    """Zero-copy view of a received RTP packet.
+
+    Parses the fixed header with a precompiled struct and keeps the
+    payload as a memoryview into the datagram instead of copying it.
+    RTPPacket builds a dataclass, slices the payload and reads the
+    wall clock for every packet; on the receive path only the header
+    fields and the payload are needed.
+
+    The receive timestamp is time.monotonic_ns(), the clock of the jitter
+    buffer and the event loop; `source` is the sender's (host, port) when
+    set by the receiver (RTCP reports go back there).
+
+    Example:
+        >>> packet = RTPPacketView.parse(datagram)
+        >>> packet.sequence_number, len(packet.payload)
+        (1234, 80)
+        >>> decoder.decode(bytes(packet.payload))  # ctypes bindings need bytes
+    """
+
+    __slots__ = (
+        "data",
+        "marker",
+        "payload_type",
+        "sequence_number",
+        "timestamp",
+        "ssrc",
+        "csrc_count",
+        "received_ns",
+        "source",
+        "_start",
+        "_end",
+    )
+
+    def __init__(
+        self,
+        data: bytes,
+        marker: bool,
+        payload_type: int,
+        sequence_number: int,
+        timestamp: int,
+        ssrc: int,
+        csrc_count: int,
+        start: int,
+        end: int,
+        received_ns: int,
+    ):
+        self.data = data
+        self.marker = marker
+        self.payload_type = payload_type
+        self.sequence_number = sequence_number
+        self.timestamp = timestamp
+        self.ssrc = ssrc
+        self.csrc_count = csrc_count
+        self._start = start
+        self._end = end
+        self.received_ns = received_ns
+        self.source: Optional[Tuple[str, int]] = None
+
+    @classmethod
+    def parse(
+        cls,
+        data: bytes,
+        received_ns: Optional[int] = None,
+    ) -> Optional["RTPPacketView"]:
+        """Parse the header of a raw RTP datagram.
+
+        Args:
+            data: Raw packet bytes (minimum 12 bytes for header)
+            received_ns: Monotonic receive time in ns (default: now)
+
+        Returns:
+            Packet view or None if invalid
+        """
+        size = len(data)
+        if size < RTP_HEADER_SIZE:
+            return None
+
+        first_byte, second_byte, sequence_number, timestamp, ssrc = (
+            RTP_HEADER.unpack_from(data)
+        )
+        if first_byte >> 6 != 2:
+            return None
+
+        # Header length: 12 + CSRC entries (+ extension header)
+        csrc_count = first_byte & 0x0F
+        start = RTP_HEADER_SIZE + csrc_count * 4
+        if first_byte & 0x10 and size >= start + 4:
+            start += 4 + 4 * ((data[start + 2] << 8) | data[start + 3])
+
+        end = size
+        if first_byte & 0x20 and end > start:
+            pad_len = data[end - 1]
+            if pad_len <= end - start:
+                end -= pad_len
+        if start > end:
+            return None
+
+        return cls(
+            data,
+            bool(second_byte & 0x80),
+            second_byte & 0x7F,
+            sequence_number,
+            timestamp,
+            ssrc,
+            csrc_count,
+            start,
+            end,
+            time.monotonic_ns() if received_ns is None else received_ns,
+        )
+
+    @property
+    def payload(self) -> memoryview:
+        """Payload as a view into the datagram (no copy)."""
+        return memoryview(self.data)[self._start:self._end]
+
+    @property
+    def payload_size(self) -> int:
+        """Payload length in bytes."""
+        return self._end - self._start
+
+    @property
+    def header_size(self) -> int:
+        """Size of RTP header in bytes (including CSRCs and extension)."""
+        return self._start
+
+    @property
+    def received_at(self) -> float:
+        """Monotonic receive time in seconds."""
+        return self.received_ns / 1e9
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for debugging."""
+        return {
+            "marker": self.marker,
+            "payload_type": self.payload_type,
+            "sequence_number": self.sequence_number,
+            "timestamp": self.timestamp,
+            "ssrc": hex(self.ssrc),
+            "payload_size": self.payload_size,
+        }
+
+
+class RTPPacketWriter:
+    """Preallocated buffer for outbound RTP packets of one stream.
+
+    The header is packed in place and the payload copied in behind it, so
+    sending a frame allocates nothing. The returned view is only valid
+    until the next write() (asyncio copies datagrams it has to queue).
+
+    Example:
+        >>> writer = RTPPacketWriter(ssrc=0x12345678, payload_type=111)
+        >>> transport.sendto(writer.write(opus_frame, seq, ts, marker=True))
+    """
+
+    __slots__ = ("ssrc", "payload_type", "_buffer", "_view")
+
+    def __init__(self, ssrc: int, payload_type: int = 111, max_payload: int = RTP_MAX_PAYLOAD):
+        """Initialize writer.
+
+        Args:
+            ssrc: Synchronization source identifier
+            payload_type: RTP payload type (111 for Opus)
+            max_payload: Initial payload capacity (grows if exceeded)
+        """
+        self.ssrc = ssrc & 0xFFFFFFFF
+        self.payload_type = payload_type & 0x7F
+        self._buffer = bytearray(RTP_HEADER_SIZE + max_payload)
+        self._view = memoryview(self._buffer)
+
+    def write(
+        self,
+        payload: bytes,
+        sequence_number: int,
+        timestamp: int,
+        marker: bool = False,
+    ) -> memoryview:
+        """Build one packet in the buffer.
+
+        Args:
+            payload: Encoded media
+            sequence_number: RTP sequence number
+            timestamp: RTP media timestamp
+            marker: Marker bit (first packet after silence)
+
+        Returns:
+            View of the complete packet
+        """
+        end = RTP_HEADER_SIZE + len(payload)
+        if end > len(self._buffer):
+            self._buffer = bytearray(end)
+            self._view = memoryview(self._buffer)
+
+        RTP_HEADER.pack_into(
+            self._buffer,
+            0,
+            0x80,  # V=2, P=0, X=0, CC=0
+            (marker << 7) | self.payload_type,
+            sequence_number & 0xFFFF,
+            timestamp & 0xFFFFFFFF,
+            self.ssrc,
+        )
+        self._view[RTP_HEADER_SIZE:end] = payload
+        return self._view[:end]
+
+
 @dataclass
 class JanusSession:
     """Janus connection session state.
@@ -395,6 +615,162 @@ class GeminiSession:
         }
 
 
+# Approximate Gemini token costs (Live API accounting)
+AUDIO_TOKENS_PER_SECOND = 32
+IMAGE_TOKENS = 258
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class TokenUsage:
+    """Client-side estimate of what a Gemini session holds in its context.
+
+    Counts audio seconds, images and text in both directions and converts
+    them with the Live API's per-modality rates. context_tokens models the
+    server's sliding window: once it passes trigger_tokens it drops back to
+    target_tokens, as context_window_compression does. Authoritative counts
+    from usageMetadata are kept alongside when the server sends them.
+
+    Attributes:
+        trigger_tokens: Compression trigger (0 = no compression)
+        target_tokens: Context kept after compression
+        context_tokens: Estimated tokens currently in context
+        compressions: Times the estimate crossed the trigger
+    """
+    trigger_tokens: int = 0
+    target_tokens: int = 0
+
+    audio_in_seconds: float = 0.0
+    audio_out_seconds: float = 0.0
+    images: int = 0
+    text_chars_in: int = 0
+    text_chars_out: int = 0
+
+    context_tokens: float = 0.0
+    compressions: int = 0
+
+    # Last usageMetadata reported by the server
+    server_prompt_tokens: int = 0
+    server_total_tokens: int = 0
+
+    @property
+    def tokens_sent(self) -> int:
+        """Estimated tokens sent to Gemini over the session."""
+        return int(
+            self.audio_in_seconds * AUDIO_TOKENS_PER_SECOND
+            + self.images * IMAGE_TOKENS
+            + self.text_chars_in / CHARS_PER_TOKEN
+        )
+
+    @property
+    def tokens_received(self) -> int:
+        """Estimated tokens generated by Gemini over the session."""
+        return int(
+            self.audio_out_seconds * AUDIO_TOKENS_PER_SECOND
+            + self.text_chars_out / CHARS_PER_TOKEN
+        )
+
+    def _grow(self, tokens: float) -> None:
+        """Add tokens to the context estimate, compressing past the trigger."""
+        self.context_tokens += tokens
+        if self.trigger_tokens and self.context_tokens > self.trigger_tokens:
+            self.context_tokens = self.target_tokens
+            self.compressions += 1
+
+    def add_audio_in(self, seconds: float) -> None:
+        """Record user audio sent."""
+        self.audio_in_seconds += seconds
+        self._grow(seconds * AUDIO_TOKENS_PER_SECOND)
+
+    def add_audio_out(self, seconds: float) -> None:
+        """Record model audio received."""
+        self.audio_out_seconds += seconds
+        self._grow(seconds * AUDIO_TOKENS_PER_SECOND)
+
+    def add_image(self) -> None:
+        """Record one image (screen-share frame) sent."""
+        self.images += 1
+        self._grow(IMAGE_TOKENS)
+
+    def add_text_in(self, text: str) -> None:
+        """Record text sent (turns, greetings)."""
+        self.text_chars_in += len(text)
+        self._grow(len(text) / CHARS_PER_TOKEN)
+
+    def add_text_out(self, text: str) -> None:
+        """Record text received."""
+        self.text_chars_out += len(text)
+        self._grow(len(text) / CHARS_PER_TOKEN)
+
+    def reset_context(self, base_tokens: float = 0.0) -> None:
+        """Start a fresh context (new, non-resumed session)."""
+        self.context_tokens = base_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "audio_in_seconds": round(self.audio_in_seconds, 1),
+            "audio_out_seconds": round(self.audio_out_seconds, 1),
+            "images": self.images,
+            "text_chars_in": self.text_chars_in,
+            "text_chars_out": self.text_chars_out,
+            "tokens_sent": self.tokens_sent,
+            "tokens_received": self.tokens_received,
+            "context_tokens": round(self.context_tokens),
+            "trigger_tokens": self.trigger_tokens,
+            "target_tokens": self.target_tokens,
+            "compressions": self.compressions,
+            "server_prompt_tokens": self.server_prompt_tokens,
+            "server_total_tokens": self.server_total_tokens,
+        }
+
+
+@dataclass
+class LatencyStats:
+    """Rolling latency samples for one measured interval.
+
+    Keeps the most recent `window` samples for percentiles; count and
+    average cover the whole lifetime.
+
+    Attributes:
+        count: Samples recorded
+        last_ms: Most recent sample
+        total_ms: Sum of all samples
+    """
+    window: int = 100
+    count: int = 0
+    last_ms: float = 0.0
+    total_ms: float = 0.0
+    _recent: Deque[float] = field(default_factory=deque, repr=False)
+
+    def add(self, ms: float) -> None:
+        """Record one sample in milliseconds."""
+        self.count += 1
+        self.last_ms = ms
+        self.total_ms += ms
+        self._recent.append(ms)
+        if len(self._recent) > self.window:
+            self._recent.popleft()
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile over the recent window (0.0 if empty)."""
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "count": self.count,
+            "last_ms": round(self.last_ms, 1),
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 1),
+            "p95_ms": round(self.percentile(95), 1),
+        }
+
+
 @dataclass
 class BridgeStats:
     """Aggregate statistics for the bridge.
@@ -413,6 +789,13 @@ class BridgeStats:
         gemini_interruptions: Times Gemini was interrupted
         decode_errors: Opus decode failures
         encode_errors: Opus encode failures
+        ttfa: User end-of-speech to first Gemini audio byte
+        interrupt_to_silence: User speech onset to agent playout cut (barge-in)
+        join_to_audio: Participant join to first agent audio (greeting)
+        gemini_recovery: Gemini connection loss to reconnected + gap replayed
+        gemini_lost_audio_ms: User audio that never reached Gemini
+            (buffer overflow during a reconnect, or failed sends)
+        gemini_replayed_audio_ms: User audio buffered during a gap and replayed
     """
     state: AgentState = AgentState.INITIALIZING
     started_at: Optional[datetime] = None
@@ -433,6 +816,11 @@ class BridgeStats:
     # Event statistics
     gemini_interruptions: int = 0
     gemini_turn_completions: int = 0
+    gemini_reconnects: int = 0
+    gemini_resumptions: int = 0
+    greetings_cached: int = 0
+    greetings_generated: int = 0
+    barge_ins: int = 0
     participants_seen: int = 0
 
     # Error statistics
@@ -441,6 +829,16 @@ class BridgeStats:
     janus_errors: int = 0
     gemini_errors: int = 0
 
+    # Latency statistics
+    ttfa: LatencyStats = field(default_factory=LatencyStats)
+    interrupt_to_silence: LatencyStats = field(default_factory=LatencyStats)
+    join_to_audio: LatencyStats = field(default_factory=LatencyStats)
+    gemini_recovery: LatencyStats = field(default_factory=LatencyStats)
+
+    # Gemini reconnection audio accounting
+    gemini_lost_audio_ms: float = 0.0
+    gemini_replayed_audio_ms: float = 0.0
+
     @property
     def uptime_seconds(self) -> float:
         """Calculate uptime in seconds."""
@@ -475,12 +873,25 @@ class BridgeStats:
                 "chunks_from_gemini": self.audio_chunks_from_gemini,
                 "bytes_to_gemini": self.audio_bytes_to_gemini,
                 "bytes_from_gemini": self.audio_bytes_from_gemini,
+                "lost_to_gemini_ms": round(self.gemini_lost_audio_ms, 1),
+                "replayed_to_gemini_ms": round(self.gemini_replayed_audio_ms, 1),
             },
             "events": {
                 "gemini_interruptions": self.gemini_interruptions,
                 "gemini_turn_completions": self.gemini_turn_completions,
+                "gemini_reconnects": self.gemini_reconnects,
+                "gemini_resumptions": self.gemini_resumptions,
+                "greetings_cached": self.greetings_cached,
+                "greetings_generated": self.greetings_generated,
+                "barge_ins": self.barge_ins,
                 "participants_seen": self.participants_seen,
             },
+            "latency": {
+                "ttfa": self.ttfa.to_dict(),
+                "interrupt_to_silence": self.interrupt_to_silence.to_dict(),
+                "join_to_audio": self.join_to_audio.to_dict(),
+                "gemini_recovery": self.gemini_recovery.to_dict(),
+            },
             "errors": {
                 "decode": self.decode_errors,
                 "encode": self.encode_errors,
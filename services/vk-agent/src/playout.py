@@ -0,0 +1,276 @@
+"""
+VK-Agent RTP Playout Scheduler
+
+Sends outbound Opus frames to Janus on an isochronous 20ms grid driven by
+the monotonic clock, instead of sleeping a fixed time after each send
+(which drifts with event-loop lag and bursts when chunks queue up).
+
+Scheduling:
+    Frame n of a talkspurt is sent at t0 + n * frame_duration, where t0 is
+    the monotonic time the talkspurt started. Sleeping to an absolute
+    deadline means processing time and loop lag do not accumulate.
+
+    ┌──────────────┐  enqueue()  ┌──────────────────┐  send() at t0+n*20ms
+    │ Opus encoder │ ──────────► │ bounded buffer   │ ─────────────────────► RTPSender
+    └──────────────┘  (bursty)   │ (drop-oldest)    │    (isochronous)
+                                 └──────────────────┘
+
+    Gemini delivers a whole answer faster than realtime; the buffer holds
+    it, up to max_buffer_ms (the oldest frames beyond are dropped and
+    counted in frames_dropped). enqueue() never waits: the bridge feeds it
+    from the Gemini receive loop, which must keep reading interruptions
+    and goAway while a long answer plays. A frame sent later than
+    late_threshold_ms after its deadline counts as late; if the loop stalls
+    beyond resync_threshold_ms the grid is re-anchored instead of bursting
+    to catch up. An empty buffer before end_of_turn() counts as an underrun.
+
+Cancellation:
+    clear() bumps a generation counter. Producers read `generation` when
+    they take a chunk and pass it to enqueue(); frames encoded for an
+    older generation (a chunk already in flight when the interruption
+    hit) are rejected instead of played. The run loop re-checks the
+    generation after every deadline sleep, so at most the frame already
+    handed to the socket goes out - silence within one frame period.
+
+        gen 3: ─ f f f f ─ clear() ─┐
+        gen 4:                      └─ enqueue(frames, gen=3) → rejected
+
+Usage:
+    >>> scheduler = PlayoutScheduler(send=rtp_sender.send)
+    >>> task = asyncio.create_task(scheduler.run())
+    >>> generation = scheduler.generation
+    >>> scheduler.enqueue(encode(chunk), generation)
+    >>> scheduler.end_of_turn()
+    >>> scheduler.stop()
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PlayoutStats:
+    """Statistics for the playout scheduler."""
+    frames_queued: int = 0
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    send_failures: int = 0
+    late_frames: int = 0
+    underruns: int = 0
+    resyncs: int = 0
+    talkspurts: int = 0
+    max_lateness_ms: float = 0.0
+    buffer_high_water: int = 0
+    invalidations: int = 0
+    frames_invalidated: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "frames_queued": self.frames_queued,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "send_failures": self.send_failures,
+            "late_frames": self.late_frames,
+            "underruns": self.underruns,
+            "resyncs": self.resyncs,
+            "talkspurts": self.talkspurts,
+            "max_lateness_ms": round(self.max_lateness_ms, 2),
+            "buffer_high_water": self.buffer_high_water,
+            "invalidations": self.invalidations,
+            "frames_invalidated": self.frames_invalidated,
+        }
+
+
+class PlayoutScheduler:
+    """Monotonic-clock playout of 20ms frames with absolute deadlines.
+
+    Example:
+        >>> scheduler = PlayoutScheduler(send=sender.send, frame_duration_ms=20)
+        >>> asyncio.create_task(scheduler.run())
+        >>> scheduler.enqueue(frames)
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes, bool], bool],
+        frame_duration_ms: int = 20,
+        max_buffer_ms: int = 30000,
+        late_threshold_ms: float = 5.0,
+        resync_threshold_ms: float = 60.0,
+    ):
+        """Initialize playout scheduler.
+
+        Args:
+            send: Callback (frame, marker) -> bool that transmits one frame
+            frame_duration_ms: Audio duration of each frame
+            max_buffer_ms: Playout buffer bound (oldest frames dropped beyond)
+            late_threshold_ms: Lateness after which a frame counts as late
+            resync_threshold_ms: Lateness after which the grid is re-anchored
+        """
+        self._send = send
+        self.frame_duration = frame_duration_ms / 1000.0
+        self.max_frames = max(1, max_buffer_ms // frame_duration_ms)
+        self.late_threshold = late_threshold_ms / 1000.0
+        self.resync_threshold = resync_threshold_ms / 1000.0
+
+        self._frames: Deque[bytes] = deque()
+        self._ready = asyncio.Event()
+        self._running = False
+
+        # Talkspurt grid state
+        self._in_talkspurt = False
+        self._turn_ended = True
+        self._t0 = 0.0
+        self._n = 0
+
+        # Bumped by clear(); frames from older generations are never sent
+        self.generation = 0
+
+        self.stats = PlayoutStats()
+
+    @property
+    def buffered_frames(self) -> int:
+        """Frames waiting to be sent."""
+        return len(self._frames)
+
+    @property
+    def buffered_ms(self) -> float:
+        """Buffered audio in milliseconds."""
+        return len(self._frames) * self.frame_duration * 1000
+
+    @property
+    def is_playing(self) -> bool:
+        """Whether a talkspurt is in progress."""
+        return self._in_talkspurt
+
+    def enqueue(self, frames: Iterable[bytes], generation: Optional[int] = None) -> bool:
+        """Queue frames for playout.
+
+        Args:
+            frames: Encoded frames in playout order
+            generation: `generation` when the producer took the source
+                chunk; stale frames are rejected (None = current)
+
+        Returns:
+            False if the frames were rejected as stale
+        """
+        if generation is not None and generation != self.generation:
+            self.stats.frames_invalidated += len(list(frames))
+            return False
+
+        for frame in frames:
+            if len(self._frames) >= self.max_frames:
+                self._frames.popleft()
+                self.stats.frames_dropped += 1
+            self._frames.append(frame)
+            self.stats.frames_queued += 1
+
+        self._turn_ended = False
+        if len(self._frames) > self.stats.buffer_high_water:
+            self.stats.buffer_high_water = len(self._frames)
+        self._ready.set()
+        return True
+
+    def end_of_turn(self) -> None:
+        """Mark that no more frames follow (buffer drain is not an underrun)."""
+        self._turn_ended = True
+
+    def clear(self) -> int:
+        """Drop all buffered frames, end the talkspurt and start a new generation.
+
+        Returns:
+            Number of frames discarded
+        """
+        dropped = len(self._frames)
+        self.generation += 1
+        self.stats.invalidations += 1
+        self.stats.frames_invalidated += dropped
+        self._frames.clear()
+        self._in_talkspurt = False
+        self._turn_ended = True
+        return dropped
+
+    def stop(self) -> None:
+        """Stop the run loop."""
+        self._running = False
+        self._ready.set()
+
+    async def run(self) -> None:
+        """Send buffered frames on the t0 + n * frame_duration grid."""
+        self._running = True
+        logger.info(
+            f"Playout scheduler started (frame={self.frame_duration * 1000:.0f}ms, "
+            f"buffer={self.max_frames} frames)"
+        )
+
+        while self._running:
+            try:
+                if not self._frames:
+                    if self._in_talkspurt:
+                        if not self._turn_ended:
+                            self.stats.underruns += 1
+                        self._in_talkspurt = False
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+
+                marker = False
+                if not self._in_talkspurt:
+                    # New talkspurt: anchor the grid at "now"
+                    self._in_talkspurt = True
+                    self._t0 = time.monotonic()
+                    self._n = 0
+                    self.stats.talkspurts += 1
+                    marker = True
+
+                generation = self.generation
+                deadline = self._t0 + self._n * self.frame_duration
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    # Cleared (interruption) or stopped while sleeping
+                    if generation != self.generation or not self._frames:
+                        continue
+
+                lateness = time.monotonic() - deadline
+                if lateness > self.late_threshold:
+                    self.stats.late_frames += 1
+                    self.stats.max_lateness_ms = max(
+                        self.stats.max_lateness_ms, lateness * 1000
+                    )
+                if lateness > self.resync_threshold:
+                    # Loop stalled: re-anchor instead of bursting to catch up
+                    self._t0 = time.monotonic() - self._n * self.frame_duration
+                    self.stats.resyncs += 1
+
+                frame = self._frames.popleft()
+                if self._send(frame, marker):
+                    self.stats.frames_sent += 1
+                else:
+                    self.stats.send_failures += 1
+                self._n += 1
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Playout error: {e}")
+                await asyncio.sleep(self.frame_duration)
+
+        logger.info(f"Playout scheduler stopped: {self.stats.to_dict()}")
+
+    def get_stats(self) -> dict:
+        """Get scheduler statistics."""
+        return {
+            **self.stats.to_dict(),
+            "buffered_frames": len(self._frames),
+            "buffered_ms": round(self.buffered_ms, 1),
+            "playing": self._in_talkspurt,
+            "generation": self.generation,
+        }
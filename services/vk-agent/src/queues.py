@@ -0,0 +1,201 @@
+"""
+VK-Agent Bounded Stage Queues
+
+Explicit, observable queues for every stage boundary in the bridge. Each
+queue has a fixed bound and an overflow policy, so overload degrades in
+a known way (dropped or coalesced data, or backpressure on the producer)
+instead of growing memory or latency without limit.
+
+Policies:
+    drop_oldest - Full queue evicts its oldest item (realtime audio: fresh
+                  data beats stale data). put_nowait() never blocks, so
+                  sync callbacks (UDP, timers) can produce.
+    latest      - Single slot; a new item replaces the unconsumed one
+                  (video: only the newest frame matters).
+    block       - put() waits for space, pushing back on the producer
+                  (Gemini audio: no gaps in the agent's speech).
+
+    producer ──put()──► ┌──────────────────────────┐ ──get()/popleft()──► consumer
+                        │ bound + policy + wakeup  │
+                        └──────────────────────────┘
+                        stats: high_water, dropped, blocked, blocked_ms
+
+Usage:
+    >>> queue = BoundedQueue("rtp_in", maxsize=100, policy=QueuePolicy.DROP_OLDEST)
+    >>> queue.put_nowait(item)       # from a sync callback
+    >>> await queue.wait()           # consumer: sleep until non-empty
+    >>> while queue:
+    ...     process(queue.popleft())
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class QueuePolicy(Enum):
+    """Overflow policy of a BoundedQueue."""
+    DROP_OLDEST = "drop_oldest"
+    LATEST = "latest"
+    BLOCK = "block"
+
+
+@dataclass
+class QueueStats:
+    """Statistics for one queue."""
+    put: int = 0
+    got: int = 0
+    dropped: int = 0
+    cleared: int = 0
+    high_water: int = 0
+    blocked: int = 0
+    blocked_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "put": self.put,
+            "got": self.got,
+            "dropped": self.dropped,
+            "cleared": self.cleared,
+            "high_water": self.high_water,
+            "blocked": self.blocked,
+            "blocked_ms": round(self.blocked_ms, 1),
+        }
+
+
+class BoundedQueue(Generic[T]):
+    """Bounded FIFO with an overflow policy and a consumer wakeup.
+
+    Example:
+        >>> frames = BoundedQueue("video", policy=QueuePolicy.LATEST)
+        >>> frames.put_nowait(jpeg_1)
+        >>> frames.put_nowait(jpeg_2)   # replaces jpeg_1 (dropped=1)
+        >>> await frames.get()
+        jpeg_2
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 100,
+        policy: QueuePolicy = QueuePolicy.DROP_OLDEST,
+    ):
+        """Initialize queue.
+
+        Args:
+            name: Name reported in stats and logs
+            maxsize: Capacity (forced to 1 for QueuePolicy.LATEST)
+            policy: Overflow policy
+        """
+        self.name = name
+        self.policy = policy
+        self.maxsize = 1 if policy is QueuePolicy.LATEST else max(1, maxsize)
+
+        self._items: Deque[T] = deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+
+        self.stats = QueueStats()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    @property
+    def full(self) -> bool:
+        """Whether the queue is at capacity."""
+        return len(self._items) >= self.maxsize
+
+    def put_nowait(self, item: T) -> bool:
+        """Add an item without waiting, applying the overflow policy.
+
+        Args:
+            item: Item to queue
+
+        Returns:
+            False if the item was rejected (full queue with block policy)
+        """
+        if self.full:
+            if self.policy is QueuePolicy.BLOCK:
+                self.stats.dropped += 1
+                return False
+            self._items.popleft()
+            self.stats.dropped += 1
+            if self.stats.dropped & (self.stats.dropped - 1) == 0:
+                # Log on powers of two to avoid flooding under sustained overload
+                logger.warning(f"Queue {self.name} overflow: {self.stats.dropped} dropped")
+
+        self._items.append(item)
+        self.stats.put += 1
+        if len(self._items) > self.stats.high_water:
+            self.stats.high_water = len(self._items)
+        if self.full:
+            self._space.clear()
+        self._ready.set()
+        return True
+
+    async def put(self, item: T) -> None:
+        """Add an item, waiting for space under the block policy.
+
+        Args:
+            item: Item to queue
+        """
+        if self.policy is QueuePolicy.BLOCK and self.full:
+            self.stats.blocked += 1
+            start = time.monotonic()
+            while self.full:
+                self._space.clear()
+                await self._space.wait()
+            self.stats.blocked_ms += (time.monotonic() - start) * 1000
+        self.put_nowait(item)
+
+    def popleft(self) -> T:
+        """Remove and return the oldest item (IndexError if empty)."""
+        item = self._items.popleft()
+        self.stats.got += 1
+        self._space.set()
+        return item
+
+    async def wait(self) -> None:
+        """Sleep until at least one item is queued."""
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+
+    async def get(self) -> T:
+        """Wait for and remove the oldest item."""
+        await self.wait()
+        return self.popleft()
+
+    def clear(self) -> int:
+        """Drop all queued items (e.g., on interruption).
+
+        Returns:
+            Number of items discarded
+        """
+        count = len(self._items)
+        self._items.clear()
+        self.stats.cleared += count
+        self._space.set()
+        return count
+
+    def get_stats(self) -> dict:
+        """Get queue statistics."""
+        return {
+            "policy": self.policy.value,
+            "size": len(self._items),
+            "maxsize": self.maxsize,
+            **self.stats.to_dict(),
+        }
@@ -0,0 +1,674 @@
+"""
+VK-Agent RTCP (RFC 3550 reports, RFC 4585 feedback)
+
+Adds the RTP control protocol to the audio and video RTP legs, multiplexed
+on the existing RTP sockets (RFC 5761 rtcp-mux). Janus learns about loss
+and jitter on our leg, lost video packets are NACKed, video keyframes are
+requested with PLI instead of restarting the forwarder over the Janus
+WebSocket, and the measured RTT/jitter/loss are exposed to other stages.
+The audio leg runs with nack=False (forwarders do not retransmit; Opus
+FEC/PLC conceals loss), and received NACK/PLI reach on_nack/on_pli for
+callers that keep a retransmit history (the bridge only counts them).
+
+Architecture:
+    RTP socket ──► is_rtcp(datagram)? ──yes──► RTCPSession.handle()
+                        │ no                     │ SR  → LSR for our RR, RTT
+                        ▼                        │ RR  → loss/jitter seen by peer, RTT
+                   RTPPacketView                 │ NACK/PLI → on_nack / on_pli
+                        │                        ▼
+                        └──► RTCPSession.on_rtp() (per-source stats, gaps → NACK)
+
+    RTCPSession.run() ── every ~interval (randomized 0.5-1.5x) ──►
+        SR (if we are sending) or RR + SDES CNAME, one compound packet
+        per peer address, report blocks for the sources that peer sends
+
+Packets:
+    SR   (200)        sender info + report blocks
+    RR   (201)        report blocks (fraction lost, cumulative lost,
+                      extended highest sequence, jitter, LSR, DLSR)
+    SDES (202)        CNAME (required in every compound packet)
+    BYE  (203)        sent on stop
+    RTPFB (205) FMT 1 generic NACK (PID + 16-bit BLP per entry)
+    PSFB  (206) FMT 1 picture loss indication (PLI)
+
+Usage:
+    >>> rtcp = RTCPSession(ssrc, clock_rate=48000, send=receiver.send_to)
+    >>> receiver.rtcp = rtcp            # demuxes RTCP, feeds RTP stats
+    >>> asyncio.create_task(rtcp.run())
+    >>> rtcp.rtt_ms, rtcp.fraction_lost, rtcp.jitter_ms
+"""
+
+import asyncio
+import logging
+import random
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .models import LatencyStats, RTPPacketView
+
+logger = logging.getLogger(__name__)
+
+# RTCP packet types
+RTCP_SR = 200
+RTCP_RR = 201
+RTCP_SDES = 202
+RTCP_BYE = 203
+RTCP_RTPFB = 205
+RTCP_PSFB = 206
+
+# Feedback message types (FMT)
+FMT_NACK = 1
+FMT_PLI = 1
+
+# Seconds between 1900-01-01 (NTP epoch) and 1970-01-01
+NTP_EPOCH_OFFSET = 2208988800
+
+_HEADER = struct.Struct("!BBH")
+_SENDER_INFO = struct.Struct("!IIIII")
+_REPORT_BLOCK = struct.Struct("!IIIIII")
+_FEEDBACK = struct.Struct("!II")
+
+Address = Tuple[str, int]
+
+
+def is_rtcp(data: bytes) -> bool:
+    """Whether a datagram on a muxed RTP port is RTCP (RFC 5761 section 4)."""
+    return len(data) >= 8 and data[0] >> 6 == 2 and 192 <= data[1] <= 223
+
+
+def ntp_now() -> Tuple[int, int]:
+    """Current wall-clock time as a 64-bit NTP timestamp (msw, lsw)."""
+    now = time.time() + NTP_EPOCH_OFFSET
+    seconds = int(now)
+    return seconds & 0xFFFFFFFF, int((now - seconds) * (1 << 32)) & 0xFFFFFFFF
+
+
+def ntp_middle(msw: int, lsw: int) -> int:
+    """Middle 32 bits of an NTP timestamp (LSR/DLSR units: 1/65536 s)."""
+    return ((msw & 0xFFFF) << 16) | (lsw >> 16)
+
+
+def _seq_diff(a: int, b: int) -> int:
+    return ((a - b + 0x8000) & 0xFFFF) - 0x8000
+
+
+def _ts_diff(a: int, b: int) -> int:
+    return ((a - b + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+@dataclass
+class ReportBlock:
+    """One RR/SR report block (reception quality of one source)."""
+    ssrc: int
+    fraction_lost: int = 0  # Fixed point /256, since the previous report
+    cumulative_lost: int = 0
+    highest_seq: int = 0  # Extended (cycles << 16 | seq)
+    jitter: int = 0  # RTP timestamp units
+    lsr: int = 0
+    dlsr: int = 0  # 1/65536 s
+
+    def pack(self) -> bytes:
+        """Serialize to the 24-byte wire format."""
+        lost = max(-0x800000, min(0x7FFFFF, self.cumulative_lost)) & 0xFFFFFF
+        return _REPORT_BLOCK.pack(
+            self.ssrc & 0xFFFFFFFF,
+            (self.fraction_lost & 0xFF) << 24 | lost,
+            self.highest_seq & 0xFFFFFFFF,
+            self.jitter & 0xFFFFFFFF,
+            self.lsr & 0xFFFFFFFF,
+            self.dlsr & 0xFFFFFFFF,
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes, offset: int) -> "ReportBlock":
+        """Parse a report block at offset."""
+        ssrc, lost_word, highest, jitter, lsr, dlsr = _REPORT_BLOCK.unpack_from(data, offset)
+        lost = lost_word & 0xFFFFFF
+        if lost & 0x800000:
+            lost -= 0x1000000
+        return cls(ssrc, lost_word >> 24, lost, highest, jitter, lsr, dlsr)
+
+
+@dataclass
+class RTCPPacket:
+    """One parsed RTCP packet from a compound datagram."""
+    packet_type: int
+    count: int  # RC / SC / FMT
+    ssrc: int = 0  # Sender SSRC
+    # SR sender info
+    ntp_msw: int = 0
+    ntp_lsw: int = 0
+    rtp_timestamp: int = 0
+    packet_count: int = 0
+    octet_count: int = 0
+    report_blocks: List[ReportBlock] = field(default_factory=list)
+    # RTPFB / PSFB
+    media_ssrc: int = 0
+    nack_seqs: List[int] = field(default_factory=list)
+
+
+def parse_compound(data: bytes) -> List[RTCPPacket]:
+    """Parse a compound RTCP datagram.
+
+    Args:
+        data: Raw datagram
+
+    Returns:
+        Parsed packets (parsing stops at the first malformed packet)
+    """
+    packets = []
+    offset = 0
+    while offset + 4 <= len(data):
+        first, packet_type, length = _HEADER.unpack_from(data, offset)
+        end = offset + (length + 1) * 4
+        if first >> 6 != 2 or end > len(data):
+            break
+        count = first & 0x1F
+        packet = RTCPPacket(packet_type=packet_type, count=count)
+        body = offset + 4
+
+        if packet_type in (RTCP_SR, RTCP_RR) and body + 4 <= end:
+            packet.ssrc = struct.unpack_from("!I", data, body)[0]
+            body += 4
+            if packet_type == RTCP_SR and body + 20 <= end:
+                (packet.ntp_msw, packet.ntp_lsw, packet.rtp_timestamp,
+                 packet.packet_count, packet.octet_count) = _SENDER_INFO.unpack_from(data, body)
+                body += 20
+            for _ in range(count):
+                if body + 24 > end:
+                    break
+                packet.report_blocks.append(ReportBlock.unpack(data, body))
+                body += 24
+
+        elif packet_type in (RTCP_RTPFB, RTCP_PSFB) and body + 8 <= end:
+            packet.ssrc, packet.media_ssrc = _FEEDBACK.unpack_from(data, body)
+            body += 8
+            if packet_type == RTCP_RTPFB and count == FMT_NACK:
+                while body + 4 <= end:
+                    pid, blp = struct.unpack_from("!HH", data, body)
+                    packet.nack_seqs.append(pid)
+                    packet.nack_seqs.extend(
+                        (pid + i + 1) & 0xFFFF for i in range(16) if blp >> i & 1
+                    )
+                    body += 4
+
+        elif body + 4 <= end:
+            packet.ssrc = struct.unpack_from("!I", data, body)[0]
+
+        packets.append(packet)
+        offset = end
+    return packets
+
+
+def _header(count: int, packet_type: int, body_len: int) -> bytes:
+    return _HEADER.pack(0x80 | (count & 0x1F), packet_type, body_len // 4)
+
+
+def build_sr(
+    ssrc: int,
+    ntp: Tuple[int, int],
+    rtp_timestamp: int,
+    packet_count: int,
+    octet_count: int,
+    blocks: List[ReportBlock] = (),
+) -> bytes:
+    """Build a sender report."""
+    body = struct.pack("!I", ssrc) + _SENDER_INFO.pack(
+        ntp[0], ntp[1], rtp_timestamp & 0xFFFFFFFF,
+        packet_count & 0xFFFFFFFF, octet_count & 0xFFFFFFFF,
+    ) + b"".join(b.pack() for b in blocks)
+    return _header(len(blocks), RTCP_SR, len(body)) + body
+
+
+def build_rr(ssrc: int, blocks: List[ReportBlock] = ()) -> bytes:
+    """Build a receiver report."""
+    body = struct.pack("!I", ssrc) + b"".join(b.pack() for b in blocks)
+    return _header(len(blocks), RTCP_RR, len(body)) + body
+
+
+def build_sdes(ssrc: int, cname: str) -> bytes:
+    """Build an SDES packet with one CNAME chunk."""
+    text = cname.encode()[:255]
+    chunk = struct.pack("!IBB", ssrc, 1, len(text)) + text + b"\x00"
+    chunk += b"\x00" * (-len(chunk) % 4)
+    return _header(1, RTCP_SDES, len(chunk)) + chunk
+
+
+def build_bye(ssrc: int) -> bytes:
+    """Build a BYE packet."""
+    return _header(1, RTCP_BYE, 4) + struct.pack("!I", ssrc)
+
+
+def build_nack(ssrc: int, media_ssrc: int, seqs: List[int]) -> bytes:
+    """Build a generic NACK (RFC 4585 6.2.1).
+
+    Args:
+        ssrc: Our SSRC
+        media_ssrc: SSRC of the stream with missing packets
+        seqs: Missing sequence numbers
+
+    Returns:
+        RTPFB packet; consecutive losses share one PID/BLP entry
+    """
+    fci = b""
+    ordered = sorted(set(s & 0xFFFF for s in seqs), key=lambda s: _seq_diff(s, seqs[0]))
+    i = 0
+    while i < len(ordered):
+        pid, blp = ordered[i], 0
+        i += 1
+        while i < len(ordered) and 0 < _seq_diff(ordered[i], pid) <= 16:
+            blp |= 1 << (_seq_diff(ordered[i], pid) - 1)
+            i += 1
+        fci += struct.pack("!HH", pid, blp)
+    body = _FEEDBACK.pack(ssrc, media_ssrc) + fci
+    return _header(FMT_NACK, RTCP_RTPFB, len(body)) + body
+
+
+def build_pli(ssrc: int, media_ssrc: int) -> bytes:
+    """Build a picture loss indication (RFC 4585 6.3.1)."""
+    return _header(FMT_PLI, RTCP_PSFB, 8) + _FEEDBACK.pack(ssrc, media_ssrc)
+
+
+class SourceStats:
+    """Reception statistics of one remote RTP source (RFC 3550 A.1, A.3, A.8)."""
+
+    def __init__(self, ssrc: int, clock_rate: int):
+        """Initialize source statistics.
+
+        Args:
+            ssrc: Remote SSRC
+            clock_rate: RTP clock rate of the stream
+        """
+        self.ssrc = ssrc
+        self.clock_rate = clock_rate
+        self.addr: Optional[Address] = None  # Where its RTP comes from
+        self.rtcp_addr: Optional[Address] = None  # Where its RTCP comes from
+
+        self.base_seq = -1
+        self.max_seq = 0
+        self.cycles = 0
+        self.received = 0
+        self._expected_prior = 0
+        self._received_prior = 0
+        self.fraction_lost = 0
+        self.jitter = 0.0  # Timestamp units
+        self._last_ts = 0
+        self._last_arrival = 0.0
+        self.last_heard = 0.0
+
+        # Last SR from this source (for LSR/DLSR)
+        self.last_sr = 0
+        self.last_sr_at = 0.0
+
+    @property
+    def extended_max(self) -> int:
+        """Extended highest sequence number received."""
+        return self.cycles + self.max_seq
+
+    @property
+    def expected(self) -> int:
+        """Packets expected since the first one."""
+        return 0 if self.base_seq < 0 else self.extended_max - self.base_seq + 1
+
+    @property
+    def lost(self) -> int:
+        """Cumulative packets lost (negative with duplicates)."""
+        return self.expected - self.received
+
+    def update(self, seq: int, timestamp: int, arrival: float, max_gap: int = 0) -> List[int]:
+        """Account for one received packet.
+
+        Args:
+            seq: RTP sequence number
+            timestamp: RTP timestamp
+            arrival: Monotonic arrival time in seconds
+            max_gap: Largest forward gap whose missing numbers are returned
+
+        Returns:
+            Sequence numbers skipped by this packet (for NACK)
+        """
+        self.received += 1
+        self.last_heard = arrival
+        if self.base_seq < 0:
+            self.base_seq = self.max_seq = seq
+            self._last_ts, self._last_arrival = timestamp, arrival
+            return []
+
+        # Interarrival jitter: J += (|D| - J) / 16, in timestamp units
+        d = (arrival - self._last_arrival) * self.clock_rate - _ts_diff(timestamp, self._last_ts)
+        self.jitter += (abs(d) - self.jitter) / 16
+        self._last_ts, self._last_arrival = timestamp, arrival
+
+        delta = _seq_diff(seq, self.max_seq)
+        if delta <= 0:
+            return []  # Late, reordered or duplicate
+        if seq < self.max_seq:
+            self.cycles += 1 << 16
+        missing = []
+        if 1 < delta <= max_gap + 1:
+            missing = [(self.max_seq + i) & 0xFFFF for i in range(1, delta)]
+        self.max_seq = seq
+        return missing
+
+    def report_block(self, now: float) -> ReportBlock:
+        """Build this source's report block and start a new interval."""
+        expected, received = self.expected, self.received
+        expected_interval = expected - self._expected_prior
+        lost_interval = expected_interval - (received - self._received_prior)
+        self._expected_prior, self._received_prior = expected, received
+        self.fraction_lost = (
+            (lost_interval << 8) // expected_interval
+            if expected_interval > 0 and lost_interval > 0 else 0
+        )
+        dlsr = int((now - self.last_sr_at) * 65536) if self.last_sr_at else 0
+        return ReportBlock(
+            ssrc=self.ssrc,
+            fraction_lost=min(self.fraction_lost, 255),
+            cumulative_lost=self.lost,
+            highest_seq=self.extended_max,
+            jitter=int(self.jitter),
+            lsr=self.last_sr,
+            dlsr=dlsr,
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "received": self.received,
+            "expected": self.expected,
+            "lost": self.lost,
+            "fraction_lost": round(self.fraction_lost / 256, 3),
+            "jitter_ms": round(self.jitter / self.clock_rate * 1000, 2),
+        }
+
+
+class RTCPSession:
+    """RTCP for one RTP leg (one local SSRC, many remote sources).
+
+    Example:
+        >>> rtcp = RTCPSession(ssrc=sender.ssrc, clock_rate=48000, send=receiver.send_to)
+        >>> rtcp.peer = janus_rtp_target
+        >>> rtcp.on_pli = encoder.force_keyframe
+        >>> asyncio.create_task(rtcp.run())
+    """
+
+    def __init__(
+        self,
+        ssrc: int,
+        clock_rate: int,
+        send: Callable[[bytes, Address], bool],
+        cname: str = "vk-agent",
+        interval: float = 5.0,
+        nack: bool = True,
+        max_nack_gap: int = 16,
+        pli_interval: float = 0.5,
+    ):
+        """Initialize RTCP session.
+
+        Args:
+            ssrc: Our SSRC on this leg
+            clock_rate: RTP clock rate of the leg's streams
+            send: Callback (datagram, addr) -> bool on the RTP socket
+            cname: SDES CNAME
+            interval: Mean seconds between reports (RFC 3550 minimum: 5)
+            nack: Send generic NACK for sequence gaps
+            max_nack_gap: Largest gap to NACK (bigger gaps are outages)
+            pli_interval: Minimum seconds between PLIs for one source
+        """
+        self.ssrc = ssrc & 0xFFFFFFFF
+        self.clock_rate = clock_rate
+        self._send = send
+        self.cname = cname
+        self.interval = interval
+        self.nack = nack
+        self.max_nack_gap = max_nack_gap
+        self.pli_interval = pli_interval
+
+        # Destination of our own media (receives our SR)
+        self.peer: Optional[Address] = None
+        self.sources: Dict[int, SourceStats] = {}
+        self._running = False
+
+        # Outbound media (for SR)
+        self._packets_sent = 0
+        self._octets_sent = 0
+        self._last_rtp_ts = 0
+        self._last_sent_at = 0.0
+        self._last_pli: Dict[int, float] = {}
+
+        # Feedback from the peer
+        self.on_nack: Optional[Callable[[int, List[int]], None]] = None
+        self.on_pli: Optional[Callable[[int], None]] = None
+        self.rtt = LatencyStats()
+        self.remote_reports: Dict[int, ReportBlock] = {}
+
+        # Statistics
+        self._reports_sent = 0
+        self._reports_received = 0
+        self._nacks_sent = 0
+        self._nacked_packets = 0
+        self._nacks_received = 0
+        self._plis_sent = 0
+        self._plis_received = 0
+
+    # ============== Inputs ==============
+
+    def on_rtp(self, packet: RTPPacketView) -> None:
+        """Account for a received RTP packet (NACKs gaps immediately)."""
+        source = self.sources.get(packet.ssrc)
+        if source is None:
+            source = self.sources[packet.ssrc] = SourceStats(packet.ssrc, self.clock_rate)
+        if packet.source is not None:
+            source.addr = packet.source
+
+        missing = source.update(
+            packet.sequence_number,
+            packet.timestamp,
+            packet.received_at,
+            self.max_nack_gap if self.nack else 0,
+        )
+        if missing:
+            self.send_nack(packet.ssrc, missing)
+
+    def on_rtp_sent(self, payload_size: int, rtp_timestamp: int) -> None:
+        """Account for a sent RTP packet (sender info of our SR)."""
+        self._packets_sent += 1
+        self._octets_sent += payload_size
+        self._last_rtp_ts = rtp_timestamp
+        self._last_sent_at = time.monotonic()
+
+    def handle(self, data: bytes, addr: Address) -> None:
+        """Process a received compound RTCP datagram.
+
+        Args:
+            data: Raw datagram (is_rtcp() was true)
+            addr: Source address (replies to this source go here)
+        """
+        now = time.monotonic()
+        for packet in parse_compound(data):
+            if packet.packet_type in (RTCP_SR, RTCP_RR):
+                self._reports_received += 1
+                source = self.sources.get(packet.ssrc)
+                if source is not None:
+                    source.rtcp_addr = addr
+                    if packet.packet_type == RTCP_SR:
+                        source.last_sr = ntp_middle(packet.ntp_msw, packet.ntp_lsw)
+                        source.last_sr_at = now
+                for block in packet.report_blocks:
+                    if block.ssrc == self.ssrc:
+                        self._on_report_block(packet.ssrc, block)
+
+            elif packet.packet_type == RTCP_RTPFB and packet.count == FMT_NACK:
+                if packet.media_ssrc == self.ssrc:
+                    self._nacks_received += 1
+                    if self.on_nack:
+                        self.on_nack(packet.ssrc, packet.nack_seqs)
+
+            elif packet.packet_type == RTCP_PSFB and packet.count == FMT_PLI:
+                if packet.media_ssrc == self.ssrc:
+                    self._plis_received += 1
+                    if self.on_pli:
+                        self.on_pli(packet.ssrc)
+
+    def _on_report_block(self, reporter: int, block: ReportBlock) -> None:
+        """Record the peer's view of our stream and derive the RTT."""
+        self.remote_reports[reporter] = block
+        if not block.lsr:
+            return
+        # RTT = A - LSR - DLSR (RFC 3550 6.4.1), 1/65536 s units
+        rtt = (ntp_middle(*ntp_now()) - block.lsr - block.dlsr) & 0xFFFFFFFF
+        if rtt < 10 << 16:  # Ignore garbage beyond 10s
+            self.rtt.add(rtt / 65536 * 1000)
+
+    # ============== Outputs ==============
+
+    def build_report(self, blocks: List[ReportBlock]) -> bytes:
+        """Build an SR (while sending) or RR compound packet with SDES."""
+        sending = self._packets_sent and time.monotonic() - self._last_sent_at < 2 * self.interval
+        if sending:
+            # RTP timestamp of "now" on our media clock
+            elapsed = time.monotonic() - self._last_sent_at
+            rtp_ts = self._last_rtp_ts + int(elapsed * self.clock_rate)
+            report = build_sr(
+                self.ssrc, ntp_now(), rtp_ts,
+                self._packets_sent, self._octets_sent, blocks,
+            )
+        else:
+            report = build_rr(self.ssrc, blocks)
+        return report + build_sdes(self.ssrc, self.cname)
+
+    def send_reports(self) -> int:
+        """Send one report to every peer address.
+
+        Returns:
+            Number of compound packets sent
+        """
+        now = time.monotonic()
+        # Forget sources silent for several intervals
+        for ssrc in [s for s, src in self.sources.items() if now - src.last_heard > 6 * self.interval]:
+            del self.sources[ssrc]
+
+        groups: Dict[Address, List[ReportBlock]] = {}
+        for source in self.sources.values():
+            addr = source.rtcp_addr or source.addr
+            if addr is not None:
+                groups.setdefault(addr, []).append(source.report_block(now))
+        if self.peer is not None and self._packets_sent:
+            groups.setdefault(self.peer, [])
+
+        sent = 0
+        for addr, blocks in groups.items():
+            for i in range(0, max(1, len(blocks)), 31):  # RC is 5 bits
+                if self._send(self.build_report(blocks[i:i + 31]), addr):
+                    sent += 1
+        self._reports_sent += sent
+        return sent
+
+    def send_nack(self, media_ssrc: int, seqs: List[int]) -> bool:
+        """Request retransmission of missing packets of a source."""
+        addr = self._source_addr(media_ssrc)
+        if addr is None or not seqs:
+            return False
+        if not self._send(build_nack(self.ssrc, media_ssrc, seqs), addr):
+            return False
+        self._nacks_sent += 1
+        self._nacked_packets += len(seqs)
+        return True
+
+    def request_keyframe(self, media_ssrc: Optional[int] = None) -> bool:
+        """Send a PLI (rate-limited per source).
+
+        Args:
+            media_ssrc: Video source (default: the most recently heard one)
+
+        Returns:
+            True if a PLI was sent or one was sent within pli_interval
+        """
+        if media_ssrc is None:
+            if not self.sources:
+                return False
+            media_ssrc = max(self.sources.values(), key=lambda s: s.last_heard).ssrc
+        addr = self._source_addr(media_ssrc)
+        if addr is None:
+            return False
+
+        now = time.monotonic()
+        if now - self._last_pli.get(media_ssrc, 0.0) < self.pli_interval:
+            return True
+        if not self._send(build_pli(self.ssrc, media_ssrc), addr):
+            return False
+        self._last_pli[media_ssrc] = now
+        self._plis_sent += 1
+        return True
+
+    def _source_addr(self, ssrc: int) -> Optional[Address]:
+        source = self.sources.get(ssrc)
+        if source is None:
+            return None
+        return source.rtcp_addr or source.addr
+
+    async def run(self) -> None:
+        """Send reports every ~interval until stopped, then BYE."""
+        self._running = True
+        while self._running:
+            try:
+                # Randomized to avoid synchronization (RFC 3550 6.3.1)
+                await asyncio.sleep(self.interval * random.uniform(0.5, 1.5))
+                if self._running:
+                    self.send_reports()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"RTCP report error: {e}")
+
+    def stop(self) -> None:
+        """Stop reporting and say BYE to every peer."""
+        self._running = False
+        bye = build_rr(self.ssrc) + build_sdes(self.ssrc, self.cname) + build_bye(self.ssrc)
+        addrs = {s.rtcp_addr or s.addr for s in self.sources.values()} | {self.peer}
+        for addr in addrs - {None}:
+            self._send(bye, addr)
+
+    # ============== Metrics ==============
+
+    @property
+    def rtt_ms(self) -> Optional[float]:
+        """Latest round-trip time to the peer, if measured."""
+        return self.rtt.last_ms if self.rtt.count else None
+
+    @property
+    def fraction_lost(self) -> float:
+        """Worst loss fraction among sources in the last report interval."""
+        return max((s.fraction_lost for s in self.sources.values()), default=0) / 256
+
+    @property
+    def jitter_ms(self) -> float:
+        """Worst interarrival jitter among sources."""
+        jitter = max((s.jitter for s in self.sources.values()), default=0.0)
+        return jitter / self.clock_rate * 1000
+
+    def get_stats(self) -> dict:
+        """Get RTCP statistics."""
+        return {
+            "rtt": self.rtt.to_dict(),
+            "fraction_lost": round(self.fraction_lost, 3),
+            "jitter_ms": round(self.jitter_ms, 2),
+            "sources": {hex(s): src.to_dict() for s, src in self.sources.items()},
+            "remote": {
+                hex(reporter): {
+                    "fraction_lost": round(block.fraction_lost / 256, 3),
+                    "cumulative_lost": block.cumulative_lost,
+                    "jitter_ms": round(block.jitter / self.clock_rate * 1000, 2),
+                }
+                for reporter, block in self.remote_reports.items()
+            },
+            "reports_sent": self._reports_sent,
+            "reports_received": self._reports_received,
+            "nacks_sent": self._nacks_sent,
+            "nacked_packets": self._nacked_packets,
+            "nacks_received": self._nacks_received,
+            "plis_sent": self._plis_sent,
+            "plis_received": self._plis_received,
+        }
@@ -6,10 +6,14 @@ between Janus AudioBridge and the VK-Agent bridge.
 
 Features:
     - RFC 3550 compliant RTP packet parsing and serialization
+    - Zero-copy receive path (RTPPacketView) and allocation-free send path
+      (RTPPacketWriter)
     - Async UDP receiver with configurable callbacks
     - UDP sender with sequence/timestamp tracking
-    - Jitter buffer for out-of-order packet handling
+    - Adaptive jitter buffer (RFC 3550 jitter, timed release, ring storage)
+    - Per-SSRC demultiplexing (one jitter buffer per forwarded publisher)
     - Statistics tracking (packets, bytes, loss)
+    - RTCP demultiplexing on the RTP socket (rtcp-mux, see rtcp.py)
 
 Architecture:
     Janus AudioBridge
@@ -17,7 +21,7 @@ Architecture:
           │ UDP (RTP Opus)
           ▼
     ┌─────────────────┐
-    │   RTPReceiver   │ ──► Callback with RTPPacket
+    │   RTPReceiver   │ ──► Callback with RTPPacketView
     └─────────────────┘
 
     ┌─────────────────┐
@@ -31,14 +35,19 @@ Architecture:
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, Callable, Tuple, Dict
+from typing import Optional, Callable, Tuple, Dict, List, Union
 
-from .models import RTPPacket
+from .models import RTPPacket, RTPPacketView, RTPPacketWriter
+from .rtcp import RTCPSession, is_rtcp
 
 logger = logging.getLogger(__name__)
 
+# Jitter buffers accept either packet type (same header attributes)
+Packet = Union[RTPPacket, RTPPacketView]
+
 
 @dataclass
 class RTPReceiverStats:
@@ -46,7 +55,8 @@ class RTPReceiverStats:
     packets_received: int = 0
     bytes_received: int = 0
     packets_lost: int = 0
-    last_sequence: int = -1
+    # Last sequence number per SSRC (publishers share the port)
+    last_sequences: Dict[int, int] = field(default_factory=dict)
     started_at: Optional[datetime] = None
 
     @property
@@ -128,7 +138,7 @@ class RTPReceiver:
     and invokes a callback with each parsed packet.
 
     Example:
-        >>> def on_packet(packet: RTPPacket):
+        >>> def on_packet(packet: RTPPacketView):
         ...     print(f"Received: seq={packet.sequence_number}")
         >>>
         >>> receiver = RTPReceiver(
@@ -145,7 +155,7 @@ class RTPReceiver:
         self,
         host: str = "0.0.0.0",
         port: int = 5004,
-        on_packet: Optional[Callable[[RTPPacket], None]] = None,
+        on_packet: Optional[Callable[[RTPPacketView], None]] = None,
         ignore_source_port: Optional[int] = None,
     ):
         """Initialize RTP receiver.
@@ -162,6 +172,9 @@ class RTPReceiver:
         self.on_packet = on_packet
         self.ignore_source_port = ignore_source_port
 
+        # RTCP arriving on this socket, and reception stats for our reports
+        self.rtcp: Optional[RTCPSession] = None
+
         self._transport: Optional[asyncio.DatagramTransport] = None
         self._protocol: Optional[RTPProtocol] = None
         self._running = False
@@ -223,6 +236,15 @@ class RTPReceiver:
             data: Raw UDP payload
             addr: Source (host, port) tuple
         """
+        received_ns = time.monotonic_ns()
+
+        # RTCP multiplexed on the RTP port (also from the ignored mix port:
+        # Janus reports on our outbound stream come from there)
+        if is_rtcp(data):
+            if self.rtcp:
+                self.rtcp.handle(data, addr)
+            return
+
         # Filter out packets from ignored source port (e.g., Janus mixed audio echo)
         if self.ignore_source_port and addr[1] == self.ignore_source_port:
             # This is our own mixed audio echoed back - ignore it
@@ -236,8 +258,8 @@ class RTPReceiver:
                 f"first_bytes={data[:12].hex() if len(data) >= 12 else data.hex()}"
             )
 
-        # Parse RTP packet
-        packet = RTPPacket.parse(data)
+        # Parse RTP header (payload stays a view into the datagram)
+        packet = RTPPacketView.parse(data, received_ns)
         if packet is None:
             logger.warning(f"[RTP-DEBUG] Failed to parse RTP from {addr}, data={data[:20].hex()}")
             return
@@ -246,17 +268,22 @@ class RTPReceiver:
         self.stats.packets_received += 1
         self.stats.bytes_received += len(data)
 
-        # Check for packet loss
-        if self.stats.last_sequence >= 0:
-            expected = (self.stats.last_sequence + 1) & 0xFFFF
+        # Check for packet loss (sequence numbers are per SSRC)
+        last = self.stats.last_sequences.get(packet.ssrc)
+        if last is not None:
+            expected = (last + 1) & 0xFFFF
             if packet.sequence_number != expected:
                 # Account for wraparound
                 diff = (packet.sequence_number - expected) & 0xFFFF
                 if diff < 0x8000:  # Forward gap
                     self.stats.packets_lost += diff
-                    logger.debug(f"Packet loss detected: {diff} packets")
+                    logger.debug(f"Packet loss detected: {diff} packets (ssrc={packet.ssrc})")
 
-        self.stats.last_sequence = packet.sequence_number
+        self.stats.last_sequences[packet.ssrc] = packet.sequence_number
+
+        packet.source = addr
+        if self.rtcp:
+            self.rtcp.on_rtp(packet)
 
         # Invoke callback
         if self.on_packet:
@@ -344,6 +371,7 @@ class RTPSender:
         ssrc: int = 0x12345678,
         payload_type: int = 111,  # Opus
         sample_rate: int = 48000,
+        frame_duration_ms: int = 20,
     ):
         """Initialize RTP sender.
 
@@ -352,7 +380,10 @@ class RTPSender:
             port: Target UDP port
             ssrc: Synchronization source identifier
             payload_type: RTP payload type (111 for Opus)
-            sample_rate: Audio sample rate (for timestamp calculation)
+            sample_rate: RTP clock rate (for timestamp calculation). For Opus
+                         this is always 48000 (RFC 7587), independent of the
+                         rate the encoder runs at.
+            frame_duration_ms: Audio duration carried by each packet
         """
         self.host = host
         self.port = port
@@ -364,10 +395,16 @@ class RTPSender:
         self._protocol: Optional[asyncio.DatagramProtocol] = None
         self._external_transport: Optional[asyncio.DatagramTransport] = None  # For sharing receiver's socket
 
+        # Preallocated packet buffer (header packed in place per frame)
+        self._writer = RTPPacketWriter(ssrc, payload_type)
+
+        # Sender info for our RTCP sender reports
+        self.rtcp: Optional[RTCPSession] = None
+
         # RTP state
         self._sequence_number = 0
         self._timestamp = 0
-        self._samples_per_packet = 960  # 20ms at 48kHz
+        self._samples_per_packet = sample_rate * frame_duration_ms // 1000  # 960 = 20ms at 48kHz
 
         self.stats = RTPSenderStats()
 
@@ -437,31 +474,27 @@ class RTPSender:
             return False
 
         try:
-            # Create RTP packet
-            packet = RTPPacket(
-                version=2,
-                marker=marker,
-                payload_type=self.payload_type,
-                sequence_number=self._sequence_number,
-                timestamp=self._timestamp,
-                ssrc=self.ssrc,
-                payload=payload,
+            # Build header + payload in the preallocated buffer
+            packet_bytes = self._writer.write(
+                payload, self._sequence_number, self._timestamp, marker
             )
 
             # Send packet - use sendto for external transport, send for own
-            packet_bytes = packet.to_bytes()
             if self._external_transport:
                 transport.sendto(packet_bytes, (self.host, self.port))
             else:
                 transport.sendto(packet_bytes)
 
+            if self.rtcp:
+                self.rtcp.on_rtp_sent(len(payload), self._timestamp)
+
             # Update state
             self._sequence_number = (self._sequence_number + 1) & 0xFFFF
             self._timestamp = (self._timestamp + self._samples_per_packet) & 0xFFFFFFFF
 
             # Update statistics
             self.stats.packets_sent += 1
-            self.stats.bytes_sent += len(payload) + 12  # payload + RTP header
+            self.stats.bytes_sent += len(packet_bytes)  # payload + RTP header
 
             return True
 
@@ -489,144 +522,421 @@ class RTPSender:
         return (self._transport is not None) or (self._external_transport is not None)
 
 
+def seq_diff(a: int, b: int) -> int:
+    """Signed distance a - b between 16-bit RTP sequence numbers (wraparound-safe)."""
+    return ((a - b + 0x8000) & 0xFFFF) - 0x8000
+
+
+def ts_diff(a: int, b: int) -> int:
+    """Signed distance a - b between 32-bit RTP timestamps (wraparound-safe)."""
+    return ((a - b + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
 class RTPJitterBuffer:
-    """Jitter buffer for RTP packet reordering.
+    """Adaptive jitter buffer for RTP packet reordering.
 
-    Buffers incoming RTP packets and outputs them in sequence order,
-    handling out-of-order delivery and packet loss.
+    Packets are stored in a fixed ring indexed by sequence number and
+    released in order once their playout deadline (derived from the RTP
+    timestamp) has passed, not on arrival.
 
-    The buffer works by:
-    1. Storing packets indexed by sequence number
-    2. Outputting packets in order when available
-    3. Skipping lost packets after timeout
+    Playout timing:
+        deadline = arrival_base + ts / clock_rate + target_delay
 
-    Performance (Phase 1 Optimization):
-        - Reduced buffer from 100ms to 50ms for lower latency
-        - Aggressive settings trade slight quality for responsiveness
-        - Suitable for voice AI where conversational latency matters
+        arrival_base is the smallest observed transit (arrival - ts/clock),
+        so the earliest-arriving packet defines "on time". target_delay
+        follows the RFC 3550 interarrival jitter estimate
+        (J += (|D| - J) / 16), clamped to [min_delay_ms, max_delay_ms].
+
+    Loss and lateness:
+        - A missing packet is skipped once the next buffered packet is due
+        - A packet arriving after its slot was played out is counted late
+        - Duplicates are discarded; a sequence jump beyond the ring resyncs
 
     Example:
-        >>> buffer = RTPJitterBuffer(buffer_time_ms=50)
-        >>>
-        >>> # Packets may arrive out of order
-        >>> buffer.put(packet_3)
-        >>> buffer.put(packet_1)
-        >>> buffer.put(packet_2)
-        >>>
-        >>> # Get returns in order
-        >>> packet_1 = buffer.get()
-        >>> packet_2 = buffer.get()
-        >>> packet_3 = buffer.get()
+        >>> buffer = RTPJitterBuffer(min_delay_ms=20, max_delay_ms=100)
+        >>> buffer.put(packet)                  # arrival = time.monotonic()
+        >>> deadline = buffer.next_deadline()   # when to call pop_ready()
+        >>> for packet in buffer.pop_ready():
+        ...     decode(packet.payload)
     """
 
     def __init__(
         self,
-        buffer_time_ms: int = 50,      # Phase 1: Reduced from 100ms (40-90ms savings)
-        max_packets: int = 25,          # Phase 1: Reduced from 50
-        skip_threshold: int = 8,        # Phase 1: Reduced from 16
+        min_delay_ms: int = 20,
+        max_delay_ms: int = 100,
+        jitter_multiplier: float = 3.0,
+        clock_rate: int = 48000,
+        capacity: int = 64,
     ):
         """Initialize jitter buffer.
 
         Args:
-            buffer_time_ms: Buffer depth in milliseconds (default: 50ms for low latency)
-            max_packets: Maximum packets to buffer before forced output (default: 25)
-            skip_threshold: Sequence gap before skipping lost packets (default: 8)
-
-        Phase 1 Optimization:
-            Reduced from conservative defaults (100ms, 50, 16) to aggressive
-            settings (50ms, 25, 8) for ~40-90ms latency savings.
+            min_delay_ms: Playout delay floor (default: one 20ms frame)
+            max_delay_ms: Playout delay ceiling
+            jitter_multiplier: Target delay as a multiple of measured jitter
+            clock_rate: RTP timestamp clock (48kHz for Opus)
+            capacity: Ring size in packets (power of two)
         """
-        self.buffer_time_ms = buffer_time_ms
-        self.max_packets = max_packets
-        self.skip_threshold = skip_threshold
-
-        self._buffer: Dict[int, RTPPacket] = {}
-        self._next_sequence: int = -1
+        if capacity & (capacity - 1):
+            raise ValueError(f"capacity must be a power of two, got {capacity}")
+
+        self.min_delay_ms = min_delay_ms
+        self.max_delay_ms = max_delay_ms
+        self.jitter_multiplier = jitter_multiplier
+        self.clock_rate = clock_rate
+        self.capacity = capacity
+        self._mask = capacity - 1
+
+        self._slots: List[Optional[Packet]] = [None] * capacity
+        self._deadlines: List[float] = [0.0] * capacity
+        self._count = 0
+        self._head = -1          # Next sequence number to release
+        self._tail = -1          # Highest sequence number buffered
+        self._released = False   # Head may only move back before first release
+
+        # Timestamp / timing state
+        self._last_ts = 0
+        self._ext_ts = 0
+        self._arrival_base: Optional[float] = None
+        self._last_transit: Optional[float] = None
+        self._jitter = 0.0       # RFC 3550 J, in seconds
 
         # Statistics
         self._packets_in = 0
         self._packets_out = 0
-        self._packets_dropped = 0
+        self._packets_lost = 0
+        self._packets_late = 0
+        self._packets_discarded = 0
+        self._resyncs = 0
+
+    @property
+    def jitter_ms(self) -> float:
+        """RFC 3550 interarrival jitter estimate in milliseconds."""
+        return self._jitter * 1000
 
-    def put(self, packet: RTPPacket) -> None:
+    @property
+    def target_delay_ms(self) -> float:
+        """Current adaptive playout delay in milliseconds."""
+        delay = self.jitter_multiplier * self.jitter_ms
+        return min(max(delay, self.min_delay_ms), self.max_delay_ms)
+
+    def put(self, packet: Packet, arrival: Optional[float] = None) -> None:
         """Add packet to buffer.
 
         Args:
             packet: RTP packet to buffer
+            arrival: Monotonic arrival time (default: now)
         """
+        if arrival is None:
+            arrival = time.monotonic()
         self._packets_in += 1
 
-        # Store packet by sequence number
-        self._buffer[packet.sequence_number] = packet
+        seq = packet.sequence_number & 0xFFFF
+        if self._head < 0:
+            self._start(seq, packet.timestamp)
+        else:
+            offset = seq_diff(seq, self._head)
+            if offset < 0:
+                if self._released or -offset >= self.capacity - self._span():
+                    # Slot already played out (or skipped as lost)
+                    self._packets_late += 1
+                    return
+                self._head = seq  # Earlier packet arrived before first release
+            elif offset >= self.capacity:
+                # Far ahead of the ring (stream restart / long gap): resync
+                logger.debug(f"Jitter buffer resync: seq {self._head} -> {seq}")
+                self._packets_discarded += self._count
+                self._resyncs += 1
+                self._reset_ring()
+                self._start(seq, packet.timestamp)
+
+        index = seq & self._mask
+        if self._slots[index] is not None:
+            self._packets_discarded += 1  # Duplicate
+            return
+
+        # Extended timestamp in seconds
+        delta = ts_diff(packet.timestamp, self._last_ts)
+        ext_ts = self._ext_ts + delta
+        if delta > 0:
+            self._last_ts = packet.timestamp
+            self._ext_ts = ext_ts
+        media_time = ext_ts / self.clock_rate
+
+        # RFC 3550 interarrival jitter: J += (|D| - J) / 16
+        transit = arrival - media_time
+        if self._last_transit is not None:
+            d = abs(transit - self._last_transit)
+            self._jitter += (d - self._jitter) / 16
+        self._last_transit = transit
+        # Re-anchor at talkspurt start so clock drift cannot erode the delay
+        if self._arrival_base is None or transit < self._arrival_base or packet.marker:
+            self._arrival_base = transit
+
+        self._slots[index] = packet
+        self._deadlines[index] = (
+            self._arrival_base + media_time + self.target_delay_ms / 1000
+        )
+        self._count += 1
+        if seq_diff(seq, self._tail) > 0:
+            self._tail = seq
 
-        # Initialize sequence tracking on first packet
-        if self._next_sequence < 0:
-            self._next_sequence = packet.sequence_number
+    def next_deadline(self) -> Optional[float]:
+        """Monotonic time at which the next packet becomes releasable.
 
-        # Prevent buffer overflow
-        if len(self._buffer) > self.max_packets:
-            self._force_output()
+        Returns:
+            Deadline of the first buffered packet, or None if empty
+        """
+        if self._count == 0:
+            return None
+        seq = self._head
+        for _ in range(self._span()):
+            index = seq & self._mask
+            if self._slots[index] is not None:
+                return self._deadlines[index]
+            seq = (seq + 1) & 0xFFFF
+        return None
 
-    def get(self) -> Optional[RTPPacket]:
-        """Get next packet in sequence.
+    def get(self, now: Optional[float] = None) -> Optional[Packet]:
+        """Get the next packet in sequence if its deadline has passed.
+
+        Args:
+            now: Monotonic time (default: now)
 
         Returns:
-            Next RTPPacket in order, or None if not ready
+            Next packet in order, or None if not ready
         """
-        if self._next_sequence < 0:
+        if self._count == 0:
+            return None
+        if now is None:
+            now = time.monotonic()
+
+        # Skip missing packets once a later packet is due
+        skipped = 0
+        seq = self._head
+        while self._slots[seq & self._mask] is None:
+            seq = (seq + 1) & 0xFFFF
+            skipped += 1
+
+        index = seq & self._mask
+        if self._deadlines[index] > now:
             return None
 
-        seq = self._next_sequence & 0xFFFF
-
-        # Exact sequence match
-        if seq in self._buffer:
-            packet = self._buffer.pop(seq)
-            self._next_sequence = (seq + 1) & 0xFFFF
-            self._packets_out += 1
-            return packet
-
-        # Look ahead for available packets (handle loss)
-        for i in range(1, self.skip_threshold + 1):
-            check_seq = (seq + i) & 0xFFFF
-            if check_seq in self._buffer:
-                # Skip lost packets
-                logger.debug(f"Jitter buffer: skipping {i} lost packets")
-                self._packets_dropped += i
-                packet = self._buffer.pop(check_seq)
-                self._next_sequence = (check_seq + 1) & 0xFFFF
-                self._packets_out += 1
-                return packet
+        if skipped:
+            logger.debug(f"Jitter buffer: skipping {skipped} lost packets")
+            self._packets_lost += skipped
 
-        return None
+        packet = self._slots[index]
+        self._slots[index] = None
+        self._count -= 1
+        self._head = (seq + 1) & 0xFFFF
+        self._released = True
+        self._packets_out += 1
+        return packet
 
-    def _force_output(self) -> None:
-        """Force output when buffer is full."""
-        if not self._buffer:
-            return
+    def pop_ready(self, now: Optional[float] = None) -> List[Packet]:
+        """Release every packet whose deadline has passed, in order.
 
-        # Find minimum sequence number
-        min_seq = min(self._buffer.keys())
-        self._next_sequence = min_seq
-        logger.debug(f"Jitter buffer overflow, resetting to seq={min_seq}")
+        Args:
+            now: Monotonic time (default: now)
+
+        Returns:
+            Ordered packets (possibly empty)
+        """
+        if now is None:
+            now = time.monotonic()
+        ready = []
+        while True:
+            packet = self.get(now)
+            if packet is None:
+                return ready
+            ready.append(packet)
+
+    def _span(self) -> int:
+        """Number of sequence slots between head and tail (inclusive)."""
+        if self._head < 0:
+            return 0
+        return seq_diff(self._tail, self._head) + 1
+
+    def _start(self, seq: int, timestamp: int) -> None:
+        """Anchor sequence and timestamp tracking on a first packet."""
+        self._head = seq
+        self._tail = seq
+        self._last_ts = timestamp
+        self._ext_ts = 0
+        self._arrival_base = None
+        self._last_transit = None
+        self._released = False
+
+    def _reset_ring(self) -> None:
+        """Empty the ring."""
+        self._slots = [None] * self.capacity
+        self._count = 0
 
     def clear(self) -> None:
         """Clear the buffer."""
-        self._buffer.clear()
-        self._next_sequence = -1
+        self._reset_ring()
+        self._head = -1
+        self._tail = -1
+        self._arrival_base = None
+        self._last_transit = None
+        self._released = False
 
     @property
     def size(self) -> int:
         """Current number of buffered packets."""
-        return len(self._buffer)
+        return self._count
 
     def get_stats(self) -> dict:
         """Get buffer statistics."""
         return {
             "packets_in": self._packets_in,
             "packets_out": self._packets_out,
-            "packets_dropped": self._packets_dropped,
-            "current_size": len(self._buffer),
-            "next_sequence": self._next_sequence,
+            "packets_lost": self._packets_lost,
+            "packets_late": self._packets_late,
+            "packets_discarded": self._packets_discarded,
+            "resyncs": self._resyncs,
+            "current_size": self._count,
+            "jitter_ms": round(self.jitter_ms, 2),
+            "target_delay_ms": round(self.target_delay_ms, 1),
+            "next_sequence": self._head,
+        }
+
+
+class RTPStreamDemuxer:
+    """Routes inbound RTP packets to one jitter buffer per SSRC.
+
+    Each Janus rtp_forward uses a distinct SSRC, so every publisher gets
+    its own sequence space and playout timing; interleaving them in one
+    buffer would scramble both. Streams are created on first packet and
+    reaped after idle_timeout seconds without packets.
+
+    Example:
+        >>> demux = RTPStreamDemuxer(lambda: RTPJitterBuffer())
+        >>> demux.put(packet)
+        >>> for ssrc, packet, lost in demux.pop_ready():
+        ...     decode(ssrc, packet.payload, lost)
+        >>> for ssrc in demux.reap_idle():
+        ...     free_decoder(ssrc)
+    """
+
+    def __init__(
+        self,
+        buffer_factory: Callable[[], RTPJitterBuffer],
+        idle_timeout: float = 2.0,
+    ):
+        """Initialize demuxer.
+
+        Args:
+            buffer_factory: Creates the jitter buffer for a new SSRC
+            idle_timeout: Seconds without packets before a stream is reaped
+        """
+        self._buffer_factory = buffer_factory
+        self.idle_timeout = idle_timeout
+
+        self._buffers: Dict[int, RTPJitterBuffer] = {}
+        self._last_arrival: Dict[int, float] = {}
+        self._last_released: Dict[int, int] = {}
+
+        self._streams_created = 0
+        self._streams_reaped = 0
+
+    @property
+    def ssrcs(self) -> List[int]:
+        """SSRCs with a live stream."""
+        return list(self._buffers.keys())
+
+    def put(self, packet: Packet, arrival: Optional[float] = None) -> None:
+        """Add packet to its SSRC's jitter buffer.
+
+        Args:
+            packet: RTP packet
+            arrival: Monotonic arrival time (default: now)
+        """
+        if arrival is None:
+            arrival = time.monotonic()
+
+        buffer = self._buffers.get(packet.ssrc)
+        if buffer is None:
+            buffer = self._buffer_factory()
+            self._buffers[packet.ssrc] = buffer
+            self._streams_created += 1
+            logger.info(f"RTP stream started: ssrc={packet.ssrc}")
+
+        buffer.put(packet, arrival)
+        self._last_arrival[packet.ssrc] = arrival
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest playout deadline across all streams."""
+        deadlines = [
+            d for d in (b.next_deadline() for b in self._buffers.values())
+            if d is not None
+        ]
+        return min(deadlines) if deadlines else None
+
+    def pop_ready(self, now: Optional[float] = None) -> List[Tuple[int, Packet, int]]:
+        """Release due packets from every stream.
+
+        Args:
+            now: Monotonic time (default: now)
+
+        Returns:
+            (ssrc, packet, frames_lost_before_packet) in per-stream order
+        """
+        if now is None:
+            now = time.monotonic()
+
+        ready = []
+        for ssrc, buffer in self._buffers.items():
+            for packet in buffer.pop_ready(now):
+                lost = 0
+                last = self._last_released.get(ssrc)
+                if last is not None:
+                    lost = max(0, seq_diff(packet.sequence_number, last) - 1)
+                self._last_released[ssrc] = packet.sequence_number
+                ready.append((ssrc, packet, lost))
+        return ready
+
+    def reap_idle(self, now: Optional[float] = None) -> List[int]:
+        """Remove streams that have not received packets for idle_timeout.
+
+        Args:
+            now: Monotonic time (default: now)
+
+        Returns:
+            SSRCs that were removed
+        """
+        if now is None:
+            now = time.monotonic()
+
+        idle = [
+            ssrc for ssrc, last in self._last_arrival.items()
+            if now - last > self.idle_timeout and self._buffers[ssrc].size == 0
+        ]
+        for ssrc in idle:
+            del self._buffers[ssrc]
+            del self._last_arrival[ssrc]
+            self._last_released.pop(ssrc, None)
+            self._streams_reaped += 1
+            logger.info(f"RTP stream idle, removed: ssrc={ssrc}")
+        return idle
+
+    def clear(self) -> None:
+        """Drop every stream."""
+        self._buffers.clear()
+        self._last_arrival.clear()
+        self._last_released.clear()
+
+    def get_stats(self) -> dict:
+        """Get demuxer statistics (with per-SSRC jitter buffer stats)."""
+        return {
+            "active_streams": len(self._buffers),
+            "streams_created": self._streams_created,
+            "streams_reaped": self._streams_reaped,
+            "streams": {
+                str(ssrc): buffer.get_stats()
+                for ssrc, buffer in self._buffers.items()
+            },
         }
 
 
@@ -636,7 +946,7 @@ async def test_rtp_handler() -> None:
 
     packets_received = []
 
-    def on_packet(packet: RTPPacket):
+    def on_packet(packet: RTPPacketView):
         packets_received.append(packet)
         print(
             f"  Received: seq={packet.sequence_number}, "
@@ -687,15 +997,13 @@ async def test_rtp_handler() -> None:
 
     # Simulate out-of-order delivery
     for seq in [3, 1, 2, 5, 4]:
-        packet = RTPPacket(sequence_number=seq, payload=b"\x00" * 10)
+        packet = RTPPacket(sequence_number=seq, timestamp=seq * 960, payload=b"\x00" * 10)
         buffer.put(packet)
         print(f"  Put seq={seq}")
 
-    print("  Getting packets in order:")
-    while True:
-        packet = buffer.get()
-        if packet is None:
-            break
+    print("  Getting packets in order (after playout delay):")
+    await asyncio.sleep(0.2)
+    for packet in buffer.pop_ready():
         print(f"    Got seq={packet.sequence_number}")
 
     print(f"  Buffer stats: {buffer.get_stats()}")
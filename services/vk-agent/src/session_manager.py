@@ -0,0 +1,420 @@
+"""
+VK-Agent Session Manager
+
+Hosts many AgentBridge sessions (one per AudioBridge room) inside a single
+vk-agent process, so concurrent calls share one event loop, one loaded VAD
+model and one API server instead of needing a container each.
+
+Architecture:
+    ┌─────────────────────────────────────────────────────────────────┐
+    │                        SessionManager                            │
+    ├─────────────────────────────────────────────────────────────────┤
+    │                                                                  │
+    │   create_room(5679) ──► RTPPortPool.allocate() ──► AgentBridge   │
+    │   create_room(5680) ──► RTPPortPool.allocate() ──► AgentBridge   │
+    │   delete_room(5679) ──► AgentBridge.stop() ──► RTPPortPool.release│
+    │                                                                  │
+    │   DSPExecutor (VK_AGENT_DSP_WORKERS threads) shared by all rooms │
+    │   LoopLagMonitor: how long the shared event loop was blocked     │
+    │   GeminiSessionPool (VK_AGENT_GEMINI_POOL_SIZE): warm sessions   │
+    │   handed to new bridges                                          │
+    │   GreetingCache (VK_AGENT_GREETING_CACHE): greeting Opus frames  │
+    │   rendered once, played by every bridge on join                  │
+    │                                                                  │
+    │   Port block per room (PORTS_PER_ROOM = 4):                      │
+    │     base + 0: audio RTP      base + 1: audio RTCP               │
+    │     base + 2: video RTP      base + 3: video RTCP               │
+    │                                                                  │
+    └─────────────────────────────────────────────────────────────────┘
+
+Usage:
+    >>> manager = SessionManager(settings)
+    >>> manager.start()  # Background monitors + Gemini pool warm-up
+    >>> bridge = await manager.create_room(5679)
+    >>> manager.list_rooms()
+    >>> await manager.delete_room(5679)
+    >>> await manager.stop_all()
+"""
+
+import asyncio
+import logging
+from dataclasses import replace
+from typing import Dict, List, Optional, Set
+
+from .bridge import AgentBridge
+from .config import Settings, get_settings
+from .dsp_executor import DSPExecutor, LoopLagMonitor
+from .gemini_pool import GeminiSessionPool
+from .greeting_cache import GreetingCache
+
+logger = logging.getLogger(__name__)
+
+# Audio RTP/RTCP + video RTP/RTCP (keeps RTP on even ports per RFC 3550)
+PORTS_PER_ROOM = 4
+
+
+class RoomExistsError(Exception):
+    """Raised when a bridge already exists for the requested room."""
+
+
+class RoomNotFoundError(Exception):
+    """Raised when no bridge exists for the requested room."""
+
+
+class PortPoolExhaustedError(Exception):
+    """Raised when no RTP port block is free for a new room."""
+
+
+class RTPPortPool:
+    """Allocator for per-room RTP port blocks.
+
+    Hands out blocks of PORTS_PER_ROOM consecutive ports starting at
+    base_port. The first block matches the single-room defaults
+    (audio 5004, video 5006) so existing Janus/Docker setups keep working.
+
+    Example:
+        >>> pool = RTPPortPool(base_port=5004, max_rooms=2)
+        >>> pool.allocate()
+        5004
+        >>> pool.allocate()
+        5008
+        >>> pool.release(5004)
+    """
+
+    def __init__(self, base_port: int = 5004, max_rooms: int = 32):
+        """Initialize port pool.
+
+        Args:
+            base_port: First audio RTP port of the pool
+            max_rooms: Number of port blocks (concurrent rooms)
+        """
+        self.base_port = base_port
+        self.max_rooms = max_rooms
+        self._free: List[int] = [
+            base_port + i * PORTS_PER_ROOM for i in range(max_rooms)
+        ]
+        self._allocated: set = set()
+
+    def allocate(self) -> int:
+        """Allocate a port block.
+
+        Returns:
+            Base (audio RTP) port of the block
+
+        Raises:
+            PortPoolExhaustedError: If every block is in use
+        """
+        if not self._free:
+            raise PortPoolExhaustedError(
+                f"All {self.max_rooms} RTP port blocks are in use"
+            )
+        port = self._free.pop(0)
+        self._allocated.add(port)
+        return port
+
+    def release(self, port: int) -> None:
+        """Return a port block to the pool.
+
+        Args:
+            port: Base port previously returned by allocate()
+        """
+        if port not in self._allocated:
+            return
+        self._allocated.discard(port)
+        self._free.append(port)
+        self._free.sort()
+
+    @property
+    def available(self) -> int:
+        """Number of free port blocks."""
+        return len(self._free)
+
+    @property
+    def in_use(self) -> int:
+        """Number of allocated port blocks."""
+        return len(self._allocated)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "base_port": self.base_port,
+            "ports_per_room": PORTS_PER_ROOM,
+            "max_rooms": self.max_rooms,
+            "available": self.available,
+            "in_use": self.in_use,
+        }
+
+
+class SessionManager:
+    """Creates and tears down AgentBridge sessions per room on demand.
+
+    All bridges run on the caller's event loop and share process-wide
+    resources (Silero VAD model, DSP executor, API server). Each room gets its own
+    Janus/Gemini connections and RTP port block.
+
+    Example:
+        >>> manager = SessionManager(settings)
+        >>> await manager.create_room(5679)
+        >>> await manager.create_room(5680, display_name="Jimmy")
+        >>> print(manager.list_rooms())
+        >>> await manager.stop_all()
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """Initialize session manager.
+
+        Args:
+            settings: Base settings; per-room copies override room and ports
+        """
+        self.settings = settings or get_settings()
+        self.port_pool = RTPPortPool(
+            base_port=self.settings.janus.rtp_port,
+            max_rooms=self.settings.max_rooms,
+        )
+
+        self._bridges: Dict[int, AgentBridge] = {}
+        self._ports: Dict[int, int] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        # Rooms whose bridge is starting (reserved, not yet in _bridges)
+        self._starting: Set[int] = set()
+        # Cleanups of bridges that stopped on their own
+        self._reaping: Set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+        # Audio DSP off the event loop (workers=0 keeps it inline)
+        self.dsp = DSPExecutor(workers=self.settings.audio.dsp_workers)
+        self.loop_lag = LoopLagMonitor()
+        self._lag_task: Optional[asyncio.Task] = None
+
+        # Pre-connected Gemini sessions (pool_size=0 connects per bridge)
+        self.gemini_pool: Optional[GeminiSessionPool] = None
+        if self.settings.gemini.pool_size > 0:
+            self.gemini_pool = GeminiSessionPool(
+                size=self.settings.gemini.pool_size,
+                max_idle=self.settings.gemini.pool_max_idle,
+            )
+        self._pool_task: Optional[asyncio.Task] = None
+
+        # Greeting audio rendered once and shared by every room
+        self.greeting_cache: Optional[GreetingCache] = None
+        if self.settings.gemini.greeting_cache:
+            self.greeting_cache = GreetingCache(
+                self.settings.gemini.greeting_cache_dir,
+                max_entries=self.settings.gemini.greeting_cache_size,
+                frame_duration_ms=self.settings.audio.frame_duration_ms,
+            )
+
+    def start(self) -> None:
+        """Start background monitors and warm the Gemini pool.
+
+        Optional: create_room() starts whatever is not yet running.
+        """
+        if self._lag_task is None:
+            self._lag_task = asyncio.create_task(self.loop_lag.run())
+        if self.gemini_pool and self._pool_task is None:
+            self.gemini_pool.warm(self.settings.gemini)
+            self._pool_task = asyncio.create_task(self.gemini_pool.run())
+
+    @property
+    def room_ids(self) -> List[int]:
+        """IDs of rooms with an active bridge."""
+        return list(self._bridges.keys())
+
+    def get_bridge(self, room_id: int) -> Optional[AgentBridge]:
+        """Get the bridge for a room, if any."""
+        return self._bridges.get(room_id)
+
+    @property
+    def default_bridge(self) -> Optional[AgentBridge]:
+        """Bridge for the configured default room (or the first room)."""
+        bridge = self._bridges.get(self.settings.janus.room_id)
+        if bridge is None and self._bridges:
+            bridge = next(iter(self._bridges.values()))
+        return bridge
+
+    def _room_settings(
+        self,
+        room_id: int,
+        base_port: int,
+        display_name: Optional[str] = None,
+    ) -> Settings:
+        """Build a per-room copy of the base settings."""
+        janus = replace(
+            self.settings.janus,
+            room_id=room_id,
+            rtp_port=base_port,
+            video_rtp_port=base_port + 2,
+            display_name=display_name or self.settings.janus.display_name,
+        )
+        return replace(self.settings, janus=janus)
+
+    async def create_room(
+        self,
+        room_id: int,
+        display_name: Optional[str] = None,
+    ) -> AgentBridge:
+        """Create and start a bridge for a room.
+
+        Args:
+            room_id: Janus AudioBridge room ID
+            display_name: Agent display name (default: from settings)
+
+        Returns:
+            The started AgentBridge
+
+        Raises:
+            RoomExistsError: If the room already has a bridge
+            PortPoolExhaustedError: If no RTP port block is free
+            RuntimeError: If the bridge fails to start
+        """
+        # Reserve the room and ports under the lock; the (slow) bridge
+        # start runs unlocked so other rooms are not held up behind it
+        async with self._lock:
+            if room_id in self._bridges or room_id in self._starting:
+                raise RoomExistsError(f"Room {room_id} already has a bridge")
+            base_port = self.port_pool.allocate()
+            self._starting.add(room_id)
+
+        room_settings = self._room_settings(room_id, base_port, display_name)
+        bridge = AgentBridge(
+            room_settings,
+            dsp=self.dsp,
+            gemini_pool=self.gemini_pool,
+            greeting_cache=self.greeting_cache,
+        )
+        self.start()
+
+        logger.info(f"Creating bridge for room {room_id} (RTP port {base_port})")
+        try:
+            started = await bridge.start()
+            if not started:
+                raise RuntimeError(f"Failed to start bridge for room {room_id}")
+        except BaseException:
+            self._starting.discard(room_id)
+            await bridge.stop()
+            self.port_pool.release(base_port)
+            raise
+
+        self._starting.discard(room_id)
+        self._register(room_id, bridge, base_port)
+        logger.info(f"Room {room_id} active ({len(self._bridges)} rooms running)")
+        return bridge
+
+    def _register(self, room_id: int, bridge: AgentBridge, base_port: int) -> None:
+        """Track a started bridge; it is reaped if it ever stops on its own."""
+        self._bridges[room_id] = bridge
+        self._ports[room_id] = base_port
+        task = asyncio.create_task(bridge.run_until_stopped())
+        task.add_done_callback(lambda _: self._on_bridge_done(room_id, bridge))
+        self._tasks[room_id] = task
+
+    def _on_bridge_done(self, room_id: int, bridge: AgentBridge) -> None:
+        """Reap a bridge that stopped without delete_room (e.g., fatal error)."""
+        if self._bridges.get(room_id) is not bridge:
+            return  # Deleted through delete_room
+
+        logger.warning(f"Room {room_id} bridge stopped on its own; releasing the room")
+        del self._bridges[room_id]
+        self._tasks.pop(room_id, None)
+        port = self._ports.pop(room_id, None)
+
+        task = asyncio.create_task(self._release(bridge, port))
+        self._reaping.add(task)
+        task.add_done_callback(self._reaping.discard)
+
+    async def _release(self, bridge: AgentBridge, port: Optional[int]) -> None:
+        """Finish stopping a bridge, then free its port block."""
+        try:
+            await bridge.stop()
+        except Exception as e:
+            logger.error(f"Error stopping bridge: {e}")
+        if port is not None:
+            self.port_pool.release(port)
+
+    async def delete_room(self, room_id: int) -> None:
+        """Stop a room's bridge and release its ports.
+
+        Args:
+            room_id: Janus AudioBridge room ID
+
+        Raises:
+            RoomNotFoundError: If the room has no bridge
+        """
+        async with self._lock:
+            bridge = self._bridges.pop(room_id, None)
+            if bridge is None:
+                raise RoomNotFoundError(f"Room {room_id} not found")
+            task = self._tasks.pop(room_id, None)
+            port = self._ports.pop(room_id, None)
+
+        await bridge.stop()
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        # Ports go back only once the bridge's sockets are closed
+        if port is not None:
+            self.port_pool.release(port)
+
+        logger.info(f"Room {room_id} deleted ({len(self._bridges)} rooms running)")
+
+    async def stop_all(self) -> None:
+        """Stop every bridge, the Gemini pool, the lag monitor and the DSP threads."""
+        for room_id in list(self._bridges.keys()):
+            try:
+                await self.delete_room(room_id)
+            except RoomNotFoundError:
+                pass
+        if self._reaping:
+            await asyncio.gather(*self._reaping, return_exceptions=True)
+
+        if self._lag_task:
+            self.loop_lag.stop()
+            self._lag_task.cancel()
+            try:
+                await self._lag_task
+            except asyncio.CancelledError:
+                pass
+            self._lag_task = None
+
+        if self._pool_task:
+            await self.gemini_pool.stop()
+            self._pool_task.cancel()
+            try:
+                await self._pool_task
+            except asyncio.CancelledError:
+                pass
+            self._pool_task = None
+        self.dsp.shutdown()
+
+    def list_rooms(self) -> List[dict]:
+        """Summarize all rooms.
+
+        Returns:
+            List of per-room summaries
+        """
+        return [
+            {
+                "room_id": room_id,
+                "state": bridge.state.value,
+                "running": bridge.is_running,
+                "rtp_port": self._ports.get(room_id),
+                "video_rtp_port": bridge.settings.janus.video_rtp_port,
+                "display_name": bridge.settings.janus.display_name,
+            }
+            for room_id, bridge in self._bridges.items()
+        ]
+
+    def get_stats(self) -> dict:
+        """Get manager statistics."""
+        return {
+            "rooms": len(self._bridges),
+            "port_pool": self.port_pool.to_dict(),
+            "dsp": self.dsp.get_stats(),
+            "event_loop": self.loop_lag.get_stats(),
+            "gemini_pool": self.gemini_pool.get_stats() if self.gemini_pool else None,
+            "greeting_cache": self.greeting_cache.get_stats() if self.greeting_cache else None,
+        }
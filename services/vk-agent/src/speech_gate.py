@@ -0,0 +1,370 @@
+"""
+VK-Agent Cascaded Speech Gate
+
+Cheap checks in front of Silero VAD so the neural model only runs on
+audio that could plausibly be speech. Each 100ms chunk goes through the
+stages in order and stops at the first one that rejects it.
+
+Architecture:
+    chunk ──► [1] Janus talking? ──no──► reject (prob 0.0)
+                    │ yes / unknown
+                    ▼
+              [2] RMS > noise floor? ──no──► reject (prob 0.0)
+                    │ yes
+                    ▼
+              [3] Silero VAD ──► speech probability
+
+Stages:
+    janus  - AudioBridge `talking` / `stopped-talking` events (room
+             audiolevel_event). Authoritative only once an event has been
+             seen; before that the stage is skipped (unknown, not silent).
+    energy - Chunk RMS against max(min_rms, noise_floor * noise_margin).
+             The noise floor tracks non-speech chunks: it drops to quieter
+             chunks at once and rises slowly (noise_rise per chunk).
+    vad    - VoiceActivityDetector.get_speech_probability().
+
+In a typical call most chunks are silence, so most of them never reach
+the model; get_stats() reports how many chunks each stage rejected.
+
+Segmentation (SpeechSegmenter):
+    The gate's probability drives VoiceActivityDetector.update() - the
+    same hysteresis as is_speech(). While silent, chunks fill a pre-roll
+    ring; when speech starts the ring is sent ahead of the triggering
+    chunk, so the first syllable is not lost. After speech ends the
+    hysteresis keeps the stream open for min_silence_duration_ms (the
+    hangover), so trailing consonants are sent too.
+
+        silence   silence   SPEECH    speech    silence   silence
+        [ring]    [ring] ─► flush+send  send    hangover   [ring]
+
+Barge-in (BargeInDetector):
+    While the agent speaks, segment audio is held rather than sent. Once
+    the held segment contains min_speech_ms of speech, the caller cuts
+    playout and forwards the held audio; a segment that closes sooner
+    (cough, backchannel) is discarded. Inbound audio is only the
+    participants' RTP forwards - Janus' mix (which carries the agent's own
+    voice) is dropped by RTPReceiver.ignore_source_port - so the agent
+    cannot barge in on itself.
+
+Usage:
+    >>> gate = SpeechGate(vad, talking=lambda: janus_client.any_talking)
+    >>> segmenter = SpeechSegmenter(gate, preroll_ms=300)
+    >>> audio = segmenter.process(chunk)  # b"" while silent
+    >>> if audio:
+    ...     await gemini.send_audio(audio)
+"""
+
+import logging
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+from .vad import VoiceActivityDetector
+
+logger = logging.getLogger(__name__)
+
+
+class SpeechGate:
+    """Janus → energy → Silero cascade for one inbound stream.
+
+    Example:
+        >>> gate = SpeechGate(vad, talking=lambda: client.any_talking)
+        >>> if gate.speech_probability(chunk) > vad.threshold:
+        ...     await gemini.send_audio(chunk)
+    """
+
+    def __init__(
+        self,
+        vad: VoiceActivityDetector,
+        talking: Optional[Callable[[], Optional[bool]]] = None,
+        use_janus: bool = True,
+        min_rms: float = 40.0,
+        noise_margin: float = 2.0,
+        noise_rise: float = 0.01,
+    ):
+        """Initialize speech gate.
+
+        Args:
+            vad: Detector run on chunks that pass the cheap stages
+            talking: Returns whether any remote participant is talking
+                according to Janus, or None if unknown
+            use_janus: Enable the Janus talking-event stage
+            min_rms: Absolute energy floor (int16 RMS)
+            noise_margin: Multiple of the tracked noise floor to pass
+            noise_rise: Per-chunk rise rate of the noise floor estimate
+        """
+        self.vad = vad
+        self._talking = talking if use_janus else None
+        self.min_rms = min_rms
+        self.noise_margin = noise_margin
+        self.noise_rise = noise_rise
+
+        self._noise_floor = 0.0
+        self.last_stage = ""
+
+        # Statistics
+        self._chunks = 0
+        self._janus_rejected = 0
+        self._energy_rejected = 0
+        self._vad_runs = 0
+        self._vad_speech = 0
+
+    @property
+    def energy_threshold(self) -> float:
+        """Current RMS a chunk must exceed to reach the VAD."""
+        return max(self.min_rms, self._noise_floor * self.noise_margin)
+
+    def speech_probability(self, audio_data: bytes) -> float:
+        """Speech probability of a chunk, short-circuiting cheap rejections.
+
+        Args:
+            audio_data: PCM16 bytes at the VAD sample rate
+
+        Returns:
+            Silero probability, or 0.0 if the Janus or energy stage rejected
+            the chunk (last_stage names the deciding stage)
+        """
+        self._chunks += 1
+
+        # Stage 1: Janus says nobody is talking
+        if self._talking is not None and self._talking() is False:
+            self._janus_rejected += 1
+            self.last_stage = "janus"
+            return 0.0
+
+        # Stage 2: below the noise floor
+        samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples * samples))) if len(samples) else 0.0
+        if rms <= self.energy_threshold:
+            self._energy_rejected += 1
+            self._track_noise(rms)
+            self.last_stage = "energy"
+            return 0.0
+
+        # Stage 3: neural VAD
+        self._vad_runs += 1
+        self.last_stage = "vad"
+        prob = self.vad.get_speech_probability(audio_data)
+        if prob > self.vad.threshold:
+            self._vad_speech += 1
+        else:
+            self._track_noise(rms)
+        return prob
+
+    def _track_noise(self, rms: float) -> None:
+        """Update the noise floor from a non-speech chunk."""
+        if rms < self._noise_floor:
+            self._noise_floor = rms
+        else:
+            self._noise_floor += (rms - self._noise_floor) * self.noise_rise
+
+    def reset(self) -> None:
+        """Forget the noise floor estimate."""
+        self._noise_floor = 0.0
+        self.last_stage = ""
+
+    def get_stats(self) -> dict:
+        """Get per-stage gating statistics."""
+        chunks = self._chunks or 1
+        return {
+            "chunks": self._chunks,
+            "janus_rejected": self._janus_rejected,
+            "energy_rejected": self._energy_rejected,
+            "vad_runs": self._vad_runs,
+            "vad_speech": self._vad_speech,
+            "janus_reject_rate": round(self._janus_rejected / chunks, 3),
+            "energy_reject_rate": round(self._energy_rejected / chunks, 3),
+            "vad_run_rate": round(self._vad_runs / chunks, 3),
+            "noise_floor_rms": round(self._noise_floor, 1),
+            "energy_threshold_rms": round(self.energy_threshold, 1),
+        }
+
+
+class SpeechSegmenter:
+    """Pre-roll + hangover around the VAD's speech state.
+
+    Example:
+        >>> segmenter = SpeechSegmenter(gate, preroll_ms=300)
+        >>> segmenter.on_speech_start = lambda: logger.info("user speaking")
+        >>> audio = segmenter.process(chunk)
+    """
+
+    def __init__(self, gate: SpeechGate, preroll_ms: int = 300):
+        """Initialize segmenter.
+
+        Args:
+            gate: Speech gate producing per-chunk probabilities; its VAD's
+                min_speech/min_silence durations set the hysteresis (the
+                latter is the hangover)
+            preroll_ms: Audio kept from before speech onset
+        """
+        self.gate = gate
+        self.vad = gate.vad
+        self.preroll_ms = preroll_ms
+        self._preroll_bytes = int(self.vad.sample_rate * preroll_ms / 1000) * 2
+        self._preroll = bytearray()
+        # Gate probability of the most recent chunk
+        self.last_probability = 0.0
+
+        # Callbacks on speech state transitions
+        self.on_speech_start: Optional[Callable[[], None]] = None
+        self.on_speech_end: Optional[Callable[[], None]] = None
+
+        # Statistics
+        self._segments = 0
+        self._chunks_sent = 0
+        self._chunks_dropped = 0
+        self._preroll_bytes_sent = 0
+        self._hangover_chunks = 0
+
+    @property
+    def is_speaking(self) -> bool:
+        """Whether the current segment is open."""
+        return self.vad.is_speaking
+
+    def process(self, audio_data: bytes) -> bytes:
+        """Gate one chunk.
+
+        Args:
+            audio_data: PCM16 chunk at the VAD sample rate
+
+        Returns:
+            Audio to send now: pre-roll + chunk at speech onset, the chunk
+            while speaking (including the hangover), or b"" while silent
+        """
+        was_speaking = self.vad.is_speaking
+        prob = self.gate.speech_probability(audio_data)
+        self.last_probability = prob
+        duration_ms = len(audio_data) / 2 / self.vad.sample_rate * 1000
+        speaking = self.vad.update(prob, duration_ms)
+
+        if speaking:
+            self._chunks_sent += 1
+            if not was_speaking:
+                self._segments += 1
+                audio = bytes(self._preroll) + audio_data
+                self._preroll_bytes_sent += len(self._preroll)
+                self._preroll.clear()
+                if self.on_speech_start:
+                    self.on_speech_start()
+                return audio
+            if prob <= self.vad.threshold:
+                self._hangover_chunks += 1
+            return audio_data
+
+        if was_speaking and self.on_speech_end:
+            self.on_speech_end()
+
+        # Silent: keep the most recent preroll_ms for the next onset
+        self._chunks_dropped += 1
+        self._preroll.extend(audio_data)
+        excess = len(self._preroll) - self._preroll_bytes
+        if excess > 0:
+            del self._preroll[:excess]
+        return b""
+
+    def clear(self) -> None:
+        """Drop the pre-roll and close any open segment."""
+        self._preroll.clear()
+        self.vad.reset()
+
+    def get_stats(self) -> dict:
+        """Get segmentation statistics."""
+        return {
+            "is_speaking": self.vad.is_speaking,
+            "segments": self._segments,
+            "chunks_sent": self._chunks_sent,
+            "chunks_dropped": self._chunks_dropped,
+            "hangover_chunks": self._hangover_chunks,
+            "preroll_ms": self.preroll_ms,
+            "preroll_ms_sent": round(
+                self._preroll_bytes_sent / 2 / self.vad.sample_rate * 1000
+            ),
+        }
+
+
+class BargeInDetector:
+    """Holds user speech during agent playback until it is sustained.
+
+    Example:
+        >>> barge_in = BargeInDetector(min_speech_ms=300)
+        >>> if barge_in.hold(segment_audio, is_speech, 100.0):
+        ...     cut_playout()
+        ...     await gemini.send_audio(barge_in.release())
+    """
+
+    def __init__(self, min_speech_ms: int = 300):
+        """Initialize barge-in detector.
+
+        Args:
+            min_speech_ms: Speech needed within one segment to interrupt
+        """
+        self.min_speech_ms = min_speech_ms
+        self._held = bytearray()
+        self._speech_ms = 0.0
+        self._onset_at: Optional[float] = None
+
+        # Statistics
+        self._triggered = 0
+        self._discarded = 0
+
+    @property
+    def pending(self) -> bool:
+        """Whether audio is being held."""
+        return bool(self._held)
+
+    @property
+    def onset_at(self) -> Optional[float]:
+        """Monotonic time of the first speech chunk of the held segment."""
+        return self._onset_at
+
+    def hold(self, audio_data: bytes, is_speech: bool, duration_ms: float) -> bool:
+        """Hold one segmenter output chunk while the agent is speaking.
+
+        Args:
+            audio_data: SpeechSegmenter.process() output (b"" once the
+                segment has closed)
+            is_speech: Whether this chunk was above the VAD threshold
+            duration_ms: Duration of the input chunk
+
+        Returns:
+            True when the held segment has reached min_speech_ms
+        """
+        if not audio_data:
+            if self._held:
+                self._discarded += 1
+            self._reset()
+            return False
+
+        self._held.extend(audio_data)
+        if is_speech:
+            if self._onset_at is None:
+                self._onset_at = time.monotonic()
+            self._speech_ms += duration_ms
+
+        if self._speech_ms < self.min_speech_ms:
+            return False
+
+        self._triggered += 1
+        return True
+
+    def release(self) -> bytes:
+        """Take the held audio (to forward) and reset."""
+        audio = bytes(self._held)
+        self._reset()
+        return audio
+
+    def _reset(self) -> None:
+        self._held.clear()
+        self._speech_ms = 0.0
+        self._onset_at = None
+
+    def get_stats(self) -> dict:
+        """Get barge-in statistics."""
+        return {
+            "min_speech_ms": self.min_speech_ms,
+            "triggered": self._triggered,
+            "discarded": self._discarded,
+            "held_ms": round(self._speech_ms),
+        }
@@ -0,0 +1,513 @@
+"""
+VK-Agent Supervisor (multi-process room sharding)
+
+One Python process runs every bridge on one event loop, so it tops out at
+one core however cheap each call is. With VK_AGENT_WORKERS > 1 the
+supervisor starts N bridge worker processes - each a complete single-process
+vk-agent (SessionManager + API) with its own RTP port range, Silero VAD
+model and DSP executor - and the public API becomes a front controller that
+routes room lifecycle calls to the worker owning the room.
+
+Architecture:
+    ┌──────────────────────────────────────────────────────────────────────┐
+    │                 Supervisor (front API, VK_AGENT_API_PORT)            │
+    │                                                                      │
+    │   POST /rooms ──► pick_worker() (fewest rooms, then lowest loop lag) │
+    │   /rooms/{id} ──► owner of the room ──► worker's own /rooms API      │
+    │   /status, /text, /screen ──► owner of the default room             │
+    │   /workers ──► per-worker rooms, loop lag, DSP stats (polled)        │
+    └──────────┬─────────────────────────┬─────────────────────────┬───────┘
+               │ HTTP (127.0.0.1)        │                         │
+    ┌──────────▼─────────┐    ┌──────────▼─────────┐    ┌──────────▼─────────┐
+    │ worker 0           │    │ worker 1           │    │ worker N-1         │
+    │ API   port + 1     │    │ API   port + 2     │    │ API   port + N     │
+    │ RTP   base + 0*R*4 │    │ RTP   base + 1*R*4 │    │ RTP   base + ...   │
+    │ SessionManager     │    │ SessionManager     │    │ SessionManager     │
+    └────────────────────┘    └────────────────────┘    └────────────────────┘
+        R = VK_AGENT_MAX_ROOMS (per worker), 4 ports per room
+
+    Workers are started with the "spawn" method, so none inherits the
+    supervisor's event loop, sockets or threads. A worker that exits is
+    restarted; the rooms it hosted are dropped from the routing table
+    (their calls ended with the process). Each poll also reconciles the
+    routing table with the worker's own /rooms list: rooms whose bridge
+    stopped inside a live worker are dropped, and rooms a worker finished
+    starting after the supervisor gave up on the request are adopted.
+
+Usage:
+    >>> supervisor = Supervisor(settings)
+    >>> await supervisor.start()
+    >>> await supervisor.create_room(5680)
+    >>> supervisor.get_stats()
+    >>> await supervisor.stop()
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .config import Settings, configure_logging, get_settings
+from .session_manager import (
+    PORTS_PER_ROOM,
+    PortPoolExhaustedError,
+    RoomExistsError,
+    RoomNotFoundError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Optional aiohttp (HTTP client for worker APIs)
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    aiohttp = None
+    HAS_AIOHTTP = False
+    logger.warning("aiohttp not available - supervisor mode disabled")
+
+# Worker API binds to loopback only; the supervisor is the public API
+WORKER_HOST = "127.0.0.1"
+
+
+def worker_settings(settings: Settings, index: int) -> Settings:
+    """Build the settings for one worker process.
+
+    Args:
+        settings: Supervisor settings
+        index: Worker index (0-based)
+
+    Returns:
+        Copy with a private API port and RTP port range
+    """
+    rtp_port = settings.janus.rtp_port + index * settings.max_rooms * PORTS_PER_ROOM
+    janus = replace(settings.janus, rtp_port=rtp_port, video_rtp_port=rtp_port + 2)
+    return replace(
+        settings,
+        workers=1,
+        api_host=WORKER_HOST,
+        api_port=settings.api_port + 1 + index,
+        janus=janus,
+    )
+
+
+def run_worker(settings: Settings) -> None:
+    """Worker process entry point (a single-process vk-agent without a default room)."""
+    from .main import run_rooms
+
+    configure_logging(settings.log_level)
+    asyncio.run(run_rooms(settings, create_default=False))
+
+
+class WorkerHandle:
+    """Supervisor-side state of one worker process."""
+
+    def __init__(self, index: int, settings: Settings):
+        """Initialize worker handle.
+
+        Args:
+            index: Worker index
+            settings: Worker settings (see worker_settings())
+        """
+        self.index = index
+        self.settings = settings
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self.rooms: Set[int] = set()
+        self.restarts = 0
+        # Bumped on every routing change; a /rooms poll that raced one is
+        # not used for reconciliation
+        self.epoch = 0
+
+        # Last polled worker stats
+        self.lag_p95_ms = 0.0
+        self.stats: dict = {}
+
+    @property
+    def url(self) -> str:
+        """Base URL of the worker's API."""
+        return f"http://{self.settings.api_host}:{self.settings.api_port}"
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running."""
+        return self.process is not None and self.process.is_alive()
+
+    @property
+    def capacity(self) -> int:
+        """Rooms this worker can host."""
+        return self.settings.max_rooms
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "index": self.index,
+            "pid": self.process.pid if self.process else None,
+            "alive": self.alive,
+            "api_port": self.settings.api_port,
+            "rtp_port": self.settings.janus.rtp_port,
+            "rooms": sorted(self.rooms),
+            "capacity": self.capacity,
+            "restarts": self.restarts,
+            "lag_p95_ms": self.lag_p95_ms,
+            "stats": self.stats,
+        }
+
+
+class Supervisor:
+    """Shards rooms across bridge worker processes.
+
+    Example:
+        >>> supervisor = Supervisor(settings)  # settings.workers == 8
+        >>> await supervisor.start()
+        >>> status, body = await supervisor.create_room(5680)
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        poll_interval: float = 2.0,
+        request_timeout: float = 30.0,
+    ):
+        """Initialize supervisor.
+
+        Args:
+            settings: Base settings (settings.workers processes are started)
+            poll_interval: Seconds between worker liveness/stats polls
+            request_timeout: Timeout for requests to workers (room creation
+                connects to Janus and Gemini)
+        """
+        self.settings = settings or get_settings()
+        self.poll_interval = poll_interval
+        self.request_timeout = request_timeout
+
+        self.workers: List[WorkerHandle] = [
+            WorkerHandle(i, worker_settings(self.settings, i))
+            for i in range(max(1, self.settings.workers))
+        ]
+        self._rooms: Dict[int, WorkerHandle] = {}
+        # Rooms whose POST to a worker is in flight
+        self._creating: Set[int] = set()
+        self._lock = asyncio.Lock()
+        self._ctx = multiprocessing.get_context("spawn")
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._watch_task: Optional[asyncio.Task] = None
+
+    @property
+    def room_ids(self) -> List[int]:
+        """IDs of rooms routed to a worker."""
+        return list(self._rooms.keys())
+
+    def owner(self, room_id: int) -> Optional[WorkerHandle]:
+        """Get the worker hosting a room, if any."""
+        return self._rooms.get(room_id)
+
+    @property
+    def default_owner(self) -> Optional[WorkerHandle]:
+        """Worker hosting the default room (or any room)."""
+        worker = self._rooms.get(self.settings.janus.room_id)
+        if worker is None and self._rooms:
+            worker = next(iter(self._rooms.values()))
+        return worker
+
+    def pick_worker(self) -> Optional[WorkerHandle]:
+        """Choose the least-loaded live worker with a free room slot.
+
+        Returns:
+            Worker with the fewest rooms (ties: lowest loop lag, then
+            index), or None if every live worker is full
+        """
+        candidates = [
+            w for w in self.workers if w.alive and len(w.rooms) < w.capacity
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda w: (len(w.rooms), w.lag_p95_ms, w.index))
+
+    # ============== Worker Processes ==============
+
+    def _spawn(self, worker: WorkerHandle) -> None:
+        worker.process = self._ctx.Process(
+            target=run_worker,
+            args=(worker.settings,),
+            name=f"vk-agent-worker-{worker.index}",
+            daemon=False,
+        )
+        worker.process.start()
+        logger.info(
+            f"Worker {worker.index} started (pid {worker.process.pid}, "
+            f"API {worker.settings.api_port}, RTP {worker.settings.janus.rtp_port})"
+        )
+
+    async def _wait_ready(self, worker: WorkerHandle, timeout: float = 30.0) -> bool:
+        """Poll a worker's /health until it answers."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while asyncio.get_running_loop().time() < deadline:
+            if not worker.alive:
+                return False
+            status, _ = await self.forward(worker, "GET", "/health")
+            if status == 200:
+                return True
+            await asyncio.sleep(0.2)
+        return False
+
+    async def start(self) -> None:
+        """Start the workers, then the default room.
+
+        Raises:
+            RuntimeError: If aiohttp is missing or no worker comes up
+        """
+        if not HAS_AIOHTTP:
+            raise RuntimeError("aiohttp is required for VK_AGENT_WORKERS > 1")
+
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+        )
+        for worker in self.workers:
+            self._spawn(worker)
+
+        ready = await asyncio.gather(*(self._wait_ready(w) for w in self.workers))
+        if not any(ready):
+            raise RuntimeError("No bridge worker became ready")
+        logger.info(f"{sum(ready)}/{len(self.workers)} workers ready")
+
+        self._watch_task = asyncio.create_task(self._watch())
+
+        try:
+            status, body = await self.create_room(self.settings.janus.room_id)
+            if status != 201:
+                logger.error(f"Failed to start default room: {body}")
+        except Exception as e:
+            logger.error(f"Failed to start default room: {e}")
+
+    async def stop(self) -> None:
+        """Stop the workers (each stops its bridges on SIGTERM)."""
+        if self._watch_task:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+        loop = asyncio.get_running_loop()
+        for worker in self.workers:
+            if worker.alive:
+                worker.process.terminate()
+        for worker in self.workers:
+            if worker.process is None:
+                continue
+            await loop.run_in_executor(None, worker.process.join, 10.0)
+            if worker.process.is_alive():
+                logger.warning(f"Worker {worker.index} did not exit, killing")
+                worker.process.kill()
+
+        self._rooms.clear()
+        if self._session:
+            await self._session.close()
+            self._session = None
+        logger.info("Supervisor stopped")
+
+    async def _watch(self) -> None:
+        """Restart dead workers and poll live ones for load."""
+        while True:
+            try:
+                await asyncio.sleep(self.poll_interval)
+                for worker in self.workers:
+                    if not worker.alive:
+                        self._restart(worker)
+                        continue
+                    epoch = worker.epoch
+                    status, body = await self.forward(worker, "GET", "/rooms")
+                    if status == 200:
+                        self._reconcile(worker, body.get("rooms", []), epoch)
+                        event_loop = body.get("event_loop", {})
+                        worker.lag_p95_ms = event_loop.get("lag", {}).get("p95_ms", 0.0)
+                        worker.stats = {
+                            "event_loop": event_loop,
+                            "dsp": body.get("dsp", {}),
+                        }
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Worker watch error: {e}")
+
+    def _restart(self, worker: WorkerHandle) -> None:
+        exitcode = worker.process.exitcode if worker.process else None
+        lost = sorted(worker.rooms)
+        logger.error(
+            f"Worker {worker.index} exited (code {exitcode}), "
+            f"restarting; rooms lost: {lost}"
+        )
+        for room_id in lost:
+            self._unroute(room_id)
+        worker.rooms.clear()
+        worker.restarts += 1
+        self._spawn(worker)
+
+    def _reconcile(self, worker: WorkerHandle, rooms: List[dict], epoch: int) -> None:
+        """Match the routing table to the rooms a worker reports.
+
+        Args:
+            worker: Polled worker
+            rooms: Room summaries from the worker's /rooms
+            epoch: worker.epoch when the poll was sent
+        """
+        if worker.epoch != epoch:
+            return  # Routing changed while the poll was in flight
+
+        actual = {room["room_id"] for room in rooms}
+        for room_id in sorted(worker.rooms - actual - self._creating):
+            logger.warning(f"Room {room_id} no longer on worker {worker.index}; dropped")
+            self._unroute(room_id)
+        for room_id in sorted(actual - worker.rooms):
+            if room_id in self._rooms:
+                logger.error(f"Room {room_id} reported by workers {worker.index} and "
+                             f"{self._rooms[room_id].index}; keeping the first route")
+                continue
+            logger.warning(f"Room {room_id} found on worker {worker.index}; adopted")
+            self._route(room_id, worker)
+
+    # ============== Routing ==============
+
+    def _route(self, room_id: int, worker: WorkerHandle) -> None:
+        """Route a room to a worker."""
+        worker.rooms.add(room_id)
+        worker.epoch += 1
+        self._rooms[room_id] = worker
+
+    def _unroute(self, room_id: int) -> None:
+        """Drop a room from the routing table."""
+        worker = self._rooms.pop(room_id, None)
+        if worker is not None:
+            worker.rooms.discard(room_id)
+            worker.epoch += 1
+
+    async def forward(
+        self,
+        worker: WorkerHandle,
+        method: str,
+        path: str,
+        payload: Optional[dict] = None,
+    ) -> Tuple[int, Any]:
+        """Send an API request to a worker.
+
+        Args:
+            worker: Target worker
+            method: HTTP method
+            path: API path (e.g., "/rooms/5679")
+            payload: JSON body
+
+        Returns:
+            (status, JSON body); a non-JSON body comes back as
+            {"detail": text}; 502 if the worker is unreachable
+        """
+        try:
+            async with self._session.request(
+                method, worker.url + path, json=payload
+            ) as response:
+                try:
+                    return response.status, await response.json(content_type=None)
+                except ValueError:
+                    # e.g. a plain-text 500 from a crashing worker
+                    return response.status, {"detail": await response.text()}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return 502, {"detail": f"Worker {worker.index} unreachable: {e}"}
+
+    async def create_room(
+        self,
+        room_id: int,
+        display_name: Optional[str] = None,
+    ) -> Tuple[int, Any]:
+        """Create a room on the least-loaded worker.
+
+        Args:
+            room_id: Janus AudioBridge room ID
+            display_name: Agent display name (default: from settings)
+
+        Returns:
+            (status, body) from the worker
+
+        Raises:
+            RoomExistsError: If the room already has a bridge
+            PortPoolExhaustedError: If every worker is full
+        """
+        # Reserve the slot under the lock; the (slow) bridge start runs unlocked
+        async with self._lock:
+            if room_id in self._rooms:
+                raise RoomExistsError(f"Room {room_id} already has a bridge")
+            worker = self.pick_worker()
+            if worker is None:
+                raise PortPoolExhaustedError(
+                    f"All {len(self.workers)} workers are full or down"
+                )
+            self._route(room_id, worker)
+            self._creating.add(room_id)
+
+        try:
+            status, body = await self.forward(
+                worker, "POST", "/rooms",
+                {"room_id": room_id, "display_name": display_name},
+            )
+            if status == 201:
+                logger.info(f"Room {room_id} assigned to worker {worker.index}")
+            elif status == 502:
+                # Timed out or unreachable: the worker may still start the
+                # room, so make sure it is gone before freeing the slot
+                cleanup, _ = await self.forward(worker, "DELETE", f"/rooms/{room_id}")
+                if cleanup in (200, 404):
+                    self._unroute(room_id)
+                else:
+                    logger.warning(
+                        f"Room {room_id} state on worker {worker.index} unknown; "
+                        f"kept routed until the next poll"
+                    )
+            else:
+                self._unroute(room_id)
+        finally:
+            self._creating.discard(room_id)
+        return status, body
+
+    async def delete_room(self, room_id: int) -> Tuple[int, Any]:
+        """Delete a room on its worker.
+
+        Args:
+            room_id: Janus AudioBridge room ID
+
+        Returns:
+            (status, body) from the worker
+
+        Raises:
+            RoomNotFoundError: If no worker hosts the room
+        """
+        worker = self._rooms.get(room_id)
+        if worker is None:
+            raise RoomNotFoundError(f"Room {room_id} not found")
+
+        status, body = await self.forward(worker, "DELETE", f"/rooms/{room_id}")
+        if status in (200, 404) and self._rooms.get(room_id) is worker:
+            self._unroute(room_id)
+        return status, body
+
+    async def list_rooms(self) -> List[dict]:
+        """Summarize all rooms across workers.
+
+        Returns:
+            Per-room summaries tagged with their worker index
+        """
+        live = [w for w in self.workers if w.alive]
+        replies = await asyncio.gather(*(self.forward(w, "GET", "/rooms") for w in live))
+        rooms = []
+        for worker, (status, body) in zip(live, replies, strict=True):
+            if status == 200:
+                rooms.extend({**room, "worker": worker.index} for room in body.get("rooms", []))
+        return rooms
+
+    def get_stats(self) -> dict:
+        """Get supervisor statistics."""
+        return {
+            "rooms": len(self._rooms),
+            "capacity": sum(w.capacity for w in self.workers),
+            "workers_alive": sum(1 for w in self.workers if w.alive),
+            "workers": [w.to_dict() for w in self.workers],
+        }
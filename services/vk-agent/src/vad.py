@@ -8,10 +8,21 @@ for non-speech audio (40-60% of conversation time is silence/pauses).
 Phase 1 Optimization:
     - Silero VAD: 87.7% true positive rate at 5% false positive rate
     - Sub-millisecond processing time per chunk
-    - Graceful fallback if torch not available
+    - Graceful fallback if no backend is available
+
+Backends (loaded lazily on first use, shared process-wide):
+    onnx  - Bundled Silero ONNX model via onnxruntime (CPU). No torch, no
+            network at startup. Recurrent state is explicit per stream, and
+            one call can run a batch of windows from independent streams.
+    torch - torch.hub Silero JIT model (needs network or a hub cache; the
+            recurrent state lives inside the shared model).
+    auto  - onnx if onnxruntime and the model file exist, else torch.
+
+    Model path: VK_AGENT_VAD_MODEL (default: src/assets/silero_vad.onnx,
+    fetched by the Dockerfile). Benchmark: python -m tests.benchmarks.bench_vad
 
 Usage:
-    >>> vad = VoiceActivityDetector()
+    >>> vad = VoiceActivityDetector(backend="onnx")
     >>> if vad.is_speech(audio_chunk_16khz):
     ...     # Send to Gemini
     ...     await gemini.send_audio(audio_chunk)
@@ -20,43 +31,260 @@ Usage:
     ...     pass
 """
 
+import importlib.util
 import logging
-from typing import Optional
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
-# Try to import torch for Silero VAD
-HAS_TORCH = False
-HAS_VAD = False
+# Backend availability (checked without importing - torch import alone takes seconds)
+HAS_TORCH = importlib.util.find_spec("torch") is not None
+HAS_ONNX = importlib.util.find_spec("onnxruntime") is not None
 
-try:
-    import torch
-    torch.set_num_threads(1)  # Single thread for low latency
-    HAS_TORCH = True
-    logger.debug("torch available for Silero VAD")
-except ImportError:
-    logger.warning("torch not available - VAD disabled")
+DEFAULT_ONNX_MODEL_PATH = os.getenv(
+    "VK_AGENT_VAD_MODEL",
+    str(Path(__file__).parent / "assets" / "silero_vad.onnx"),
+)
 
-# Load Silero VAD model if torch available
-_vad_model = None
-_vad_utils = None
+# Whether some backend can be loaded
+HAS_VAD = HAS_TORCH or (HAS_ONNX and os.path.exists(DEFAULT_ONNX_MODEL_PATH))
 
-if HAS_TORCH:
-    try:
-        _vad_model, _vad_utils = torch.hub.load(
+# Silero window at 16kHz (512 samples = 32ms) and ONNX context prefix
+WINDOW_SIZE = 512
+CONTEXT_SIZE = 64
+
+
+@dataclass
+class SileroState:
+    """Recurrent state of one audio stream for the ONNX backend."""
+    state: np.ndarray = field(
+        default_factory=lambda: np.zeros((2, 1, 128), dtype=np.float32)
+    )
+    context: np.ndarray = field(
+        default_factory=lambda: np.zeros(CONTEXT_SIZE, dtype=np.float32)
+    )
+
+
+class OnnxSileroBackend:
+    """Silero VAD on onnxruntime (CPU) with explicit per-stream state.
+
+    Example:
+        >>> backend = OnnxSileroBackend("src/assets/silero_vad.onnx")
+        >>> states = [backend.new_state(), backend.new_state()]
+        >>> probs = backend.infer(windows_2x512, states)  # one step, 2 streams
+    """
+
+    name = "onnx"
+
+    def __init__(self, model_path: str = DEFAULT_ONNX_MODEL_PATH, sample_rate: int = 16000):
+        """Load the ONNX model.
+
+        Args:
+            model_path: Path to silero_vad.onnx (v5 state/context interface)
+            sample_rate: Audio sample rate (16000)
+        """
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = 1  # Single thread for low latency
+        options.inter_op_num_threads = 1
+        self._session = onnxruntime.InferenceSession(
+            model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._sr = np.array(sample_rate, dtype=np.int64)
+
+    def new_state(self) -> SileroState:
+        """Create zeroed recurrent state for a new stream."""
+        return SileroState()
+
+    def infer(self, windows: np.ndarray, states: Sequence[SileroState]) -> np.ndarray:
+        """Run one step for a batch of independent streams.
+
+        Args:
+            windows: float32 array (B, 512), one window per stream
+            states: B per-stream states (updated in place)
+
+        Returns:
+            Speech probabilities, shape (B,)
+        """
+        batch = len(states)
+        inputs = np.empty((batch, CONTEXT_SIZE + WINDOW_SIZE), dtype=np.float32)
+        inputs[:, CONTEXT_SIZE:] = windows
+        for i, st in enumerate(states):
+            inputs[i, :CONTEXT_SIZE] = st.context
+
+        state = (
+            states[0].state if batch == 1
+            else np.concatenate([st.state for st in states], axis=1)
+        )
+        out, state_n = self._session.run(
+            None, {"input": inputs, "state": state, "sr": self._sr}
+        )
+
+        for i, st in enumerate(states):
+            st.state = state_n[:, i:i + 1, :]
+            st.context = inputs[i, -CONTEXT_SIZE:].copy()
+        return out[:, 0]
+
+    def probabilities(self, windows: np.ndarray, state: SileroState) -> np.ndarray:
+        """Run consecutive windows of one stream.
+
+        Args:
+            windows: float32 array (N, 512) in time order
+            state: The stream's state (updated in place)
+
+        Returns:
+            Speech probability per window, shape (N,)
+        """
+        probs = np.empty(len(windows), dtype=np.float32)
+        for i in range(len(windows)):
+            probs[i] = self.infer(windows[i:i + 1], (state,))[0]
+        return probs
+
+    def reset(self, state: SileroState) -> SileroState:
+        """Return fresh state for a stream."""
+        return self.new_state()
+
+
+class TorchSileroBackend:
+    """Silero VAD JIT model from torch.hub (legacy path).
+
+    The recurrent state lives inside the model, so all detectors using
+    this backend share one state; new_state() returns None.
+    """
+
+    name = "torch"
+
+    def __init__(self, sample_rate: int = 16000):
+        """Load the model from torch.hub (network or hub cache required).
+
+        Args:
+            sample_rate: Audio sample rate (16000)
+        """
+        import torch
+
+        torch.set_num_threads(1)  # Single thread for low latency
+        self._torch = torch
+        self._model, _ = torch.hub.load(
             repo_or_dir='snakers4/silero-vad',
             model='silero_vad',
             force_reload=False,
             trust_repo=True,
         )
         # Reset model state for fresh start
-        _vad_model.reset_states()
-        HAS_VAD = True
-        logger.info("Silero VAD model loaded successfully")
+        self._model.reset_states()
+        self._sample_rate = sample_rate
+
+    def new_state(self) -> None:
+        """State is held by the model."""
+        return None
+
+    def infer(self, windows: np.ndarray, states: Sequence[None]) -> np.ndarray:
+        """Run windows through the shared model one at a time."""
+        return self.probabilities(windows, None)
+
+    def probabilities(self, windows: np.ndarray, state: None) -> np.ndarray:
+        """Run consecutive windows through the shared model."""
+        probs = np.empty(len(windows), dtype=np.float32)
+        for i, window in enumerate(windows):
+            tensor = self._torch.from_numpy(np.ascontiguousarray(window))
+            probs[i] = self._model(tensor, self._sample_rate).item()
+        return probs
+
+    def reset(self, state: None) -> None:
+        """Reset the shared model state."""
+        self._model.reset_states()
+        return None
+
+
+_backends: Dict[str, object] = {}
+
+
+def load_backend(name: str = "auto", model_path: Optional[str] = None):
+    """Load (once per process) and return a VAD backend.
+
+    Args:
+        name: "auto", "onnx" or "torch"
+        model_path: ONNX model path (default: DEFAULT_ONNX_MODEL_PATH)
+
+    Returns:
+        Backend instance, or None if the requested backend is unavailable
+    """
+    model_path = model_path or DEFAULT_ONNX_MODEL_PATH
+
+    if name == "auto":
+        if HAS_ONNX and os.path.exists(model_path):
+            return load_backend("onnx", model_path)
+        if HAS_TORCH:
+            return load_backend("torch")
+        logger.warning("No VAD backend available (install onnxruntime + model, or torch)")
+        return None
+
+    key = f"onnx:{model_path}" if name == "onnx" else name
+    if key in _backends:
+        return _backends[key]
+
+    try:
+        if name == "onnx":
+            if not HAS_ONNX:
+                raise ImportError("onnxruntime not installed")
+            backend = OnnxSileroBackend(model_path)
+        elif name == "torch":
+            if not HAS_TORCH:
+                raise ImportError("torch not installed")
+            backend = TorchSileroBackend()
+        else:
+            raise ValueError(f"Unknown VAD backend: {name}")
     except Exception as e:
-        logger.warning(f"Failed to load Silero VAD model: {e}")
-        _vad_model = None
+        logger.warning(f"Failed to load Silero VAD ({name}): {e}")
+        return None
+
+    logger.info(f"Silero VAD model loaded successfully (backend={name})")
+    _backends[key] = backend
+    return backend
+
+
+def _normalize(samples: np.ndarray) -> np.ndarray:
+    """Gain quiet WebRTC int16 audio to speech level, as float32 in [-1, 1].
+
+    Silero expects audio at typical speech levels (RMS ~3000-8000);
+    WebRTC/Janus output is much quieter (RMS ~100-1600).
+    """
+    audio = samples.astype(np.float32)
+    rms = np.sqrt(np.mean(audio ** 2))
+
+    # Target RMS for Silero (typical speech level)
+    target_rms = 5000.0
+
+    # Calculate gain needed (with limits to prevent noise amplification)
+    # WebRTC audio can be very quiet (RMS 3-20), so use low threshold
+    if rms > 1:  # Only avoid division by zero
+        gain = min(target_rms / rms, 50.0)  # Max 50x gain for very quiet audio
+    else:
+        gain = 1.0  # Don't amplify pure digital silence
+
+    # Apply gain, clip to int16 range, normalize for Silero
+    return np.clip(audio * gain, -32768, 32767) / 32768.0
+
+
+def _windows(audio_float: np.ndarray) -> np.ndarray:
+    """Split audio into (N, 512) windows; pad a last partial window of >= 256."""
+    full = len(audio_float) // WINDOW_SIZE
+    tail = len(audio_float) - full * WINDOW_SIZE
+    count = full + (1 if tail >= WINDOW_SIZE // 2 else 0)
+
+    windows = np.zeros((count, WINDOW_SIZE), dtype=np.float32)
+    windows[:full] = audio_float[:full * WINDOW_SIZE].reshape(full, WINDOW_SIZE)
+    if count > full:
+        windows[full, :tail] = audio_float[full * WINDOW_SIZE:]
+    return windows
 
 
 class VoiceActivityDetector:
@@ -88,6 +316,8 @@ class VoiceActivityDetector:
         sample_rate: int = 16000,
         min_speech_duration_ms: int = 250,
         min_silence_duration_ms: int = 100,
+        backend: str = "auto",
+        model_path: Optional[str] = None,
     ):
         """Initialize Voice Activity Detector.
 
@@ -96,6 +326,8 @@ class VoiceActivityDetector:
             sample_rate: Audio sample rate (default: 16000 for Gemini)
             min_speech_duration_ms: Minimum speech duration to trigger (default: 250ms)
             min_silence_duration_ms: Minimum silence to stop speech (default: 100ms)
+            backend: "auto", "onnx" or "torch" (see module docstring)
+            model_path: ONNX model path (default: VK_AGENT_VAD_MODEL)
         """
         self.threshold = threshold
         self.sample_rate = sample_rate
@@ -114,14 +346,17 @@ class VoiceActivityDetector:
 
         # Frame size for VAD (Silero expects specific sizes)
         # 512 samples = 32ms at 16kHz (supported by Silero)
-        self._frame_size = 512
+        self._frame_size = WINDOW_SIZE
 
-        self._available = HAS_VAD
+        # Shared model, per-detector recurrent state
+        self._backend = load_backend(backend, model_path)
+        self._state = self._backend.new_state() if self._backend else None
+        self._available = self._backend is not None
 
         if self._available:
             logger.info(
                 f"VAD initialized: threshold={threshold}, "
-                f"sample_rate={sample_rate}Hz"
+                f"sample_rate={sample_rate}Hz, backend={self._backend.name}"
             )
         else:
             logger.warning("VAD not available - all audio will pass through")
@@ -131,6 +366,11 @@ class VoiceActivityDetector:
         """Check if VAD is available."""
         return self._available
 
+    @property
+    def backend_name(self) -> Optional[str]:
+        """Name of the loaded backend ("onnx"/"torch"), or None."""
+        return self._backend.name if self._backend else None
+
     @property
     def is_speaking(self) -> bool:
         """Check if currently in speech state."""
@@ -150,7 +390,7 @@ class VoiceActivityDetector:
             WebRTC/Janus output is much quieter (RMS ~100-1600), so we normalize
             the audio before passing to Silero.
         """
-        if not self._available or _vad_model is None:
+        if not self._available:
             return 1.0  # Pass all audio if VAD not available
 
         try:
@@ -159,44 +399,16 @@ class VoiceActivityDetector:
                 return 0.0
 
             # CRITICAL FIX: Normalize quiet WebRTC audio before Silero VAD
-            # Silero expects audio at typical speech levels (RMS ~3000-8000)
-            # WebRTC/Janus output is much quieter (RMS ~100-1600)
-            rms = np.sqrt(np.mean(samples.astype(np.float32) ** 2))
-
-            # Target RMS for Silero (typical speech level)
-            target_rms = 5000.0
-
-            # Calculate gain needed (with limits to prevent noise amplification)
-            # WebRTC audio can be very quiet (RMS 3-20), so use low threshold
-            if rms > 1:  # Only avoid division by zero
-                gain = min(target_rms / rms, 50.0)  # Max 50x gain for very quiet audio
-            else:
-                gain = 1.0  # Don't amplify pure digital silence
-
-            # Apply gain and clip to int16 range
-            amplified = np.clip(samples.astype(np.float32) * gain, -32768, 32767)
-
-            # Normalize to float32 [-1, 1] for Silero
-            audio_float = amplified / 32768.0
-
-            # Process in 512-sample chunks
-            chunk_size = 512
-            max_prob = 0.0
-
-            for i in range(0, len(audio_float), chunk_size):
-                chunk = audio_float[i:i + chunk_size]
-
-                if len(chunk) < chunk_size // 2:
-                    continue
+            audio_float = _normalize(samples)
 
-                if len(chunk) < chunk_size:
-                    chunk = np.pad(chunk, (0, chunk_size - len(chunk)), mode='constant')
-
-                audio_tensor = torch.from_numpy(chunk.astype(np.float32))
-                speech_prob = _vad_model(audio_tensor, self.sample_rate).item()
-                max_prob = max(max_prob, speech_prob)
+            # Split into 512-sample windows; the backend runs them in order
+            # (one inference per window, carrying the recurrent state)
+            windows = _windows(audio_float)
+            if len(windows) == 0:
+                return 0.0
 
-            return max_prob
+            probs = self._backend.probabilities(windows, self._state)
+            return float(probs.max())
 
         except Exception as e:
             logger.error(f"VAD error: {e}")
@@ -215,18 +427,34 @@ class VoiceActivityDetector:
         Returns:
             True if speech detected, False if silence
         """
-        self._total_frames += 1
-
         if not self._available:
+            self._total_frames += 1
             return True  # Pass all audio if VAD not available
 
         prob = self.get_speech_probability(audio_data)
-        is_speech_frame = prob > self.threshold
 
         # Calculate frame duration
         samples = len(audio_data) // 2  # PCM16 = 2 bytes per sample
         frame_duration_ms = (samples / self.sample_rate) * 1000
 
+        return self.update(prob, frame_duration_ms)
+
+    def update(self, prob: float, frame_duration_ms: float) -> bool:
+        """Advance the speech/silence hysteresis by one chunk.
+
+        Lets callers that compute the probability themselves (e.g. through
+        SpeechGate) share the same state machine as is_speech().
+
+        Args:
+            prob: Speech probability of the chunk
+            frame_duration_ms: Duration of the chunk
+
+        Returns:
+            True while in the speech state
+        """
+        self._total_frames += 1
+        is_speech_frame = prob > self.threshold
+
         if is_speech_frame:
             self._speech_frames += 1
             self._speech_frames_total += 1
@@ -249,10 +477,12 @@ class VoiceActivityDetector:
         return self._is_speaking
 
     def reset(self) -> None:
-        """Reset VAD state."""
+        """Reset VAD state (hysteresis and model recurrent state)."""
         self._is_speaking = False
         self._speech_frames = 0
         self._silence_frames = 0
+        if self._backend:
+            self._state = self._backend.reset(self._state)
 
     def get_stats(self) -> dict:
         """Get VAD statistics.
@@ -267,6 +497,7 @@ class VoiceActivityDetector:
 
         return {
             "available": self._available,
+            "backend": self.backend_name,
             "threshold": self.threshold,
             "is_speaking": self._is_speaking,
             "total_frames": self._total_frames,
@@ -289,29 +520,72 @@ def is_speech(audio_data: bytes, threshold: float = 0.5, sample_rate: int = 1600
     Returns:
         True if speech detected
     """
-    if not HAS_VAD or _vad_model is None:
+    backend = load_backend("auto")
+    if backend is None:
         return True
 
     try:
         samples = np.frombuffer(audio_data, dtype=np.int16)
-        audio_float = samples.astype(np.float32) / 32768.0
-        audio_tensor = torch.from_numpy(audio_float)
-        speech_prob = _vad_model(audio_tensor, sample_rate).item()
-        return speech_prob > threshold
+        windows = _windows(samples.astype(np.float32) / 32768.0)
+        if len(windows) == 0:
+            return False
+        probs = backend.probabilities(windows, backend.new_state())
+        return float(probs.max()) > threshold
     except Exception:
         return True
 
 
+def batch_speech_probability(
+    detectors: Sequence["VoiceActivityDetector"],
+    chunks: Sequence[bytes],
+) -> List[float]:
+    """Speech probability for one chunk per detector, batched across streams.
+
+    With the ONNX backend, window t of every stream runs in a single
+    session call (batch = number of streams still having a window t), each
+    with its own recurrent state. Other backends fall back to per-detector
+    get_speech_probability(). Normalization matches get_speech_probability.
+
+    Args:
+        detectors: Detectors sharing one backend (one per stream)
+        chunks: PCM16 chunk per detector
+
+    Returns:
+        Max window probability per detector (1.0 where VAD is unavailable)
+    """
+    backend = detectors[0]._backend if detectors else None
+    if not isinstance(backend, OnnxSileroBackend) or any(
+        d._backend is not backend for d in detectors
+    ):
+        return [d.get_speech_probability(c) for d, c in zip(detectors, chunks, strict=True)]
+
+    per_stream = [
+        _windows(_normalize(np.frombuffer(chunk, dtype=np.int16)))
+        for chunk in chunks
+    ]
+    result = np.zeros(len(detectors), dtype=np.float32)
+    steps = max((len(w) for w in per_stream), default=0)
+
+    for t in range(steps):
+        active = [i for i, w in enumerate(per_stream) if len(w) > t]
+        windows = np.stack([per_stream[i][t] for i in active])
+        probs = backend.infer(windows, [detectors[i]._state for i in active])
+        np.maximum.at(result, active, probs)
+
+    return result.tolist()
+
+
 async def test_vad() -> None:
     """Test VAD functionality."""
     import asyncio
 
     print("Testing Voice Activity Detector...")
     print(f"  torch available: {HAS_TORCH}")
+    print(f"  onnxruntime available: {HAS_ONNX}")
     print(f"  VAD available: {HAS_VAD}")
 
     vad = VoiceActivityDetector(threshold=0.5)
-    print(f"  VAD initialized: {vad.is_available}")
+    print(f"  VAD initialized: {vad.is_available} (backend={vad.backend_name})")
 
     if vad.is_available:
         # Generate test audio (silence)
@@ -330,7 +604,7 @@ async def test_vad() -> None:
 
         print(f"\nVAD stats: {vad.get_stats()}")
     else:
-        print("\nVAD not available - install torch to enable")
+        print("\nVAD not available - install onnxruntime (+ model) or torch to enable")
 
     print("\nVAD test complete!")
 
@@ -4,6 +4,10 @@ VK-Agent Video Processor
 Handles video frame extraction from RTP streams and encoding for Gemini.
 Supports VP8 and H.264 codecs commonly used in WebRTC.
 
+RTCP from the Janus forwarder (rtcp-mux on the video RTP port) is handed
+to VideoRTPReceiver.rtcp, which also sees every RTP packet for loss/NACK
+accounting and sends PLI keyframe requests.
+
 Dependencies:
     - av (PyAV) for video decoding
     - Pillow for image processing
@@ -13,10 +17,13 @@ import asyncio
 import logging
 import struct
 from io import BytesIO
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, List, Tuple
 from collections import deque
 import time
 
+from .models import RTPPacketView
+from .rtcp import RTCPSession, is_rtcp
+
 logger = logging.getLogger(__name__)
 
 # Try to import video processing libraries
@@ -450,6 +457,9 @@ class VideoRTPReceiver:
         self.host = host
         self.processor = processor or VideoProcessor()
 
+        # RTCP on this socket (reception stats, NACK, PLI)
+        self.rtcp: Optional[RTCPSession] = None
+
         self._transport: Optional[asyncio.DatagramTransport] = None
         self._protocol: Optional["VideoRTPProtocol"] = None
         self._running = False
@@ -459,7 +469,7 @@ class VideoRTPReceiver:
         loop = asyncio.get_event_loop()
 
         self._transport, self._protocol = await loop.create_datagram_endpoint(
-            lambda: VideoRTPProtocol(self.processor),
+            lambda: VideoRTPProtocol(self),
             local_addr=(self.host, self.port),
         )
 
@@ -474,19 +484,45 @@ class VideoRTPReceiver:
             self._transport = None
         logger.info("Video RTP receiver stopped")
 
+    def send_to(self, data: bytes, addr: Tuple[str, int]) -> bool:
+        """Send a datagram (RTCP feedback) from the video RTP socket."""
+        if not self._transport:
+            return False
+        try:
+            self._transport.sendto(data, addr)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send via video RTP socket: {e}")
+            return False
+
+    def handle_datagram(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Route a datagram to RTCP or to the video processor."""
+        if is_rtcp(data):
+            if self.rtcp:
+                self.rtcp.handle(data, addr)
+            return
+
+        if self.rtcp:
+            packet = RTPPacketView.parse(data)
+            if packet is not None:
+                packet.source = addr
+                self.rtcp.on_rtp(packet)
+
+        # Process through video processor
+        self.processor.process_rtp_packet(data)
+
 
 class VideoRTPProtocol(asyncio.DatagramProtocol):
     """UDP protocol for receiving video RTP packets."""
 
-    def __init__(self, processor: VideoProcessor):
-        self.processor = processor
+    def __init__(self, receiver: VideoRTPReceiver):
+        self.receiver = receiver
         self.packets_received = 0
 
     def datagram_received(self, data: bytes, addr):
         """Handle incoming UDP packet."""
         self.packets_received += 1
-        # Process through video processor
-        self.processor.process_rtp_packet(data)
+        self.receiver.handle_datagram(data, addr)
 
     def error_received(self, exc):
         """Handle UDP error."""
@@ -49,12 +49,15 @@ class VideoRoomConfig:
         display_name: str = "VK-Agent",
         rtp_video_port: int = 5006,
         rtp_video_host: str = "127.0.0.1",
+        rtcp: bool = False,
     ):
         self.ws_url = ws_url
         self.room_id = room_id
         self.display_name = display_name
         self.rtp_video_port = rtp_video_port
         self.rtp_video_host = rtp_video_host
+        # Ask Janus to exchange RTCP with us on the video RTP port (rtcp-mux)
+        self.rtcp = rtcp
 
 
 class Publisher:
@@ -374,18 +377,23 @@ class VideoRoomClient:
 
         # Use RTP forwarding directly - no WebRTC subscription needed
         # This forwards the publisher's raw RTP stream to our port
+        body = {
+            "request": "rtp_forward",
+            "room": self.config.room_id,
+            "publisher_id": publisher_id,
+            "host": self.config.rtp_video_host,
+            "video_port": self.config.rtp_video_port,
+            "video_pt": 96,  # VP8 payload type
+            "admin_key": "videoroom_admin_secret",
+        }
+        if self.config.rtcp:
+            # Janus sends SRs to this port and turns our PLIs into keyframe requests
+            body["video_rtcp_port"] = self.config.rtp_video_port
+
         response = await self._send({
             "janus": "message",
             "handle_id": self.handle_id,
-            "body": {
-                "request": "rtp_forward",
-                "room": self.config.room_id,
-                "publisher_id": publisher_id,
-                "host": self.config.rtp_video_host,
-                "video_port": self.config.rtp_video_port,
-                "video_pt": 96,  # VP8 payload type
-                "admin_key": "videoroom_admin_secret",
-            }
+            "body": body,
         })
 
         logger.info(f"RTP forward response: {response}")
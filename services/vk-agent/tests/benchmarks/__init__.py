@@ -0,0 +1 @@
+# VK-Agent microbenchmarks (run as modules, not collected by pytest)
@@ -0,0 +1,88 @@
+"""
+Call-start benchmark: participant join to first agent audio
+
+Runs the greeting path against the local Gemini stand-in server with a
+configurable setup and response latency, comparing:
+
+    connect + 1.5s sleep   connect on join, fixed greeting delay (before)
+    connect on join        connect on join, greet immediately
+    warm pool              GeminiSessionPool hands over a set-up session
+
+Usage:
+    python -m tests.benchmarks.bench_call_start [--calls 5] [--setup-ms 400] [--response-ms 250]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from src.config import GeminiConfig
+from src.gemini_client import GeminiLiveClient
+from src.gemini_pool import GeminiSessionPool
+from src.models import LatencyStats
+from tests.gemini_server import GeminiStandIn
+
+
+async def _greet(client: GeminiLiveClient, joined_at: float, greeting_delay: float) -> float:
+    """Send the greeting and return join -> first audio in ms."""
+    first_audio = asyncio.get_running_loop().create_future()
+    client.on_audio = lambda pcm: first_audio.done() or first_audio.set_result(time.monotonic())
+    await asyncio.sleep(greeting_delay)
+    await client.send_text("A user named Bench just joined the call. Greet them.")
+    return (await first_audio - joined_at) * 1000
+
+
+async def _cold(config: GeminiConfig, greeting_delay: float) -> float:
+    """Connect on join, then greet."""
+    joined_at = time.monotonic()
+    client = GeminiLiveClient(config)
+    await client.connect()
+    try:
+        return await _greet(client, joined_at, greeting_delay)
+    finally:
+        await client.disconnect()
+
+
+async def run(calls: int, setup_ms: int, response_ms: int) -> None:
+    """Run the benchmark and print a comparison table."""
+    logging.disable(logging.CRITICAL)
+    server = GeminiStandIn(setup_delay=setup_ms / 1000, response_delay=response_ms / 1000)
+    await server.start()
+    config = GeminiConfig(api_key="bench", ws_url=server.url)
+
+    results = {}
+    for name, delay in (("connect + 1.5s sleep", 1.5), ("connect on join", 0.0)):
+        stats = results[name] = LatencyStats()
+        for _ in range(calls):
+            stats.add(await _cold(config, delay))
+
+    pool = GeminiSessionPool(size=1)
+    pool.warm(config)
+    task = asyncio.create_task(pool.run())
+    stats = results["warm pool"] = LatencyStats()
+    for _ in range(calls):
+        while pool.idle_count(config) == 0:  # Calls arrive after replenishment
+            await asyncio.sleep(0.01)
+        joined_at = time.monotonic()
+        client = await pool.acquire(config)
+        stats.add(await _greet(client, joined_at, 0.0))
+        await client.disconnect()
+    await pool.stop()
+    await task
+    await server.stop()
+
+    print(f"Call start benchmark ({calls} calls, setup {setup_ms}ms, response {response_ms}ms)")
+    print(f"{'path':<22} {'avg ms':>8} {'p95 ms':>8}")
+    for name, stats in results.items():
+        summary = stats.to_dict()
+        print(f"{name:<22} {summary['avg_ms']:>8.1f} {summary['p95_ms']:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=5)
+    parser.add_argument("--setup-ms", type=int, default=400)
+    parser.add_argument("--response-ms", type=int, default=250)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.setup_ms, args.response_ms))
@@ -0,0 +1,98 @@
+"""
+Gemini wire codec microbenchmark
+
+Messages per second and transient allocation per message for the Gemini
+hot path: realtimeInput encoding of 100ms PCM chunks (dict + json.dumps vs
+MediaChunkEncoder) and serverContent decoding of audio responses
+(json.loads + b64decode vs decode_server_message). Allocation is the
+tracemalloc peak while handling one message, i.e. the extra memory the
+codec touches beyond the input frame.
+
+Usage:
+    python -m tests.benchmarks.bench_gemini_codec [--messages 20000] [--chunk-ms 100]
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+import tracemalloc
+
+from src.gemini_codec import HAS_ORJSON, MediaChunkEncoder, decode_server_message
+
+
+def _baseline_encode(pcm: bytes) -> str:
+    """GeminiLiveClient.send_audio before the codec."""
+    return json.dumps({
+        "realtimeInput": {
+            "mediaChunks": [
+                {"mimeType": "audio/pcm;rate=16000", "data": base64.b64encode(pcm).decode("utf-8")}
+            ]
+        }
+    })
+
+
+def _baseline_decode(message: bytes) -> list:
+    """GeminiLiveClient._receive_loop/_handle_message before the codec."""
+    data = json.loads(message)
+    return [
+        base64.b64decode(part["inlineData"]["data"])
+        for part in data["serverContent"]["modelTurn"]["parts"]
+    ]
+
+
+def _rate(fn, arg, count: int) -> float:
+    """Return calls per second of fn(arg)."""
+    for _ in range(min(count, 500)):  # Warm up
+        fn(arg)
+    start = time.perf_counter()
+    for _ in range(count):
+        fn(arg)
+    return count / (time.perf_counter() - start)
+
+
+def _peak_kib(fn, arg) -> float:
+    """Return the tracemalloc peak (KiB) of one fn(arg) call."""
+    fn(arg)  # Warm caches and reusable buffers
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def run(messages: int, chunk_ms: int) -> None:
+    """Run the benchmark and print a comparison table."""
+    pcm_in = os.urandom(16000 * 2 * chunk_ms // 1000)
+    pcm_out = os.urandom(24000 * 2 * chunk_ms // 1000)
+    server_frame = json.dumps({"serverContent": {"modelTurn": {"parts": [
+        {"inlineData": {"mimeType": "audio/pcm;rate=24000", "data": base64.b64encode(pcm_out).decode()}}
+    ]}}}).encode()
+    encoder = MediaChunkEncoder("audio/pcm;rate=16000")
+
+    cases = [
+        ("encode", "dict + json.dumps", _baseline_encode, pcm_in),
+        ("encode", "MediaChunkEncoder", encoder.encode, pcm_in),
+        ("decode", "json.loads + b64decode", _baseline_decode, server_frame),
+        ("decode", "decode_server_message", decode_server_message, server_frame),
+    ]
+
+    print(f"Gemini codec benchmark ({messages} messages, {chunk_ms}ms chunks, "
+          f"{len(server_frame) / 1024:.1f} KiB server frame, orjson={HAS_ORJSON})")
+    print(f"{'path':<7} {'implementation':<24} {'msgs/s':>10} {'us/msg':>8} {'peak KiB/msg':>13}")
+    baseline = {}
+    for path, name, fn, arg in cases:
+        rate = _rate(fn, arg, messages)
+        speedup = f"  x{rate / baseline[path]:.1f}" if path in baseline else ""
+        baseline.setdefault(path, rate)
+        print(f"{path:<7} {name:<24} {rate:>10,.0f} {1e6 / rate:>8.2f} {_peak_kib(fn, arg):>13.1f}{speedup}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    args = parser.parse_args()
+    run(args.messages, args.chunk_ms)
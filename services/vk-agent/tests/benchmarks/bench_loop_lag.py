@@ -0,0 +1,99 @@
+"""
+Event-loop lag benchmark for the DSP executor
+
+Simulates N rooms on one event loop, each doing the bridge's per-100ms
+DSP work (streaming resample + gate + Silero VAD on a 100ms chunk), and measures how late the loop wakes up -
+the delay every RTP packet and WebSocket message would see. Runs once
+with jobs inline on the loop and once per thread-pool size.
+
+Usage:
+    python -m tests.benchmarks.bench_loop_lag [--rooms 8] [--seconds 5] [--workers 2 4]
+"""
+
+import argparse
+import asyncio
+
+import numpy as np
+
+from src.audio_processor import StreamingResampler
+from src.dsp_executor import DSPExecutor, LoopLagMonitor
+from src.speech_gate import SpeechGate, SpeechSegmenter
+from src.vad import VoiceActivityDetector
+
+
+def _chunk() -> np.ndarray:
+    """100ms of loud noisy tone at 48kHz (passes the energy stage)."""
+    rng = np.random.default_rng(0)
+    t = np.arange(4800) / 48000
+    tone = np.sin(2 * np.pi * 220 * t) * 6000 + rng.normal(0, 800, 4800)
+    return tone.astype(np.int16)
+
+
+class Room:
+    """DSP state of one simulated bridge."""
+
+    def __init__(self):
+        self.resampler = StreamingResampler(48000, 16000)
+        self.segmenter = SpeechSegmenter(SpeechGate(VoiceActivityDetector()))
+
+    def process(self, pcm_48k: np.ndarray) -> bytes:
+        """One 100ms forward-path job: downsample, then gate + VAD."""
+        pcm_16k = self.resampler.process(pcm_48k)
+        return self.segmenter.process(pcm_16k.tobytes())
+
+
+async def _room_loop(room: Room, dsp: DSPExecutor, chunk: np.ndarray, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        await dsp.run(room.process, chunk)
+        await asyncio.sleep(0.1)
+
+
+async def measure(rooms: int, seconds: float, workers: int) -> dict:
+    """Run the simulated rooms and return loop lag statistics."""
+    dsp = DSPExecutor(workers=workers)
+    monitor = LoopLagMonitor(interval=0.01, warn_ms=float("inf"))
+    chunk = _chunk()
+    stop = asyncio.Event()
+
+    room_list = [Room() for _ in range(rooms)]
+    monitor_task = asyncio.create_task(monitor.run())
+    tasks = [asyncio.create_task(_room_loop(r, dsp, chunk, stop)) for r in room_list]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    monitor.stop()
+    monitor_task.cancel()
+    await asyncio.gather(monitor_task, return_exceptions=True)
+    dsp.shutdown()
+
+    lag = monitor.get_stats()
+    return {
+        "workers": workers,
+        "jobs": dsp.get_stats()["jobs"],
+        "job_ms": dsp.get_stats()["run_time"]["avg_ms"],
+        "lag_p50_ms": lag["lag"]["p50_ms"],
+        "lag_p95_ms": lag["lag"]["p95_ms"],
+        "lag_max_ms": lag["max_lag_ms"],
+    }
+
+
+def run(rooms: int, seconds: float, workers: list) -> None:
+    """Print a comparison of inline vs pooled DSP."""
+    vad_ready = VoiceActivityDetector().is_available
+    print(f"Loop lag benchmark ({rooms} rooms, {seconds}s, VAD={'on' if vad_ready else 'off'})")
+    print(f"{'workers':>8} {'jobs':>7} {'job ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for count in [0] + workers:
+        r = asyncio.run(measure(rooms, seconds, count))
+        print(
+            f"{'inline' if count == 0 else count:>8} {r['jobs']:>7} {r['job_ms']:>8} "
+            f"{r['lag_p50_ms']:>8} {r['lag_p95_ms']:>8} {r['lag_max_ms']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rooms", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, nargs="*", default=[2, 4])
+    args = parser.parse_args()
+    run(args.rooms, args.seconds, args.workers)
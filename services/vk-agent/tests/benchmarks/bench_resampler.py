@@ -0,0 +1,57 @@
+"""
+Resampler microbenchmark
+
+Compares the per-20ms-frame cost of the stateless path (soxr.resample via
+float64 on every packet) with the persistent int16 StreamingResampler for
+both bridge directions.
+
+Usage:
+    python -m tests.benchmarks.bench_resampler [--frames 5000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.audio_processor import HAS_SOXR, StreamingResampler, resample_oneshot
+
+
+def _sine_frames(rate: int, frames: int, frame_ms: int = 20) -> list:
+    """Generate consecutive 20ms int16 frames of a 440Hz tone."""
+    samples = rate * frame_ms // 1000
+    t = np.arange(samples * frames) / rate
+    tone = (np.sin(2 * np.pi * 440 * t) * 12000).astype(np.int16)
+    return [tone[i * samples:(i + 1) * samples] for i in range(frames)]
+
+
+def _bench(fn, frames: list) -> float:
+    """Return mean microseconds per frame."""
+    for frame in frames[:50]:  # Warm up
+        fn(frame)
+    start = time.perf_counter()
+    for frame in frames:
+        fn(frame)
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def run(frames: int) -> None:
+    """Run the benchmark and print a comparison table."""
+    print(f"Resampler benchmark ({frames} x 20ms frames, soxr={HAS_SOXR})")
+    print(f"{'direction':<12} {'oneshot us/frame':>18} {'stream us/frame':>17} {'speedup':>9}")
+
+    for from_rate, to_rate in ((48000, 16000), (24000, 48000)):
+        data = _sine_frames(from_rate, frames)
+        stream = StreamingResampler(from_rate, to_rate)
+
+        oneshot_us = _bench(lambda f, a=from_rate, b=to_rate: resample_oneshot(f, a, b), data)
+        stream_us = _bench(stream.process, data)
+
+        label = f"{from_rate // 1000}k->{to_rate // 1000}k"
+        print(f"{label:<12} {oneshot_us:>18.1f} {stream_us:>17.1f} {oneshot_us / stream_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=5000)
+    run(parser.parse_args().frames)
@@ -0,0 +1,65 @@
+"""
+RTP packet microbenchmark
+
+Packets per second for the receive path (RTPPacket.parse dataclass vs the
+zero-copy RTPPacketView) and the send path (RTPPacket(...).to_bytes() vs
+the preallocated RTPPacketWriter), on 20ms Opus-sized packets.
+
+Usage:
+    python -m tests.benchmarks.bench_rtp [--packets 200000] [--payload 80]
+"""
+
+import argparse
+import time
+
+from src.models import RTPPacket, RTPPacketView, RTPPacketWriter
+
+
+def _pps(fn, count: int) -> float:
+    """Return calls per second of fn(i) over count iterations."""
+    for i in range(min(count, 1000)):  # Warm up
+        fn(i)
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    return count / (time.perf_counter() - start)
+
+
+def run(packets: int, payload_size: int) -> None:
+    """Run the benchmark and print a comparison table."""
+    payload = (bytes(range(256)) * (payload_size // 256 + 1))[:payload_size]
+    datagrams = [
+        RTPPacket(sequence_number=i, timestamp=i * 960, ssrc=0x1234, payload=payload).to_bytes()
+        for i in range(1024)
+    ]
+    writer = RTPPacketWriter(ssrc=0x1234, payload_type=111)
+
+    results = [
+        ("parse", "RTPPacket.parse",
+         _pps(lambda i: RTPPacket.parse(datagrams[i & 1023]), packets)),
+        ("parse", "RTPPacketView.parse",
+         _pps(lambda i: RTPPacketView.parse(datagrams[i & 1023]), packets)),
+        ("serialize", "RTPPacket.to_bytes",
+         _pps(lambda i: RTPPacket(
+             marker=False, payload_type=111, sequence_number=i & 0xFFFF,
+             timestamp=i * 960 & 0xFFFFFFFF, ssrc=0x1234, payload=payload,
+         ).to_bytes(), packets)),
+        ("serialize", "RTPPacketWriter.write",
+         _pps(lambda i: writer.write(payload, i, i * 960), packets)),
+    ]
+
+    print(f"RTP benchmark ({packets} packets, {payload_size}B payload)")
+    print(f"{'path':<10} {'implementation':<24} {'packets/s':>12} {'us/packet':>10}")
+    baseline = {}
+    for path, name, pps in results:
+        speedup = f"  x{pps / baseline[path]:.1f}" if path in baseline else ""
+        baseline.setdefault(path, pps)
+        print(f"{path:<10} {name:<24} {pps:>12,.0f} {1e6 / pps:>10.2f}{speedup}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--packets", type=int, default=200000)
+    parser.add_argument("--payload", type=int, default=80)
+    args = parser.parse_args()
+    run(args.packets, args.payload)
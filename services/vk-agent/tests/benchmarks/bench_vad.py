@@ -0,0 +1,122 @@
+"""
+VAD backend benchmark
+
+Compares the torch.hub and ONNX Silero backends on model load time,
+resident memory after load, and per-chunk latency for the bridge's
+100ms (1600-sample) chunks. Each backend is measured in a fresh
+subprocess so import cost and RSS are not shared.
+
+Usage:
+    python -m tests.benchmarks.bench_vad [--chunks 500] [--streams 8]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+def _rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _chunks(count: int) -> list:
+    """100ms int16 chunks of noisy tone at 16kHz."""
+    rng = np.random.default_rng(0)
+    t = np.arange(1600) / 16000
+    tone = np.sin(2 * np.pi * 220 * t) * 3000
+    return [
+        (tone + rng.normal(0, 500, 1600)).astype(np.int16).tobytes()
+        for _ in range(count)
+    ]
+
+
+def measure(backend: str, chunks: int, streams: int) -> dict:
+    """Measure one backend in the current process."""
+    baseline_mb = _rss_mb()
+
+    start = time.perf_counter()
+    from src.vad import VoiceActivityDetector, batch_speech_probability
+    vad = VoiceActivityDetector(backend=backend)
+    load_s = time.perf_counter() - start
+
+    if not vad.is_available:
+        return {"backend": backend, "available": False}
+
+    data = _chunks(chunks)
+    for chunk in data[:20]:  # Warm up
+        vad.get_speech_probability(chunk)
+
+    start = time.perf_counter()
+    for chunk in data:
+        vad.get_speech_probability(chunk)
+    chunk_us = (time.perf_counter() - start) / len(data) * 1e6
+
+    # One chunk from each of N streams per call
+    detectors = [VoiceActivityDetector(backend=backend) for _ in range(streams)]
+    rounds = max(1, chunks // streams)
+    start = time.perf_counter()
+    for i in range(rounds):
+        batch_speech_probability(detectors, data[i * streams % len(data):][:streams])
+    batch_us = (time.perf_counter() - start) / (rounds * streams) * 1e6
+
+    return {
+        "backend": backend,
+        "available": True,
+        "load_s": round(load_s, 3),
+        "rss_mb": round(_rss_mb() - baseline_mb, 1),
+        "chunk_us": round(chunk_us, 1),
+        "batched_chunk_us": round(batch_us, 1),
+    }
+
+
+def run(chunks: int, streams: int) -> None:
+    """Run each backend in a subprocess and print a comparison table."""
+    print(f"VAD benchmark ({chunks} x 100ms chunks, batch of {streams} streams)")
+    print(
+        f"{'backend':<8} {'load s':>8} {'RSS MB':>8} "
+        f"{'us/chunk':>10} {'batched us/chunk':>17}"
+    )
+
+    for backend in ("torch", "onnx"):
+        proc = subprocess.run(
+            [
+                sys.executable, "-m", "tests.benchmarks.bench_vad",
+                "--child", backend,
+                "--chunks", str(chunks),
+                "--streams", str(streams),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        try:
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+        except (IndexError, json.JSONDecodeError):
+            result = {"available": False}
+
+        if not result.get("available"):
+            print(f"{backend:<8} {'unavailable':>8}")
+            continue
+
+        print(
+            f"{backend:<8} {result['load_s']:>8.2f} {result['rss_mb']:>8.1f} "
+            f"{result['chunk_us']:>10.1f} {result['batched_chunk_us']:>17.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, default=500)
+    parser.add_argument("--streams", type=int, default=8)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.chunks, args.streams)))
+    else:
+        run(args.chunks, args.streams)
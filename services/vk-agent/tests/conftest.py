@@ -4,7 +4,16 @@ VK-Agent Test Configuration
 
 import pytest
 import asyncio
-from typing import Generator
+import time
+from typing import Callable, Generator
+
+
+async def until(predicate: Callable[[], bool], timeout: float = 3.0) -> None:
+    """Wait until predicate() is true (fails the test after timeout seconds)."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,116 @@
+"""
+Local stand-in for the Gemini Live WebSocket endpoint
+
+Speaks just enough of BidiGenerateContent for connection tests and
+call-start benchmarks: answers `setup` with `setupComplete` after
+`setup_delay` (plus a `sessionResumptionUpdate` when the setup asks for
+resumption), answers `clientContent` with `audio_chunks` inlineData
+audio chunks after `response_delay` (then `after_audio`, if set, e.g. a
+goAway mid-answer) followed by `turnComplete`, and records the
+realtimeInput and clientContent messages it receives. Setups with a handle it did not
+issue are closed, like an expired handle.
+
+Usage:
+    server = GeminiStandIn(setup_delay=0.3)
+    await server.start()
+    config = GeminiConfig(api_key="test", ws_url=server.url)
+    ...
+    await server.stop()
+"""
+
+import asyncio
+import base64
+import json
+
+from websockets.asyncio.server import serve
+
+
+class GeminiStandIn:
+    """Minimal Gemini Live server on 127.0.0.1 (random port)."""
+
+    def __init__(
+        self,
+        setup_delay: float = 0.0,
+        response_delay: float = 0.0,
+        complete_setup: bool = True,
+        audio: bytes = b"\x00\x00" * 2400,
+        audio_chunks: int = 1,
+        after_audio: dict | None = None,
+    ):
+        self.setup_delay = setup_delay
+        self.response_delay = response_delay
+        self.complete_setup = complete_setup
+        self.audio = audio
+        self.audio_chunks = audio_chunks
+        self.after_audio = after_audio
+        self.setups = 0
+        self.setup_messages = []
+        self.realtime_input = []
+        self.client_content = []
+        self.handles = set()
+        self.connections = set()
+        self._server = None
+        self.url = ""
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await serve(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}/ws"
+
+    async def stop(self) -> None:
+        """Close every connection and stop listening."""
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def drop_all(self) -> None:
+        """Close every open connection (server-side disconnect)."""
+        for ws in list(self.connections):
+            await ws.close()
+
+    async def go_away(self) -> None:
+        """Announce an imminent close on every connection."""
+        for ws in list(self.connections):
+            await ws.send(json.dumps({"goAway": {"timeLeft": "1s"}}))
+
+    async def _handle(self, ws) -> None:
+        self.connections.add(ws)
+        try:
+            async for raw in ws:
+                message = json.loads(raw)
+                if "setup" in message:
+                    self.setups += 1
+                    self.setup_messages.append(message["setup"])
+                    resumption = message["setup"].get("session_resumption")
+                    if resumption and resumption.get("handle") not in (None, *self.handles):
+                        await ws.close(1008, "invalid resumption handle")
+                        return
+                    await asyncio.sleep(self.setup_delay)
+                    if self.complete_setup:
+                        await ws.send(json.dumps({"setupComplete": {}}))
+                    if resumption is not None:
+                        handle = f"handle-{self.setups}"
+                        self.handles.add(handle)
+                        await ws.send(json.dumps({"sessionResumptionUpdate": {
+                            "newHandle": handle, "resumable": True,
+                        }}))
+                elif "realtimeInput" in message:
+                    self.realtime_input.append(message["realtimeInput"])
+                elif "clientContent" in message:
+                    self.client_content.append(message["clientContent"])
+                    await asyncio.sleep(self.response_delay)
+                    chunk = json.dumps({"serverContent": {"modelTurn": {"parts": [{
+                        "inlineData": {
+                            "mimeType": "audio/pcm;rate=24000",
+                            "data": base64.b64encode(self.audio).decode(),
+                        }
+                    }]}}})
+                    for _ in range(self.audio_chunks):
+                        await ws.send(chunk)
+                    if self.after_audio is not None:
+                        await ws.send(json.dumps(self.after_audio))
+                    await ws.send(json.dumps({"serverContent": {"turnComplete": True}}))
+        except Exception:
+            pass
+        finally:
+            self.connections.discard(ws)
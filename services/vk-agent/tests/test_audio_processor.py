@@ -0,0 +1,208 @@
+"""
+Tests for VK-Agent audio processor
+"""
+
+import numpy as np
+import pytest
+
+from src.audio_processor import (
+    AudioProcessor,
+    HAS_OPUS,
+    HAS_SOXR,
+    PCMFramer,
+    SimpleAudioProcessor,
+    StreamingResampler,
+    opus_packet_has_fec,
+)
+from src.config import AudioConfig
+from src.rtp_handler import RTPSender
+
+
+def _frames(audio: bytes, samples_per_frame: int) -> list:
+    """Split PCM16 bytes into int16 frames."""
+    samples = np.frombuffer(audio, dtype=np.int16)
+    return [
+        samples[i:i + samples_per_frame]
+        for i in range(0, len(samples), samples_per_frame)
+    ]
+
+
+class TestStreamingResampler:
+    """Tests for the stateful per-direction resampler."""
+
+    def test_output_dtype_is_int16(self, sample_audio_48k):
+        """Test that int16 in gives int16 out (no float64 round trip)."""
+        resampler = StreamingResampler(48000, 16000)
+        out = resampler.process(np.frombuffer(sample_audio_48k, dtype=np.int16))
+        assert out.dtype == np.int16
+
+    def test_stream_length_tracks_ratio(self, sample_audio_48k):
+        """Test that total output matches the rate ratio across frames."""
+        resampler = StreamingResampler(48000, 16000)
+
+        total = 0
+        for frame in _frames(sample_audio_48k, 960):
+            total += len(resampler.process(frame))
+        total += len(resampler.flush())
+
+        assert abs(total - 4800 // 3) <= 2
+
+    @pytest.mark.skipif(not HAS_SOXR, reason="soxr not installed")
+    def test_no_boundary_artifacts(self, sample_audio_16k):
+        """Test that streamed output matches resampling the whole signal."""
+        samples = np.frombuffer(sample_audio_16k, dtype=np.int16) // 2
+        resampler = StreamingResampler(16000, 48000)
+
+        streamed = np.concatenate(
+            [resampler.process(frame) for frame in _frames(samples.tobytes(), 320)]
+            + [resampler.flush()]
+        )
+        whole = StreamingResampler(16000, 48000)
+        reference = np.concatenate([whole.process(samples), whole.flush()])
+
+        assert len(streamed) == len(reference)
+        # Only rounding differences, no per-packet edge effects
+        assert np.max(np.abs(streamed.astype(np.int32) - reference)) <= 4
+
+    def test_reset_counts(self):
+        """Test that reset is tracked."""
+        resampler = StreamingResampler(24000, 48000)
+        resampler.reset()
+        assert resampler.resets == 1
+
+    def test_same_rate_passthrough(self):
+        """Test that equal rates return the input unchanged."""
+        resampler = StreamingResampler(16000, 16000)
+        samples = np.arange(320, dtype=np.int16)
+        assert np.array_equal(resampler.process(samples), samples)
+
+
+class TestPCMFramer:
+    """Tests for outbound frame accumulation across chunks."""
+
+    def test_remainder_carries_across_chunks(self):
+        """Test that odd-sized chunks produce contiguous full frames only."""
+        framer = PCMFramer(frame_size=480)
+        stream = np.arange(2000, dtype=np.int16)
+
+        frames = []
+        for start in range(0, len(stream), 700):  # 700 is not a multiple of 480
+            frames.extend(framer.push(stream[start:start + 700]))
+
+        assert len(frames) == 4
+        assert all(len(f) == 480 for f in frames)
+        np.testing.assert_array_equal(np.concatenate(frames), stream[:1920])
+        assert framer.pending == 80
+        assert framer.frames_padded == 0
+
+    def test_flush_pads_tail_once(self):
+        """Test that only the final flush zero-pads."""
+        framer = PCMFramer(frame_size=480)
+        framer.push(np.ones(500, dtype=np.int16))
+
+        last = framer.flush()
+        assert len(last) == 480
+        assert last[:20].tolist() == [1] * 20
+        assert not last[20:].any()
+        assert framer.frames_padded == 1
+        assert framer.flush() is None
+
+    def test_grows_for_large_chunks(self):
+        """Test that chunks larger than the buffer are accepted."""
+        framer = PCMFramer(frame_size=10, capacity_frames=2)
+        frames = framer.push(np.zeros(105, dtype=np.int16))
+        assert len(frames) == 10
+        assert framer.pending == 5
+
+    def test_simple_processor_frames_gemini_chunks(self):
+        """Test that chunk boundaries no longer insert padded frames."""
+        processor = SimpleAudioProcessor(AudioConfig())
+        chunk = np.zeros(1000, dtype=np.int16).tobytes()  # 41.7ms at 24kHz
+
+        frames = processor.gemini_to_janus(chunk) + processor.gemini_to_janus(chunk)
+        frames += processor.flush_outbound()
+
+        # 2000 samples @24k -> 4000 @48k = 4 full frames + 1 padded tail
+        assert len(frames) == 5
+
+
+class TestNativeRateCodecs:
+    """Tests for the native-rate Opus codec mode."""
+
+    def test_native_mode_skips_resampling(self):
+        """Test that codecs run at Gemini rates with pass-through resamplers."""
+        processor = AudioProcessor(AudioConfig(opus_native_rate=True))
+
+        assert processor.decoder_rate == 16000
+        assert processor.encoder_rate == 24000
+        assert processor.decode_frame_size == 320
+        assert processor.encode_frame_size == 480
+        assert not processor._inbound_resampler.is_streaming
+        assert not processor._outbound_resampler.is_streaming
+
+    def test_fallback_mode_uses_48k_codecs(self):
+        """Test that disabling native mode restores the resample path."""
+        processor = AudioProcessor(AudioConfig(opus_native_rate=False))
+
+        assert processor.decoder_rate == 48000
+        assert processor.encoder_rate == 48000
+        assert processor.encode_frame_size == 960
+
+    def test_rtp_timestamp_uses_48k_clock(self):
+        """Test that RTP timestamps advance 960 per 20ms frame regardless of codec rate."""
+        sender = RTPSender(sample_rate=48000, frame_duration_ms=20)
+        assert sender._samples_per_packet == 960
+
+
+class TestLossRecovery:
+    """Tests for Opus FEC/PLC on the inbound path."""
+
+    def test_fec_flag_detection(self):
+        """Test the SILK LBRR flag check on single-frame packets."""
+        silk_20ms = 1 << 3  # SILK-only NB 20ms, code 0
+        assert opus_packet_has_fec(bytes([silk_20ms, 0x40, 0x00]))
+        assert not opus_packet_has_fec(bytes([silk_20ms, 0x80, 0x00]))
+
+        hybrid_20ms = 13 << 3
+        assert opus_packet_has_fec(bytes([hybrid_20ms, 0x40]))
+
+        celt_20ms = 31 << 3  # CELT-only: no SILK layer, no LBRR
+        assert not opus_packet_has_fec(bytes([celt_20ms, 0xFF]))
+        assert not opus_packet_has_fec(bytes([silk_20ms | 0x1, 0x40]))  # 2 frames
+        assert not opus_packet_has_fec(b"")
+
+    @pytest.mark.skipif(not HAS_OPUS, reason="opuslib not installed")
+    def test_lost_frames_are_concealed(self):
+        """Test that a gap is filled before the next packet's audio."""
+        processor = AudioProcessor(AudioConfig())
+        frame = np.zeros(processor.encode_frame_size, dtype=np.int16)
+        packet = processor.encode_opus(frame)
+
+        whole = processor.janus_to_gemini(packet)
+        with_gap = processor.janus_to_gemini(packet, lost=2)
+
+        assert len(with_gap) == 3 * len(whole)
+        stats = processor.get_stats()
+        assert stats["plc_concealed_frames"] + stats["fec_recovered_frames"] == 2
+
+    @pytest.mark.skipif(not HAS_OPUS, reason="opuslib not installed")
+    def test_long_gap_not_synthesized(self):
+        """Test that gaps beyond max_conceal_frames are left out."""
+        processor = AudioProcessor(AudioConfig())
+        assert processor.recover_lost(processor.max_conceal_frames + 1, b"") is None
+        assert processor.get_stats()["unrecovered_lost_frames"] == 6
+
+    def test_per_ssrc_inbound_state(self):
+        """Test that each SSRC gets its own decoder/resampler state."""
+        processor = AudioProcessor(AudioConfig(opus_native_rate=False))
+
+        first = processor._inbound(1111)
+        second = processor._inbound(2222)
+        assert first is not second
+        assert first.resampler is not second.resampler
+        assert processor.get_stats()["inbound_sources"] == 2
+
+        processor.remove_inbound(1111)
+        processor.remove_inbound(0)  # Default stream is never removed
+        assert processor.get_stats()["inbound_sources"] == 1
+        assert 0 in processor._inbound_streams
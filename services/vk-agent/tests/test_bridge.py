@@ -0,0 +1,160 @@
+"""
+Tests for VK-Agent bridge Gemini recovery (against a local stand-in server)
+"""
+
+import asyncio
+
+from src.audio_processor import SimpleAudioProcessor
+from src.bridge import AgentBridge
+from src.config import AudioConfig, GeminiConfig, Settings
+from src.gemini_client import GeminiLiveClient
+
+from .conftest import until
+from .gemini_server import GeminiStandIn
+
+CHUNK = b"\x01\x00" * 1600  # 100ms at 16kHz
+
+
+class _Wire:
+    """RTP sender stand-in that accepts every frame."""
+
+    def send(self, frame: bytes, marker: bool = False) -> bool:
+        return True
+
+
+async def _bridge(server: GeminiStandIn, audio: AudioConfig | None = None, **gemini) -> AgentBridge:
+    """Running bridge with only its Gemini leg connected."""
+    settings = Settings(
+        gemini=GeminiConfig(api_key="test", ws_url=server.url, **gemini),
+        audio=audio or AudioConfig(),
+    )
+    bridge = AgentBridge(settings)
+    bridge.gemini_client = GeminiLiveClient(settings.gemini)
+    bridge._wire_gemini(bridge.gemini_client)
+    assert await bridge.gemini_client.connect()
+    await until(lambda: bridge.gemini_client.resumption_handle is not None)
+    bridge._running = True
+    return bridge
+
+
+class TestGeminiRecovery:
+    """Tests for resume-on-drop with buffered user audio."""
+
+    async def test_drop_resumes_and_replays_gap_audio(self):
+        """Test that audio sent during the gap reaches the resumed session."""
+        server = GeminiStandIn(setup_delay=0.1)
+        await server.start()
+        bridge = await _bridge(server)
+
+        await server.drop_all()
+        await until(lambda: bridge._gemini_recovering)
+        for _ in range(3):
+            await bridge._send_user_audio(CHUNK)
+        await until(lambda: not bridge._gemini_recovering and len(server.realtime_input) == 3)
+
+        assert server.setup_messages[-1]["session_resumption"] == {"handle": "handle-1"}
+        stats = bridge.stats
+        assert (stats.gemini_reconnects, stats.gemini_resumptions) == (1, 1)
+        assert stats.gemini_replayed_audio_ms == 300
+        assert stats.gemini_lost_audio_ms == 0
+        assert stats.gemini_recovery.last_ms < 1000  # No fixed 2s sleep
+
+        bridge._running = False
+        await bridge.gemini_client.disconnect()
+        await server.stop()
+
+    async def test_buffer_is_bounded(self):
+        """Test that only the newest resume_buffer_ms of audio is kept."""
+        server = GeminiStandIn()
+        await server.start()
+        bridge = await _bridge(server, resume_buffer_ms=200)
+        bridge._gemini_recovering = True  # Gap in progress
+
+        for _ in range(5):
+            await bridge._send_user_audio(CHUNK)
+
+        assert len(bridge._resume_buffer) == 2
+        assert bridge.stats.gemini_lost_audio_ms == 300
+        await bridge.gemini_client.disconnect()
+        await server.stop()
+
+    async def test_client_turns_reopened_on_replay(self):
+        """Test that a turn spanning the gap is framed by activity signals."""
+        server = GeminiStandIn()
+        await server.start()
+        bridge = await _bridge(server, turn_detection="client")
+        bridge._gemini_recovering = True
+
+        await bridge._send_user_audio(CHUNK)
+        await bridge._end_user_activity()
+        await bridge._send_user_audio(CHUNK)
+        bridge._gemini_recovering = False
+        await bridge._replay_resume_buffer()
+        await until(lambda: len(server.realtime_input) == 5)
+
+        kinds = [next(iter(message)) for message in server.realtime_input]
+        assert kinds == ["activityStart", "mediaChunks", "activityEnd", "activityStart", "mediaChunks"]
+        assert bridge._activity_open
+        await bridge.gemini_client.disconnect()
+        await server.stop()
+
+    async def test_go_away_moves_to_new_connection(self):
+        """Test that goAway reconnects before the server closes."""
+        server = GeminiStandIn()
+        await server.start()
+        bridge = await _bridge(server)
+
+        await server.go_away()
+        await until(lambda: bridge.stats.gemini_resumptions == 1)
+
+        assert bridge.gemini_client.is_ready
+        assert bridge.stats.gemini_errors == 0
+        bridge._running = False
+        await bridge.gemini_client.disconnect()
+        await server.stop()
+
+
+class TestPlayback:
+    """Tests for the Gemini -> playout path."""
+
+    async def test_long_answer_does_not_hold_control_messages(self):
+        """Test that goAway behind more audio than the playout buffer is handled at once."""
+        # 200 x 40ms chunks = 8s of speech against a 200ms playout buffer
+        server = GeminiStandIn(
+            audio=b"\x00\x00" * 960, audio_chunks=200,
+            after_audio={"goAway": {"timeLeft": "1s"}},
+        )
+        await server.start()
+        bridge = await _bridge(server, audio=AudioConfig(playout_buffer_ms=200))
+        bridge.audio_processor = SimpleAudioProcessor(bridge.settings.audio)
+        bridge.rtp_sender = _Wire()
+        tasks = [
+            asyncio.create_task(bridge._playout.run()),
+            asyncio.create_task(bridge._audio_playback_loop()),
+        ]
+
+        assert await bridge.gemini_client.send_text("hello")
+        await until(lambda: bridge.stats.gemini_resumptions == 1, timeout=1.0)
+
+        assert bridge.stats.audio_chunks_from_gemini == 200
+        assert bridge._playout.buffered_frames <= bridge._playout.max_frames
+        bridge._running = False
+        bridge._playout.stop()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await bridge.gemini_client.disconnect()
+        await server.stop()
+
+
+class TestDecodeJob:
+    """Tests for state handed to the decode DSP job."""
+
+    def test_reaped_sources_freed_by_decode_job(self):
+        """Test that idle SSRCs are freed inside the job, not by the loop."""
+        bridge = AgentBridge(Settings(gemini=GeminiConfig(api_key="test")))
+        bridge.audio_processor = SimpleAudioProcessor(bridge.settings.audio)
+        bridge._mixer.push(7, CHUNK)
+
+        assert bridge._decode_batch([], reaped=[7]) == b""
+        assert bridge._mixer.active_sources == 0
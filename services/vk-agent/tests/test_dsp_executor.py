@@ -0,0 +1,79 @@
+"""
+Tests for VK-Agent DSP executor and event-loop lag monitor
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from src.dsp_executor import DSPExecutor, LoopLagMonitor
+
+
+class TestDSPExecutor:
+    """Tests for inline and threaded job execution."""
+
+    async def test_inline_runs_on_loop_thread(self):
+        """Test that workers=0 runs jobs on the calling thread."""
+        dsp = DSPExecutor(workers=0)
+        result = await dsp.run(lambda x: (x * 2, threading.get_ident()), 21)
+
+        assert dsp.inline
+        assert result == (42, threading.get_ident())
+        assert dsp.get_stats()["jobs"] == 1
+
+    async def test_pool_runs_off_loop_thread(self):
+        """Test that jobs run on a worker thread when workers > 0."""
+        dsp = DSPExecutor(workers=2)
+        try:
+            value, thread_id = await dsp.run(lambda x: (x + 1, threading.get_ident()), 1)
+        finally:
+            dsp.shutdown()
+
+        assert value == 2
+        assert thread_id != threading.get_ident()
+        stats = dsp.get_stats()
+        assert stats["inline"] is False
+        assert stats["run_time"]["count"] == 1
+        assert stats["queue_wait"]["count"] == 1
+
+    async def test_errors_propagate(self):
+        """Test that job exceptions reach the caller and are counted."""
+        dsp = DSPExecutor(workers=1)
+
+        def fail():
+            raise ValueError("bad frame")
+
+        try:
+            with pytest.raises(ValueError):
+                await dsp.run(fail)
+        finally:
+            dsp.shutdown()
+        assert dsp.get_stats()["errors"] == 1
+
+
+class TestLoopLagMonitor:
+    """Tests for loop lag measurement."""
+
+    async def _lag_with(self, dsp: DSPExecutor) -> float:
+        monitor = LoopLagMonitor(interval=0.01, warn_ms=1000)
+        task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.02)
+        await dsp.run(time.sleep, 0.1)  # Synchronous DSP-sized stall
+        await asyncio.sleep(0.03)
+        monitor.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return monitor.max_lag_ms
+
+    async def test_inline_job_blocks_loop(self):
+        """Test that an inline job shows up as loop lag."""
+        assert await self._lag_with(DSPExecutor(workers=0)) >= 50
+
+    async def test_pool_keeps_loop_free(self):
+        """Test that the same job in the pool does not block the loop."""
+        dsp = DSPExecutor(workers=1)
+        try:
+            assert await self._lag_with(dsp) < 50
+        finally:
+            dsp.shutdown()
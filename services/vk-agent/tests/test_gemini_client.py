@@ -0,0 +1,179 @@
+"""
+Tests for VK-Agent Gemini Live client
+"""
+
+import base64
+import json
+import time
+
+from src.config import GeminiConfig
+from src.gemini_client import GeminiLiveClient
+from src.gemini_codec import decode_server_message
+
+from .conftest import until
+from .gemini_server import GeminiStandIn
+
+
+class RecordingWebSocket:
+    """Collects JSON messages the client sends."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+
+def _client(turn_detection: str) -> tuple:
+    """Connected, set-up client writing to a RecordingWebSocket."""
+    client = GeminiLiveClient(GeminiConfig(api_key="test", turn_detection=turn_detection))
+    ws = RecordingWebSocket()
+    client._ws = ws
+    client.session.connected = True
+    client.session.setup_complete = True
+    return client, ws
+
+
+class TestTurnDetection:
+    """Tests for server vs client-side turn detection."""
+
+    async def test_server_mode_keeps_automatic_detection(self):
+        """Test that the default setup leaves Gemini endpointing on."""
+        client, ws = _client("server")
+        await client._send_setup()
+
+        assert "realtime_input_config" not in ws.sent[0]["setup"]
+
+    async def test_client_mode_disables_automatic_detection(self):
+        """Test that client mode turns off Gemini's activity detection."""
+        client, ws = _client("client")
+        await client._send_setup()
+
+        config = ws.sent[0]["setup"]["realtime_input_config"]
+        assert config == {"automatic_activity_detection": {"disabled": True}}
+
+    async def test_context_compression_in_setup(self):
+        """Test the sliding-window compression config and opting out."""
+        client, ws = _client("server")
+        await client._send_setup()
+        assert ws.sent[0]["setup"]["context_window_compression"] == {
+            "trigger_tokens": client.config.context_trigger_tokens,
+            "sliding_window": {"target_tokens": client.config.context_target_tokens},
+        }
+
+        client.config.context_compression = False
+        await client._send_setup()
+        assert "context_window_compression" not in ws.sent[1]["setup"]
+
+    async def test_activity_signals(self):
+        """Test activityStart/activityEnd framing and counters."""
+        client, ws = _client("client")
+
+        assert await client.send_activity_start()
+        assert await client.send_audio(b"\x00\x00" * 160)
+        assert await client.send_activity_end()
+
+        assert ws.sent[0] == {"realtimeInput": {"activityStart": {}}}
+        assert ws.sent[2] == {"realtimeInput": {"activityEnd": {}}}
+        stats = client.get_stats()
+        assert stats["activity_starts"] == 1
+        assert stats["activity_ends"] == 1
+
+    async def test_activity_requires_setup(self):
+        """Test that signals are not sent before setupComplete."""
+        client, ws = _client("client")
+        client.session.setup_complete = False
+
+        assert not await client.send_activity_start()
+        assert ws.sent == []
+
+
+class TestWireFormat:
+    """Tests for the codec-backed send and receive paths."""
+
+    async def test_audio_roundtrip(self):
+        """Test that sent audio is framed and received audio arrives as PCM."""
+        client, ws = _client("server")
+        received = []
+        client.on_audio = received.append
+
+        assert await client.send_audio(b"\x01\x02" * 800)
+        chunk = ws.sent[0]["realtimeInput"]["mediaChunks"][0]
+        assert chunk["mimeType"] == "audio/pcm;rate=16000"
+        assert base64.b64decode(chunk["data"]) == b"\x01\x02" * 800
+
+        pcm = b"\x03\x04" * 2400
+        message = {"serverContent": {"modelTurn": {"parts": [
+            {"inlineData": {"mimeType": "audio/pcm;rate=24000", "data": base64.b64encode(pcm).decode()}}
+        ]}}}
+        await client._handle_message(decode_server_message(json.dumps(message).encode()))
+
+        assert received == [pcm]
+        assert client.get_stats()["bytes_received"] == len(pcm)
+
+
+class TestSessionResumption:
+    """Tests for resumption handles and goAway against the stand-in server."""
+
+    async def test_handle_sent_on_reconnect(self):
+        """Test that the latest handle is used for the next setup."""
+        server = GeminiStandIn()
+        await server.start()
+        client = GeminiLiveClient(GeminiConfig(api_key="test", ws_url=server.url))
+
+        assert await client.connect()
+        await until(lambda: client.resumption_handle is not None)
+        assert server.setup_messages[0]["session_resumption"] == {}
+        assert not client.resumed
+
+        await server.drop_all()
+        await until(lambda: not client.is_connected)
+        assert await client.connect()
+
+        assert server.setup_messages[1]["session_resumption"] == {"handle": "handle-1"}
+        assert client.resumed
+        assert client.get_stats()["resumptions"] == 1
+        await client.disconnect()
+        await server.stop()
+
+    async def test_rejected_handle_fails_fast(self):
+        """Test that a close during setup does not wait for the timeout."""
+        server = GeminiStandIn()
+        await server.start()
+        client = GeminiLiveClient(GeminiConfig(api_key="test", ws_url=server.url))
+        client.resumption_handle = "expired"
+
+        start = time.monotonic()
+        assert not await client.connect()
+        assert time.monotonic() - start < 1.0
+        await server.stop()
+
+    async def test_go_away_callback(self):
+        """Test that goAway reaches on_go_away."""
+        client, _ = _client("server")
+        notices = []
+        client.on_go_away = notices.append
+
+        await client._handle_message({"goAway": {"timeLeft": "10s"}})
+        await client._handle_message({"sessionResumptionUpdate": {"newHandle": "h", "resumable": False}})
+
+        assert notices == ["10s"]
+        assert client.resumption_handle is None  # Not resumable at that point
+
+
+class TestTokenAccounting:
+    """Tests for the token estimates exposed in get_stats."""
+
+    async def test_sent_and_reported_tokens(self):
+        """Test that audio seconds, images and usageMetadata are counted."""
+        client, _ = _client("server")
+
+        assert await client.send_audio(b"\x00\x00" * 16000)  # 1s at 16kHz
+        assert await client.send_image(b"\xff\xd8")
+        await client._handle_message({"usageMetadata": {"promptTokenCount": 300, "totalTokenCount": 350}})
+
+        tokens = client.get_stats()["tokens"]
+        assert tokens["audio_in_seconds"] == 1.0
+        assert tokens["images"] == 1
+        assert tokens["tokens_sent"] == 32 + 258
+        assert tokens["server_total_tokens"] == 350
@@ -0,0 +1,103 @@
+"""
+Tests for VK-Agent Gemini wire codec
+"""
+
+import base64
+import json
+import os
+
+import pytest
+
+from src.gemini_codec import (
+    ACTIVITY_END,
+    ACTIVITY_START,
+    MediaChunkEncoder,
+    decode_server_message,
+    encode_media_chunk,
+)
+
+
+def _audio_message(*chunks: bytes, **content) -> dict:
+    """serverContent message with one inlineData part per chunk."""
+    parts = [
+        {"inlineData": {"mimeType": "audio/pcm;rate=24000", "data": base64.b64encode(c).decode()}}
+        for c in chunks
+    ]
+    return {"serverContent": {"modelTurn": {"parts": parts}, **content}}
+
+
+def _reference(message: dict) -> dict:
+    """What json.loads + b64decode of each inlineData part would give."""
+    for part in message["serverContent"]["modelTurn"]["parts"]:
+        if "inlineData" in part:
+            part["inlineData"]["data"] = base64.b64decode(part["inlineData"]["data"])
+    return message
+
+
+class TestEncoder:
+    """Tests for template-based realtimeInput encoding."""
+
+    def test_matches_json(self):
+        """Test that the template produces the same message as json.dumps."""
+        encoder = MediaChunkEncoder("audio/pcm;rate=16000")
+        for size in (3200, 2, 0, 4800):  # Buffer shrinks and grows
+            pcm = os.urandom(size)
+            assert json.loads(encoder.encode(pcm)) == {
+                "realtimeInput": {"mediaChunks": [{
+                    "mimeType": "audio/pcm;rate=16000",
+                    "data": base64.b64encode(pcm).decode(),
+                }]}
+            }
+
+    def test_one_off_and_activity(self):
+        """Test image chunks and the prebuilt activity signals."""
+        message = json.loads(encode_media_chunk(b"\xff\xd8", "image/jpeg"))
+        assert message["realtimeInput"]["mediaChunks"][0]["mimeType"] == "image/jpeg"
+        assert json.loads(ACTIVITY_START) == {"realtimeInput": {"activityStart": {}}}
+        assert json.loads(ACTIVITY_END) == {"realtimeInput": {"activityEnd": {}}}
+
+
+class TestDecoder:
+    """Tests for lean serverContent decoding."""
+
+    @pytest.mark.parametrize("frame", [
+        lambda m: json.dumps(m),
+        lambda m: json.dumps(m, separators=(",", ":")).encode(),
+        lambda m: json.dumps(m, indent=2),
+    ])
+    def test_matches_reference(self, frame):
+        """Test text/binary, compact/pretty frames against a full parse."""
+        message = _audio_message(os.urandom(4800), b"\x00\x00\x00", os.urandom(960), turnComplete=True)
+        message["serverContent"]["modelTurn"]["parts"].append({"text": 'says "data": here'})
+
+        assert decode_server_message(frame(message)) == _reference(json.loads(json.dumps(message)))
+
+    def test_escaped_data_falls_back(self):
+        """Test that an escaped base64 string is still decoded correctly."""
+        pcm = os.urandom(960)
+        raw = json.dumps(_audio_message(pcm)).replace("/", "\\/")
+        assert decode_server_message(raw)["serverContent"]["modelTurn"]["parts"][0]["inlineData"]["data"] == pcm
+
+    def test_other_data_keys_untouched(self):
+        """Test that a large "data" outside modelTurn stays a string."""
+        blob = "A" * 1000
+        message = {"toolCall": {"functionCalls": [{"name": "f", "args": {"data": blob}}]}}
+        assert decode_server_message(json.dumps(message)) == message
+
+    def test_large_data_before_audio(self):
+        """Test that a large "data" ahead of the audio does not shift the chunks."""
+        blob = base64.b64encode(os.urandom(3072)).decode()  # 4KB of base64
+        message = {
+            "toolCall": {"functionCalls": [{"name": "f", "args": {"data": blob}}]},
+            **_audio_message(os.urandom(4800), b"\x00\x00"),
+        }
+        expected = _reference(json.loads(json.dumps(message)))
+        assert decode_server_message(json.dumps(message)) == expected
+        assert decode_server_message(json.dumps(message).encode()) == expected
+
+    def test_non_audio_messages(self):
+        """Test messages without inline data."""
+        assert decode_server_message(b'{"setupComplete":{}}') == {"setupComplete": {}}
+        assert decode_server_message('{"serverContent":{"interrupted":true}}') == {
+            "serverContent": {"interrupted": True}
+        }
@@ -0,0 +1,144 @@
+"""
+Tests for VK-Agent warm Gemini session pool (against a local stand-in server)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.config import GeminiConfig
+from src.gemini_client import GeminiLiveClient
+from src.gemini_pool import GeminiSessionPool, profile_key
+
+from .conftest import until
+from .gemini_server import GeminiStandIn
+
+
+@pytest.fixture
+async def server():
+    """Stand-in Gemini Live endpoint."""
+    server = GeminiStandIn(setup_delay=0.05)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _config(server: GeminiStandIn, **overrides) -> GeminiConfig:
+    """GeminiConfig pointed at the stand-in server."""
+    return GeminiConfig(api_key="test", ws_url=server.url, **overrides)
+
+
+class TestClientSetup:
+    """Tests for setupComplete handling in GeminiLiveClient.connect."""
+
+    async def test_connect_returns_on_setup_complete(self, server):
+        """Test that connect() returns as soon as setupComplete arrives."""
+        client = GeminiLiveClient(_config(server))
+        start = time.monotonic()
+
+        assert await client.connect()
+        assert client.is_ready
+        assert time.monotonic() - start < 0.5  # Not rounded up to a poll tick
+        await client.disconnect()
+
+    async def test_setup_timeout(self, server):
+        """Test that a session that never completes setup is closed."""
+        server.complete_setup = False
+        config = _config(server)
+        config.setup_timeout = 0.1
+        client = GeminiLiveClient(config)
+
+        assert not await client.connect()
+        assert not client.is_connected
+
+
+class TestGeminiSessionPool:
+    """Tests for warm-up, hand-over and replenishment."""
+
+    async def test_warm_acquire_is_hit_and_replenished(self, server):
+        """Test that a warm session is handed over and replaced."""
+        config = _config(server)
+        pool = GeminiSessionPool(size=2)
+        pool.warm(config)
+        task = asyncio.create_task(pool.run())
+        await until(lambda: pool.idle_count(config) == 2)
+
+        client = await pool.acquire(config)
+        assert client.is_ready
+        assert pool.hits == 1 and pool.misses == 0
+        assert pool.acquire_time.last_ms < 20  # No connect on the call path
+
+        await until(lambda: pool.idle_count(config) == 2)
+        assert server.setups == 3
+
+        await client.disconnect()
+        await pool.stop()
+        await task
+        assert pool.get_stats()["idle"] == 0
+
+    async def test_cold_acquire_connects(self, server):
+        """Test that acquire() connects on demand when nothing is warm."""
+        config = _config(server)
+        pool = GeminiSessionPool(size=1)
+
+        client = await pool.acquire(config)
+        assert client.is_ready
+        assert pool.misses == 1
+        await client.disconnect()
+
+    async def test_profiles_are_separate(self, server):
+        """Test that a session is only handed to its own profile."""
+        puck, aoede = _config(server), _config(server, voice="Aoede")
+        assert profile_key(puck) != profile_key(aoede)
+
+        pool = GeminiSessionPool(size=1)
+        pool.warm(puck)
+        task = asyncio.create_task(pool.run())
+        await until(lambda: pool.idle_count(puck) == 1)
+
+        client = await pool.acquire(aoede)
+        assert pool.misses == 1
+        assert client.config.voice == "Aoede"
+
+        await client.disconnect()
+        await pool.stop()
+        await task
+
+    def test_profile_covers_every_setup_field(self, server):
+        """Test that settings beyond voice/persona also split profiles."""
+        base = profile_key(_config(server))
+        assert profile_key(_config(server, context_compression=False)) != base
+        assert profile_key(_config(server, context_trigger_tokens=64000)) != base
+        assert profile_key(_config(server, session_resumption=False)) != base
+        assert profile_key(_config(server, turn_detection="client")) != base
+        assert profile_key(_config(server)) == base
+
+    async def test_closed_sessions_are_evicted(self, server):
+        """Test that sessions the server dropped are not handed out."""
+        config = _config(server)
+        pool = GeminiSessionPool(size=1, refill_interval=0.05)
+        pool.warm(config)
+        task = asyncio.create_task(pool.run())
+        await until(lambda: pool.idle_count(config) == 1)
+
+        await server.drop_all()
+        await until(lambda: pool.evicted == 1 and pool.idle_count(config) == 1)
+        client = await pool.acquire(config)
+        assert client.is_ready
+
+        await client.disconnect()
+        await pool.stop()
+        await task
+
+    async def test_failed_connects_back_off(self, server):
+        """Test that an unreachable endpoint is not retried in a tight loop."""
+        config = GeminiConfig(api_key="test", ws_url="ws://127.0.0.1:9/ws")
+        pool = GeminiSessionPool(size=1, refill_interval=0.02)
+        pool.warm(config)
+        task = asyncio.create_task(pool.run())
+        await asyncio.sleep(0.3)
+
+        assert pool.connect_failures == 1  # Next attempt after 1s
+        await pool.stop()
+        await task
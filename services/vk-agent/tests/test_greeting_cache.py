@@ -0,0 +1,187 @@
+"""
+Tests for VK-Agent greeting cache
+"""
+
+import asyncio
+import os
+import time
+
+from src.bridge import AgentBridge
+from src.config import AudioConfig, GeminiConfig, Settings
+from src.gemini_client import GeminiLiveClient
+from src.greeting_cache import MIN_FRAMES, GreetingCache, GreetingCapture
+from src.models import Participant
+
+from .conftest import until
+from .gemini_server import GeminiStandIn
+
+FRAMES = [bytes([i]) * (40 + i) for i in range(MIN_FRAMES * 2)]
+
+
+class TestGreetingCache:
+    """Tests for storage, keys and LRU eviction."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test that stored frames come back unchanged."""
+        cache = GreetingCache(str(tmp_path))
+        key = cache.key("Puck", "persona", "hello", 20, 24000)
+
+        assert cache.get(key) is None
+        assert cache.put(key, FRAMES)
+        assert cache.get(key) == FRAMES
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_short_capture_rejected(self, tmp_path):
+        """Test that an interrupted (too short) greeting is not stored."""
+        cache = GreetingCache(str(tmp_path))
+        assert not cache.put("short", FRAMES[:MIN_FRAMES - 1])
+        assert cache.get("short") is None
+
+    def test_key_covers_rendering_inputs(self):
+        """Test that voice, persona and template each change the key."""
+        base = GreetingCache.key("Puck", "persona", "hello", 20, 24000)
+        assert GreetingCache.key("Kore", "persona", "hello", 20, 24000) != base
+        assert GreetingCache.key("Puck", "other", "hello", 20, 24000) != base
+        assert GreetingCache.key("Puck", "persona", "hi", 20, 24000) != base
+        assert GreetingCache.key("Puck", "persona", "hello", 20, 16000) != base
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used greeting is evicted."""
+        cache = GreetingCache(str(tmp_path), max_entries=2)
+        cache.put("a", FRAMES)
+        cache.put("b", FRAMES)
+        os.utime(tmp_path / "a.greeting", (1, 1))
+        os.utime(tmp_path / "b.greeting", (2, 2))
+
+        assert cache.get("a") == FRAMES  # Touch: "b" is now the oldest
+        cache.put("c", FRAMES)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == FRAMES
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["entries"] == 2
+
+    def test_corrupt_file_removed(self, tmp_path):
+        """Test that an unreadable file counts as a miss and is deleted."""
+        cache = GreetingCache(str(tmp_path))
+        (tmp_path / "bad.greeting").write_bytes(b"VKG1\x00")
+
+        assert cache.get("bad") is None
+        assert not (tmp_path / "bad.greeting").exists()
+
+    def test_frame_duration_mismatch(self, tmp_path):
+        """Test that frames of another duration are not played."""
+        GreetingCache(str(tmp_path), frame_duration_ms=20).put("k", FRAMES)
+        assert GreetingCache(str(tmp_path), frame_duration_ms=40).get("k") is None
+
+
+class TestBridgeGreeting:
+    """Tests for the cached greeting on join."""
+
+    async def test_cache_hit_plays_and_follows_up_by_name(self, tmp_path):
+        """Test that cached frames are queued at once and the name goes to Gemini."""
+        server = GeminiStandIn()
+        await server.start()
+        settings = Settings(gemini=GeminiConfig(
+            api_key="test", ws_url=server.url, greeting_cache_dir=str(tmp_path),
+        ))
+        bridge = AgentBridge(settings)
+        bridge._greeting_cache.put(bridge._greeting_key(), FRAMES)
+        bridge._joined_at = time.monotonic()
+
+        greeting = asyncio.create_task(bridge._send_greeting("Ada"))
+        await until(lambda: bridge._playout.buffered_frames == len(FRAMES))
+        assert bridge.stats.greetings_cached == 1
+        assert bridge.stats.join_to_audio.count == 1
+        assert server.client_content == []  # Gemini not connected yet
+
+        bridge.gemini_client = GeminiLiveClient(settings.gemini)
+        assert await bridge.gemini_client.connect()
+        await greeting
+        await until(lambda: server.client_content)
+
+        text = server.client_content[0]["turns"][0]["parts"][0]["text"]
+        assert "Ada" in text
+        await bridge.gemini_client.disconnect()
+        await server.stop()
+
+    async def test_capture_records_one_uninterrupted_turn(self, tmp_path):
+        """Test the playback-loop capture hook for complete and cut turns."""
+        settings = Settings(gemini=GeminiConfig(api_key="test", greeting_cache_dir=str(tmp_path)))
+        bridge = AgentBridge(settings)
+
+        capture = GreetingCapture(key="k", generation=bridge._playout.generation)
+        bridge._greeting_capture = capture
+        bridge._capture_greeting(capture.generation, FRAMES[:5])
+        bridge._capture_greeting(capture.generation, FRAMES[5:], end_of_turn=True)
+        assert capture.complete and capture.done.is_set()
+        assert capture.frames == FRAMES
+
+        cut = GreetingCapture(key="k", generation=bridge._playout.generation)
+        bridge._greeting_capture = cut
+        bridge._capture_greeting(cut.generation, FRAMES[:5])
+        bridge._playout.clear()  # Barge-in
+        bridge._capture_greeting(bridge._playout.generation, FRAMES[5:], end_of_turn=True)
+        assert cut.done.is_set() and not cut.complete
+
+    async def test_each_participant_greeted_once(self, tmp_path):
+        """Test that list updates and leaves do not greet anyone again."""
+        settings = Settings(gemini=GeminiConfig(api_key="test", greeting_cache_dir=str(tmp_path)))
+        bridge = AgentBridge(settings)
+        greeted = []
+
+        async def record(name, forwarding=None):
+            greeted.append(name)
+
+        bridge._send_greeting = record
+        ada, bob = Participant(1, "Ada"), Participant(2, "Bob")
+        bridge._on_participants_changed([ada])
+        bridge._on_participants_changed([ada])  # Update (e.g. mute)
+        bridge._on_participants_changed([ada, bob])
+        bridge._on_participants_changed([bob])  # Ada left
+        await asyncio.sleep(0)
+
+        assert greeted == ["Ada", "Bob"]
+
+    async def test_cache_skipped_while_agent_speaks(self, tmp_path):
+        """Test that the cached greeting does not talk over a Gemini answer."""
+        server = GeminiStandIn()
+        await server.start()
+        settings = Settings(gemini=GeminiConfig(
+            api_key="test", ws_url=server.url, greeting_cache_dir=str(tmp_path),
+        ))
+        bridge = AgentBridge(settings)
+        bridge._greeting_cache.put(bridge._greeting_key(), FRAMES)
+        bridge.gemini_client = GeminiLiveClient(settings.gemini)
+        assert await bridge.gemini_client.connect()
+        bridge._gemini_speaking = True
+
+        await bridge._send_greeting("Ada")
+        await until(lambda: len(server.client_content) == 2)
+
+        assert bridge._playout.buffered_frames == 0
+        assert bridge.stats.greetings_cached == 0
+        assert "Ada" in server.client_content[1]["turns"][0]["parts"][0]["text"]
+        await bridge.gemini_client.disconnect()
+        await server.stop()
+
+    async def test_cached_greeting_can_be_cut(self, tmp_path):
+        """Test that barge-in stops a cached greeting like a Gemini turn."""
+        settings = Settings(
+            gemini=GeminiConfig(api_key="test", greeting_cache_dir=str(tmp_path)),
+            audio=AudioConfig(barge_in=True),
+        )
+        bridge = AgentBridge(settings)
+        generation = bridge._playout.generation
+
+        assert bridge._play_cached_greeting(FRAMES, generation)
+        assert bridge._gemini_speaking
+        assert bridge._playout.buffered_frames == len(FRAMES)
+
+        speech_ms = settings.audio.barge_in_min_speech_ms
+        assert bridge._apply_barge_in(b"\x01\x00" * 4800, True, speech_ms)
+        assert bridge._playout.buffered_frames == 0
+        assert not bridge._gemini_speaking
+        assert not bridge._suppress_gemini_audio  # No Gemini turn to swallow
+        assert not bridge._play_cached_greeting(FRAMES, generation)  # Cut before queued
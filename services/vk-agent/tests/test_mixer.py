@@ -0,0 +1,98 @@
+"""
+Tests for VK-Agent inbound audio mixer
+"""
+
+import numpy as np
+from src.mixer import AudioMixer
+
+FRAME = 0.02
+
+
+def _pcm(values) -> bytes:
+    return np.asarray(values, dtype=np.int16).tobytes()
+
+
+def _mixer(**kwargs) -> AudioMixer:
+    """Mixer with 4-sample frames (200Hz, 20ms) for readable tests."""
+    return AudioMixer(sample_rate=200, frame_duration_ms=20, **kwargs)
+
+
+class TestAudioMixer:
+    """Tests for per-publisher PCM mixing."""
+
+    def test_single_source_passthrough(self):
+        """Test that one speaker's whole frames are returned unchanged."""
+        mixer = _mixer()
+        mixer.push(1, _pcm([1, 2, 3]))
+        assert mixer.mix(now=0.0) == b""  # No whole frame yet
+
+        mixer.push(1, _pcm([4, 5]))
+        assert mixer.mix(now=0.0) == _pcm([1, 2, 3, 4])
+        assert mixer.get_stats()["multi_source_mixes"] == 0
+
+    def test_sources_are_summed(self):
+        """Test that concurrent speakers are added sample by sample."""
+        mixer = _mixer()
+        mixer.push(1, _pcm([100, 200, 300, 400]))
+        mixer.push(2, _pcm([10, 20, 30, 40]))
+
+        assert mixer.mix(now=0.0) == _pcm([110, 220, 330, 440])
+        assert mixer.active_sources == 0
+
+    def test_sum_is_clipped(self):
+        """Test that overflow saturates instead of wrapping."""
+        mixer = _mixer()
+        mixer.push(1, _pcm([30000, -30000, 0, 0]))
+        mixer.push(2, _pcm([30000, -30000, 0, 0]))
+
+        assert mixer.mix(now=0.0) == _pcm([32767, -32768, 0, 0])
+        assert mixer.get_stats()["clipped_samples"] == 2
+
+    def test_empty_and_removed(self):
+        """Test that empty pushes and removed sources produce nothing."""
+        mixer = _mixer()
+        mixer.push(1, b"")
+        mixer.push(2, _pcm([5, 5, 5, 5]))
+        mixer.remove(2)
+
+        assert mixer.mix(now=0.0) == b""
+
+    def test_sources_in_separate_batches_overlap(self):
+        """Test that offset publishers are summed, not concatenated.
+
+        Each jitter buffer releases on its own deadline, so the two
+        sources arrive in alternating calls 7ms apart.
+        """
+        mixer = _mixer()
+        out = bytearray()
+        for i in range(50):
+            t = i * FRAME
+            mixer.push(1, _pcm([100] * 4))
+            out += mixer.mix(now=t)
+            mixer.push(2, _pcm([10] * 4))
+            out += mixer.mix(now=t + 0.007)
+
+        samples = np.frombuffer(bytes(out), dtype=np.int16)
+        assert len(samples) <= 50 * 4  # One stream's length, not two
+        assert len(samples) >= 49 * 4
+        assert np.count_nonzero(samples == 110) >= 48 * 4
+        assert mixer.get_stats()["multi_source_mixes"] >= 48
+
+    def test_late_source_gets_silence(self):
+        """Test that a tick does not wait for a source with no frame."""
+        mixer = _mixer()
+        mixer.push(1, _pcm([1] * 4))
+        mixer.push(2, _pcm([2] * 4))
+        assert mixer.mix(now=0.0) == _pcm([3] * 4)
+
+        mixer.push(1, _pcm([1] * 4))
+        assert mixer.mix(now=FRAME) == _pcm([1] * 4)
+        assert mixer.get_stats()["silence_fills"] == 1
+
+    def test_backlog_is_bounded(self):
+        """Test that a source running ahead of the clock drops its oldest audio."""
+        mixer = _mixer(max_backlog_ms=40)
+        mixer.push(1, _pcm(range(12)))
+
+        assert mixer.get_stats()["dropped_samples"] == 4
+        assert mixer.mix(now=0.0) == _pcm([4, 5, 6, 7])
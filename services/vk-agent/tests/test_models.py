@@ -5,10 +5,14 @@ Tests for VK-Agent data models
 import pytest
 from src.models import (
     RTPPacket,
+    RTPPacketView,
+    RTPPacketWriter,
     AudioFormat,
     CodecType,
     AgentState,
     BridgeStats,
+    LatencyStats,
+    TokenUsage,
 )
 
 
@@ -68,6 +72,80 @@ class TestRTPPacket:
         assert parsed.payload == original.payload
 
 
+class TestRTPPacketView:
+    """Tests for the zero-copy receive-path packet view."""
+
+    def test_matches_dataclass_parse(self):
+        """Test that header fields and payload match RTPPacket.parse."""
+        raw = RTPPacket(
+            marker=True, sequence_number=65535, timestamp=0xFFFFFFF0,
+            ssrc=0xDEADBEEF, payload=b"opus frame",
+        ).to_bytes()
+
+        view = RTPPacketView.parse(raw, received_ns=123)
+        packet = RTPPacket.parse(raw)
+        assert view.marker == packet.marker
+        assert view.payload_type == packet.payload_type
+        assert view.sequence_number == packet.sequence_number
+        assert view.timestamp == packet.timestamp
+        assert view.ssrc == packet.ssrc
+        assert bytes(view.payload) == packet.payload
+        assert view.received_ns == 123
+
+    def test_payload_is_not_copied(self):
+        """Test that the payload is a view into the datagram."""
+        raw = RTPPacket(payload=b"abcdef").to_bytes()
+        view = RTPPacketView.parse(raw)
+
+        assert isinstance(view.payload, memoryview)
+        assert view.payload.obj is raw
+        assert view.payload_size == 6
+
+    def test_csrc_extension_and_padding(self):
+        """Test header length with CSRCs and extension, and padding removal."""
+        header = bytes([0xB1, 0x6F, 0, 1, 0, 0, 0, 2, 0, 0, 0, 3])  # P=1 X=1 CC=1
+        csrc = b"\x00\x00\x00\x09"
+        extension = b"\xbe\xde\x00\x01" + b"\x10\xff\x00\x00"
+        raw = header + csrc + extension + b"data" + b"\x00\x00\x03"
+
+        view = RTPPacketView.parse(raw)
+        assert view.header_size == 12 + 4 + 8
+        assert bytes(view.payload) == b"data"
+        assert bytes(view.payload) == RTPPacket.parse(raw).payload
+
+    def test_invalid_packets(self):
+        """Test that short and non-v2 datagrams are rejected."""
+        assert RTPPacketView.parse(b"\x80" * 11) is None
+        assert RTPPacketView.parse(b"\x40" + b"\x00" * 11) is None
+
+
+class TestRTPPacketWriter:
+    """Tests for the preallocated send-path packet buffer."""
+
+    def test_roundtrip(self):
+        """Test that written packets parse back to the same fields."""
+        writer = RTPPacketWriter(ssrc=0x12345678, payload_type=111)
+        raw = bytes(writer.write(b"frame", 70000, 2**32 + 5, marker=True))
+
+        packet = RTPPacket.parse(raw)
+        assert raw == RTPPacket(
+            marker=True, sequence_number=70000 & 0xFFFF, timestamp=5,
+            ssrc=0x12345678, payload=b"frame",
+        ).to_bytes()
+        assert packet.sequence_number == 70000 & 0xFFFF
+        assert packet.timestamp == 5
+        assert packet.payload == b"frame"
+
+    def test_buffer_reused_and_grows(self):
+        """Test that shorter packets reuse the buffer and larger ones fit."""
+        writer = RTPPacketWriter(ssrc=1, max_payload=4)
+        assert len(writer.write(b"abcd", 1, 0)) == 16
+        assert bytes(writer.write(b"xy", 2, 0))[12:] == b"xy"
+
+        big = bytes(range(200))
+        assert RTPPacket.parse(bytes(writer.write(big, 3, 0))).payload == big
+
+
 class TestAudioFormat:
     """Tests for audio format configuration."""
 
@@ -129,3 +207,77 @@ class TestBridgeStats:
         assert result["state"] == "active"
         assert result["rtp"]["packets_received"] == 100
         assert result["rtp"]["packets_sent"] == 50
+
+
+class TestLatencyStats:
+    """Tests for rolling latency samples."""
+
+    def test_summary(self):
+        """Test count, average and percentiles."""
+        stats = LatencyStats()
+        for ms in range(1, 101):
+            stats.add(float(ms))
+
+        d = stats.to_dict()
+        assert d["count"] == 100
+        assert d["last_ms"] == 100.0
+        assert d["avg_ms"] == 50.5
+        assert d["p50_ms"] == 50.0
+        assert d["p95_ms"] == 95.0
+
+    def test_window_bounds_percentiles(self):
+        """Test that percentiles only cover the recent window."""
+        stats = LatencyStats(window=3)
+        for ms in (1000.0, 10.0, 20.0, 30.0):
+            stats.add(ms)
+
+        assert stats.percentile(95) == 30.0
+        assert stats.count == 4
+
+    def test_empty(self):
+        """Test an unused tracker."""
+        assert LatencyStats().to_dict()["p95_ms"] == 0.0
+
+
+class TestTokenUsage:
+    """Tests for approximate Gemini token accounting."""
+
+    def test_rates(self):
+        """Test per-modality token estimates."""
+        usage = TokenUsage()
+        usage.add_audio_in(10.0)   # 320 tokens
+        usage.add_image()          # 258 tokens
+        usage.add_text_in("x" * 40)  # 10 tokens
+        usage.add_audio_out(5.0)   # 160 tokens
+
+        assert usage.tokens_sent == 588
+        assert usage.tokens_received == 160
+        assert usage.context_tokens == 748
+
+    def test_sliding_window(self):
+        """Test that the context estimate stays bounded on a long call."""
+        usage = TokenUsage(trigger_tokens=32000, target_tokens=16000)
+        for _ in range(3600):  # One hour at 1 fps screenshots + speech
+            usage.add_image()
+            usage.add_audio_in(1.0)
+
+        assert usage.context_tokens <= 32000
+        assert usage.compressions > 0
+        assert usage.tokens_sent == 3600 * (258 + 32)
+
+    def test_fractional_chunks_accumulate(self):
+        """Test that short chunks are not truncated to whole tokens each."""
+        usage = TokenUsage()
+        for _ in range(100):
+            usage.add_audio_out(0.04)  # 1.28 tokens per 40ms chunk
+
+        assert usage.context_tokens == pytest.approx(128)
+        assert usage.to_dict()["context_tokens"] == 128
+
+    def test_no_compression(self):
+        """Test that without a trigger the context only grows."""
+        usage = TokenUsage()
+        for _ in range(1000):
+            usage.add_image()
+        assert usage.context_tokens == 258000
+        assert usage.to_dict()["compressions"] == 0
@@ -0,0 +1,127 @@
+"""
+Tests for VK-Agent RTP playout scheduler
+"""
+
+import asyncio
+import time
+
+import pytest
+from src.playout import PlayoutScheduler
+
+
+class FrameSink:
+    """Records (send time, frame, marker) for each sent frame."""
+
+    def __init__(self):
+        self.sent = []
+
+    def __call__(self, frame: bytes, marker: bool) -> bool:
+        self.sent.append((time.monotonic(), frame, marker))
+        return True
+
+
+async def _drain(scheduler: PlayoutScheduler, timeout: float = 2.0) -> None:
+    """Wait until the scheduler has sent every buffered frame."""
+    deadline = time.monotonic() + timeout
+    while scheduler.buffered_frames and time.monotonic() < deadline:
+        await asyncio.sleep(0.005)
+
+
+class TestPlayoutScheduler:
+    """Tests for monotonic-deadline playout."""
+
+    async def test_burst_is_paced_on_20ms_grid(self):
+        """Test that a burst of frames goes out at t0 + n*20ms without drift."""
+        sink = FrameSink()
+        scheduler = PlayoutScheduler(send=sink, frame_duration_ms=20)
+        task = asyncio.create_task(scheduler.run())
+
+        frames = [bytes([i]) for i in range(10)]
+        scheduler.enqueue(frames)
+        scheduler.end_of_turn()
+        await _drain(scheduler)
+        scheduler.stop()
+        await task
+
+        assert [f for _, f, _ in sink.sent] == frames
+        t0 = sink.sent[0][0]
+        # Absolute deadlines: frame 9 lands at ~180ms, not 9 * (20ms + overhead)
+        assert sink.sent[-1][0] - t0 == pytest.approx(0.180, abs=0.015)
+        assert scheduler.stats.frames_sent == 10
+        assert scheduler.stats.underruns == 0
+
+    async def test_marker_only_on_talkspurt_start(self):
+        """Test that the marker bit is set on the first frame only."""
+        sink = FrameSink()
+        scheduler = PlayoutScheduler(send=sink)
+        task = asyncio.create_task(scheduler.run())
+
+        scheduler.enqueue([b"a", b"b", b"c"])
+        scheduler.end_of_turn()
+        await _drain(scheduler)
+        scheduler.stop()
+        await task
+
+        assert [m for _, _, m in sink.sent] == [True, False, False]
+        assert scheduler.stats.talkspurts == 1
+
+    async def test_underrun_counted_when_turn_not_ended(self):
+        """Test that running dry mid-turn counts as an underrun."""
+        sink = FrameSink()
+        scheduler = PlayoutScheduler(send=sink)
+        task = asyncio.create_task(scheduler.run())
+
+        scheduler.enqueue([b"a"])
+        await asyncio.sleep(0.05)
+        scheduler.stop()
+        await task
+
+        assert scheduler.stats.underruns == 1
+
+    def test_bounded_buffer_drops_oldest(self):
+        """Test that the buffer bound drops the oldest frames."""
+        scheduler = PlayoutScheduler(send=FrameSink(), max_buffer_ms=60)
+        scheduler.enqueue([b"1", b"2", b"3", b"4", b"5"])
+
+        assert scheduler.buffered_frames == 3
+        assert scheduler.stats.frames_dropped == 2
+        assert list(scheduler._frames) == [b"3", b"4", b"5"]
+
+    def test_clear(self):
+        """Test that clear discards buffered frames."""
+        scheduler = PlayoutScheduler(send=FrameSink())
+        scheduler.enqueue([b"a", b"b"])
+
+        assert scheduler.clear() == 2
+        assert scheduler.buffered_frames == 0
+        assert not scheduler.is_playing
+
+    def test_stale_generation_rejected(self):
+        """Test that frames encoded before an interruption are not queued."""
+        scheduler = PlayoutScheduler(send=FrameSink())
+        generation = scheduler.generation
+        scheduler.enqueue([b"a"], generation)
+
+        scheduler.clear()  # Interruption while the next chunk was encoding
+
+        assert not scheduler.enqueue([b"b", b"c"], generation)
+        assert scheduler.buffered_frames == 0
+        assert scheduler.stats.frames_invalidated == 3
+        assert scheduler.enqueue([b"d"], scheduler.generation)
+
+    async def test_clear_silences_within_one_frame(self):
+        """Test that an interruption mid-talkspurt stops sends within 20ms."""
+        sink = FrameSink()
+        scheduler = PlayoutScheduler(send=sink, frame_duration_ms=20)
+        task = asyncio.create_task(scheduler.run())
+
+        scheduler.enqueue([bytes([i]) for i in range(50)])
+        await asyncio.sleep(0.1)
+        cleared_at = time.monotonic()
+        scheduler.clear()
+        await asyncio.sleep(0.1)
+        scheduler.stop()
+        await task
+
+        assert all(t <= cleared_at + 0.02 for t, _, _ in sink.sent)
+        assert scheduler.stats.invalidations == 1
@@ -0,0 +1,82 @@
+"""
+Tests for VK-Agent bounded stage queues
+"""
+
+import asyncio
+
+import pytest
+from src.queues import BoundedQueue, QueuePolicy
+
+
+class TestBoundedQueue:
+    """Tests for overflow policies and stats."""
+
+    def test_drop_oldest(self):
+        """Test that a full queue evicts its oldest item."""
+        queue = BoundedQueue("q", maxsize=3)
+        for i in range(5):
+            assert queue.put_nowait(i)
+
+        assert [queue.popleft() for _ in range(len(queue))] == [2, 3, 4]
+        stats = queue.get_stats()
+        assert stats["dropped"] == 2
+        assert stats["high_water"] == 3
+        assert stats["got"] == 3
+
+    def test_latest_wins(self):
+        """Test that the single-slot policy keeps only the newest item."""
+        queue = BoundedQueue("video", maxsize=10, policy=QueuePolicy.LATEST)
+        queue.put_nowait("frame1")
+        queue.put_nowait("frame2")
+
+        assert queue.maxsize == 1
+        assert len(queue) == 1
+        assert queue.popleft() == "frame2"
+        assert queue.stats.dropped == 1
+
+    def test_block_policy_rejects_nowait(self):
+        """Test that put_nowait on a full blocking queue is refused."""
+        queue = BoundedQueue("q", maxsize=1, policy=QueuePolicy.BLOCK)
+        assert queue.put_nowait("a")
+        assert not queue.put_nowait("b")
+        assert queue.popleft() == "a"
+
+    async def test_block_policy_waits_for_space(self):
+        """Test that put() blocks until the consumer makes room."""
+        queue = BoundedQueue("q", maxsize=1, policy=QueuePolicy.BLOCK)
+        await queue.put("a")
+        producer = asyncio.create_task(queue.put("b"))
+
+        await asyncio.sleep(0.02)
+        assert not producer.done()
+
+        assert queue.popleft() == "a"
+        await asyncio.wait_for(producer, 1.0)
+        assert queue.popleft() == "b"
+        assert queue.stats.blocked == 1
+        assert queue.stats.blocked_ms >= 15
+
+    async def test_clear_releases_blocked_producer(self):
+        """Test that clearing (interruption) unblocks a waiting put()."""
+        queue = BoundedQueue("q", maxsize=1, policy=QueuePolicy.BLOCK)
+        await queue.put("a")
+        producer = asyncio.create_task(queue.put("b"))
+        await asyncio.sleep(0)
+
+        assert queue.clear() == 1
+        await asyncio.wait_for(producer, 1.0)
+        assert list(queue._items) == ["b"]
+
+    async def test_get_wakes_consumer(self):
+        """Test that a waiting consumer wakes on put."""
+        queue = BoundedQueue("q")
+        consumer = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait("x")
+
+        assert await asyncio.wait_for(consumer, 1.0) == "x"
+
+    def test_popleft_empty(self):
+        """Test that popping an empty queue raises like deque."""
+        with pytest.raises(IndexError):
+            BoundedQueue("q").popleft()
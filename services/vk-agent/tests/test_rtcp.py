@@ -0,0 +1,240 @@
+"""
+Tests for VK-Agent RTCP
+"""
+
+from src.models import RTPPacket, RTPPacketView
+from src.rtcp import (
+    RTCP_PSFB,
+    RTCP_RR,
+    RTCP_RTPFB,
+    RTCP_SDES,
+    RTCP_SR,
+    ReportBlock,
+    RTCPSession,
+    SourceStats,
+    build_nack,
+    build_pli,
+    build_rr,
+    build_sr,
+    is_rtcp,
+    ntp_middle,
+    ntp_now,
+    parse_compound,
+)
+from src.rtp_handler import RTPReceiver
+
+JANUS = ("10.0.0.1", 40000)
+
+
+def _view(seq: int, ssrc: int = 0xAA, arrival: float = 0.0) -> RTPPacketView:
+    raw = RTPPacket(sequence_number=seq & 0xFFFF, timestamp=seq * 960, ssrc=ssrc, payload=b"x").to_bytes()
+    packet = RTPPacketView.parse(raw, received_ns=int(arrival * 1e9))
+    packet.source = JANUS
+    return packet
+
+
+class Wire:
+    """Captures datagrams sent by an RTCPSession."""
+
+    def __init__(self):
+        self.sent = []
+
+    def __call__(self, data: bytes, addr) -> bool:
+        self.sent.append((parse_compound(data), addr))
+        return True
+
+
+class TestPackets:
+    """Tests for RTCP serialization and parsing."""
+
+    def test_demux(self):
+        """Test that RTCP and Opus RTP are told apart on one port."""
+        assert is_rtcp(build_rr(1))
+        assert not is_rtcp(RTPPacket(payload_type=111, payload=b"x").to_bytes())
+        assert not is_rtcp(RTPPacket(marker=True, payload_type=111, payload=b"x").to_bytes())
+
+    def test_sr_roundtrip(self):
+        """Test sender report fields and report blocks."""
+        block = ReportBlock(ssrc=7, fraction_lost=64, cumulative_lost=-3, highest_seq=70000,
+                            jitter=120, lsr=0x12345678, dlsr=65536)
+        (packet,) = parse_compound(build_sr(42, (1, 2), 3, 4, 5, [block]))
+
+        assert packet.packet_type == RTCP_SR
+        assert packet.ssrc == 42
+        assert (packet.ntp_msw, packet.ntp_lsw, packet.rtp_timestamp) == (1, 2, 3)
+        assert (packet.packet_count, packet.octet_count) == (4, 5)
+        assert packet.report_blocks == [block]
+
+    def test_nack_bitmask(self):
+        """Test that nearby losses share a PID/BLP entry."""
+        (packet,) = parse_compound(build_nack(1, 0xAA, [100, 101, 103, 120]))
+
+        assert packet.packet_type == RTCP_RTPFB
+        assert packet.media_ssrc == 0xAA
+        assert packet.nack_seqs == [100, 101, 103, 120]
+        # Two FCI entries: header(4) + ssrcs(8) + 2 * 4
+        assert len(build_nack(1, 0xAA, [100, 101, 103, 120])) == 20
+
+    def test_pli(self):
+        """Test picture loss indication."""
+        (packet,) = parse_compound(build_pli(1, 0xBB))
+        assert (packet.packet_type, packet.count, packet.media_ssrc) == (RTCP_PSFB, 1, 0xBB)
+
+
+class TestSourceStats:
+    """Tests for RFC 3550 reception statistics."""
+
+    def test_loss_and_fraction(self):
+        """Test cumulative loss and per-interval fraction lost."""
+        source = SourceStats(0xAA, 48000)
+        for seq in [0, 1, 2, 5, 6, 7, 8, 9]:
+            source.update(seq, seq * 960, seq * 0.02)
+
+        block = source.report_block(now=1.0)
+        assert source.expected == 10
+        assert block.cumulative_lost == 2
+        assert block.fraction_lost == (2 << 8) // 10
+        # Next interval without loss
+        source.update(10, 10 * 960, 0.2)
+        assert source.report_block(now=2.0).fraction_lost == 0
+
+    def test_sequence_wrap(self):
+        """Test the extended highest sequence across a wrap."""
+        source = SourceStats(0xAA, 48000)
+        for seq in (65534, 65535, 0, 1):
+            source.update(seq, 0, 0.0)
+        assert source.extended_max == 65536 + 1
+        assert source.lost == 0
+
+    def test_paced_stream_has_no_jitter(self):
+        """Test that packets arriving exactly on their timestamps add no jitter."""
+        source = SourceStats(0xAA, 48000)
+        for seq in range(50):
+            source.update(seq, seq * 960, seq * 0.02)
+        assert source.jitter < 1e-6
+
+    def test_gap_reports_missing(self):
+        """Test that a small forward gap returns the skipped numbers."""
+        source = SourceStats(0xAA, 48000)
+        source.update(10, 0, 0.0, max_gap=16)
+        assert source.update(13, 0, 0.0, max_gap=16) == [11, 12]
+        assert source.update(100, 0, 0.0, max_gap=16) == []  # Outage, not NACKed
+
+
+class TestRTCPSession:
+    """Tests for report exchange, feedback and RTT."""
+
+    def test_nack_on_gap(self):
+        """Test that a sequence gap is NACKed to the stream's source."""
+        wire = Wire()
+        rtcp = RTCPSession(ssrc=1, clock_rate=48000, send=wire)
+        rtcp.on_rtp(_view(1))
+        rtcp.on_rtp(_view(4))
+
+        (packets, addr), = wire.sent
+        assert addr == JANUS
+        assert packets[0].nack_seqs == [2, 3]
+        assert rtcp.get_stats()["nacked_packets"] == 2
+
+    def test_nack_disabled(self):
+        """Test that a leg without NACK (audio) still tracks loss silently."""
+        wire = Wire()
+        rtcp = RTCPSession(ssrc=1, clock_rate=48000, send=wire, nack=False)
+        rtcp.on_rtp(_view(1))
+        rtcp.on_rtp(_view(4))
+
+        assert wire.sent == []
+        assert rtcp.get_stats()["nacks_sent"] == 0
+
+    def test_receiver_report_with_lsr(self):
+        """Test that RRs go to the source and echo its last SR."""
+        wire = Wire()
+        rtcp = RTCPSession(ssrc=1, clock_rate=48000, send=wire)
+        rtcp.on_rtp(_view(1))
+        rtcp.sources[0xAA].last_heard = float("inf")  # Keep the source alive
+        sr = build_sr(0xAA, (0x00011234, 0x56780000), 0, 10, 100)
+        rtcp.handle(sr, ("10.0.0.1", 40001))
+
+        assert rtcp.send_reports() == 1
+        packets, addr = wire.sent[-1]
+        assert addr == ("10.0.0.1", 40001)  # RTCP address preferred once known
+        assert [p.packet_type for p in packets] == [RTCP_RR, RTCP_SDES]
+        (block,) = packets[0].report_blocks
+        assert block.ssrc == 0xAA
+        assert block.lsr == 0x12345678
+
+    def test_sender_report_and_rtt(self):
+        """Test SR while sending and RTT from the peer's report block."""
+        wire = Wire()
+        rtcp = RTCPSession(ssrc=1, clock_rate=48000, send=wire)
+        rtcp.peer = JANUS
+        rtcp.on_rtp_sent(80, 960)
+        rtcp.send_reports()
+
+        packets, addr = wire.sent[-1]
+        assert addr == JANUS
+        assert packets[0].packet_type == RTCP_SR
+        assert packets[0].packet_count == 1
+        assert packets[0].octet_count == 80
+
+        # Peer echoes our SR 50ms ago and held it for 20ms -> RTT ~30ms
+        lsr = (ntp_middle(*ntp_now()) - int(0.05 * 65536)) & 0xFFFFFFFF
+        block = ReportBlock(ssrc=1, fraction_lost=26, lsr=lsr, dlsr=int(0.02 * 65536))
+        rtcp.handle(build_rr(0xCC, [block]), JANUS)
+
+        assert 25 < rtcp.rtt_ms < 40
+        assert rtcp.get_stats()["remote"][hex(0xCC)]["fraction_lost"] == round(26 / 256, 3)
+
+    def test_feedback_callbacks(self):
+        """Test NACK and PLI addressed to our SSRC reach the callbacks."""
+        rtcp = RTCPSession(ssrc=1, clock_rate=90000, send=Wire())
+        nacks, plis = [], []
+        rtcp.on_nack = lambda ssrc, seqs: nacks.append(seqs)
+        rtcp.on_pli = plis.append
+        rtcp.handle(build_nack(9, 1, [5, 6]) + build_pli(9, 1) + build_pli(9, 2), JANUS)
+
+        assert nacks == [[5, 6]]
+        assert plis == [9]
+
+    def test_pli_rate_limited(self):
+        """Test that repeated keyframe requests send one PLI."""
+        wire = Wire()
+        rtcp = RTCPSession(ssrc=1, clock_rate=90000, send=wire)
+        assert not rtcp.request_keyframe()  # No source yet
+        rtcp.on_rtp(_view(1, ssrc=0xBB))
+
+        assert rtcp.request_keyframe()
+        assert rtcp.request_keyframe()
+        assert len(wire.sent) == 1
+        assert wire.sent[0][0][0].media_ssrc == 0xBB
+
+
+class TestReceiverDemux:
+    """Tests for RTCP demultiplexing on the RTP socket."""
+
+    def test_rtcp_not_delivered_as_rtp(self):
+        """Test that RTCP goes to the session and RTP to the callback."""
+        delivered = []
+        receiver = RTPReceiver(on_packet=delivered.append, ignore_source_port=JANUS[1])
+        receiver.rtcp = RTCPSession(ssrc=1, clock_rate=48000, send=Wire())
+
+        receiver._handle_datagram(build_rr(0xCC, [ReportBlock(ssrc=1)]), JANUS)
+        receiver._handle_datagram(RTPPacket(ssrc=0xAA, payload=b"x").to_bytes(), ("10.0.0.2", 1))
+
+        assert receiver.rtcp.get_stats()["reports_received"] == 1
+        assert len(delivered) == 1
+        assert 0xAA in receiver.rtcp.sources
+
+    def test_loss_tracked_per_ssrc(self):
+        """Test that interleaved publishers on one port do not count as loss."""
+        receiver = RTPReceiver(on_packet=lambda packet: None, ignore_source_port=JANUS[1])
+
+        for seq in range(5):
+            for ssrc, base in ((0xAA, 100), (0xBB, 40000)):
+                raw = RTPPacket(ssrc=ssrc, sequence_number=base + seq, payload=b"x").to_bytes()
+                receiver._handle_datagram(raw, ("10.0.0.2", 1))
+        assert receiver.stats.packets_lost == 0
+
+        raw = RTPPacket(ssrc=0xAA, sequence_number=107, payload=b"x").to_bytes()
+        receiver._handle_datagram(raw, ("10.0.0.2", 1))
+        assert receiver.stats.packets_lost == 2
@@ -3,10 +3,25 @@ Tests for VK-Agent RTP handler
 """
 
 import pytest
-from src.rtp_handler import RTPJitterBuffer
+from src.rtp_handler import RTPJitterBuffer, RTPStreamDemuxer, seq_diff
 from src.models import RTPPacket
 
 
+def _packet(seq: int, marker: bool = False, ssrc: int = 0) -> RTPPacket:
+    """20ms Opus packet with a 48kHz timestamp matching its sequence."""
+    return RTPPacket(
+        sequence_number=seq & 0xFFFF,
+        timestamp=(seq * 960) & 0xFFFFFFFF,
+        ssrc=ssrc,
+        marker=marker,
+        payload=b"data",
+    )
+
+
+# Far enough in the future that every deadline has passed
+LATER = 1e9
+
+
 class TestRTPJitterBuffer:
     """Tests for RTP jitter buffer."""
 
@@ -16,13 +31,12 @@ class TestRTPJitterBuffer:
 
         # Add packets in order
         for seq in range(1, 6):
-            packet = RTPPacket(sequence_number=seq, payload=b"data")
-            buffer.put(packet)
+            buffer.put(_packet(seq), arrival=0.0)
 
         # Get packets
         results = []
         for _ in range(5):
-            p = buffer.get()
+            p = buffer.get(now=LATER)
             if p:
                 results.append(p.sequence_number)
 
@@ -34,13 +48,12 @@ class TestRTPJitterBuffer:
 
         # Add packets out of order
         for seq in [3, 1, 5, 2, 4]:
-            packet = RTPPacket(sequence_number=seq, payload=b"data")
-            buffer.put(packet)
+            buffer.put(_packet(seq), arrival=0.0)
 
         # Get packets (should be in order)
         results = []
         for _ in range(10):  # Try more than we added
-            p = buffer.get()
+            p = buffer.get(now=LATER)
             if p:
                 results.append(p.sequence_number)
 
@@ -48,28 +61,17 @@ class TestRTPJitterBuffer:
         assert results == [1, 2, 3, 4, 5]
 
     def test_lost_packet_handling(self):
-        """Test that lost packets are skipped after threshold."""
-        buffer = RTPJitterBuffer(skip_threshold=3)
+        """Test that lost packets are skipped once a later packet is due."""
+        buffer = RTPJitterBuffer()
 
         # Add packets with gap (seq 2-4 missing)
-        buffer.put(RTPPacket(sequence_number=1, payload=b"data"))
-        buffer.put(RTPPacket(sequence_number=5, payload=b"data"))
-        buffer.put(RTPPacket(sequence_number=6, payload=b"data"))
+        buffer.put(_packet(1), arrival=0.0)
+        buffer.put(_packet(5), arrival=0.08)
+        buffer.put(_packet(6), arrival=0.1)
 
-        # Get first packet
-        p1 = buffer.get()
-        assert p1 is not None
-        assert p1.sequence_number == 1
-
-        # Next get should skip to 5 (after looking ahead)
-        p5 = buffer.get()
-        assert p5 is not None
-        assert p5.sequence_number == 5
-
-        # Next should be 6
-        p6 = buffer.get()
-        assert p6 is not None
-        assert p6.sequence_number == 6
+        ready = buffer.pop_ready(now=LATER)
+        assert [p.sequence_number for p in ready] == [1, 5, 6]
+        assert buffer.get_stats()["packets_lost"] == 3
 
     def test_clear(self):
         """Test buffer clearing."""
@@ -77,7 +79,7 @@ class TestRTPJitterBuffer:
 
         # Add some packets
         for seq in range(1, 6):
-            buffer.put(RTPPacket(sequence_number=seq, payload=b"data"))
+            buffer.put(_packet(seq))
 
         assert buffer.size == 5
 
@@ -85,7 +87,7 @@ class TestRTPJitterBuffer:
         buffer.clear()
 
         assert buffer.size == 0
-        assert buffer.get() is None
+        assert buffer.get(now=LATER) is None
 
     def test_stats(self):
         """Test statistics tracking."""
@@ -93,12 +95,108 @@ class TestRTPJitterBuffer:
 
         # Add and get packets
         for seq in range(1, 6):
-            buffer.put(RTPPacket(sequence_number=seq, payload=b"data"))
+            buffer.put(_packet(seq))
 
-        for _ in range(5):
-            buffer.get()
+        buffer.pop_ready(now=LATER)
 
         stats = buffer.get_stats()
         assert stats["packets_in"] == 5
         assert stats["packets_out"] == 5
         assert stats["current_size"] == 0
+
+    def test_released_on_deadline_not_arrival(self):
+        """Test that packets wait for the playout delay."""
+        buffer = RTPJitterBuffer(min_delay_ms=40, max_delay_ms=40)
+        buffer.put(_packet(1), arrival=10.0)
+
+        assert buffer.get(now=10.0) is None
+        assert buffer.next_deadline() == pytest.approx(10.04)
+        assert buffer.get(now=10.041).sequence_number == 1
+
+    def test_sequence_wraparound(self):
+        """Test ordering across the 65535 -> 0 wrap."""
+        buffer = RTPJitterBuffer()
+        for seq in [65534, 0, 65535, 1]:
+            buffer.put(_packet(seq), arrival=0.0)
+
+        ready = buffer.pop_ready(now=LATER)
+        assert [p.sequence_number for p in ready] == [65534, 65535, 0, 1]
+        assert seq_diff(0, 65535) == 1
+
+    def test_late_and_duplicate_packets(self):
+        """Test that played-out and duplicate packets are not released."""
+        buffer = RTPJitterBuffer()
+        buffer.put(_packet(1), arrival=0.0)
+        buffer.put(_packet(2), arrival=0.02)
+        buffer.pop_ready(now=LATER)
+
+        buffer.put(_packet(1), arrival=0.5)  # Late: already played
+        buffer.put(_packet(3), arrival=0.5)
+        buffer.put(_packet(3), arrival=0.5)  # Duplicate
+
+        stats = buffer.get_stats()
+        assert stats["packets_late"] == 1
+        assert stats["packets_discarded"] == 1
+        assert [p.sequence_number for p in buffer.pop_ready(now=LATER)] == [3]
+
+    def test_delay_adapts_to_jitter(self):
+        """Test that the RFC 3550 jitter estimate raises the playout delay."""
+        steady = RTPJitterBuffer(min_delay_ms=20, max_delay_ms=200)
+        jittery = RTPJitterBuffer(min_delay_ms=20, max_delay_ms=200)
+
+        for seq in range(100):
+            steady.put(_packet(seq), arrival=seq * 0.02)
+            # +/-15ms alternating arrival jitter
+            jittery.put(_packet(seq), arrival=seq * 0.02 + (0.015 if seq % 2 else 0.0))
+
+        assert steady.jitter_ms == pytest.approx(0.0, abs=1e-6)
+        assert steady.target_delay_ms == 20
+        assert jittery.jitter_ms == pytest.approx(15.0, rel=0.05)
+        assert jittery.target_delay_ms > 40
+
+    def test_resync_on_large_jump(self):
+        """Test that a jump beyond the ring restarts the sequence."""
+        buffer = RTPJitterBuffer(capacity=16)
+        buffer.put(_packet(1), arrival=0.0)
+        buffer.put(_packet(1000), arrival=0.02)
+
+        assert buffer.get_stats()["resyncs"] == 1
+        assert [p.sequence_number for p in buffer.pop_ready(now=LATER)] == [1000]
+
+
+class TestRTPStreamDemuxer:
+    """Tests for per-SSRC jitter buffering."""
+
+    def test_interleaved_publishers_stay_ordered(self):
+        """Test that two SSRCs with overlapping sequence numbers do not mix."""
+        demux = RTPStreamDemuxer(RTPJitterBuffer)
+        for seq in (10, 11, 12):
+            demux.put(_packet(seq, ssrc=1), arrival=0.0)
+            demux.put(_packet(500 + seq, ssrc=2), arrival=0.0)
+
+        ready = demux.pop_ready(now=LATER)
+        by_ssrc = {1: [], 2: []}
+        for ssrc, packet, lost in ready:
+            by_ssrc[ssrc].append(packet.sequence_number)
+            assert lost == 0
+
+        assert by_ssrc == {1: [10, 11, 12], 2: [510, 511, 512]}
+
+    def test_lost_count_per_stream(self):
+        """Test that sequence gaps are reported per SSRC."""
+        demux = RTPStreamDemuxer(RTPJitterBuffer)
+        demux.put(_packet(1, ssrc=7), arrival=0.0)
+        demux.put(_packet(4, ssrc=7), arrival=0.06)
+
+        ready = demux.pop_ready(now=LATER)
+        assert [(p.sequence_number, lost) for _, p, lost in ready] == [(1, 0), (4, 2)]
+
+    def test_idle_streams_are_reaped(self):
+        """Test that silent publishers are removed after the timeout."""
+        demux = RTPStreamDemuxer(RTPJitterBuffer, idle_timeout=1.0)
+        demux.put(_packet(1, ssrc=1), arrival=0.0)
+        demux.put(_packet(1, ssrc=2), arrival=5.0)
+        demux.pop_ready(now=LATER)
+
+        assert demux.reap_idle(now=5.5) == [1]
+        assert demux.ssrcs == [2]
@@ -0,0 +1,105 @@
+"""
+Tests for VK-Agent session manager
+"""
+
+import asyncio
+
+import pytest
+from src.bridge import AgentBridge
+from src.config import JanusConfig, Settings
+from src.session_manager import (
+    PORTS_PER_ROOM,
+    PortPoolExhaustedError,
+    RoomNotFoundError,
+    RTPPortPool,
+    SessionManager,
+)
+
+
+class TestRTPPortPool:
+    """Tests for RTP port block allocation."""
+
+    def test_first_block_matches_single_room_defaults(self):
+        """Test that the first block starts at the base port."""
+        pool = RTPPortPool(base_port=5004, max_rooms=4)
+        assert pool.allocate() == 5004
+        assert pool.allocate() == 5004 + PORTS_PER_ROOM
+
+    def test_exhaustion(self):
+        """Test that allocation fails once every block is in use."""
+        pool = RTPPortPool(base_port=6000, max_rooms=2)
+        pool.allocate()
+        pool.allocate()
+
+        with pytest.raises(PortPoolExhaustedError):
+            pool.allocate()
+
+    def test_release_reuses_lowest_block(self):
+        """Test that released blocks are handed out again."""
+        pool = RTPPortPool(base_port=6000, max_rooms=3)
+        first = pool.allocate()
+        pool.allocate()
+        pool.release(first)
+
+        assert pool.available == 2
+        assert pool.allocate() == first
+
+    def test_release_unknown_port_is_ignored(self):
+        """Test that releasing a non-allocated port is a no-op."""
+        pool = RTPPortPool(base_port=6000, max_rooms=1)
+        pool.release(1234)
+        assert pool.available == 1
+
+
+class TestSessionManager:
+    """Tests for per-room bridge management."""
+
+    def test_room_settings_override_room_and_ports(self):
+        """Test that per-room settings get their own room and port block."""
+        manager = SessionManager(Settings())
+        room = manager._room_settings(4242, 5008, display_name="Agent")
+
+        assert room.janus.room_id == 4242
+        assert room.janus.rtp_port == 5008
+        assert room.janus.video_rtp_port == 5010
+        assert room.janus.display_name == "Agent"
+        # Base settings are untouched
+        assert room.janus is not manager.settings.janus
+        assert manager.settings.janus.room_id != 4242
+
+    async def test_delete_unknown_room(self):
+        """Test that deleting a missing room raises."""
+        manager = SessionManager(Settings())
+        with pytest.raises(RoomNotFoundError):
+            await manager.delete_room(1)
+
+    async def test_failed_start_releases_reservation(self):
+        """Test that a room whose bridge cannot start frees its slot and ports."""
+        settings = Settings(janus=JanusConfig(websocket_url="ws://127.0.0.1:9/janus"))
+        manager = SessionManager(settings)
+        manager.start()
+
+        for _ in range(2):  # The reservation does not outlive the failure
+            with pytest.raises(RuntimeError):
+                await manager.create_room(4242)
+        assert manager.port_pool.in_use == 0
+        await manager.stop_all()
+
+    async def test_bridge_that_stops_itself_is_reaped(self):
+        """Test that a bridge stopping without delete_room releases its room."""
+        manager = SessionManager(Settings())
+        port = manager.port_pool.allocate()
+        bridge = AgentBridge(manager._room_settings(4242, port))
+        bridge._running = True
+        manager._register(4242, bridge, port)
+        await asyncio.sleep(0)
+
+        await bridge.stop()  # e.g. a fatal Janus/Gemini error
+        for _ in range(100):
+            if manager.port_pool.in_use == 0:
+                break
+            await asyncio.sleep(0.01)
+
+        assert manager.get_bridge(4242) is None
+        assert manager.port_pool.in_use == 0
+        await manager.stop_all()
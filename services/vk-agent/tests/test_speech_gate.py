@@ -0,0 +1,188 @@
+"""
+Tests for VK-Agent cascaded speech gate
+"""
+
+import numpy as np
+from src.speech_gate import BargeInDetector, SpeechGate, SpeechSegmenter
+from src.vad import VoiceActivityDetector
+
+
+class CountingVAD:
+    """Fixed-probability detector that counts how often it runs."""
+
+    threshold = 0.5
+
+    def __init__(self, prob: float = 0.9):
+        self.prob = prob
+        self.calls = 0
+
+    def get_speech_probability(self, audio_data: bytes) -> float:
+        self.calls += 1
+        return self.prob
+
+
+def _chunk(rms: float) -> bytes:
+    """100ms PCM16 square wave with the given RMS."""
+    samples = np.full(1600, rms, dtype=np.float32)
+    samples[::2] *= -1
+    return samples.astype(np.int16).tobytes()
+
+
+class TestSpeechGate:
+    """Tests for the Janus -> energy -> Silero cascade."""
+
+    def test_janus_silence_skips_everything(self):
+        """Test that nobody talking per Janus rejects before RMS or VAD."""
+        vad = CountingVAD()
+        gate = SpeechGate(vad, talking=lambda: False)
+
+        assert gate.speech_probability(_chunk(2000)) == 0.0
+        assert gate.last_stage == "janus"
+        assert vad.calls == 0
+
+    def test_unknown_janus_state_falls_through(self):
+        """Test that no talking events yet (None) does not gate audio."""
+        vad = CountingVAD()
+        gate = SpeechGate(vad, talking=lambda: None)
+
+        assert gate.speech_probability(_chunk(2000)) == 0.9
+        assert gate.last_stage == "vad"
+
+    def test_energy_floor_skips_vad(self):
+        """Test that quiet chunks never reach the model."""
+        vad = CountingVAD()
+        gate = SpeechGate(vad, talking=lambda: True, min_rms=40)
+
+        assert gate.speech_probability(_chunk(10)) == 0.0
+        assert gate.speech_probability(b"") == 0.0
+        assert gate.last_stage == "energy"
+        assert vad.calls == 0
+
+        assert gate.speech_probability(_chunk(500)) == 0.9
+        assert vad.calls == 1
+
+    def test_noise_floor_adapts(self):
+        """Test that steady background noise raises the energy threshold."""
+        vad = CountingVAD(prob=0.1)  # Model calls the noise non-speech
+        gate = SpeechGate(vad, min_rms=40, noise_margin=2.0, noise_rise=0.2)
+
+        for _ in range(50):
+            gate.speech_probability(_chunk(100))
+
+        assert gate.energy_threshold > 150
+        calls = vad.calls
+        gate.speech_probability(_chunk(100))
+        assert vad.calls == calls  # Now rejected by the energy stage
+
+    def test_stats(self):
+        """Test per-stage rates."""
+        talking = [False]
+        gate = SpeechGate(CountingVAD(), talking=lambda: talking[0])
+
+        gate.speech_probability(_chunk(1000))
+        talking[0] = True
+        gate.speech_probability(_chunk(0))
+        gate.speech_probability(_chunk(1000))
+        gate.speech_probability(_chunk(1000))
+
+        stats = gate.get_stats()
+        assert stats["chunks"] == 4
+        assert stats["janus_rejected"] == 1
+        assert stats["energy_rejected"] == 1
+        assert stats["vad_runs"] == 2
+        assert stats["vad_run_rate"] == 0.5
+
+
+class ScriptedVAD(VoiceActivityDetector):
+    """Real hysteresis driven by a scripted probability per chunk."""
+
+    def __init__(self, probs, **kwargs):
+        super().__init__(backend="onnx", model_path="/nonexistent/model.onnx", **kwargs)
+        self.probs = list(probs)
+
+    def get_speech_probability(self, audio_data: bytes) -> float:
+        return self.probs.pop(0)
+
+
+def _numbered(i: int) -> bytes:
+    """100ms chunk whose samples all equal 1000 + i (loud, identifiable)."""
+    return np.full(1600, 1000 + i, dtype=np.int16).tobytes()
+
+
+class TestSpeechSegmenter:
+    """Tests for pre-roll and hangover around the VAD hysteresis."""
+
+    def _segmenter(self, probs, preroll_ms=200, hangover_ms=200):
+        vad = ScriptedVAD(
+            probs, min_speech_duration_ms=100, min_silence_duration_ms=hangover_ms
+        )
+        return SpeechSegmenter(SpeechGate(vad), preroll_ms=preroll_ms)
+
+    def test_preroll_flushed_at_onset(self):
+        """Test that the chunks before onset are sent ahead of it."""
+        segmenter = self._segmenter([0.1, 0.1, 0.1, 0.9])
+        sent = [segmenter.process(_numbered(i)) for i in range(4)]
+
+        assert sent[:3] == [b"", b"", b""]
+        # Pre-roll holds the last 200ms (chunks 1 and 2), then the onset chunk
+        assert sent[3] == _numbered(1) + _numbered(2) + _numbered(3)
+        assert segmenter.get_stats()["preroll_ms_sent"] == 200
+
+    def test_hangover_keeps_sending_after_speech(self):
+        """Test that sub-threshold chunks are sent until the hangover elapses."""
+        segmenter = self._segmenter([0.9, 0.1, 0.1, 0.1], hangover_ms=200)
+        sent = [segmenter.process(_numbered(i)) for i in range(4)]
+
+        assert sent[1] == _numbered(1)  # 100ms of silence: still open
+        assert sent[2] == b""  # 200ms: segment closed
+        assert sent[3] == b""
+        assert segmenter.get_stats()["hangover_chunks"] == 1
+
+    def test_transition_callbacks(self):
+        """Test speech start/end callbacks fire once per segment."""
+        events = []
+        segmenter = self._segmenter([0.9, 0.9, 0.1, 0.1, 0.9])
+        segmenter.on_speech_start = lambda: events.append("start")
+        segmenter.on_speech_end = lambda: events.append("end")
+
+        for i in range(5):
+            segmenter.process(_numbered(i))
+
+        assert events == ["start", "end", "start"]
+        assert segmenter.get_stats()["segments"] == 2
+
+    def test_clear_drops_preroll(self):
+        """Test that clear() empties the ring and closes the segment."""
+        segmenter = self._segmenter([0.1, 0.9])
+        segmenter.process(_numbered(0))
+        segmenter.clear()
+
+        assert segmenter.process(_numbered(1)) == _numbered(1)
+
+
+class TestBargeInDetector:
+    """Tests for holding user speech during agent playback."""
+
+    def test_sustained_speech_triggers(self):
+        """Test that held audio is released once speech is sustained."""
+        barge_in = BargeInDetector(min_speech_ms=300)
+
+        assert not barge_in.hold(b"pre" + b"a", True, 100.0)
+        assert not barge_in.hold(b"b", False, 100.0)  # Pause inside segment
+        assert not barge_in.hold(b"c", True, 100.0)
+        assert barge_in.onset_at is not None
+        assert barge_in.hold(b"d", True, 100.0)
+
+        assert barge_in.release() == b"preabcd"
+        assert not barge_in.pending
+        assert barge_in.get_stats()["triggered"] == 1
+
+    def test_short_segment_discarded(self):
+        """Test that a segment closing before the threshold is dropped."""
+        barge_in = BargeInDetector(min_speech_ms=300)
+        barge_in.hold(b"cough", True, 100.0)
+
+        assert not barge_in.hold(b"", False, 100.0)  # Segment closed
+        assert not barge_in.pending
+        assert barge_in.onset_at is None
+        assert barge_in.get_stats()["discarded"] == 1
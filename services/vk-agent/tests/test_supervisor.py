@@ -0,0 +1,231 @@
+"""
+Tests for VK-Agent multi-process supervisor
+"""
+
+import pytest
+from src.config import Settings
+from src.session_manager import (
+    PORTS_PER_ROOM,
+    PortPoolExhaustedError,
+    RoomExistsError,
+    RoomNotFoundError,
+)
+from src.supervisor import HAS_AIOHTTP, Supervisor, WORKER_HOST, aiohttp, worker_settings
+
+
+class AliveProcess:
+    """Stands in for a running worker process."""
+    pid = 1
+    exitcode = None
+
+    def __init__(self, alive: bool = True):
+        self._alive = alive
+
+    def is_alive(self) -> bool:
+        return self._alive
+
+
+class RoutingSupervisor(Supervisor):
+    """Supervisor whose workers answer from an in-memory room table."""
+
+    def __init__(self, settings: Settings, create_status: int = 201, delete_status: int = 200):
+        super().__init__(settings)
+        self.create_status = create_status
+        self.delete_status = delete_status
+        self.requests = []
+        for worker in self.workers:
+            worker.process = AliveProcess()
+
+    async def forward(self, worker, method, path, payload=None):
+        self.requests.append((worker.index, method, path))
+        if method == "POST" and path == "/rooms":
+            if self.create_status != 201:
+                return self.create_status, {"detail": "Janus unreachable"}
+            return 201, {"success": True, "room_id": payload["room_id"]}
+        if method == "DELETE":
+            return self.delete_status, {"success": self.delete_status == 200}
+        return 200, {}
+
+
+def _settings(workers: int = 3, max_rooms: int = 2) -> Settings:
+    settings = Settings()
+    settings.workers = workers
+    settings.max_rooms = max_rooms
+    return settings
+
+
+class TestWorkerSettings:
+    """Tests for per-worker port partitioning."""
+
+    def test_port_ranges_do_not_overlap(self):
+        """Test that each worker gets its own API port and RTP block."""
+        settings = _settings(workers=4, max_rooms=8)
+        workers = [worker_settings(settings, i) for i in range(4)]
+
+        assert [w.api_port for w in workers] == [settings.api_port + 1 + i for i in range(4)]
+        span = settings.max_rooms * PORTS_PER_ROOM
+        for i, w in enumerate(workers):
+            assert w.janus.rtp_port == settings.janus.rtp_port + i * span
+            assert w.api_host == WORKER_HOST
+            assert w.workers == 1
+        # Base settings are not modified
+        assert settings.workers == 4
+
+    def test_validate_checks_total_port_range(self):
+        """Test that the RTP range of all workers must fit below 65535."""
+        settings = _settings(workers=64, max_rooms=512)
+        assert any("RTP port range" in e for e in settings.validate())
+
+
+class TestSupervisor:
+    """Tests for room placement and routing."""
+
+    def test_pick_least_loaded(self):
+        """Test that the worker with the fewest rooms is chosen."""
+        supervisor = RoutingSupervisor(_settings())
+        supervisor.workers[0].rooms = {1, 2}
+        supervisor.workers[1].rooms = {3}
+
+        assert supervisor.pick_worker().index == 2
+
+    def test_pick_breaks_ties_by_loop_lag(self):
+        """Test that equal room counts prefer the less lagged worker."""
+        supervisor = RoutingSupervisor(_settings())
+        supervisor.workers[0].lag_p95_ms = 40.0
+        supervisor.workers[1].lag_p95_ms = 2.0
+        supervisor.workers[2].lag_p95_ms = 10.0
+
+        assert supervisor.pick_worker().index == 1
+
+    def test_pick_skips_dead_and_full_workers(self):
+        """Test that dead or full workers receive no rooms."""
+        supervisor = RoutingSupervisor(_settings(max_rooms=1))
+        supervisor.workers[0].process = AliveProcess(alive=False)
+        supervisor.workers[1].rooms = {7}
+
+        assert supervisor.pick_worker().index == 2
+        supervisor.workers[2].rooms = {8}
+        assert supervisor.pick_worker() is None
+
+    async def test_create_spreads_rooms(self):
+        """Test that consecutive rooms land on different workers."""
+        supervisor = RoutingSupervisor(_settings())
+        for room_id in (10, 11, 12):
+            status, _ = await supervisor.create_room(room_id)
+            assert status == 201
+
+        assert sorted(supervisor.owner(r).index for r in (10, 11, 12)) == [0, 1, 2]
+        assert supervisor.get_stats()["rooms"] == 3
+
+    async def test_create_duplicate_and_full(self):
+        """Test duplicate rooms and exhausted capacity."""
+        supervisor = RoutingSupervisor(_settings(workers=1, max_rooms=1))
+        await supervisor.create_room(10)
+
+        with pytest.raises(RoomExistsError):
+            await supervisor.create_room(10)
+        with pytest.raises(PortPoolExhaustedError):
+            await supervisor.create_room(11)
+
+    async def test_failed_create_releases_slot(self):
+        """Test that a worker-side failure does not leak the reservation."""
+        supervisor = RoutingSupervisor(_settings(workers=1, max_rooms=1), create_status=500)
+        status, _ = await supervisor.create_room(10)
+
+        assert status == 500
+        assert supervisor.owner(10) is None
+        assert supervisor.pick_worker() is not None
+
+    async def test_timed_out_create_is_cleaned_up(self):
+        """Test that a create that timed out is deleted on the worker first."""
+        supervisor = RoutingSupervisor(_settings(workers=1, max_rooms=1), create_status=502)
+        status, _ = await supervisor.create_room(10)
+
+        assert status == 502
+        assert supervisor.requests[-1] == (0, "DELETE", "/rooms/10")
+        assert supervisor.owner(10) is None
+        assert supervisor.pick_worker() is not None
+
+    async def test_timed_out_create_kept_while_worker_unknown(self):
+        """Test that the slot stays reserved if the cleanup also fails."""
+        supervisor = RoutingSupervisor(
+            _settings(workers=1, max_rooms=1), create_status=502, delete_status=502
+        )
+        await supervisor.create_room(10)
+
+        assert supervisor.owner(10) is supervisor.workers[0]
+        assert supervisor.pick_worker() is None
+
+    def test_poll_reconciles_rooms(self):
+        """Test that dead rooms are dropped and unrouted ones adopted."""
+        supervisor = RoutingSupervisor(_settings())
+        worker = supervisor.workers[0]
+        supervisor._route(40, worker)
+        supervisor._route(41, worker)
+
+        # A poll that raced a routing change is ignored
+        supervisor._reconcile(worker, [{"room_id": 42}], worker.epoch - 1)
+        assert supervisor.owner(40) is worker
+
+        supervisor._reconcile(worker, [{"room_id": 41}, {"room_id": 42}], worker.epoch)
+        assert supervisor.owner(40) is None
+        assert supervisor.owner(42) is worker
+        assert worker.rooms == {41, 42}
+
+    def test_poll_keeps_rooms_being_created(self):
+        """Test that a room whose POST is in flight is not dropped."""
+        supervisor = RoutingSupervisor(_settings())
+        worker = supervisor.workers[0]
+        supervisor._route(50, worker)
+        supervisor._creating.add(50)
+
+        supervisor._reconcile(worker, [], worker.epoch)
+        assert supervisor.owner(50) is worker
+
+    async def test_delete_routes_to_owner(self):
+        """Test that deletes go to the worker hosting the room."""
+        supervisor = RoutingSupervisor(_settings())
+        supervisor.workers[0].rooms = {1}
+        await supervisor.create_room(20)
+        owner = supervisor.owner(20).index
+
+        status, _ = await supervisor.delete_room(20)
+        assert status == 200
+        assert supervisor.requests[-1] == (owner, "DELETE", "/rooms/20")
+        assert supervisor.owner(20) is None
+        with pytest.raises(RoomNotFoundError):
+            await supervisor.delete_room(20)
+
+    @pytest.mark.skipif(not HAS_AIOHTTP, reason="aiohttp not installed")
+    async def test_forward_relays_non_json_body(self):
+        """Test that a plain-text worker reply comes back as its detail."""
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get("/rooms", lambda request: web.Response(status=500, text="boom"))
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, WORKER_HOST, 0).start()
+
+        supervisor = Supervisor(_settings(workers=1))
+        worker = supervisor.workers[0]
+        worker.settings.api_port = runner.addresses[0][1]
+        supervisor._session = aiohttp.ClientSession()
+        try:
+            assert await supervisor.forward(worker, "GET", "/rooms") == (500, {"detail": "boom"})
+        finally:
+            await supervisor._session.close()
+            await runner.cleanup()
+
+    def test_restart_drops_lost_rooms(self):
+        """Test that rooms of a dead worker leave the routing table."""
+        supervisor = RoutingSupervisor(_settings())
+        worker = supervisor.workers[1]
+        worker.rooms = {30}
+        supervisor._rooms[30] = worker
+        supervisor._spawn = lambda w: setattr(w, "process", AliveProcess())
+
+        supervisor._restart(worker)
+        assert supervisor.owner(30) is None
+        assert worker.restarts == 1
+        assert worker.alive
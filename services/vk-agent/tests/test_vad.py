@@ -0,0 +1,94 @@
+"""
+Tests for VK-Agent voice activity detection
+"""
+
+import os
+
+import numpy as np
+import pytest
+from src.vad import (
+    DEFAULT_ONNX_MODEL_PATH,
+    HAS_ONNX,
+    WINDOW_SIZE,
+    VoiceActivityDetector,
+    _normalize,
+    _windows,
+    batch_speech_probability,
+)
+
+HAS_ONNX_MODEL = HAS_ONNX and os.path.exists(DEFAULT_ONNX_MODEL_PATH)
+
+
+def _tone(seconds: float = 0.1, amplitude: float = 3000.0) -> bytes:
+    """Noisy 220Hz tone as PCM16 at 16kHz."""
+    t = np.arange(int(16000 * seconds)) / 16000
+    rng = np.random.default_rng(1)
+    samples = np.sin(2 * np.pi * 220 * t) * amplitude + rng.normal(0, 300, len(t))
+    return samples.astype(np.int16).tobytes()
+
+
+class TestWindowing:
+    """Tests for Silero input preparation."""
+
+    def test_windows_pad_long_tail(self):
+        """Test that a tail of at least half a window is zero-padded."""
+        audio = np.ones(3 * WINDOW_SIZE + 300, dtype=np.float32)
+        windows = _windows(audio)
+
+        assert windows.shape == (4, WINDOW_SIZE)
+        assert windows[3, :300].all()
+        assert not windows[3, 300:].any()
+
+    def test_windows_drop_short_tail(self):
+        """Test that a tail under half a window is not evaluated."""
+        assert _windows(np.ones(1600, dtype=np.float32)).shape == (3, WINDOW_SIZE)
+        assert _windows(np.ones(WINDOW_SIZE + 100, dtype=np.float32)).shape == (1, WINDOW_SIZE)
+        assert _windows(np.ones(100, dtype=np.float32)).shape == (0, WINDOW_SIZE)
+
+    def test_normalize_gains_quiet_audio(self):
+        """Test that quiet WebRTC audio is raised toward speech level."""
+        quiet = np.full(512, 100, dtype=np.int16)
+        silence = np.zeros(512, dtype=np.int16)
+
+        assert np.abs(_normalize(quiet)).max() == pytest.approx(5000 / 32768, rel=1e-3)
+        assert not _normalize(silence).any()
+
+
+class TestVoiceActivityDetector:
+    """Tests for VAD backends."""
+
+    def test_unavailable_backend_passes_audio_through(self):
+        """Test that a missing model degrades to pass-through, not an error."""
+        vad = VoiceActivityDetector(backend="onnx", model_path="/nonexistent/model.onnx")
+
+        assert not vad.is_available
+        assert vad.get_speech_probability(_tone()) == 1.0
+        assert vad.is_speech(_tone())
+
+    @pytest.mark.skipif(not HAS_ONNX_MODEL, reason="onnxruntime or Silero ONNX model not available")
+    def test_onnx_state_is_per_detector(self):
+        """Test that two detectors on the shared session do not share state."""
+        a = VoiceActivityDetector(backend="onnx")
+        b = VoiceActivityDetector(backend="onnx")
+        assert a._backend is b._backend
+
+        chunk = _tone()
+        a.get_speech_probability(_tone(amplitude=8000))
+        first = b.get_speech_probability(chunk)
+        b.reset()
+
+        assert b.get_speech_probability(chunk) == pytest.approx(first, abs=1e-6)
+
+    @pytest.mark.skipif(not HAS_ONNX_MODEL, reason="onnxruntime or Silero ONNX model not available")
+    def test_batched_matches_sequential(self):
+        """Test that cross-stream batching gives the per-stream results."""
+        chunks = [_tone(0.1, amp) for amp in (500, 3000, 8000)]
+        chunks.append(np.zeros(800, dtype=np.int16).tobytes())  # Shorter stream
+
+        sequential = [VoiceActivityDetector(backend="onnx") for _ in chunks]
+        batched = [VoiceActivityDetector(backend="onnx") for _ in chunks]
+
+        for _ in range(3):
+            expected = [d.get_speech_probability(c) for d, c in zip(sequential, chunks, strict=True)]
+            actual = batch_speech_probability(batched, chunks)
+            assert actual == pytest.approx(expected, abs=1e-5)